@@ -1,9 +1,12 @@
 """Example weather agent using OpenAI and HTTP requests to fetch weather data."""
 
 import argparse
+import atexit
 import logging
+import threading
 import tomllib
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from os import environ
@@ -13,6 +16,8 @@ from pathlib import Path
 from strands.models import Model
 from dotenv import load_dotenv
 
+from my_python_ai_kata.agents.shared_loop import BackgroundLoop, SharedLoopModel
+
 load_dotenv()
 
 # Environment variable for application config directory
@@ -50,6 +55,11 @@ class ApplicationConfig:
         """Get model configuration."""
         return self.config["agents"]
 
+    @property
+    def vector_store(self) -> Dict[str, Any]:
+        """Get vector store configuration."""
+        return self.config.get("vector_store", {})
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key."""
         return self.config.get(key, default)
@@ -182,6 +192,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_TEMPERATURE: float = 0.7
 DEFAULT_MAX_TOKENS: int = 1000
 DEFAULT_AI_MODEL: str = "gpt-4.1"
+DEFAULT_HTTP_MAX_CONNECTIONS: int = 20
+DEFAULT_HTTP_KEEPALIVE_CONNECTIONS: int = 20
+DEFAULT_HTTP_KEEPALIVE_SECONDS: float = 120.0
+DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+DEFAULT_HTTP_TIMEOUT_SECONDS: float = 600.0
 
 
 class ModelType(Enum):
@@ -191,9 +206,12 @@ class ModelType(Enum):
     BEDROCK = "bedrock"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelConfig:
-    """Configuration for the AI model."""
+    """Configuration for the AI model.
+
+    It is immutable and hashable, so that equal configurations share the same model instance.
+    """
     model_type: ModelType
     api_key: str
     base_url: Optional[str]
@@ -272,11 +290,14 @@ class ModelConfig:
                 )
 
 
-def get_or_create_ai_model(model_config: ModelConfig | None) -> Model:
-    """Factory method for creating an AI model that is ready to use according to required configuration.
+def create_ai_model(model_config: ModelConfig) -> Model:
+    """Factory method for creating a new AI model according to required configuration.
+
+    The OpenAI models get an HTTP client with a keep-alive connection pool tuned by the
+    ``http_*`` settings of the ``[agents]`` section of the application config.
 
     Args:
-        model_config (ModelConfig | None): The model configuration to use. If None, will create from environment.
+        model_config (ModelConfig): The model configuration to use.
 
     Returns:
         Model: The created AI model.
@@ -284,9 +305,6 @@ def get_or_create_ai_model(model_config: ModelConfig | None) -> Model:
     Raises:
         ValueError: If the model configuration is invalid.
     """
-    if model_config is None:
-        model_config = ModelConfig.from_config()
-
     client_args: dict[str, Any] = {"api_key": model_config.api_key}
     if model_config.base_url:  # type: ignore
         client_args["base_url"] = model_config.base_url
@@ -294,7 +312,20 @@ def get_or_create_ai_model(model_config: ModelConfig | None) -> Model:
     match model_config.model_type:
         case ModelType.OPENAI:
             logger.info(f"Creating OpenAI model with ID: {model_config.model_id}")
+            import httpx
             from strands.models.openai import OpenAIModel
+            agents_config = get_application_config().agents
+            client_args["http_client"] = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=agents_config.get("http_max_connections", DEFAULT_HTTP_MAX_CONNECTIONS),
+                    max_keepalive_connections=agents_config.get("http_keepalive_connections", DEFAULT_HTTP_KEEPALIVE_CONNECTIONS),
+                    keepalive_expiry=agents_config.get("http_keepalive_seconds", DEFAULT_HTTP_KEEPALIVE_SECONDS),
+                ),
+                timeout=httpx.Timeout(
+                    agents_config.get("http_timeout_seconds", DEFAULT_HTTP_TIMEOUT_SECONDS),
+                    connect=agents_config.get("http_connect_timeout_seconds", DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS),
+                ),
+            )
             return OpenAIModel(
                 client_args=client_args,
                 model_id=model_config.model_id,
@@ -327,3 +358,136 @@ def get_or_create_ai_model(model_config: ModelConfig | None) -> Model:
             )
         case _:
             raise ValueError(f"Unsupported model type: {model_config.model_type}")
+
+
+class ModelRegistry:
+    """Thread-safe registry of the AI models shared by all the agents of the process.
+
+    Models are created once per configuration. Their requests all run on one background
+    event loop, so that their HTTP connections stay open between agent calls, whichever
+    thread and event loop the agents run on.
+    """
+
+    def __init__(self, factory: Callable[[ModelConfig], Model] = create_ai_model):
+        """Initialize an empty registry.
+
+        Args:
+            factory (Callable[[ModelConfig], Model]): Creates a new model for a configuration.
+        """
+        self.factory = factory
+        self._models: dict[ModelConfig, SharedLoopModel] = {}
+        self._retired: list[SharedLoopModel] = []
+        self._refresh_hooks: list[Callable[[], None]] = []
+        self._loop: BackgroundLoop | None = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return the number of shared models."""
+        with self._lock:
+            return len(self._models)
+
+    def get(self, model_config: ModelConfig) -> Model:
+        """Return the shared model of a configuration, creating it on first use.
+
+        Args:
+            model_config (ModelConfig): The model configuration.
+
+        Returns:
+            Model: The shared model.
+        """
+        with self._lock:
+            model = self._models.get(model_config)
+            if model is None:
+                if self._loop is None or not self._loop.running:
+                    self._loop = BackgroundLoop()
+                model = SharedLoopModel(self.factory(model_config), self._loop)
+                self._models[model_config] = model
+            return model
+
+    def on_refresh(self, hook: Callable[[], None]) -> None:
+        """Register a hook run on refresh, to drop whatever holds the replaced models.
+
+        Args:
+            hook (Callable[[], None]): The hook.
+        """
+        with self._lock:
+            self._refresh_hooks.append(hook)
+
+    def refresh(self, model_config: ModelConfig | None = None) -> None:
+        """Replace the shared models on their next use, e.g. after a change of API keys.
+
+        The replaced models keep serving the requests in flight, and are closed on shutdown.
+
+        Args:
+            model_config (ModelConfig | None): The configuration to refresh, or None for all.
+        """
+        with self._lock:
+            configs = list(self._models) if model_config is None else [model_config]
+            for config in configs:
+                model = self._models.pop(config, None)
+                if model is not None:
+                    self._retired.append(model)
+            hooks = list(self._refresh_hooks)
+        for hook in hooks:
+            hook()
+
+    def shutdown(self) -> None:
+        """Close every model client and its connections, and stop the background loop."""
+        with self._lock:
+            models = list(self._models.values()) + self._retired
+            self._models.clear()
+            self._retired.clear()
+            loop, self._loop = self._loop, None
+        for model in models:
+            model.close()
+        if loop is not None:
+            loop.stop()
+
+
+_model_registry: ModelRegistry | None = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Lazy get or create the model registry of the process, shut down at exit.
+
+    Returns:
+        The model registry
+    """
+    global _model_registry
+    with _model_registry_lock:
+        if _model_registry is None:
+            _model_registry = ModelRegistry()
+            atexit.register(_model_registry.shutdown)
+        return _model_registry
+
+
+def get_or_create_ai_model(model_config: ModelConfig | None) -> Model:
+    """Get the AI model shared by the agents for the required configuration.
+
+    Args:
+        model_config (ModelConfig | None): The model configuration to use. If None, will create from environment.
+
+    Returns:
+        Model: The shared AI model, created on first use.
+
+    Raises:
+        ValueError: If the model configuration is invalid.
+    """
+    if model_config is None:
+        model_config = ModelConfig.from_config()
+    return get_model_registry().get(model_config)
+
+
+def refresh_ai_models(model_config: ModelConfig | None = None) -> None:
+    """Replace the shared AI models on their next use.
+
+    Args:
+        model_config (ModelConfig | None): The configuration to refresh, or None for all.
+    """
+    get_model_registry().refresh(model_config)
+
+
+def shutdown_ai_models() -> None:
+    """Close the shared AI models and their connection pools."""
+    get_model_registry().shutdown()
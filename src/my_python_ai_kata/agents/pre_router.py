@@ -0,0 +1,306 @@
+"""Local pre-router sending obvious queries straight to a specialist.
+
+The teacher agent spends a full LLM round trip deciding which specialist
+answers a query before any of them starts. A pre-router answers that question
+locally, in well under a millisecond, for the queries it is confident about;
+the others still go through the teacher agent.
+
+Two routers are available:
+
+* ``KeywordRouter`` matches subject keywords, and routes a query when several
+  of them match and all point at the same specialist: a single keyword is
+  often incidental ("the mean temperature on Mars"), and the keywords of two
+  subjects ask for both specialists;
+* ``ClassifierRouter`` is a character n-gram TF-IDF and logistic regression
+  classifier (it needs scikit-learn), trained on labelled queries: the bundled
+  examples and the routes the teacher agent took, logged by a ``RouteLog``.
+  A few examples per specialist make it cautious; it routes more queries as
+  the log grows.
+
+A ``PreRouter`` chains routers, and takes the first confident decision.
+"""
+
+import json
+import logging
+import re
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Optional
+from typing import Protocol
+
+from my_python_ai_kata.agents.routing_examples import ROUTING_EXAMPLES
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEYWORD_CONFIDENCE = 1.0
+DEFAULT_KEYWORD_MIN_HITS = 2
+DEFAULT_CLASSIFIER_CONFIDENCE = 0.6
+PRE_ROUTERS = ("off", "keywords", "classifier", "both")
+
+_LANGUAGES = "(spanish|french|german|italian|japanese|chinese|portuguese|russian|arabic|korean|latin)"
+
+KEYWORD_RULES: dict[str, list[str]] = {
+    "math": [
+        r"\d\s*[-+*/^×÷=]\s*\d",
+        r"\d+\s*%",
+        r"\b(solve|calculat|comput|simplif|factor)\w*",
+        r"\b(equations?|polynomials?|fractions?|derivatives?|integrals?|theorems?|matrix|matrices)\b",
+        r"\b(algebra|geometry|calculus|trigonometry|statistics|probability|arithmetic)\b",
+        r"\b(square root|prime numbers?|standard deviation|mean|median|average|percent(age)?)\b",
+        r"\b(area|perimeter|volume|angles?|radius|hexagon|triangle|circle)\b",
+    ],
+    "english": [
+        r"\b(grammar|grammatical|punctuation|spelling|proofread|semicolon|comma)\w*",
+        r"\b(essays?|paragraphs?|composition|short story|narrative|plot|themes?)\b",
+        r"\b(metaphor|simile|symbolism|poems?|poetry|poets?|sonnets?|novels?|literature|literary)\b",
+        r"\b(shakespeare|macbeth|hamlet|austen|gatsby|hemingway|dickens)\b",
+        r"\b(modifier|pentameter|tense of my|sentence structure|writing style)\b",
+    ],
+    "language": [
+        r"\btranslat\w*",
+        r"\bhow (do|would) (you|i) say\b",
+        r"\b(pronounc\w*|conjugat\w*|vocabulary|greetings|particle)\b",
+        rf"\b(in|into|to|from) {_LANGUAGES}\b",
+        rf"\b{_LANGUAGES} (words?|nouns?|verbs?|expressions?|greetings|grammar|particles?)\b",
+        r"\bwhat does .+ mean\b",
+        r"\b(word|expression) for\b",
+    ],
+    "computer_science": [
+        r"\b(python|java|javascript|typescript|c\+\+|rust|golang|sql|html|css)\b",
+        r"\b(code|coding|program|programming|function|class|compile|debug|bug|segmentation fault)\b",
+        r"\b(algorithms?|data structures?|complexity|recursion|sort(ing)?|binary search|hash table|linked list)\b",
+        r"\b(stack|queue|graph|tree|array|pointer|thread|race condition|garbage collection)\b",
+        r"\b(tcp|udp|http|api|database|query|operating system|compiler)\b",
+        r"\b(dijkstra|quicksort|mergesort|object-oriented)\b",
+    ],
+}
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """The specialist a router picked for a query, if it is confident enough."""
+
+    specialist: Optional[str]
+    confidence: float
+    router: str
+
+    @property
+    def confident(self) -> bool:
+        """Whether the query can skip the teacher agent."""
+        return self.specialist is not None
+
+
+class Router(Protocol):
+    """Something that decides which specialist answers a query."""
+
+    def route(self, query: str) -> RouteDecision:
+        """Decide which specialist answers a query, if any."""
+        ...
+
+
+class KeywordRouter:
+    """Route queries whose subject keywords all point at one specialist."""
+
+    name = "keywords"
+
+    def __init__(
+        self,
+        rules: Optional[dict[str, list[str]]] = None,
+        min_confidence: float = DEFAULT_KEYWORD_CONFIDENCE,
+        min_hits: int = DEFAULT_KEYWORD_MIN_HITS,
+    ):
+        """Compile the keyword rules.
+
+        Args:
+            rules (Optional[dict[str, list[str]]]): The regular expressions
+                matching each specialist; by default ``KEYWORD_RULES``.
+            min_confidence (float): Minimum share of the matched rules that
+                point at the picked specialist.
+            min_hits (int): Minimum number of matched rules of the picked
+                specialist.
+        """
+        self.rules = {
+            specialist: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for specialist, patterns in (rules or KEYWORD_RULES).items()
+        }
+        self.min_confidence = min_confidence
+        self.min_hits = min_hits
+
+    def route(self, query: str) -> RouteDecision:
+        """Pick the specialist most of the matched rules point at.
+
+        Args:
+            query (str): The student query.
+
+        Returns:
+            RouteDecision: The decision, without specialist when too few
+            rules matched or the matches are spread over several specialists.
+        """
+        scores = {
+            specialist: sum(1 for pattern in patterns if pattern.search(query))
+            for specialist, patterns in self.rules.items()
+        }
+        total = sum(scores.values())
+        if not total:
+            return RouteDecision(None, 0.0, self.name)
+        specialist, score = max(scores.items(), key=lambda item: item[1])
+        confidence = score / total
+        if confidence < self.min_confidence or score < self.min_hits:
+            return RouteDecision(None, confidence, self.name)
+        return RouteDecision(specialist, confidence, self.name)
+
+
+class ClassifierRouter:
+    """Route queries with a text classifier trained on labelled queries."""
+
+    name = "classifier"
+
+    def __init__(
+        self,
+        examples: Iterable[tuple[str, str]],
+        min_confidence: float = DEFAULT_CLASSIFIER_CONFIDENCE,
+    ):
+        """Train the classifier.
+
+        Args:
+            examples (Iterable[tuple[str, str]]): The queries, with the
+                specialist that should answer them.
+            min_confidence (float): Minimum probability of the picked specialist.
+
+        Raises:
+            ImportError: If scikit-learn is not installed.
+        """
+        try:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            from sklearn.linear_model import LogisticRegression
+            from sklearn.pipeline import make_pipeline
+        except ImportError as ex:
+            raise ImportError(
+                "The classifier pre-router needs scikit-learn, install the 'extra' dependencies"
+            ) from ex
+
+        queries, labels = zip(*examples)
+        # Character n-grams generalize better than words from a few examples per specialist
+        self.model: Any = make_pipeline(
+            TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True),
+            LogisticRegression(C=10, max_iter=1000),
+        )
+        self.model.fit(list(queries), list(labels))
+        self.min_confidence = min_confidence
+
+    def route(self, query: str) -> RouteDecision:
+        """Pick the most likely specialist.
+
+        Args:
+            query (str): The student query.
+
+        Returns:
+            RouteDecision: The decision, without specialist when its
+            probability is too low.
+        """
+        probabilities = self.model.predict_proba([query])[0]
+        best = int(probabilities.argmax())
+        confidence = float(probabilities[best])
+        if confidence < self.min_confidence:
+            return RouteDecision(None, confidence, self.name)
+        return RouteDecision(str(self.model.classes_[best]), confidence, self.name)
+
+
+class PreRouter:
+    """Routers tried in turn, the first confident one deciding."""
+
+    def __init__(self, routers: list[Router]):
+        """Initialize the chain.
+
+        Args:
+            routers (list[Router]): The routers, cheapest first.
+        """
+        self.routers = routers
+
+    def route(self, query: str) -> RouteDecision:
+        """Decide which specialist answers a query, if any router is confident.
+
+        Args:
+            query (str): The student query.
+
+        Returns:
+            RouteDecision: The first confident decision, or the last one.
+        """
+        decision = RouteDecision(None, 0.0, "none")
+        for router in self.routers:
+            decision = router.route(query)
+            if decision.confident:
+                break
+        return decision
+
+
+class RouteLog:
+    """JSON lines file of the queries routed by the teacher agent, to train the classifier."""
+
+    def __init__(self, path: str | Path):
+        """Initialize the log.
+
+        Args:
+            path (str | Path): The log file, created on first append.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def append(self, query: str, specialist: str) -> None:
+        """Record the specialist the teacher agent picked for a query.
+
+        Args:
+            query (str): The student query.
+            specialist (str): The specialist.
+        """
+        line = json.dumps({"query": query, "specialist": specialist})
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as log:
+                log.write(line + "\n")
+
+    def load(self) -> list[tuple[str, str]]:
+        """Return the logged routes.
+
+        Returns:
+            list[tuple[str, str]]: The queries, with their specialist.
+        """
+        if not self.path.exists():
+            return []
+        with self.path.open(encoding="utf-8") as log:
+            routes = [json.loads(line) for line in log if line.strip()]
+        return [(route["query"], route["specialist"]) for route in routes]
+
+
+def build_pre_router(
+    kind: str, route_log: Optional[RouteLog] = None
+) -> Optional[PreRouter]:
+    """Create a pre-router.
+
+    Args:
+        kind (str): One of ``PRE_ROUTERS``.
+        route_log (Optional[RouteLog]): Logged routes, to train the classifier
+            along with the bundled examples.
+
+    Returns:
+        Optional[PreRouter]: The pre-router, or None when it is off.
+
+    Raises:
+        ValueError: If the kind is unknown.
+    """
+    if kind not in PRE_ROUTERS:
+        raise ValueError(f"Unknown pre-router {kind!r}, expected one of {PRE_ROUTERS}")
+    routers: list[Router] = []
+    if kind in ("keywords", "both"):
+        routers.append(KeywordRouter())
+    if kind in ("classifier", "both"):
+        logged = route_log.load() if route_log is not None else []
+        logger.info(
+            f"Training the pre-router classifier on {len(logged)} logged routes"
+        )
+        routers.append(ClassifierRouter(ROUTING_EXAMPLES + logged))
+    return PreRouter(routers) if routers else None
@@ -0,0 +1,159 @@
+"""Labelled student queries, by the specialist that should answer them.
+
+They seed the classifier of the pre-router and, with the routes logged by the
+Teacher's Assistant, make up the offline set its accuracy is measured on. The
+held-out examples are only used to measure it.
+"""
+
+ROUTING_EXAMPLES: list[tuple[str, str]] = [
+    # Math
+    ("What is 15% of 240?", "math"),
+    ("Solve the equation 3x + 7 = 22", "math"),
+    ("Calculate the area of a circle with a radius of 4 cm", "math"),
+    ("What is the derivative of x^3 + 2x?", "math"),
+    ("How do I compute the mean and standard deviation of 2, 4, 4, 5, 7?", "math"),
+    ("Factor the polynomial x^2 - 5x + 6", "math"),
+    ("What is the probability of rolling two sixes with two dice?", "math"),
+    ("Explain the Pythagorean theorem with an example", "math"),
+    ("What is the integral of sin(x) from 0 to pi?", "math"),
+    ("How many degrees are in the interior angles of a hexagon?", "math"),
+    ("Simplify the fraction 84/126", "math"),
+    ("What is the square root of 1764?", "math"),
+    ("Can you explain what a matrix determinant is?", "math"),
+    ("If a train travels 300 km in 2.5 hours, what is its average speed?", "math"),
+    ("What are prime numbers and is 91 one of them?", "math"),
+    # English
+    (
+        "Can you check the grammar of this sentence: 'Me and him goes to school'?",
+        "english",
+    ),
+    ("What is the difference between a metaphor and a simile?", "english"),
+    ("Summarize the plot of Pride and Prejudice", "english"),
+    ("Help me write an introduction for my essay about climate change", "english"),
+    ("What are the main themes of Macbeth?", "english"),
+    ("When should I use a semicolon instead of a comma?", "english"),
+    ("Explain iambic pentameter in Shakespeare's sonnets", "english"),
+    ("How can I improve the structure of my persuasive essay?", "english"),
+    ("What is the narrative point of view in The Great Gatsby?", "english"),
+    ("Proofread my paragraph and fix the punctuation", "english"),
+    ("Who are the most famous poets of the Romantic period?", "english"),
+    ("What's the difference between 'affect' and 'effect'?", "english"),
+    ("Give me tips to write a good short story", "english"),
+    ("What is a dangling modifier?", "english"),
+    ("Analyze the symbolism in The Old Man and the Sea", "english"),
+    # Language
+    ("Translate 'good morning, how are you?' into Spanish", "language"),
+    ("How do you say 'thank you very much' in Japanese?", "language"),
+    ("What does 'carpe diem' mean in English?", "language"),
+    ("Translate this sentence to French: I would like a cup of coffee", "language"),
+    ("How do I conjugate the verb 'avoir' in the present tense?", "language"),
+    ("What is the German word for 'library'?", "language"),
+    ("Teach me some basic Italian greetings", "language"),
+    ("How do you pronounce 'croissant' in French?", "language"),
+    ("Translate 'Ich bin müde' from German", "language"),
+    ("What are the genders of nouns in Spanish?", "language"),
+    ("How do I say 'where is the station' in Portuguese?", "language"),
+    ("What is the difference between 'ser' and 'estar' in Spanish?", "language"),
+    ("Can you translate 'happy birthday' into Chinese?", "language"),
+    ("What does the Italian expression 'in bocca al lupo' mean?", "language"),
+    ("How is the Japanese particle 'wa' used?", "language"),
+    # Computer science
+    ("Write a Python function that reverses a linked list", "computer_science"),
+    ("What is the time complexity of quicksort?", "computer_science"),
+    ("Explain the difference between a stack and a queue", "computer_science"),
+    ("How does a hash table handle collisions?", "computer_science"),
+    (
+        "Why does my JavaScript code say 'undefined is not a function'?",
+        "computer_science",
+    ),
+    ("What is recursion in programming?", "computer_science"),
+    ("How do I read a CSV file in Python?", "computer_science"),
+    ("Explain how binary search works", "computer_science"),
+    ("What is the difference between TCP and UDP?", "computer_science"),
+    ("Write a SQL query that counts the orders per customer", "computer_science"),
+    ("What is object-oriented programming?", "computer_science"),
+    ("How does garbage collection work in Java?", "computer_science"),
+    ("Implement Dijkstra's algorithm for a graph", "computer_science"),
+    ("What is a race condition between threads?", "computer_science"),
+    ("How do I fix a segmentation fault in my C program?", "computer_science"),
+    # General
+    ("What is the capital of Australia?", "general"),
+    ("Who painted the Mona Lisa?", "general"),
+    ("Why is the sky blue?", "general"),
+    ("When did the Second World War end?", "general"),
+    ("What are the health benefits of green tea?", "general"),
+    ("How do volcanoes form?", "general"),
+    ("Who was the first person to walk on the moon?", "general"),
+    ("What causes the seasons on Earth?", "general"),
+    ("Recommend a good strategy to study for exams", "general"),
+    ("How does photosynthesis work?", "general"),
+    ("What is the tallest mountain in Europe?", "general"),
+    ("Why do cats purr?", "general"),
+    ("What were the causes of the French Revolution?", "general"),
+    ("How many planets are in the solar system?", "general"),
+    ("What is the largest ocean on Earth?", "general"),
+]
+
+# Queries kept apart from the keyword rules and the classifier training, to
+# measure the accuracy of the pre-routers on queries they were not tuned on.
+# Some of them mention the keywords of another subject in passing.
+HELD_OUT_ROUTING_EXAMPLES: list[tuple[str, str]] = [
+    # Math
+    ("What is 7 times 8?", "math"),
+    ("Find x if 5x - 3 = 2x + 9", "math"),
+    ("What is the volume of a cube with sides of 3 cm?", "math"),
+    ("Convert 3/8 to a decimal", "math"),
+    ("What is the slope of the line through (1, 2) and (3, 8)?", "math"),
+    ("Is 221 a prime number?", "math"),
+    ("How do I find the median of an even list of numbers?", "math"),
+    ("What is the sum of the angles of a triangle?", "math"),
+    ("How many sides does a dodecagon have?", "math"),
+    ("What is the limit of 1/x as x goes to infinity?", "math"),
+    # English
+    ("Is it 'affect' or 'effect' in this sentence?", "english"),
+    ("What is the theme of the poem The Road Not Taken?", "english"),
+    ("How do I write a strong thesis statement?", "english"),
+    ("Why does Holden Caulfield distrust adults in The Catcher in the Rye?", "english"),
+    ("What does iambic pentameter sound like?", "english"),
+    ("Can you proofread my cover letter?", "english"),
+    ("Explain the plot twist at the end of Hamlet", "english"),
+    ("What is the main conflict in To Kill a Mockingbird?", "english"),
+    ("When do I use 'whom' instead of 'who'?", "english"),
+    ("What is the mean message of Animal Farm?", "english"),
+    # Language
+    ("How do I ask for the bill politely in Japanese?", "language"),
+    ("How do you count to ten in Mandarin?", "language"),
+    ("Conjugate the Spanish verb tener in the past tense", "language"),
+    ("Translate 'I am looking for a pharmacy' into Italian", "language"),
+    ("What does 'schadenfreude' mean?", "language"),
+    ("How do I pronounce the Spanish letter ñ?", "language"),
+    ("When do French adjectives go before the noun?", "language"),
+    ("How formal is 'vous' compared to 'tu'?", "language"),
+    ("Is Portuguese hard to learn for Spanish speakers?", "language"),
+    ("What is the plural of 'Buch' in German?", "language"),
+    # Computer science
+    (
+        "What is the difference between a list and a tuple in Python?",
+        "computer_science",
+    ),
+    ("What is the difference between a process and a thread?", "computer_science"),
+    ("Why does my Java program throw a NullPointerException?", "computer_science"),
+    ("Explain big O notation", "computer_science"),
+    ("How do I reverse a linked list?", "computer_science"),
+    ("What is a deadlock between two threads?", "computer_science"),
+    ("Write a SQL query to count the rows of a table", "computer_science"),
+    ("How does DNS resolve a domain name?", "computer_science"),
+    ("What does the static keyword do in C++?", "computer_science"),
+    ("Compute the time complexity of binary search", "computer_science"),
+    # General
+    ("What is the area of Canada?", "general"),
+    ("How tall does an oak tree grow?", "general"),
+    ("What was the plot to kill Julius Caesar?", "general"),
+    ("Which class of animals do frogs belong to?", "general"),
+    ("What is the function of the liver?", "general"),
+    ("What is the average lifespan of a dog?", "general"),
+    ("Who invented the printing press?", "general"),
+    ("Why do leaves change color in autumn?", "general"),
+    ("What is the mean temperature on Mars?", "general"),
+    ("How do bees make honey?", "general"),
+]
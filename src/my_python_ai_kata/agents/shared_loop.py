@@ -0,0 +1,206 @@
+"""Models whose requests all run on one long-lived event loop.
+
+A Strands ``Agent`` called synchronously runs each call on a new event loop,
+in a new thread. The HTTP connections of an asynchronous model client belong
+to the loop that opened them, so a client shared between calls would find its
+kept-alive connections tied to a closed loop, and a client per call never keeps
+a connection warm.
+
+A ``SharedLoopModel`` wraps a model and runs its requests on a single
+background loop, whatever the loop of the caller: the orchestrator and every
+specialist agent of a process then share the connection pool of one client,
+and its connections stay open between agent calls.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from typing import Any
+from typing import Optional
+from typing import TypeVar
+
+from strands.models import Model
+from strands.types.content import Messages
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def _pump(
+    stream: Callable[[], AsyncIterator[Any]],
+    caller: asyncio.AbstractEventLoop,
+    queue: "asyncio.Queue[tuple[Any, Optional[BaseException]]]",
+) -> None:
+    """Iterate a stream, and pass its items, end or error to the queue of another loop."""
+
+    def put(item: Any, error: Optional[BaseException] = None) -> None:
+        try:
+            caller.call_soon_threadsafe(queue.put_nowait, (item, error))
+        except RuntimeError:
+            # The caller gave up and its loop is gone
+            pass
+
+    try:
+        async for item in stream():
+            put(item)
+    except BaseException as error:
+        put(None, error)
+        if not isinstance(error, Exception):
+            raise
+    else:
+        put(_DONE)
+
+
+class BackgroundLoop:
+    """An event loop running forever on a daemon thread."""
+
+    def __init__(self, name: str = "shared-model-loop"):
+        """Start the loop.
+
+        Args:
+            name (str): The name of the thread of the loop.
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name=name, daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop still accepts work."""
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    async def relay(
+        self, stream: Callable[[], AsyncIterator[T]]
+    ) -> AsyncGenerator[T, None]:
+        """Iterate a stream on the background loop, from the loop of the caller.
+
+        Args:
+            stream (Callable[[], AsyncIterator[T]]): Opens the stream; it is
+                called on the background loop.
+
+        Yields:
+            T: The items of the stream, as they arrive.
+        """
+        queue: asyncio.Queue[tuple[Any, Optional[BaseException]]] = asyncio.Queue()
+        future = asyncio.run_coroutine_threadsafe(
+            _pump(stream, asyncio.get_running_loop(), queue), self.loop
+        )
+        try:
+            while True:
+                item, error = await queue.get()
+                if error is not None:
+                    raise error
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            # Stops the request when the caller stops reading early
+            future.cancel()
+
+    def run(self, coroutine: Any, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and wait for its result from another thread.
+
+        Args:
+            coroutine (Any): The coroutine.
+            timeout (Optional[float]): Maximum wait, in seconds.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def stop(self, timeout: Optional[float] = 5) -> None:
+        """Stop the loop and wait for its thread.
+
+        Args:
+            timeout (Optional[float]): Maximum wait, in seconds.
+        """
+        if not self.running:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+class SharedLoopModel(Model):
+    """A model that sends the requests of the wrapped model from a background loop."""
+
+    def __init__(self, model: Model, loop: BackgroundLoop):
+        """Wrap a model.
+
+        Args:
+            model (Model): The wrapped model, whose client is only used on the
+                background loop.
+            loop (BackgroundLoop): The background loop.
+        """
+        self.model = model
+        self.loop = loop
+
+    @property
+    def config(self) -> Any:
+        """The configuration of the wrapped model."""
+        return self.model.get_config()
+
+    def update_config(self, **model_config: Any) -> None:
+        """Update the configuration of the wrapped model."""
+        self.model.update_config(**model_config)
+
+    def get_config(self) -> Any:
+        """Return the configuration of the wrapped model."""
+        return self.model.get_config()
+
+    def structured_output(
+        self,
+        output_model: type[T],
+        prompt: Messages,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Get structured output from the wrapped model, on the background loop."""
+        return self.loop.relay(
+            lambda: self.model.structured_output(
+                output_model, prompt, system_prompt=system_prompt, **kwargs
+            )
+        )
+
+    def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[list[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[StreamEvent, None]:
+        """Stream the response of the wrapped model, requested on the background loop."""
+        return self.loop.relay(
+            lambda: self.model.stream(messages, tool_specs, system_prompt, **kwargs)
+        )
+
+    def close(self, timeout: Optional[float] = 5) -> None:
+        """Close the client of the wrapped model and its kept-alive connections.
+
+        Args:
+            timeout (Optional[float]): Maximum wait, in seconds.
+        """
+        close = getattr(getattr(self.model, "client", None), "close", None)
+        if close is None or not self.loop.running:
+            return
+        try:
+            if inspect.iscoroutinefunction(close):
+                self.loop.run(close(), timeout)
+            else:
+                close()
+        except Exception:
+            logger.exception("Could not close the model client")
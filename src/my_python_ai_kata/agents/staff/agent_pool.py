@@ -0,0 +1,170 @@
+"""Pool of reusable specialist agents.
+
+Building a specialist ``Agent`` loads the model configuration, creates a model
+client and registers the tools of the agent, before the first token is even
+requested. An ``AgentPool`` builds agents once and lends them to the calls of
+a specialist tool: an agent is checked out for a single call, then reset to its
+initial conversation state and kept for the next call. Concurrent calls get
+agents of their own, and the agents left idle for too long are dropped.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import Any
+from typing import Optional
+
+from strands import Agent
+from strands.agent.state import AgentState
+from strands.telemetry.metrics import EventLoopMetrics
+
+from my_python_ai_kata.agents.app_config import get_application_config
+from my_python_ai_kata.agents.app_config import get_model_registry
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IDLE = 4
+DEFAULT_IDLE_SECONDS = 300.0
+
+
+class _PooledAgent:
+    """An agent of a pool, with the state it is reset to after every use."""
+
+    def __init__(self, agent: Agent, generation: int):
+        """Remember the initial state of an agent.
+
+        Args:
+            agent (Agent): A newly built agent.
+            generation (int): The generation of the pool the agent was built in.
+        """
+        self.agent = agent
+        self.generation = generation
+        self.messages = deepcopy(agent.messages)
+        self.state = agent.state.get()
+        self.conversation = agent.conversation_manager.get_state()
+        self.released = time.monotonic()
+
+    def reset(self) -> None:
+        """Clear the conversation of the agent, and restore its initial state."""
+        self.agent.messages[:] = deepcopy(self.messages)
+        self.agent.state = AgentState(deepcopy(self.state))
+        self.agent.conversation_manager.restore_from_session(self.conversation)
+        self.agent.event_loop_metrics = EventLoopMetrics()
+        self.released = time.monotonic()
+
+
+class AgentPool:
+    """Agents built once by a factory, and lent to one call at a time."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Agent],
+        max_idle: int = DEFAULT_MAX_IDLE,
+        idle_seconds: Optional[float] = DEFAULT_IDLE_SECONDS,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            factory (Callable[[], Agent]): Builds a new agent.
+            max_idle (int): Maximum number of agents kept between calls.
+            idle_seconds (Optional[float]): Time after which an unused agent is
+                dropped, or None to keep agents forever.
+        """
+        self.factory = factory
+        self.max_idle = max_idle
+        self.idle_seconds = idle_seconds
+        self.created = 0
+        self._generation = 0
+        self._idle: deque[_PooledAgent] = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, factory: Callable[[], Agent]) -> "AgentPool":
+        """Create a pool sized by the ``[agents]`` section of the application config.
+
+        The pool drops its agents when the shared models are refreshed, so
+        that new agents get the new models; the agents lent at the time are
+        dropped when they are returned.
+
+        Args:
+            factory (Callable[[], Agent]): Builds a new agent.
+
+        Returns:
+            AgentPool: The pool.
+        """
+        agents_config: dict[str, Any] = get_application_config().agents
+        pool = cls(
+            factory,
+            max_idle=agents_config.get("pool_max_idle", DEFAULT_MAX_IDLE),
+            idle_seconds=agents_config.get("pool_idle_seconds", DEFAULT_IDLE_SECONDS),
+        )
+        get_model_registry().on_refresh(pool.clear)
+        return pool
+
+    def __len__(self) -> int:
+        """Return the number of idle agents."""
+        with self._lock:
+            return len(self._idle)
+
+    @contextmanager
+    def checkout(self) -> Iterator[Agent]:
+        """Lend an agent with a clear conversation, building one if none is idle.
+
+        Yields:
+            Agent: The agent, returned to the pool once the block exits.
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            pooled = self._idle.pop() if self._idle else None
+            generation = self._generation
+        if pooled is None:
+            pooled = _PooledAgent(self.factory(), generation)
+            with self._lock:
+                self.created += 1
+            logger.debug(f"Built agent {pooled.agent.name} ({self.created} so far)")
+        try:
+            yield pooled.agent
+        finally:
+            self._release(pooled)
+
+    def clear(self) -> None:
+        """Drop every idle agent, and the lent ones once they are returned."""
+        with self._lock:
+            self._generation += 1
+            self._idle.clear()
+
+    def _release(self, pooled: _PooledAgent) -> None:
+        """Reset an agent and keep it for the next call, unless the pool is full.
+
+        Agents built before the pool was last cleared are dropped instead.
+        """
+        if pooled.generation != self._generation:
+            return
+        try:
+            pooled.reset()
+        except Exception:
+            logger.exception(
+                f"Dropping agent {pooled.agent.name} that could not be reset"
+            )
+            return
+        with self._lock:
+            if pooled.generation != self._generation:
+                return
+            # The most recently used agents are lent first, the others age out
+            self._idle.append(pooled)
+            while len(self._idle) > self.max_idle:
+                self._idle.popleft()
+            self._evict(pooled.released)
+
+    def _evict(self, now: float) -> None:
+        """Drop the agents idle for too long; the lock must be held."""
+        if self.idle_seconds is None:
+            return
+        while self._idle and now - self._idle[0].released > self.idle_seconds:
+            self._idle.popleft()
@@ -1,9 +1,12 @@
 """English Assistant."""
 
 from strands import Agent, tool  # type: ignore
+from strands.models import Model
 from strands_tools import python_repl, shell, file_read, file_write, editor  # type: ignore
 
 from my_python_ai_kata.agents.app_config import ModelConfig, get_or_create_ai_model
+from my_python_ai_kata.agents.staff.agent_pool import AgentPool
+from my_python_ai_kata.agents.streaming import relay_to
 
 COMPUTER_SCIENCE_ASSISTANT_SYSTEM_PROMPT = """
 You are ComputerScienceExpert, a specialized assistant for computer science education and programming. Your capabilities include:
@@ -37,12 +40,13 @@ Focus on providing clear, practical explanations that demonstrate concepts with
 
 
 @tool
-def computer_science_assistant(query: str) -> str:
+def computer_science_assistant(query: str, agent: Agent | None = None) -> str:
     """
     Process and respond to computer science and programming-related questions using a specialized agent with code execution capabilities.
     
     Args:
         query: The user's computer science or programming question
+        agent: The agent calling the tool, which gets the tokens of the answer as they stream
         
     Returns:
         A detailed response addressing computer science concepts or code execution results
@@ -52,9 +56,8 @@ def computer_science_assistant(query: str) -> str:
     
     try:
         print("Routed to Computer Science Assistant")
-        cs_agent = get_computer_science_assistant()
-
-        agent_response = cs_agent(formatted_query)
+        with computer_science_assistant_pool.checkout() as cs_agent:
+            agent_response = cs_agent(formatted_query, callback_handler=relay_to(agent, "Computer Science Assistant"))
         text_response = str(agent_response)
 
         if len(text_response) > 0:
@@ -66,18 +69,27 @@ def computer_science_assistant(query: str) -> str:
         return f"Error processing your computer science query: {str(e)}"
 
 
-def get_computer_science_assistant() -> Agent:
+def get_computer_science_assistant(model: Model | None = None) -> Agent:
     """Create and return a computer science assistant agent.
 
+    Args:
+        model: The model of the agent, by default the configured one
+
     Returns:
         A configured Strands Agent for computer science assistance
     """
-    model = get_or_create_ai_model(ModelConfig.from_config())
+    if model is None:
+        model = get_or_create_ai_model(ModelConfig.from_config())
     cs_agent = Agent(
         name="Computer Science Assistant",
         description="A specialized assistant for computer science education and programming.",
         system_prompt=COMPUTER_SCIENCE_ASSISTANT_SYSTEM_PROMPT,
         tools=[python_repl, shell, file_read, file_write, editor],
+        callback_handler=None,
         model=model
     )
-    return cs_agent
\ No newline at end of file
+    return cs_agent
+
+
+# Agents reused by the calls of the tool, reset between calls
+computer_science_assistant_pool = AgentPool.from_config(get_computer_science_assistant)
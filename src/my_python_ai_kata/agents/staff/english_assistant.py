@@ -1,9 +1,12 @@
 """English Assistant."""
 
 from strands import Agent, tool  # type: ignore
+from strands.models import Model
 from strands_tools import file_read, file_write, editor  # type: ignore
 
 from my_python_ai_kata.agents.app_config import ModelConfig, get_or_create_ai_model
+from my_python_ai_kata.agents.staff.agent_pool import AgentPool
+from my_python_ai_kata.agents.streaming import relay_to
 
 ENGLISH_ASSISTANT_SYSTEM_PROMPT = """
 You are English master, an advanced English education assistant. Your capabilities include:
@@ -32,11 +35,12 @@ Focus on being clear, encouraging, and educational in all interactions. Always e
 
 
 @tool
-def english_assistant(query: str) -> str:
+def english_assistant(query: str, agent: Agent | None = None) -> str:
     """Process and respond to English language, literature, and writing-related queries.
 
     Args:
         query: The user's English language or literature question
+        agent: The agent calling the tool, which gets the tokens of the answer as they stream
 
     Returns:
         A helpful response addressing English language or literature concepts
@@ -47,9 +51,8 @@ def english_assistant(query: str) -> str:
     try:
         print("Routed to English Assistant")
 
-        english_agent = get_english_assistant()
-
-        agent_response = english_agent(formatted_query)
+        with english_assistant_pool.checkout() as english_agent:
+            agent_response = english_agent(formatted_query, callback_handler=relay_to(agent, "English Assistant"))
         text_response = str(agent_response)
 
         if len(text_response) > 0:
@@ -61,18 +64,27 @@ def english_assistant(query: str) -> str:
         return f"Error processing your English language query: {str(e)}"
 
 
-def get_english_assistant() -> Agent:
+def get_english_assistant(model: Model | None = None) -> Agent:
     """Create and return an English assistant agent.
 
+    Args:
+        model: The model of the agent, by default the configured one
+
     Returns:
         A configured Strands Agent for English assistance
     """
-    model = get_or_create_ai_model(ModelConfig.from_config())
+    if model is None:
+        model = get_or_create_ai_model(ModelConfig.from_config())
     english_agent = Agent(
         name="English Assistant",
         description="A specialized assistant for English language and literature.",
         system_prompt=ENGLISH_ASSISTANT_SYSTEM_PROMPT,
         tools=[editor, file_read, file_write],
+        callback_handler=None,
         model=model
     )
     return english_agent
+
+
+# Agents reused by the calls of the tool, reset between calls
+english_assistant_pool = AgentPool.from_config(get_english_assistant)
@@ -1,9 +1,12 @@
 """Language Assistant for translation and language learning."""
 
 from strands import Agent, tool  # type: ignore
+from strands.models import Model
 from strands_tools import http_request  # type: ignore
 
 from my_python_ai_kata.agents.app_config import ModelConfig, get_or_create_ai_model
+from my_python_ai_kata.agents.staff.agent_pool import AgentPool
+from my_python_ai_kata.agents.streaming import relay_to
 
 LANGUAGE_ASSISTANT_SYSTEM_PROMPT = """
 You are LanguageAssistant, a specialized language translation and learning assistant. Your role encompasses:
@@ -32,12 +35,13 @@ Maintain accuracy while ensuring translations are natural and contextually appro
 
 
 @tool
-def language_assistant(query: str) -> str:
+def language_assistant(query: str, agent: Agent | None = None) -> str:
     """
     Process and respond to language translation and foreign language learning queries.
     
     Args:
         query: A request for translation or language learning assistance
+        agent: The agent calling the tool, which gets the tokens of the answer as they stream
         
     Returns:
         A translated text or language learning guidance with explanations
@@ -47,9 +51,8 @@ def language_assistant(query: str) -> str:
     
     try:
         print("Routed to Language Assistant")
-        language_agent = get_language_assistant()
-
-        agent_response = language_agent(formatted_query)
+        with language_assistant_pool.checkout() as language_agent:
+            agent_response = language_agent(formatted_query, callback_handler=relay_to(agent, "Language Assistant"))
         text_response = str(agent_response)
 
         if len(text_response) > 0:
@@ -61,18 +64,27 @@ def language_assistant(query: str) -> str:
         return f"Error processing your language query: {str(e)}"
 
 
-def get_language_assistant() -> Agent:
+def get_language_assistant(model: Model | None = None) -> Agent:
     """Create and return a language assistant agent.
 
+    Args:
+        model: The model of the agent, by default the configured one
+
     Returns:
         A configured Strands Agent for language assistance
     """
-    model = get_or_create_ai_model(ModelConfig.from_config())
+    if model is None:
+        model = get_or_create_ai_model(ModelConfig.from_config())
     language_agent = Agent(
         name="Language Assistant",
         description="A specialized assistant for language translation and learning.",
         system_prompt=LANGUAGE_ASSISTANT_SYSTEM_PROMPT,
         tools=[http_request],
+        callback_handler=None,
         model=model
     )
     return language_agent
+
+
+# Agents reused by the calls of the tool, reset between calls
+language_assistant_pool = AgentPool.from_config(get_language_assistant)
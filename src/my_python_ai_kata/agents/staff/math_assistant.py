@@ -1,9 +1,12 @@
 """Math assistant agent for solving mathematical problems and providing educational explanations."""
 
 from strands import Agent, tool  # type: ignore
+from strands.models import Model
 from strands_tools import calculator  # type: ignore
 
 from my_python_ai_kata.agents.app_config import ModelConfig, get_or_create_ai_model
+from my_python_ai_kata.agents.staff.agent_pool import AgentPool
+from my_python_ai_kata.agents.streaming import relay_to
 
 MATH_ASSISTANT_SYSTEM_PROMPT = """
 You are math wizard, a specialized mathematics education assistant. Your capabilities include:
@@ -31,12 +34,13 @@ Focus on clarity and systematic problem-solving while ensuring students understa
 
 
 @tool
-def math_assistant(query: str) -> str:
+def math_assistant(query: str, agent: Agent | None = None) -> str:
     """
     Process and respond to math-related queries using a specialized math agent.
     
     Args:
         query: A mathematical question or problem from the user
+        agent: The agent calling the tool, which gets the tokens of the answer as they stream
         
     Returns:
         A detailed mathematical answer with explanations and steps
@@ -46,10 +50,9 @@ def math_assistant(query: str) -> str:
     
     try:
         print("Routed to Math Assistant")
-        # Create the math agent with calculator capability
-        math_agent = get_math_assistant()
-
-        agent_response = math_agent(formatted_query)
+        # Borrow a math agent with calculator capability
+        with math_assistant_pool.checkout() as math_agent:
+            agent_response = math_agent(formatted_query, callback_handler=relay_to(agent, "Math Assistant"))
         text_response = str(agent_response)
 
         if len(text_response) > 0:
@@ -61,19 +64,28 @@ def math_assistant(query: str) -> str:
         return f"Error processing your mathematical query: {str(e)}"
 
 
-def get_math_assistant() -> Agent:
+def get_math_assistant(model: Model | None = None) -> Agent:
     """
     Create and return a math assistant agent.
 
+    Args:
+        model: The model of the agent, by default the configured one
+
     Returns:
         A configured Strands Agent for math assistance
     """
-    model = get_or_create_ai_model(ModelConfig.from_config())
+    if model is None:
+        model = get_or_create_ai_model(ModelConfig.from_config())
     math_agent = Agent(
         name="Math Assistant",
         description="A specialized assistant for mathematics education and problem-solving.",
         system_prompt=MATH_ASSISTANT_SYSTEM_PROMPT,
         tools=[calculator],
+        callback_handler=None,
         model=model
     )
     return math_agent
+
+
+# Agents reused by the calls of the tool, reset between calls
+math_assistant_pool = AgentPool.from_config(get_math_assistant)
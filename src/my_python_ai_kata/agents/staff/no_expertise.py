@@ -1,8 +1,11 @@
 """English Assistant."""
 
 from strands import Agent, tool  # type: ignore
+from strands.models import Model
 
 from my_python_ai_kata.agents.app_config import ModelConfig, get_or_create_ai_model
+from my_python_ai_kata.agents.staff.agent_pool import AgentPool
+from my_python_ai_kata.agents.streaming import relay_to
 
 GENERAL_ASSISTANT_SYSTEM_PROMPT = """
 You are GeneralAssist, a concise general knowledge assistant for topics outside specialized domains. Your key characteristics are:
@@ -33,13 +36,14 @@ Always maintain accuracy while prioritizing conciseness and clarity in every res
 
 
 @tool
-def general_assistant(query: str) -> str:
+def general_assistant(query: str, agent: Agent | None = None) -> str:
     """
     Handle general knowledge queries that fall outside specialized domains.
     Provides concise, accurate responses to non-specialized questions.
 
     Args:
         query: The user's general knowledge question
+        agent: The agent calling the tool, which gets the tokens of the answer as they stream
 
     Returns:
         A concise response to the general knowledge query
@@ -49,9 +53,8 @@ def general_assistant(query: str) -> str:
 
     try:
         print("Routed to General Assistant")
-        general_agent = get_general_assistant()
-
-        agent_response = general_agent(formatted_query)
+        with general_assistant_pool.checkout() as general_agent:
+            agent_response = general_agent(formatted_query, callback_handler=relay_to(agent, "General Assistant"))
         text_response = str(agent_response)
 
         if len(text_response) > 0:
@@ -63,18 +66,27 @@ def general_assistant(query: str) -> str:
         return f"Error processing your question: {str(e)}"
 
 
-def get_general_assistant() -> Agent:
+def get_general_assistant(model: Model | None = None) -> Agent:
     """Create and return a general knowledge assistant agent.
 
+    Args:
+        model: The model of the agent, by default the configured one
+
     Returns:
         A configured Strands Agent for general knowledge assistance
     """
-    model = get_or_create_ai_model(ModelConfig.from_config())
+    if model is None:
+        model = get_or_create_ai_model(ModelConfig.from_config())
     general_agent = Agent(
         name="General Assistant",
         description="A general knowledge assistant for various topics while not being a specialist.",
         system_prompt=GENERAL_ASSISTANT_SYSTEM_PROMPT,
         tools=[],  # No specialized tools needed for general knowledge
+        callback_handler=None,
         model=model
     )
     return general_agent
+
+
+# Agents reused by the calls of the tool, reset between calls
+general_assistant_pool = AgentPool.from_config(get_general_assistant)
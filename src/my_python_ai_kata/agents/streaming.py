@@ -0,0 +1,126 @@
+"""Token streaming from the specialist agents, through the teacher agent, to the console.
+
+A specialist tool runs a whole sub-agent before returning its answer to the
+teacher agent, and the teacher agent only returns once its own final turn is
+done: printing the result of the teacher agent leaves the student waiting for
+every token of every model call. Strands tools only return a final result, so
+the text deltas of a specialist take another way out: the callback handler of
+its sub-agent, made by ``relay_to``, forwards them to the callback handler of
+the agent calling the tool, tagged with the name of the specialist.
+
+A ``TokenStream`` is such a callback handler at the end of the chain: it writes
+the deltas as they arrive, and times the first token of an answer apart from
+the whole answer.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from typing import Optional
+
+from strands import Agent
+from strands.handlers.callback_handler import null_callback_handler
+
+
+def _print(text: str) -> None:
+    """Print text right away, without a new line."""
+    print(text, end="", flush=True)
+
+
+@dataclass(frozen=True)
+class StreamTiming:
+    """When the tokens of an answer arrived."""
+
+    time_to_first_token: Optional[float]
+    total: float
+    chunks: int
+
+    def __str__(self) -> str:
+        """Return the timings in milliseconds."""
+        first = (
+            "no token"
+            if self.time_to_first_token is None
+            else f"first token after {self.time_to_first_token * 1000:.0f}ms"
+        )
+        return f"{first}, {self.chunks} chunk(s) in {self.total * 1000:.0f}ms"
+
+
+class TokenStream:
+    """Callback handler writing the text deltas of an answer as they arrive."""
+
+    def __init__(self, write: Optional[Callable[[str], None]] = None):
+        """Initialize the stream.
+
+        Args:
+            write (Optional[Callable[[str], None]]): Writes a text delta; by
+                default it is printed at once.
+        """
+        self.write = write or _print
+        self._lock = threading.Lock()
+        self.start()
+
+    def start(self) -> None:
+        """Start timing a new answer."""
+        with self._lock:
+            self.started = time.perf_counter()
+            self.first_token: Optional[float] = None
+            self.chunks = 0
+            self._source: Optional[str] = None
+
+    def __call__(self, **kwargs: Any) -> None:
+        """Write the text delta of a callback event, if any.
+
+        Args:
+            **kwargs: The callback event; ``data`` is a text delta, and
+                ``source`` names the specialist it comes from.
+        """
+        text = kwargs.get("data")
+        if not text:
+            return
+        source = kwargs.get("source")
+        with self._lock:
+            if self.first_token is None:
+                self.first_token = time.perf_counter()
+            self.chunks += 1
+            # Deltas of parallel specialists may interleave, each run of them gets a header
+            if source != self._source:
+                self.write(f"\n\n[{source}]\n" if source else "\n\n")
+                self._source = source
+            self.write(text)
+
+    def finish(self) -> StreamTiming:
+        """Return the timings of the answer so far.
+
+        Returns:
+            StreamTiming: The timings, from the last ``start``.
+        """
+        with self._lock:
+            first = (
+                None if self.first_token is None else self.first_token - self.started
+            )
+            return StreamTiming(first, time.perf_counter() - self.started, self.chunks)
+
+
+def relay_to(agent: Optional[Agent], source: str) -> Callable[..., None]:
+    """Create the callback handler of a specialist agent called by another agent.
+
+    Args:
+        agent (Optional[Agent]): The agent calling the specialist, None when
+            the specialist is called directly.
+        source (str): The name of the specialist.
+
+    Returns:
+        Callable[..., None]: Forwards the text deltas of the specialist to the
+        callback handler of the calling agent, or drops them without one.
+    """
+    if agent is None:
+        return null_callback_handler
+    parent = agent.callback_handler
+
+    def relay(**kwargs: Any) -> None:
+        if kwargs.get("data"):
+            parent(data=kwargs["data"], source=source)
+
+    return relay
@@ -7,11 +7,19 @@ A specialized Strands agent that is the orchestrator to utilize sub-agents and t
 ## What This Example Shows
 
 """
+import argparse
 import os
 import logging
+import threading
+import time
 import tomllib
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Literal
 
+from pydantic import BaseModel, Field
 from strands import Agent
 from strands.types.tools import AgentTool
 from strands.agent.conversation_manager import ConversationManager
@@ -22,7 +30,9 @@ from my_python_ai_kata.agents.staff.computer_science_assistant import computer_s
 from my_python_ai_kata.agents.staff.language_assistant import language_assistant
 from my_python_ai_kata.agents.staff.no_expertise import general_assistant
 
-from my_python_ai_kata.agents.app_config import ModelConfig, get_or_create_ai_model
+from my_python_ai_kata.agents.app_config import ModelConfig, get_application_config, get_or_create_ai_model
+from my_python_ai_kata.agents.pre_router import PRE_ROUTERS, PreRouter, RouteLog, build_pre_router
+from my_python_ai_kata.agents.streaming import TokenStream
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +91,301 @@ def get_teacher_agent(tools: list[AgentTool], conversation_manager: Conversation
     return teacher_agent
 
 
+PLANNER_SYSTEM_PROMPT = """
+You are TeachPlan, the planner of an educational orchestrator. Split the student query into the
+questions to ask to the specialists, one question per specialist that is actually needed:
+   - math: mathematical calculations, problems, and concepts
+   - english: writing, grammar, literature, and composition
+   - language: translation and language-related queries
+   - computer_science: programming, algorithms, data structures, and code execution
+   - general: all other topics outside these specialized domains
+
+Each question must be self-contained, as the specialists do not see the original query.
+Most queries need a single specialist; only split queries that span several subjects.
+"""
+
+DEFAULT_SPECIALIST_TIMEOUT_SECONDS: float = 120.0
+DEFAULT_MAX_PARALLEL_SPECIALISTS: int = 5
+
+Specialist = Literal["math", "english", "language", "computer_science", "general"]
+
+SPECIALIST_TITLES: dict[str, str] = {
+    "math": "Math Assistant",
+    "english": "English Assistant",
+    "language": "Language Assistant",
+    "computer_science": "Computer Science Assistant",
+    "general": "General Assistant",
+}
+
+
+# The tools of the local specialist agents, by specialist
+LOCAL_SPECIALISTS: dict[str, AgentTool] = {
+    "math": math_assistant,
+    "english": english_assistant,
+    "language": language_assistant,
+    "computer_science": computer_science_assistant,
+    "general": general_assistant,
+}
+
+
+class SpecialistTask(BaseModel):
+    """A question for a single specialist."""
+    specialist: Specialist = Field(description="The specialist to ask")
+    query: str = Field(description="The self-contained question for the specialist")
+
+
+class FanOutPlan(BaseModel):
+    """The specialists needed to answer a query, with their questions."""
+    tasks: list[SpecialistTask] = Field(description="One question per needed specialist")
+
+
+@dataclass
+class SpecialistAnswer:
+    """The outcome of a question asked to a specialist."""
+    task: SpecialistTask
+    answer: str | None
+    seconds: float
+    timed_out: bool = False
+
+
+@dataclass
+class FanOutResponse:
+    """The merged answer of the specialists to a query."""
+    answers: list[SpecialistAnswer]
+    seconds: float
+
+    @property
+    def message(self) -> str:
+        """The answers of the specialists, one section each."""
+        return merge_answers(self.answers)
+
+    def __str__(self) -> str:
+        """Return the merged answer."""
+        return self.message
+
+
+def get_planner_agent() -> Agent:
+    """Create the agent planning which specialists answer a query.
+
+    Returns:
+        Agent: The planner agent instance.
+    """
+    return Agent(
+        name="Teacher's Assistant Planner",
+        description="Plans which subject-specific agents answer a query.",
+        system_prompt=PLANNER_SYSTEM_PROMPT,
+        callback_handler=None,
+        model=get_or_create_ai_model(ModelConfig.from_config()),
+    )
+
+
+def wait_for_answer(future: Future[str], running: threading.Event, started_at: Callable[[], float],
+                    timeout: float, stalled: Callable[[], bool]) -> str:
+    """Wait for the answer of a specialist, up to its timeout from the moment it started running.
+
+    Args:
+        future (Future[str]): The answer of the specialist.
+        running (threading.Event): Set once the specialist started running.
+        started_at (Callable[[], float]): Returns when the specialist started running.
+        timeout (float): The maximum wait for the specialist once it runs, in seconds.
+        stalled (Callable[[], bool]): Whether the specialist can no longer get a thread to run on.
+
+    Returns:
+        str: The answer.
+
+    Raises:
+        TimeoutError: If the specialist did not answer in time, or could not start.
+    """
+    while not running.wait(0.01):
+        if stalled():
+            raise TimeoutError
+    return future.result(timeout=max(started_at() + timeout - time.perf_counter(), 0))
+
+
+def run_specialists(
+    tasks: list[SpecialistTask],
+    specialists: dict[str, Callable[[str], str]],
+    timeouts: dict[str, float],
+    max_workers: int = DEFAULT_MAX_PARALLEL_SPECIALISTS,
+) -> list[SpecialistAnswer]:
+    """Ask all the questions of a plan at the same time, waiting for each up to its timeout.
+
+    The specialists run on threads of their own, which a specialist that timed out keeps until it is
+    done: it never holds up the specialists of the next queries. The timeout of a specialist starts
+    when it starts running; a question still waiting for a thread while all of them are held by
+    specialists that timed out is given up on.
+
+    Args:
+        tasks (list[SpecialistTask]): The questions, with their specialists.
+        specialists (dict[str, Callable[[str], str]]): Answers a question, by specialist.
+        timeouts (dict[str, float]): The maximum wait for each specialist, in seconds.
+        max_workers (int): Number of specialists running at the same time.
+
+    Returns:
+        list[SpecialistAnswer]: The answers, in the order of the tasks.
+    """
+    started = time.perf_counter()
+    workers = max(1, min(max_workers, len(tasks)))
+    running = [threading.Event() for _ in tasks]
+    started_at: dict[int, float] = {}
+    finished: dict[int, float] = {}
+    abandoned: set[int] = set()
+
+    def ask(index: int, task: SpecialistTask) -> str:
+        started_at[index] = time.perf_counter()
+        running[index].set()
+        try:
+            return specialists[task.specialist](task.query)
+        finally:
+            finished[index] = time.perf_counter() - started
+
+    def stalled() -> bool:
+        return sum(1 for i in abandoned if i not in finished) >= workers
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="specialist")
+    futures: list[Future[str]] = [executor.submit(ask, i, task) for i, task in enumerate(tasks)]
+    answers = []
+    for i, (task, future) in enumerate(zip(tasks, futures)):
+        timeout = timeouts[task.specialist]
+        try:
+            answer = wait_for_answer(future, running[i], partial(started_at.__getitem__, i), timeout, stalled)
+        except TimeoutError:
+            # The specialist keeps running on its thread, but nobody waits for it
+            future.cancel()
+            abandoned.add(i)
+            logger.warning(f"{SPECIALIST_TITLES[task.specialist]} timed out after {timeout}s")
+            answers.append(SpecialistAnswer(task, None, time.perf_counter() - started, timed_out=True))
+            continue
+        except Exception as e:
+            answer = f"Error processing your query: {str(e)}"
+        answers.append(SpecialistAnswer(task, answer, finished.get(i, time.perf_counter() - started)))
+    executor.shutdown(wait=False, cancel_futures=True)
+    return answers
+
+
+def merge_answers(answers: list[SpecialistAnswer]) -> str:
+    """Merge the answers of the specialists in a single response.
+
+    Args:
+        answers (list[SpecialistAnswer]): The answers.
+
+    Returns:
+        str: The response, with a section per specialist when there are several.
+    """
+    texts = [
+        answer.answer if not answer.timed_out
+        else f"The {SPECIALIST_TITLES[answer.task.specialist]} did not answer in time, please ask again later."
+        for answer in answers
+    ]
+    if len(answers) == 1:
+        return texts[0]
+    return "\n\n".join(
+        f"## {SPECIALIST_TITLES[answer.task.specialist]}\n\n{text}" for answer, text in zip(answers, texts)
+    )
+
+
+class FanOutTeacher:
+    """Teacher's Assistant that asks all the needed specialists at the same time.
+
+    A planner splits the query into a question per needed specialist, the specialists answer
+    in parallel on threads of the query, each within its own timeout, and their answers are merged.
+    The latency of a query spanning several subjects is then close to the one of the slowest
+    specialist, instead of the total of all of them.
+    """
+
+    name = "Teacher's Assistant (fan-out)"
+
+    def __init__(
+        self,
+        specialists: dict[str, Callable[[str], str]],
+        planner: Callable[[str], FanOutPlan] | None = None,
+        timeout: float = DEFAULT_SPECIALIST_TIMEOUT_SECONDS,
+        timeouts: dict[str, float] | None = None,
+        max_workers: int = DEFAULT_MAX_PARALLEL_SPECIALISTS,
+    ):
+        """Initialize the orchestrator.
+
+        Args:
+            specialists (dict[str, Callable[[str], str]]): Answers a question, by specialist.
+            planner (Callable[[str], FanOutPlan] | None): Plans the questions of a query. By default
+                an LLM planner with the configured model.
+            timeout (float): The maximum wait for a specialist, in seconds.
+            timeouts (dict[str, float] | None): Overrides the timeout of some specialists.
+            max_workers (int): Number of specialists running at the same time.
+        """
+        if planner is None:
+            planner_agent = get_planner_agent()
+            planner = lambda query: planner_agent.structured_output(FanOutPlan, query)  # noqa: E731
+        self.specialists = specialists
+        self.planner = planner
+        self.timeouts = {name: timeout for name in specialists} | (timeouts or {})
+        self.max_workers = max_workers
+
+    def plan(self, query: str) -> FanOutPlan:
+        """Plan the questions of a query, falling back on the general assistant.
+
+        Args:
+            query (str): The student query.
+
+        Returns:
+            FanOutPlan: The plan, with a single task per specialist, asking all the questions planned
+            for it.
+        """
+        try:
+            plan = self.planner(query)
+        except Exception:
+            logger.exception("Could not plan the query, asking the general assistant")
+            plan = FanOutPlan(tasks=[])
+        tasks: dict[str, SpecialistTask] = {}
+        for task in plan.tasks:
+            if task.specialist not in self.specialists:
+                logger.warning(f"Dropped the question for the unknown {task.specialist} specialist")
+            elif task.specialist in tasks:
+                # A specialist gets all its questions at once
+                merged = f"{tasks[task.specialist].query}\n\n{task.query}"
+                tasks[task.specialist] = SpecialistTask(specialist=task.specialist, query=merged)
+            else:
+                tasks[task.specialist] = task
+        if not tasks:
+            tasks = {"general": SpecialistTask(specialist="general", query=query)}
+        return FanOutPlan(tasks=list(tasks.values()))
+
+    def __call__(self, query: str) -> FanOutResponse:
+        """Answer a query with all the needed specialists.
+
+        Args:
+            query (str): The student query.
+
+        Returns:
+            FanOutResponse: The answers of the specialists.
+        """
+        started = time.perf_counter()
+        plan = self.plan(query)
+        logger.info(f"Fan-out to {', '.join(task.specialist for task in plan.tasks)}")
+        answers = run_specialists(plan.tasks, self.specialists, self.timeouts, self.max_workers)
+        return FanOutResponse(answers, time.perf_counter() - started)
+
+    def close(self) -> None:
+        """Nothing to stop: the specialists still running after a timeout end on their own."""
+
+
+def get_fan_out_teacher() -> FanOutTeacher:
+    """Create the fan-out Teacher's Assistant with the local specialist agents.
+
+    The timeouts and parallelism come from the ``[agents]`` section of the application config.
+
+    Returns:
+        FanOutTeacher: The fan-out Teacher's Assistant.
+    """
+    agents_config = get_application_config().agents
+    return FanOutTeacher(
+        specialists=LOCAL_SPECIALISTS,  # type: ignore[arg-type]
+        timeout=agents_config.get("specialist_timeout_seconds", DEFAULT_SPECIALIST_TIMEOUT_SECONDS),
+        timeouts=agents_config.get("specialist_timeouts_seconds", {}),
+        max_workers=agents_config.get("max_parallel_specialists", DEFAULT_MAX_PARALLEL_SPECIALISTS),
+    )
+
+
 def load_config() -> dict[str, Any]:
     """Load configuration from config/config.toml.
 
@@ -104,14 +409,92 @@ def configure_logging() -> None:
         logging.basicConfig(level=logging.INFO)
 
 
-def start_interactive_session(teacher_assistant_agent: Agent) -> None:
-    """Starts an interactive session with the Teacher's Assistant agent.
+def specialist_tool_calls(teacher_assistant_agent: Agent) -> dict[str, int]:
+    """Count the calls of the teacher agent to each local specialist so far.
 
     Args:
         teacher_assistant_agent (Agent): The Teacher's Assistant agent instance.
+
+    Returns:
+        dict[str, int]: The number of calls, by specialist.
+    """
+    specialists = {tool.tool_name: name for name, tool in LOCAL_SPECIALISTS.items()}
+    return {
+        specialists[tool_name]: metrics.call_count
+        for tool_name, metrics in teacher_assistant_agent.event_loop_metrics.tool_metrics.items()
+        if tool_name in specialists
+    }
+
+
+def answer_query(
+    teacher_assistant_agent: Agent | FanOutTeacher,
+    query: str,
+    pre_router: PreRouter | None = None,
+    route_log: RouteLog | None = None,
+) -> Any:
+    """Answers a query, straight from a specialist when the pre-router is confident about it.
+
+    A pre-routed query and its answer are added to the conversation of the teacher agent, so that it
+    knows them when it answers the follow-up queries.
+
+    Args:
+        teacher_assistant_agent (Agent | FanOutTeacher): The Teacher's Assistant agent instance.
+        query (str): The student query.
+        pre_router (PreRouter | None): Sends the queries it is confident about straight to a local
+            specialist, skipping the teacher agent.
+        route_log (RouteLog | None): Records the specialist the teacher agent picked for the query, if
+            it routed it to a single one.
+
+    Returns:
+        Any: The answer of the specialist or of the teacher agent.
+    """
+    streamed_agent = teacher_assistant_agent if isinstance(teacher_assistant_agent, Agent) else None
+    decision = pre_router.route(query) if pre_router is not None else None
+    if decision is not None and decision.specialist is not None:
+        logger.info(f"Pre-routed to {decision.specialist} by {decision.router} ({decision.confidence:.2f})")
+        answer = LOCAL_SPECIALISTS[decision.specialist](query, agent=streamed_agent)
+        if streamed_agent is not None:
+            streamed_agent.messages.append({"role": "user", "content": [{"text": query}]})
+            streamed_agent.messages.append({"role": "assistant", "content": [{"text": str(answer)}]})
+        return answer
+
+    calls_before = specialist_tool_calls(streamed_agent) if streamed_agent is not None else {}
+    response = teacher_assistant_agent(query)
+    if route_log is not None and streamed_agent is not None:
+        calls = specialist_tool_calls(streamed_agent)
+        routed = [name for name, count in calls.items() if count > calls_before.get(name, 0)]
+        if len(routed) == 1:
+            route_log.append(query, routed[0])
+    logger.debug(f"Response from {teacher_assistant_agent.name}: {str(response)}")
+    return response
+
+
+def start_interactive_session(
+    teacher_assistant_agent: Agent | FanOutTeacher,
+    pre_router: PreRouter | None = None,
+    route_log: RouteLog | None = None,
+) -> None:
+    """Starts an interactive session with the Teacher's Assistant agent.
+
+    The answers of a teacher agent, and of the specialists it calls, are printed token by token as
+    they stream; the fan-out mode prints its merged answer once all the specialists are done. The time
+    to the first token and to the whole answer are logged for every query.
+
+    Args:
+        teacher_assistant_agent (Agent | FanOutTeacher): The Teacher's Assistant agent instance.
+        pre_router (PreRouter | None): Sends the queries it is confident about straight to a local
+            specialist, skipping the teacher agent.
+        route_log (RouteLog | None): Records the specialist the teacher agent picked for each query
+            routed to a single one, to train the pre-router.
     """
     configure_logging()
 
+    # The specialists called by the teacher agent relay their tokens to its callback handler
+    stream = TokenStream()
+    streamed_agent = teacher_assistant_agent if isinstance(teacher_assistant_agent, Agent) else None
+    if streamed_agent is not None:
+        streamed_agent.callback_handler = stream
+
     print("\n📁 Teacher's Assistant Strands Agent 📁\n")
     print("✅ Ask a question in any subject area, and I'll route it to the appropriate specialist.")
     print("✅ Type 'exit' to quit.")
@@ -124,19 +507,15 @@ def start_interactive_session(teacher_assistant_agent: Agent) -> None:
                 print("\n✅ Goodbye! 👋")
                 break
 
-            response = teacher_assistant_agent(
-                user_input,
-            )
-
-            # Extract and print only the relevant content from the specialized agent's response
-            # content = response.message
-            logger.debug(f"Response from {teacher_assistant_agent.name}: {str(response)}")
-            # all_text = ''.join(
-            #     item.get('text', '') for item in content['content']
-            # )
-            # logger.info(f"✅ {all_text}")
-            # print(all_text)
-            print(response.message)
+            stream.start()
+            response = answer_query(teacher_assistant_agent, user_input, pre_router, route_log)
+            timing = stream.finish()
+            if timing.chunks:
+                print()
+            else:
+                # Answers that did not stream, like the fan-out ones or errors, are printed whole
+                print(str(response))
+            logger.info(f"Answered with {timing}")
         except KeyboardInterrupt:
             print("\n\n✅ Execution interrupted. Exiting...")
             break
@@ -146,9 +525,33 @@ def start_interactive_session(teacher_assistant_agent: Agent) -> None:
 
 def start_teacher_agent() -> None:
     """Starts the Teacher's Assistant agent with local specialist agents."""
+    parser = argparse.ArgumentParser(description="Teacher's Assistant with local specialist agents")
+    parser.add_argument(
+        "--fan-out",
+        action="store_true",
+        help="ask all the specialists needed by a query at the same time, instead of letting the LLM call them in turn",
+    )
+    parser.add_argument(
+        "--pre-route",
+        choices=PRE_ROUTERS,
+        help="local router sending obvious queries straight to a specialist (default: pre_router in config)",
+    )
+    args = parser.parse_args()
+
+    agents_config = get_application_config().agents
+    route_log = RouteLog(agents_config.get("route_log", "./logs/routes.jsonl"))
+    pre_router = build_pre_router(args.pre_route or agents_config.get("pre_router", "off"), route_log)
+
+    if args.fan_out:
+        teacher = get_fan_out_teacher()
+        try:
+            start_interactive_session(teacher, pre_router)
+        finally:
+            teacher.close()
+        return
     tools: list[AgentTool] = [math_assistant, language_assistant, english_assistant, computer_science_assistant, general_assistant]
     teacher_agent = get_teacher_agent(tools, conversation_manager=None)
-    start_interactive_session(teacher_agent)
+    start_interactive_session(teacher_agent, pre_router, route_log)
 
 
 # Example usage
@@ -0,0 +1,198 @@
+"""Benchmark the overhead of routing a query to a specialist agent.
+
+Every specialist answers with a stub model, which replies at once without any
+network call, so the time of a route is the time spent around the model: by
+default the agents are built with the configured model client, then their
+model is swapped for the stub. Each specialist is called in two ways:
+
+* per call: the agent is built for the call, as the specialist tools did
+  before they had a pool;
+* pooled: the agent is checked out of an ``AgentPool`` and reset after the
+  call.
+
+For each way it prints the routes per second and the p50 / p99 route latency.
+Run it with::
+
+    python -m my_python_ai_kata.benchmarks.agent_pool --calls 200
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import time
+from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterable
+from collections.abc import Callable
+from typing import Any
+from typing import Optional
+
+import numpy as np
+from strands import Agent
+from strands.models import Model
+from strands.types.content import Messages
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+from my_python_ai_kata.agents.staff.agent_pool import AgentPool
+from my_python_ai_kata.agents.staff.computer_science_assistant import (
+    get_computer_science_assistant,
+)
+from my_python_ai_kata.agents.staff.english_assistant import get_english_assistant
+from my_python_ai_kata.agents.staff.language_assistant import get_language_assistant
+from my_python_ai_kata.agents.staff.math_assistant import get_math_assistant
+from my_python_ai_kata.agents.staff.no_expertise import get_general_assistant
+
+
+SPECIALISTS: dict[str, Callable[..., Agent]] = {
+    "math": get_math_assistant,
+    "english": get_english_assistant,
+    "language": get_language_assistant,
+    "computer science": get_computer_science_assistant,
+    "general": get_general_assistant,
+}
+
+
+class StubModel(Model):
+    """A model that streams a fixed reply, optionally after some latency."""
+
+    def __init__(
+        self,
+        reply: str = "42",
+        latency: float = 0.0,
+        chunks: int = 1,
+        chunk_latency: float = 0.0,
+    ):
+        """Initialize the stub.
+
+        Args:
+            reply (str): The text of every reply.
+            latency (float): Seconds waited before the first chunk of a reply.
+            chunks (int): Number of chunks the reply is streamed in.
+            chunk_latency (float): Seconds waited between two chunks.
+        """
+        self.config: dict[str, Any] = {"model_id": "stub"}
+        self.reply = reply
+        self.latency = latency
+        self.chunks = chunks
+        self.chunk_latency = chunk_latency
+
+    def update_config(self, **model_config: Any) -> None:
+        """Update the configuration of the stub."""
+        self.config.update(model_config)
+
+    def get_config(self) -> dict[str, Any]:
+        """Return the configuration of the stub."""
+        return self.config
+
+    async def structured_output(
+        self,
+        output_model: Any,
+        prompt: Messages,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Structured output is not supported by the stub."""
+        raise NotImplementedError("The stub model only streams text")
+        yield {}
+
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[list[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterable[StreamEvent]:
+        """Stream the reply, as a model answering without tool calls."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockStart": {"start": {}}}
+        size = -(-len(self.reply) // self.chunks)
+        for start in range(0, len(self.reply), size):
+            if start and self.chunk_latency:
+                await asyncio.sleep(self.chunk_latency)
+            yield {
+                "contentBlockDelta": {
+                    "delta": {"text": self.reply[start : start + size]}
+                }
+            }
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+
+def time_routes(calls: int, route: Callable[[], Any]) -> np.ndarray:
+    """Run routes one after another and time each of them.
+
+    Args:
+        calls (int): Number of routes.
+        route (Callable[[], Any]): Runs a route.
+
+    Returns:
+        np.ndarray: The latency of every route, in milliseconds.
+    """
+    timings = np.zeros(calls)
+    # Keep the console quiet, whatever the agents print
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(calls):
+            start = time.perf_counter()
+            route()
+            timings[i] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def benchmark(calls: int, configured_model: bool) -> None:
+    """Print the throughput and latency of the routes to every specialist.
+
+    Args:
+        calls (int): Number of routes per specialist and way.
+        configured_model (bool): Whether the agents are built with the
+            configured model client before it is swapped for the stub.
+    """
+    stub = StubModel()
+
+    def build(factory: Callable[..., Agent]) -> Agent:
+        agent = factory() if configured_model else factory(stub)
+        agent.model = stub
+        return agent
+
+    for name, factory in SPECIALISTS.items():
+        pool = AgentPool(lambda factory=factory: build(factory))
+
+        def per_call(factory: Callable[..., Agent] = factory) -> None:
+            build(factory)("What is 6 times 7?")
+
+        def pooled(pool: AgentPool = pool) -> None:
+            with pool.checkout() as agent:
+                agent("What is 6 times 7?")
+
+        for way, route in (("per call", per_call), ("pooled", pooled)):
+            timings = time_routes(calls, route)
+            print(
+                f"  {name:>16} {way:>8}: {calls / timings.sum() * 1000:.0f} routes/s, "
+                f"p50 {np.percentile(timings, 50):.3f}ms, "
+                f"p99 {np.percentile(timings, 99):.3f}ms"
+            )
+        print(f"  {name:>16} pool built {pool.created} agent(s)")
+
+
+def main() -> None:
+    """Time the routes to the specialists with and without agent pools."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument(
+        "--stub-only",
+        action="store_true",
+        help="build the agents with the stub model instead of the configured one",
+    )
+    args = parser.parse_args()
+
+    if not args.stub_only:
+        # The configured model client is built, but never called
+        os.environ.setdefault("OPENAI_API_KEY", "stub")
+        os.environ.setdefault("LITELLM_API_KEY", "stub")
+    benchmark(args.calls, not args.stub_only)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Benchmark the pooled MCP client against the serial calls of my_hello_client.
+
+The hello server is started over streamable HTTP. Several concurrent callers
+then run rounds of the calls of ``my_hello_client`` (a tool call and two
+resource reads), in three ways:
+
+* serial: a new client per round, awaiting every call in turn, as in the
+  original ``interact_with_server``;
+* warm serial: one client per caller, reused by its rounds;
+* pooled: a shared ``McpClientPool``, issuing the calls of a round together.
+
+For each way it prints the rounds per second and the p50 / p99 round latency.
+Run it with::
+
+    python -m my_python_ai_kata.benchmarks.client_pool --callers 8 --rounds 20
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+import numpy as np
+from fastmcp import Client
+
+from my_python_ai_kata.benchmarks.concurrent_queries import free_port
+from my_python_ai_kata.mcp.client_pool import McpClientPool
+
+
+async def serial_round(client: Client) -> None:
+    """Await the calls of a round one after another.
+
+    Args:
+        client (Client): A connected client.
+    """
+    await client.call_tool_mcp("greet", {"name": "Remote Client"})
+    await client.read_resource("data://config")
+    await client.read_resource("users://102/profile")
+
+
+async def run_callers(
+    callers: int, rounds: int, run_round: Callable[[int], Awaitable[None]]
+) -> tuple[float, np.ndarray]:
+    """Run concurrent callers, each running rounds in a row.
+
+    Args:
+        callers (int): Number of concurrent callers.
+        rounds (int): Number of rounds per caller.
+        run_round (Callable[[int], Awaitable[None]]): Runs a round of a caller.
+
+    Returns:
+        tuple[float, np.ndarray]: The wall time in seconds, and the latency of
+        every round in milliseconds.
+    """
+    timings: list[float] = []
+
+    async def caller(c: int) -> None:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await run_round(c)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller(c) for c in range(callers)))
+    return time.perf_counter() - start, np.array(timings)
+
+
+async def benchmark(url: str, callers: int, rounds: int) -> None:
+    """Print the throughput and latency percentiles of every way of calling.
+
+    Args:
+        url (str): The MCP endpoint.
+        callers (int): Number of concurrent callers.
+        rounds (int): Number of rounds per caller.
+    """
+
+    async def serial(c: int) -> None:
+        async with Client(url) as client:
+            await serial_round(client)
+
+    clients = [Client(url) for _ in range(callers)]
+    for client in clients:
+        await client.__aenter__()
+
+    async def warm_serial(c: int) -> None:
+        await serial_round(clients[c])
+
+    async with McpClientPool() as pool:
+
+        async def pooled(c: int) -> None:
+            await asyncio.gather(
+                pool.call_tool(url, "greet", {"name": "Remote Client"}),
+                pool.read_resource(url, "data://config"),
+                pool.read_resource(url, "users://102/profile"),
+            )
+
+        await pooled(0)
+        for name, run_round in (
+            ("serial", serial),
+            ("warm serial", warm_serial),
+            ("pooled", pooled),
+        ):
+            elapsed, timings = await run_callers(callers, rounds, run_round)
+            print(
+                f"  {name:>11}: {len(timings) / elapsed:.1f} rounds/s, "
+                f"p50 {np.percentile(timings, 50):.1f}ms, "
+                f"p99 {np.percentile(timings, 99):.1f}ms"
+            )
+        calls = np.array([t.seconds * 1000 for t in pool.timings])
+        print(
+            f"  pooled calls: {len(calls)}, p50 {np.percentile(calls, 50):.1f}ms, "
+            f"{sum(len(s) for s in pool._sessions.values())} sessions"
+        )
+    for client in clients:
+        await client.__aexit__(None, None, None)
+
+
+async def wait_until_ready(url: str, timeout: float) -> None:
+    """Wait for the server to answer the MCP handshake.
+
+    Args:
+        url (str): The MCP endpoint.
+        timeout (float): Maximum wait, in seconds.
+    """
+    started = time.perf_counter()
+    while True:
+        try:
+            async with Client(url):
+                return
+        except Exception:
+            if time.perf_counter() - started > timeout:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def main() -> None:
+    """Start the hello server and compare the ways of calling it."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    port = free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "my_python_ai_kata.mcp.my_hello_server",
+            "--transport",
+            "streamable-http",
+            "--port",
+            str(port),
+        ],
+        env=os.environ,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/mcp"
+    try:
+        asyncio.run(wait_until_ready(url, args.timeout))
+        print(f"{args.callers} callers x {args.rounds} rounds of 3 calls")
+        asyncio.run(benchmark(url, args.callers, args.rounds))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark the cold start of VectorStoreQueryHelper with each storage layout.
+
+A synthetic store is written to a temporary directory, then the helper is
+opened with the parquet and the memory-mapped layouts, and a first query is
+run. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.cold_start --chunks 20000 --dim 1536
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+from my_python_ai_kata.mcp.ingestion_pipeline import ParquetStoreWriter
+from my_python_ai_kata.mcp.mmap_vector_store import export_mmap_store
+from my_python_ai_kata.mcp.vector_store_helpers import VectorStoreQueryHelper
+
+
+def write_store(path: str, chunks: int, dim: int) -> None:
+    """Write a parquet store of random chunks.
+
+    Args:
+        path (str): Path to the parquet file.
+        chunks (int): Number of chunks.
+        dim (int): Embedding dimension.
+    """
+    rng = np.random.default_rng(0)
+    with ParquetStoreWriter(path, row_group_size=1024) as writer:
+        for i in range(chunks):
+            writer.write(
+                f"id-{i}",
+                f"synthetic chunk {i} " * 50,
+                {"source": f"https://example.com/{i}"},
+                rng.normal(size=dim),
+            )
+
+
+def main() -> None:
+    """Print the time to open the store and answer a first query, per layout."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=20_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        parquet_path = os.path.join(work_dir, "sklearn_vectorstore.parquet")
+        write_store(parquet_path, args.chunks, args.dim)
+        for dtype in ("float32", "float16"):
+            export_mmap_store(parquet_path, dtype)
+            for layout in ("parquet", "mmap"):
+                if layout == "parquet" and dtype == "float16":
+                    continue
+                start = time.perf_counter()
+                helper = VectorStoreQueryHelper(
+                    parquet_path,
+                    embeddings=FakeEmbeddings(size=args.dim),
+                    layout=layout,
+                    dtype=dtype,
+                )
+                opened = time.perf_counter() - start
+                helper.query("What is LangGraph?")
+                answered = time.perf_counter() - start
+                print(
+                    f"{layout:>7} ({dtype}): opened in {opened * 1000:.1f}ms, "
+                    f"first answer after {answered * 1000:.1f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
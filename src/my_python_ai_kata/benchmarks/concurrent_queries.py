@@ -0,0 +1,149 @@
+"""Benchmark concurrent MCP clients querying the vector store over streamable HTTP.
+
+A synthetic store is served by a local FastMCP server exposing the same query
+twice: as a blocking tool, which embeds and searches on the event loop like the
+original ``langgraph_query_tool``, and as an async tool using
+``VectorStoreQueryHelper.aquery``. A fake embedder simulates the latency of the
+embedding API, and the result caches are disabled so that every call embeds.
+For each tool it prints the throughput and the p50 / p99 call latency of many
+concurrent clients. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.concurrent_queries --clients 50
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import numpy as np
+import uvicorn
+from fastmcp import Client
+from mcp.server.fastmcp import FastMCP
+
+from my_python_ai_kata.benchmarks.cold_start import write_store
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+from my_python_ai_kata.mcp.vector_store_helpers import VectorStoreQueryHelper
+
+
+def free_port() -> int:
+    """Return a free local TCP port.
+
+    Returns:
+        int: The port number.
+    """
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def serve(helper: VectorStoreQueryHelper, port: int) -> uvicorn.Server:
+    """Serve the blocking and the async query tools on a background thread.
+
+    Args:
+        helper (VectorStoreQueryHelper): The query helper.
+        port (int): The local port to listen on.
+
+    Returns:
+        uvicorn.Server: The started server.
+    """
+    mcp = FastMCP("Concurrent-Queries-Benchmark", log_level="WARNING")
+
+    @mcp.tool()
+    def query_blocking(query: str) -> str:
+        return "\n\n".join(doc.page_content for doc in helper.query(query))
+
+    @mcp.tool()
+    async def query_async(query: str) -> str:
+        return "\n\n".join(doc.page_content for doc in await helper.aquery(query))
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            mcp.streamable_http_app(), port=port, log_level="warning", lifespan="on"
+        )
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def run_clients(
+    url: str, tool: str, clients: int, calls: int, argument: str = "query"
+) -> tuple[float, np.ndarray, int]:
+    """Run concurrent clients, each calling a tool several times in a row.
+
+    Args:
+        url (str): The MCP endpoint.
+        tool (str): The tool name.
+        clients (int): Number of concurrent clients.
+        calls (int): Number of calls per client.
+        argument (str): The name of the string argument of the tool.
+
+    Returns:
+        tuple[float, np.ndarray, int]: The wall time in seconds, the latency of
+        every successful call in milliseconds, and the number of failed calls.
+    """
+    timings: list[float] = []
+    failures = 0
+
+    async def client(c: int) -> None:
+        nonlocal failures
+        async with Client(url, timeout=120) as session:
+            for i in range(calls):
+                start = time.perf_counter()
+                try:
+                    await session.call_tool(tool, {argument: f"{tool} {c} {i}"})
+                except Exception:
+                    failures += 1
+                    continue
+                timings.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(c) for c in range(clients)))
+    return time.perf_counter() - start, np.array(timings), failures
+
+
+def main() -> None:
+    """Print the throughput and latency percentiles of each tool."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=4)
+    parser.add_argument("--chunks", type=int, default=10_000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        parquet_path = os.path.join(work_dir, "sklearn_vectorstore.parquet")
+        write_store(parquet_path, args.chunks, args.dim)
+        helper = VectorStoreQueryHelper(
+            parquet_path,
+            embeddings=FakeEmbeddings(size=args.dim, latency=args.latency),
+            layout="mmap",
+            cache_size=0,
+        )
+        port = free_port()
+        server = serve(helper, port)
+        url = f"http://127.0.0.1:{port}/mcp"
+        print(
+            f"{args.clients} clients x {args.calls} calls, {args.chunks} chunks, "
+            f"{args.latency * 1000:.0f}ms embedding latency"
+        )
+        for tool in ("query_blocking", "query_async"):
+            elapsed, timings, failures = asyncio.run(
+                run_clients(url, tool, args.clients, args.calls)
+            )
+            print(
+                f"  {tool:>14}: {len(timings) / elapsed:.1f} calls/s, "
+                f"p50 {np.percentile(timings, 50):.0f}ms, "
+                f"p99 {np.percentile(timings, 99):.0f}ms, {failures} failed"
+            )
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
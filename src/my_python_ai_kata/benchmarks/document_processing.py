@@ -0,0 +1,110 @@
+"""Benchmark serial against multi-process HTML extraction, splitting and token counting.
+
+The pages are a fixed, seeded set of synthetic documentation pages shaped like
+the LangGraph ones. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.document_processing --pages 500
+"""
+
+import argparse
+import os
+import random
+import time
+
+from langchain_core.documents import Document
+
+from my_python_ai_kata.mcp.document_processing import DEFAULT_CHUNK_OVERLAP
+from my_python_ai_kata.mcp.document_processing import DEFAULT_CHUNK_SIZE
+from my_python_ai_kata.mcp.document_processing import DocumentProcessor
+from my_python_ai_kata.mcp.tokenizers import count_tokens
+
+
+WORDS = (
+    "graph node edge state agent tool message checkpoint stream memory "
+    "thread config runnable interrupt human loop subgraph reducer schema"
+).split()
+
+
+def make_pages(pages: int, paragraphs: int, seed: int = 0) -> list[Document]:
+    """Generate a fixed set of HTML documentation pages.
+
+    Args:
+        pages (int): Number of pages.
+        paragraphs (int): Number of paragraphs per page.
+        seed (int): Seed of the word generator.
+
+    Returns:
+        list[Document]: Pages with their raw HTML as content.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    nav = '<a href="#">link</a>' * 50
+    documents = []
+    for i in range(pages):
+        body = "".join(
+            f"<h2>Section {j}</h2><p>{' '.join(rng.choices(WORDS, k=120))}</p>"
+            f"<pre><code>graph.add_node('{rng.choice(WORDS)}', fn)</code></pre>\n\n\n"
+            for j in range(paragraphs)
+        )
+        html = (
+            f"<html><head><title>Page {i}</title></head><body>"
+            f"<nav>{nav}</nav>"
+            f'<article class="md-content__inner">{body}</article></body></html>'
+        )
+        documents.append(Document(page_content=html, metadata={"source": f"{i}"}))
+    return documents
+
+
+def run(processor: DocumentProcessor, pages: list[Document]) -> tuple[float, int]:
+    """Process the pages and return the wall time in seconds and the chunk count.
+
+    Args:
+        processor (DocumentProcessor): The processor to benchmark.
+        pages (list[Document]): The raw HTML pages.
+
+    Returns:
+        tuple[float, int]: The elapsed wall time and the number of chunks.
+    """
+    start = time.perf_counter()
+    chunks = sum(len(p.chunks) for p in processor.map((page, None) for page in pages))
+    return time.perf_counter() - start, chunks
+
+
+def main() -> None:
+    """Print throughput for the serial and the multi-process stages."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--paragraphs", type=int, default=40)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--chunk-overlap", type=int, default=DEFAULT_CHUNK_OVERLAP)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1]
+    )
+    parser.add_argument(
+        "--chars",
+        action="store_true",
+        help="Measure chunks in characters instead of tiktoken tokens",
+    )
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages, args.paragraphs)
+    megabytes = sum(len(page.page_content) for page in pages) / 1e6
+    print(f"Processing {len(pages)} pages ({megabytes:.1f} MB of HTML)")
+    baseline = None
+    for workers in args.workers:
+        processor = DocumentProcessor(
+            chunk_size=args.chunk_size,
+            chunk_overlap=args.chunk_overlap,
+            length_function=len if args.chars else count_tokens,
+            max_workers=workers,
+        )
+        elapsed, chunks = run(processor, pages)
+        baseline = baseline or elapsed
+        print(
+            f"workers={workers:>3}: {elapsed:.2f}s, {len(pages) / elapsed:.0f} pages/s, "
+            f"{megabytes / elapsed:.1f} MB/s, {chunks} chunks, "
+            f"speedup {baseline / elapsed:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
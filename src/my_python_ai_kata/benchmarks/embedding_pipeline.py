@@ -0,0 +1,74 @@
+"""Benchmark the batched embedding pipeline against a local fake embedder.
+
+Run it with::
+
+    python -m my_python_ai_kata.benchmarks.embedding_pipeline --chunks 2000
+"""
+
+import argparse
+import time
+
+from my_python_ai_kata.mcp.embedding_pipeline import EmbeddingPipeline
+from my_python_ai_kata.mcp.embedding_pipeline import pack_batches
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+
+
+def run(
+    chunks: int,
+    tokens_per_chunk: int,
+    max_tokens: int,
+    latency: float,
+    concurrency: int,
+) -> float:
+    """Embed a synthetic corpus and return the wall time in seconds.
+
+    Args:
+        chunks (int): Number of chunks in the synthetic corpus.
+        tokens_per_chunk (int): Token count assumed for every chunk.
+        max_tokens (int): Token budget of a single embedding request.
+        latency (float): Simulated latency of every embedding request, in seconds.
+        concurrency (int): Maximum number of requests in flight.
+
+    Returns:
+        float: The elapsed wall time, in seconds.
+    """
+    embeddings = FakeEmbeddings(size=64, latency=latency)
+    pipeline = EmbeddingPipeline(embeddings, max_concurrency=concurrency)
+    texts = [f"synthetic chunk number {i}" for i in range(chunks)]
+    batches = pack_batches(texts, [tokens_per_chunk] * chunks, max_tokens=max_tokens)
+
+    start = time.perf_counter()
+    embedded = sum(len(batch) for batch, _ in pipeline.embed_batches(batches))
+    elapsed = time.perf_counter() - start
+    assert embedded == chunks  # noqa: S101
+    return elapsed
+
+
+def main() -> None:
+    """Print wall times for increasing concurrency limits."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--tokens-per-chunk", type=int, default=2000)
+    parser.add_argument("--max-tokens", type=int, default=250_000)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    total_tokens = args.chunks * args.tokens_per_chunk
+    print(
+        f"Embedding {args.chunks} chunks ({total_tokens} tokens), "
+        f"{args.latency}s per request"
+    )
+    for concurrency in args.concurrency:
+        elapsed = run(
+            args.chunks,
+            args.tokens_per_chunk,
+            args.max_tokens,
+            args.latency,
+            concurrency,
+        )
+        print(f"concurrency={concurrency:>3}: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark the fan-out mode of the Teacher's Assistant on multi-subject queries.
+
+The specialist agents answer with stub models, each after its own latency, as
+remote models would. A query spanning several subjects is then answered in
+two ways:
+
+* in turn: the specialists are asked one after another, as the teacher agent
+  does when the LLM calls one specialist tool per turn;
+* fan-out: a ``FanOutTeacher`` asks them at the same time.
+
+The planner is replaced by a fixed plan, so only the specialists are timed.
+For each way it prints the p50 / p99 query latency. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.fan_out --queries 10
+"""
+
+import argparse
+import contextlib
+import os
+import time
+from collections.abc import Callable
+
+import numpy as np
+from strands import Agent
+
+from my_python_ai_kata.agents.staff.agent_pool import AgentPool
+from my_python_ai_kata.agents.staff.computer_science_assistant import (
+    get_computer_science_assistant,
+)
+from my_python_ai_kata.agents.staff.english_assistant import get_english_assistant
+from my_python_ai_kata.agents.staff.math_assistant import get_math_assistant
+from my_python_ai_kata.agents.teachers_assistant import FanOutPlan
+from my_python_ai_kata.agents.teachers_assistant import FanOutTeacher
+from my_python_ai_kata.agents.teachers_assistant import SpecialistTask
+from my_python_ai_kata.benchmarks.agent_pool import StubModel
+
+
+SPECIALISTS: dict[str, Callable[..., Agent]] = {
+    "math": get_math_assistant,
+    "english": get_english_assistant,
+    "computer_science": get_computer_science_assistant,
+}
+
+
+def stub_specialist(
+    factory: Callable[..., Agent], latency: float
+) -> Callable[[str], str]:
+    """Return a specialist answering with pooled agents of a slow stub model.
+
+    Args:
+        factory (Callable[..., Agent]): Builds an agent of the specialist.
+        latency (float): Seconds the stub model waits before answering.
+
+    Returns:
+        Callable[[str], str]: Answers a question.
+    """
+    pool = AgentPool(lambda: factory(StubModel("Done.", latency=latency)))
+
+    def ask(query: str) -> str:
+        with pool.checkout() as agent:
+            return str(agent(query))
+
+    return ask
+
+
+def main() -> None:
+    """Time multi-subject queries answered in turn and with fan-out."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument(
+        "--latencies",
+        type=float,
+        nargs=3,
+        default=[0.4, 0.6, 0.5],
+        metavar=("MATH", "ENGLISH", "CS"),
+        help="seconds each specialist model takes to answer",
+    )
+    args = parser.parse_args()
+
+    specialists = {
+        name: stub_specialist(factory, latency)
+        for (name, factory), latency in zip(SPECIALISTS.items(), args.latencies)
+    }
+    tasks = [
+        SpecialistTask(specialist=name, query=f"A {name} question")
+        for name in specialists
+    ]
+    teacher = FanOutTeacher(specialists, planner=lambda query: FanOutPlan(tasks=tasks))
+
+    def in_turn() -> None:
+        for task in tasks:
+            specialists[task.specialist](task.query)
+
+    def fan_out() -> None:
+        teacher("A question spanning three subjects")
+
+    print(f"{args.queries} queries for {', '.join(specialists)} ({args.latencies}s)")
+    # The agents print their replies as they stream
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = []
+        for name, run in (("in turn", in_turn), ("fan-out", fan_out)):
+            timings = np.zeros(args.queries)
+            for i in range(args.queries):
+                start = time.perf_counter()
+                run()
+                timings[i] = (time.perf_counter() - start) * 1000
+            results.append((name, timings))
+    teacher.close()
+    for name, timings in results:
+        print(
+            f"  {name:>8}: p50 {np.percentile(timings, 50):.0f}ms, "
+            f"p99 {np.percentile(timings, 99):.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark the BM25 lexical index on a synthetic documentation corpus.
+
+Chunks are drawn from a Zipf-distributed vocabulary sprinkled with API names,
+and queries mix API names with common words. For every corpus size it prints
+the build time, the persisted size, and the p50 / p99 latency of a lexical
+query. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.lexical_index --sizes 1000 10000 50000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from my_python_ai_kata.mcp.lexical_index import BM25Index
+
+
+def make_corpus(
+    n: int, words_per_chunk: int = 400, vocabulary: int = 20_000, seed: int = 0
+) -> tuple[list[str], list[str]]:
+    """Generate synthetic chunks and the API names they mention.
+
+    Args:
+        n (int): Number of chunks.
+        words_per_chunk (int): Number of words per chunk.
+        vocabulary (int): Number of distinct plain words.
+        seed (int): Random seed.
+
+    Returns:
+        tuple[list[str], list[str]]: The chunks and the API names.
+    """
+    rng = np.random.default_rng(seed)
+    words = np.array([f"word{i}" for i in range(vocabulary)])
+    api_names = [f"Graph{i}.add_node_{i}" for i in range(vocabulary // 10)]
+    chunks = []
+    for _ in range(n):
+        ranks = np.minimum(rng.zipf(1.2, size=words_per_chunk), vocabulary) - 1
+        names = rng.choice(api_names, size=3)
+        chunks.append(" ".join(words[ranks]) + " " + " ".join(names))
+    return chunks, api_names
+
+
+def main() -> None:
+    """Print build time, index size and query latency percentiles per size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    for size in args.sizes:
+        chunks, api_names = make_corpus(size)
+        queries = [
+            f"how to use {rng.choice(api_names)} with word{rng.integers(100)}"
+            for _ in range(args.queries)
+        ]
+        index = BM25Index()
+        start = time.perf_counter()
+        index.build(chunks)
+        build_time = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "store.bm25.index")
+            index.save(path)
+            size_mb = os.path.getsize(path) / 1e6
+            start = time.perf_counter()
+            index.load(path)
+            load_time = time.perf_counter() - start
+
+        timings = np.zeros(len(queries))
+        for i, query in enumerate(queries):
+            start = time.perf_counter()
+            index.search([query], args.k)
+            timings[i] = (time.perf_counter() - start) * 1000
+        print(
+            f"{size} chunks, {len(index.terms)} terms: build {build_time:.1f}s, "
+            f"{size_mb:.1f} MB, load {load_time * 1000:.0f}ms, "
+            f"query p50 {np.percentile(timings, 50):.3f}ms, "
+            f"p99 {np.percentile(timings, 99):.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
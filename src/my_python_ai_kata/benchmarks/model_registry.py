@@ -0,0 +1,191 @@
+"""Benchmark the shared model registry against a model client per agent call.
+
+A fake OpenAI-compatible chat completions server is started on localhost; it
+streams a fixed reply and records the client port of every request, hence
+the number of connections the clients opened. Agents then answer in a row:
+
+* per call: with a new OpenAI model, and HTTP client, for every call, as
+  ``get_or_create_ai_model`` created them before the registry;
+* shared: with the model of the registry, whose requests reuse the kept-alive
+  connections of one client.
+
+For each way it prints the calls per second, the p50 / p99 call latency and
+the connections opened. The server is plain HTTP, so the TLS handshakes that
+a remote API adds to every new connection are not counted. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.model_registry --calls 200
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+
+import numpy as np
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from strands import Agent
+from strands.models import Model
+from strands.models.openai import OpenAIModel
+
+from my_python_ai_kata.agents.app_config import ModelConfig
+from my_python_ai_kata.agents.app_config import ModelRegistry
+from my_python_ai_kata.agents.app_config import ModelType
+from my_python_ai_kata.benchmarks.concurrent_queries import free_port
+
+
+def fake_openai_app(
+    reply: str, chunks: int = 1, latency: float = 0.0, connections: set | None = None
+) -> Starlette:
+    """Create a server answering chat completions with a streamed fixed reply.
+
+    Args:
+        reply (str): The text of every reply.
+        chunks (int): Number of chunks the reply is streamed in.
+        latency (float): Seconds waited before the first chunk, and between chunks.
+        connections (set | None): Collects the client address of every request.
+
+    Returns:
+        Starlette: The application, serving ``/v1/chat/completions``.
+    """
+    size = -(-len(reply) // chunks)
+
+    async def completions(request: Request) -> StreamingResponse:
+        if connections is not None and request.client is not None:
+            connections.add((request.client.host, request.client.port))
+        body = await request.json()
+
+        def event(choices: list[dict], **extra: object) -> str:
+            chunk = {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": body.get("model", "fake"),
+                "choices": choices,
+                **extra,
+            }
+            return f"data: {json.dumps(chunk)}\n\n"
+
+        def delta(content: dict, finish_reason: str | None = None) -> str:
+            return event(
+                [{"index": 0, "delta": content, "finish_reason": finish_reason}]
+            )
+
+        async def events() -> AsyncIterator[str]:
+            yield delta({"role": "assistant", "content": ""})
+            for start in range(0, len(reply), size):
+                if latency:
+                    await asyncio.sleep(latency)
+                yield delta({"content": reply[start : start + size]})
+            yield delta({}, "stop")
+            usage = {
+                "prompt_tokens": 1,
+                "completion_tokens": chunks,
+                "total_tokens": chunks + 1,
+            }
+            yield event([], usage=usage)
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return Starlette(
+        routes=[Route("/v1/chat/completions", completions, methods=["POST"])]
+    )
+
+
+def serve_in_thread(app: Starlette, port: int) -> uvicorn.Server:
+    """Serve an application on localhost from a daemon thread.
+
+    Args:
+        app (Starlette): The application.
+        port (int): The port.
+
+    Returns:
+        uvicorn.Server: The started server.
+    """
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def time_calls(calls: int, model: Callable[[], Model]) -> np.ndarray:
+    """Run agent calls one after another and time each of them.
+
+    Args:
+        calls (int): Number of calls.
+        model (Callable[[], Model]): Returns the model of each call.
+
+    Returns:
+        np.ndarray: The latency of every call, in milliseconds.
+    """
+    timings = np.zeros(calls)
+    for i in range(calls):
+        start = time.perf_counter()
+        Agent(model=model(), callback_handler=None)("What is 6 times 7?")
+        timings[i] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def main() -> None:
+    """Start the fake model server and compare the ways of getting models."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--chunks", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    connections: set = set()
+    port = free_port()
+    server = serve_in_thread(
+        fake_openai_app(
+            "Six times seven is 42.", args.chunks, args.latency, connections
+        ),
+        port,
+    )
+    model_config = ModelConfig(
+        model_type=ModelType.OPENAI,
+        api_key="fake",
+        base_url=f"http://127.0.0.1:{port}/v1",
+        model_id="fake",
+        max_tokens=100,
+        temperature=0.0,
+    )
+    registry = ModelRegistry()
+
+    def per_call() -> Model:
+        return OpenAIModel(
+            client_args={
+                "api_key": model_config.api_key,
+                "base_url": model_config.base_url,
+            },
+            model_id=model_config.model_id,
+        )
+
+    try:
+        for name, model in (
+            ("per call", per_call),
+            ("shared", lambda: registry.get(model_config)),
+        ):
+            connections.clear()
+            timings = time_calls(args.calls, model)
+            print(
+                f"  {name:>8}: {args.calls / timings.sum() * 1000:.0f} calls/s, "
+                f"p50 {np.percentile(timings, 50):.2f}ms, "
+                f"p99 {np.percentile(timings, 99):.2f}ms, "
+                f"{len(connections)} connection(s)"
+            )
+    finally:
+        registry.shutdown()
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark an MCP server over streamable HTTP as worker processes are added.
+
+The LangGraph documentation server is started on a synthetic store, shared by
+its workers through the ``mmap`` layout, or the hello server is started, with
+each number of workers in turn. Once every worker answers, many concurrent
+``fastmcp.Client`` sessions call a tool, and the throughput and the p50 / p99
+call latency are printed per number of workers. Queries are lexical, so that
+no embedding API is needed. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.multi_worker --workers 1 2 4 --clients 64
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from fastmcp import Client
+
+from my_python_ai_kata.benchmarks.cold_start import write_store
+from my_python_ai_kata.benchmarks.concurrent_queries import free_port
+from my_python_ai_kata.benchmarks.concurrent_queries import run_clients
+from my_python_ai_kata.mcp.lexical_index import build_lexical_index
+from my_python_ai_kata.mcp.mmap_vector_store import export_mmap_store
+
+
+CONFIG = """
+[vector_store]
+path = "{work_dir}"
+layout = "mmap"
+retrieval_mode = "lexical"
+warmup_queries = ["synthetic chunk 1"]
+"""
+
+SERVERS = {
+    "langgraph": ("my_python_ai_kata.mcp.langgraph_query_tool", "langgraph_query_tool"),
+    "hello": ("my_python_ai_kata.mcp.my_hello_server", "greet"),
+}
+
+
+async def wait_until_ready(
+    url: str, tool: str, argument: str, workers: int, timeout: float
+) -> None:
+    """Call a tool until as many sessions as workers succeed at once.
+
+    Args:
+        url (str): The MCP endpoint.
+        tool (str): The tool name.
+        argument (str): The name of the string argument of the tool.
+        workers (int): Number of worker processes.
+        timeout (float): Maximum wait, in seconds.
+    """
+
+    async def call() -> None:
+        async with Client(url, timeout=timeout) as client:
+            await client.call_tool(tool, {argument: "warm-up"})
+
+    started = time.perf_counter()
+    while True:
+        try:
+            await asyncio.gather(*(call() for _ in range(2 * workers)))
+            return
+        except Exception:
+            if time.perf_counter() - started > timeout:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def main() -> None:
+    """Print the throughput and latency percentiles per number of workers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--server", choices=sorted(SERVERS), default="langgraph")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--stateful", action="store_true")
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--calls", type=int, default=8)
+    parser.add_argument("--chunks", type=int, default=20_000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+
+    module, tool = SERVERS[args.server]
+    argument = "query" if args.server == "langgraph" else "name"
+    with tempfile.TemporaryDirectory() as work_dir:
+        if args.server == "langgraph":
+            parquet_path = os.path.join(work_dir, "sklearn_vectorstore.parquet")
+            write_store(parquet_path, args.chunks, args.dim)
+            export_mmap_store(parquet_path)
+            build_lexical_index(parquet_path)
+            with open(os.path.join(work_dir, "config.toml"), "w") as f:
+                f.write(CONFIG.format(work_dir=work_dir))
+        print(
+            f"{args.server} server, {os.cpu_count()} CPUs, "
+            f"{args.clients} clients x {args.calls} calls"
+        )
+        for workers in args.workers:
+            port = free_port()
+            server = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    module,
+                    "--transport",
+                    "streamable-http",
+                    "--port",
+                    str(port),
+                    "--workers",
+                    str(workers),
+                ]
+                + (["--stateful"] if args.stateful else []),
+                env={
+                    **os.environ,
+                    "APP_CONFIG_DIR": work_dir,
+                    "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "unused"),
+                },
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            url = f"http://127.0.0.1:{port}/mcp"
+            try:
+                asyncio.run(
+                    wait_until_ready(url, tool, argument, workers, args.timeout)
+                )
+                elapsed, timings, failures = asyncio.run(
+                    run_clients(url, tool, args.clients, args.calls, argument)
+                )
+            finally:
+                server.terminate()
+                server.wait()
+            print(
+                f"  {workers:>2} workers: {len(timings) / elapsed:.1f} calls/s, "
+                f"p50 {np.percentile(timings, 50):.0f}ms, "
+                f"p99 {np.percentile(timings, 99):.0f}ms, {failures} failed"
+            )
+
+
+if __name__ == "__main__":
+    main()
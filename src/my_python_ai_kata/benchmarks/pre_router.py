@@ -0,0 +1,143 @@
+"""Report the accuracy and the latency savings of the pre-routers offline.
+
+The labelled queries are the bundled routing examples, plus the routes logged
+by the Teacher's Assistant if ``--log`` names its route log. The classifier is
+evaluated with stratified k-fold cross-validation, so that it never routes a
+query it was trained on; the keyword rules were written with the bundled
+examples at hand, so their figures on those are optimistic. All the pre-routers
+are then evaluated on the held-out examples, which neither the rules nor the
+classifier saw.
+
+For each pre-router it prints:
+
+* coverage: the share of queries it routes locally;
+* accuracy: the share of those it sends to the labelled specialist;
+* the p50 / p99 latency of a routing decision;
+* the latency saved per query on average, as the routed queries skip the LLM
+  routing turn of the teacher agent, whose duration is given by ``--llm-hop-ms``.
+
+Run it with::
+
+    python -m my_python_ai_kata.benchmarks.pre_router --log logs/routes.jsonl
+"""
+
+import argparse
+import time
+
+import numpy as np
+from sklearn.model_selection import StratifiedKFold
+
+from my_python_ai_kata.agents.pre_router import ClassifierRouter
+from my_python_ai_kata.agents.pre_router import KeywordRouter
+from my_python_ai_kata.agents.pre_router import PreRouter
+from my_python_ai_kata.agents.pre_router import RouteDecision
+from my_python_ai_kata.agents.pre_router import RouteLog
+from my_python_ai_kata.agents.routing_examples import HELD_OUT_ROUTING_EXAMPLES
+from my_python_ai_kata.agents.routing_examples import ROUTING_EXAMPLES
+
+
+def evaluate(
+    name: str,
+    examples: list[tuple[str, str]],
+    decisions: list[RouteDecision],
+    timings: np.ndarray,
+    llm_hop_ms: float,
+) -> None:
+    """Print the coverage, accuracy, latency and savings of a pre-router.
+
+    Args:
+        name (str): The name of the pre-router.
+        examples (list[tuple[str, str]]): The labelled queries.
+        decisions (list[RouteDecision]): The decision for every query.
+        timings (np.ndarray): The latency of every decision, in microseconds.
+        llm_hop_ms (float): The latency of the LLM routing turn, in milliseconds.
+    """
+    routed = [
+        (decision.specialist, label)
+        for decision, (_, label) in zip(decisions, examples)
+        if decision.confident
+    ]
+    coverage = len(routed) / len(examples)
+    correct = sum(1 for specialist, label in routed if specialist == label)
+    accuracy = correct / len(routed) if routed else 0.0
+    print(
+        f"  {name:>10}: coverage {coverage:.0%}, accuracy {accuracy:.0%} "
+        f"({correct}/{len(routed)}), "
+        f"p50 {np.percentile(timings, 50):.0f}us, p99 {np.percentile(timings, 99):.0f}us, "
+        f"saves {coverage * llm_hop_ms:.0f}ms per query"
+    )
+
+
+def decide(
+    router: PreRouter, queries: list[str]
+) -> tuple[list[RouteDecision], list[float]]:
+    """Route queries and time each decision.
+
+    Args:
+        router (PreRouter): The pre-router.
+        queries (list[str]): The queries.
+
+    Returns:
+        tuple[list[RouteDecision], list[float]]: The decisions, and their
+        latency in microseconds.
+    """
+    decisions, timings = [], []
+    for query in queries:
+        start = time.perf_counter()
+        decisions.append(router.route(query))
+        timings.append((time.perf_counter() - start) * 1e6)
+    return decisions, timings
+
+
+def main() -> None:
+    """Evaluate the keyword, classifier and chained pre-routers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--log", help="route log of the Teacher's Assistant")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument(
+        "--llm-hop-ms",
+        type=float,
+        default=1000.0,
+        help="latency of the routing turn of the teacher agent",
+    )
+    args = parser.parse_args()
+
+    examples = list(ROUTING_EXAMPLES)
+    if args.log:
+        examples += RouteLog(args.log).load()
+    queries = [query for query, _ in examples]
+    labels = [label for _, label in examples]
+    print(f"{len(examples)} labelled queries, {args.folds}-fold cross-validation")
+
+    keywords = KeywordRouter()
+    decisions, timings = decide(PreRouter([keywords]), queries)
+    evaluate("keywords", examples, decisions, np.array(timings), args.llm_hop_ms)
+
+    folds = StratifiedKFold(args.folds, shuffle=True, random_state=0)
+    for name, with_keywords in (("classifier", False), ("both", True)):
+        decisions = [RouteDecision(None, 0.0, "none")] * len(examples)
+        timings = [0.0] * len(examples)
+        for train, test in folds.split(queries, labels):
+            classifier = ClassifierRouter([examples[i] for i in train])
+            router = PreRouter(
+                [keywords, classifier] if with_keywords else [classifier]
+            )
+            fold_decisions, fold_timings = decide(router, [queries[i] for i in test])
+            for i, decision, timing in zip(test, fold_decisions, fold_timings):
+                decisions[i], timings[i] = decision, timing
+        evaluate(name, examples, decisions, np.array(timings), args.llm_hop_ms)
+
+    held_out = HELD_OUT_ROUTING_EXAMPLES
+    print(f"{len(held_out)} held-out queries")
+    classifier = ClassifierRouter(examples)
+    for name, router in (
+        ("keywords", PreRouter([keywords])),
+        ("classifier", PreRouter([classifier])),
+        ("both", PreRouter([keywords, classifier])),
+    ):
+        decisions, timings = decide(router, [query for query, _ in held_out])
+        evaluate(name, held_out, decisions, np.array(timings), args.llm_hop_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark quantized indexes: memory, latency and recall@k against exact search.
+
+Every mode scans its compact codes, then re-ranks a shortlist of candidates
+against the full precision vectors, which are memory-mapped from disk as in
+the query servers. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.quantization --size 100000 --dim 1024
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from my_python_ai_kata.benchmarks.vector_index import latencies
+from my_python_ai_kata.benchmarks.vector_index import make_vectors
+from my_python_ai_kata.benchmarks.vector_index import recall
+from my_python_ai_kata.mcp.vector_index import ExactIndex
+from my_python_ai_kata.mcp.vector_index import QuantizedIndex
+from my_python_ai_kata.mcp.vector_index import create_index
+from my_python_ai_kata.mcp.vector_index import normalize
+
+
+def main() -> None:
+    """Print memory, latency percentiles and recall@k per quantization mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--shortlists", type=int, nargs="+", default=[0, 4, 10])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    vectors = normalize(make_vectors(args.size, args.dim))
+    picks = rng.integers(args.size, size=args.queries)
+    queries = vectors[picks] + 0.1 * rng.normal(size=(args.queries, args.dim))
+    print(f"{args.size} vectors of dimension {args.dim}, {args.queries} queries")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, "vectors.npy")
+        np.save(path, vectors)
+        mapped = np.load(path, mmap_mode="r")
+
+        exact = ExactIndex(normalized=True)
+        exact.build(vectors)
+        expected, timings = latencies(exact, queries, args.k)
+        print(
+            f"{'exact float32':>16}: {vectors.nbytes / 1e6:8.1f} MB, "
+            f"recall@{args.k} 1.000, p50 {np.percentile(timings, 50):.2f}ms, "
+            f"p99 {np.percentile(timings, 99):.2f}ms"
+        )
+        for mode in ("float16", "int8", "binary"):
+            for shortlist in args.shortlists:
+                index = create_index(mode, shortlist=shortlist)
+                assert isinstance(index, QuantizedIndex)  # noqa: S101
+                start = time.perf_counter()
+                index.build(mapped)
+                build_time = time.perf_counter() - start
+                found, timings = latencies(index, queries, args.k)
+                print(
+                    f"{f'{mode} x{shortlist}':>16}: "
+                    f"{index.codes.nbytes / 1e6:8.1f} MB, "
+                    f"recall@{args.k} {recall(expected, found):.3f}, "
+                    f"p50 {np.percentile(timings, 50):.2f}ms, "
+                    f"p99 {np.percentile(timings, 99):.2f}ms, "
+                    f"build {build_time:.1f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
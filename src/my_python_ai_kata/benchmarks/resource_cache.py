@@ -0,0 +1,124 @@
+"""Benchmark repeated reads of unchanged resources of the hello server.
+
+On the server side, it times the serialization of user profiles of several
+sizes against the reuse of their cached payload. On the client side, the hello server is started
+over streamable HTTP and the same resources are read over and over through a
+pool without and with the resource cache, then once more after every profile
+was updated, which makes the server notify the changes. For each case it
+prints the reads per second and the p50 / p99 read latency. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.resource_cache --reads 500
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pydantic_core
+
+from my_python_ai_kata.benchmarks.client_pool import wait_until_ready
+from my_python_ai_kata.benchmarks.concurrent_queries import free_port
+from my_python_ai_kata.mcp.client_pool import McpClientPool
+from my_python_ai_kata.mcp.resource_cache import VersionedPayloadCache
+
+
+URIS = ["data://config", "users://101/profile", "users://102/profile"]
+
+
+def time_server_side(reads: int, items: int) -> None:
+    """Print the cost of serializing a profile and of reusing its payload.
+
+    Args:
+        reads (int): Number of reads.
+        items (int): Number of items listed in the profile.
+    """
+    profile = {"name": "Alice", "status": "active", "tags": list(range(items))}
+    cache = VersionedPayloadCache()
+    for name, read in (
+        ("serialize", lambda: pydantic_core.to_json(profile, fallback=str).decode()),
+        ("cached", lambda: cache.payload("users://101/profile", lambda: profile)),
+    ):
+        start = time.perf_counter()
+        for _ in range(reads):
+            read()
+        print(
+            f"  server {name:>9} ({items} items): "
+            f"{(time.perf_counter() - start) / reads * 1e6:.2f}us per read"
+        )
+
+
+async def time_client_side(url: str, reads: int) -> None:
+    """Print the throughput and latency of repeated reads through a pool.
+
+    Args:
+        url (str): The MCP endpoint.
+        reads (int): Number of reads per case.
+    """
+
+    async def run(pool: McpClientPool, name: str) -> None:
+        timings = np.zeros(reads)
+        start = time.perf_counter()
+        for i in range(reads):
+            read_start = time.perf_counter()
+            await pool.read_resource(url, URIS[i % len(URIS)])
+            timings[i] = (time.perf_counter() - read_start) * 1000
+        elapsed = time.perf_counter() - start
+        print(
+            f"  client {name:>9}: {reads / elapsed:.0f} reads/s, "
+            f"p50 {np.percentile(timings, 50):.3f}ms, "
+            f"p99 {np.percentile(timings, 99):.3f}ms"
+        )
+
+    async with McpClientPool() as pool:
+        await run(pool, "uncached")
+    async with McpClientPool(cache_resources=True) as pool:
+        await run(pool, "cached")
+        for user_id in (101, 102):
+            await pool.call_tool(
+                url,
+                "update_user_profile",
+                {"user_id": user_id, "name": f"User {user_id}", "status": "active"},
+            )
+        await run(pool, "updated")
+
+
+def main() -> None:
+    """Time the server-side and the client-side resource caches."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=500)
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 1000])
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    for items in args.items:
+        time_server_side(args.reads * 20, items)
+    port = free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "my_python_ai_kata.mcp.my_hello_server",
+            "--transport",
+            "streamable-http",
+            "--port",
+            str(port),
+        ],
+        env=os.environ,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/mcp"
+    try:
+        asyncio.run(wait_until_ready(url, args.timeout))
+        asyncio.run(time_client_side(url, args.reads))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark the startup policies of the LangGraph documentation MCP server.
+
+A synthetic store is written to a temporary directory, and the server is
+started with each policy over streamable HTTP, pointed at the store by a
+temporary configuration. A client polls the server until the MCP handshake
+succeeds, then calls the query tool once. For each policy it prints the time
+from the process start to the first handshake and to the first answer. Queries
+are lexical, so that no embedding API is needed. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.startup --chunks 20000 --dim 1536
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from fastmcp import Client
+
+from my_python_ai_kata.benchmarks.cold_start import write_store
+from my_python_ai_kata.benchmarks.concurrent_queries import free_port
+from my_python_ai_kata.mcp.lexical_index import build_lexical_index
+from my_python_ai_kata.mcp.startup import STARTUP_POLICIES
+
+
+CONFIG = """
+[vector_store]
+path = "{work_dir}"
+startup = "{startup}"
+warmup_queries = ["synthetic chunk 1"]
+retrieval_mode = "lexical"
+"""
+
+
+async def measure(url: str, started: float, timeout: float) -> tuple[float, float]:
+    """Wait for the server handshake, then for the answer of a first query.
+
+    Args:
+        url (str): The MCP endpoint.
+        started (float): The perf_counter time the server process was started.
+        timeout (float): Maximum wait, in seconds.
+
+    Returns:
+        tuple[float, float]: The seconds to the first handshake and to the
+        first answer.
+    """
+    while True:
+        try:
+            async with Client(url, timeout=timeout) as client:
+                handshake = time.perf_counter() - started
+                await client.call_tool(
+                    "langgraph_query_tool", {"query": "synthetic chunk 42"}
+                )
+                return handshake, time.perf_counter() - started
+        except Exception:
+            if time.perf_counter() - started > timeout:
+                raise
+            await asyncio.sleep(0.02)
+
+
+def main() -> None:
+    """Print the time to the first handshake and to the first answer per policy."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=20_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        parquet_path = os.path.join(work_dir, "sklearn_vectorstore.parquet")
+        write_store(parquet_path, args.chunks, args.dim)
+        build_lexical_index(parquet_path)
+        print(f"{args.chunks} chunks of dimension {args.dim}")
+        for startup in STARTUP_POLICIES:
+            with open(os.path.join(work_dir, "config.toml"), "w") as f:
+                f.write(CONFIG.format(work_dir=work_dir, startup=startup))
+            port = free_port()
+            started = time.perf_counter()
+            server = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "my_python_ai_kata.mcp.langgraph_query_tool",
+                    "--transport",
+                    "streamable-http",
+                    "--port",
+                    str(port),
+                ],
+                env={
+                    **os.environ,
+                    "APP_CONFIG_DIR": work_dir,
+                    "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "unused"),
+                },
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                handshake, answer = asyncio.run(
+                    measure(f"http://127.0.0.1:{port}/mcp", started, args.timeout)
+                )
+            finally:
+                server.terminate()
+                server.wait()
+            print(
+                f"  {startup:>10}: first handshake {handshake:.2f}s, "
+                f"first answer {answer:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Benchmark the time to the first token of the Teacher's Assistant against its total latency.
+
+The teacher agent and the math specialist answer with stub models streaming
+their replies in chunks, with a delay before the first chunk and between two
+chunks, as a remote model would: the teacher model first calls the math
+specialist tool, then writes a short conclusion. Every query is answered in two
+ways:
+
+* buffered: the answer is printed once the teacher agent returns, as the
+  interactive session did before it streamed, so the first token reaches the
+  student with the last one;
+* streamed: the specialist relays its tokens to the ``TokenStream`` of the
+  teacher agent, which writes them as they arrive.
+
+Queries sent straight to the specialist, as the pre-router does, are timed
+too. For each way it prints the p50 / p99 time to the first token and to the
+whole answer. Run it with::
+
+    python -m my_python_ai_kata.benchmarks.streaming --queries 20
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+from collections.abc import AsyncIterable
+from collections.abc import Callable
+from typing import Any
+from typing import Optional
+
+import numpy as np
+from strands import Agent
+from strands.handlers.callback_handler import null_callback_handler
+from strands.types.content import Messages
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
+
+from my_python_ai_kata.agents.staff.math_assistant import get_math_assistant
+from my_python_ai_kata.agents.staff.math_assistant import math_assistant
+from my_python_ai_kata.agents.staff.math_assistant import math_assistant_pool
+from my_python_ai_kata.agents.streaming import StreamTiming
+from my_python_ai_kata.agents.streaming import TokenStream
+from my_python_ai_kata.benchmarks.agent_pool import StubModel
+
+
+class RoutingStubModel(StubModel):
+    """A stub model that calls a tool with the query, then streams its reply."""
+
+    def __init__(self, tool: str, **kwargs: Any):
+        """Initialize the stub.
+
+        Args:
+            tool (str): The name of the tool to call.
+            **kwargs: The arguments of ``StubModel``.
+        """
+        super().__init__(**kwargs)
+        self.tool = tool
+
+    async def stream(
+        self,
+        messages: Messages,
+        tool_specs: Optional[list[ToolSpec]] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterable[StreamEvent]:
+        """Call the tool after a user query, or stream the reply after a tool result."""
+        content = messages[-1]["content"]
+        if any("toolResult" in block for block in content):
+            async for event in super().stream(
+                messages, tool_specs, system_prompt, **kwargs
+            ):
+                yield event
+            return
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        query = "".join(block.get("text", "") for block in content)
+        tool_use = {"toolUseId": f"route-{len(messages)}", "name": self.tool}
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockStart": {"start": {"toolUse": tool_use}}}  # type: ignore[typeddict-item]
+        yield {
+            "contentBlockDelta": {
+                "delta": {"toolUse": {"input": json.dumps({"query": query})}}
+            }
+        }
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "tool_use"}}
+
+
+def time_answers(
+    queries: int, answer: Callable[[TokenStream], Any]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Answer queries one after another and time their tokens.
+
+    Args:
+        queries (int): Number of queries.
+        answer (Callable[[TokenStream], Any]): Answers a query, streaming its
+            tokens to the stream, if at all.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The time to the first token and to the
+        whole answer of every query, in milliseconds; an answer that did not
+        stream gets its first token with the whole answer.
+    """
+    first, total = np.zeros(queries), np.zeros(queries)
+    stream = TokenStream(write=lambda text: None)
+    # The specialist tools print where they route
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(queries):
+            stream.start()
+            answer(stream)
+            timing: StreamTiming = stream.finish()
+            total[i] = timing.total * 1000
+            first[i] = (timing.time_to_first_token or timing.total) * 1000
+    return first, total
+
+
+def main() -> None:
+    """Time the answers of the Teacher's Assistant, buffered and streamed."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument(
+        "--latency", type=float, default=0.3, help="seconds to the first chunk"
+    )
+    parser.add_argument(
+        "--chunk-latency", type=float, default=0.02, help="seconds between chunks"
+    )
+    parser.add_argument("--chunks", type=int, default=40)
+    args = parser.parse_args()
+
+    specialist_model = StubModel(
+        "Six times seven is 42: add six to itself seven times. " * 4,
+        latency=args.latency,
+        chunks=args.chunks,
+        chunk_latency=args.chunk_latency,
+    )
+    math_assistant_pool.factory = lambda: get_math_assistant(specialist_model)
+    math_assistant_pool.clear()
+    teacher = Agent(
+        name="Teacher's Assistant",
+        model=RoutingStubModel(
+            math_assistant.tool_name,
+            reply="The Math Assistant answered your question.",
+            latency=args.latency,
+            chunks=args.chunks // 4,
+            chunk_latency=args.chunk_latency,
+        ),
+        tools=[math_assistant],
+        callback_handler=None,
+    )
+
+    def routed(stream: Callable[..., None]) -> None:
+        teacher.messages.clear()
+        teacher.callback_handler = stream
+        teacher("What is 6 times 7?")
+
+    def pre_routed(stream: Callable[..., None]) -> None:
+        teacher.callback_handler = stream
+        math_assistant("What is 6 times 7?", agent=teacher)
+
+    ways: dict[str, Callable[[TokenStream], Any]] = {
+        "teacher buffered": lambda stream: routed(null_callback_handler),
+        "teacher streamed": routed,
+        "pre-routed buffered": lambda stream: pre_routed(null_callback_handler),
+        "pre-routed streamed": pre_routed,
+    }
+    for name, answer in ways.items():
+        first, total = time_answers(args.queries, answer)
+        print(
+            f"  {name:>19}: first token p50 {np.percentile(first, 50):.0f}ms, "
+            f"p99 {np.percentile(first, 99):.0f}ms; "
+            f"whole answer p50 {np.percentile(total, 50):.0f}ms, "
+            f"p99 {np.percentile(total, 99):.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
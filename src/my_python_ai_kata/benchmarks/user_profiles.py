@@ -0,0 +1,124 @@
+"""Benchmark the user profile repository behind the hello server.
+
+The profiles are bulk loaded in a database (a temporary SQLite file unless
+``--url`` names another one), then looked up with user ids drawn from a Zipf
+distribution, as the reads of a few popular users dominate real traffic:
+
+* single lookups without the cache of hot rows, then with it;
+* batches of lookups, as ``users://batch/{ids}`` runs them, against the same
+  number of single lookups.
+
+For each case it prints the lookups per second and the p50 / p99 latency. Run
+it with::
+
+    python -m my_python_ai_kata.benchmarks.user_profiles --profiles 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from my_python_ai_kata.mcp.user_profiles import DEFAULT_HOT_ROWS
+from my_python_ai_kata.mcp.user_profiles import UserProfileRepository
+from my_python_ai_kata.mcp.user_profiles import create_profile_engine
+
+
+def report(name: str, lookups: int, timings: np.ndarray) -> None:
+    """Print the throughput and latency percentiles of a case.
+
+    Args:
+        name (str): The name of the case.
+        lookups (int): Number of profiles looked up.
+        timings (np.ndarray): The latency of every call, in milliseconds.
+    """
+    print(
+        f"  {name:>14}: {lookups / timings.sum() * 1000:.0f} lookups/s, "
+        f"p50 {np.percentile(timings, 50):.3f}ms, "
+        f"p99 {np.percentile(timings, 99):.3f}ms"
+    )
+
+
+def time_calls(calls: list[Callable[[], object]]) -> np.ndarray:
+    """Run calls one after another and time each of them.
+
+    Args:
+        calls (list[Callable[[], object]]): The calls.
+
+    Returns:
+        np.ndarray: The latency of every call, in milliseconds.
+    """
+    timings = np.zeros(len(calls))
+    for i, call in enumerate(calls):
+        start = time.perf_counter()
+        call()
+        timings[i] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def benchmark(url: str, profiles: int, lookups: int, batch: int, hot_rows: int) -> None:
+    """Print the load time and the lookup throughput of the repository.
+
+    Args:
+        url (str): The SQLAlchemy database URL.
+        profiles (int): Number of stored profiles.
+        lookups (int): Number of profiles looked up per case.
+        batch (int): Number of profiles per batch.
+        hot_rows (int): Number of profiles cached in memory.
+    """
+    engine = create_profile_engine(url)
+    cold = UserProfileRepository(engine, hot_rows=0)
+    start = time.perf_counter()
+    cold.put_many(
+        {
+            user_id: {"name": f"User {user_id}", "status": "active"}
+            for user_id in range(profiles)
+        }
+    )
+    print(
+        f"  {'bulk load':>14}: {profiles} profiles in {time.perf_counter() - start:.2f}s"
+    )
+
+    rng = np.random.default_rng(0)
+    ids = [int(i) for i in (rng.zipf(1.2, lookups) - 1) % profiles]
+    hot = UserProfileRepository(engine, hot_rows=hot_rows)
+    for name, repository in (("single cold", cold), ("single hot", hot)):
+        report(name, lookups, time_calls([lambda i=i: repository.get(i) for i in ids]))
+
+    batches = [ids[start : start + batch] for start in range(0, lookups, batch)]
+    report(
+        f"{batch} single",
+        lookups,
+        time_calls([lambda b=b: [cold.get(i) for i in b] for b in batches]),
+    )
+    report(
+        f"{batch} batched",
+        lookups,
+        time_calls([lambda b=b: cold.get_many(b) for b in batches]),
+    )
+    engine.dispose()
+
+
+def main() -> None:
+    """Load the profiles and time their lookups."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--url", help="SQLAlchemy database URL (default: a temporary SQLite file)"
+    )
+    parser.add_argument("--profiles", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--hot-rows", type=int, default=DEFAULT_HOT_ROWS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.url or f"sqlite:///{os.path.join(directory, 'profiles.db')}"
+        print(f"{args.profiles} profiles, {args.lookups} Zipf distributed lookups")
+        benchmark(url, args.profiles, args.lookups, args.batch, args.hot_rows)
+
+
+if __name__ == "__main__":
+    main()
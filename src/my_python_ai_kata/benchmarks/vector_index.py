@@ -0,0 +1,123 @@
+"""Benchmark approximate nearest-neighbour indexes against exact search.
+
+Vectors are drawn around random cluster centres, and queries are perturbed
+copies of stored vectors. For every size and backend it prints the build time,
+recall@k against the exact search and the p50 / p99 single-query latency. Run
+it with::
+
+    python -m my_python_ai_kata.benchmarks.vector_index --sizes 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from my_python_ai_kata.mcp.vector_index import INDEX_BACKENDS
+from my_python_ai_kata.mcp.vector_index import VectorIndex
+from my_python_ai_kata.mcp.vector_index import create_index
+
+
+def make_vectors(n: int, dim: int, clusters: int = 1000, seed: int = 0) -> np.ndarray:
+    """Generate clustered float32 vectors.
+
+    Args:
+        n (int): Number of vectors.
+        dim (int): Vector dimension.
+        clusters (int): Number of cluster centres.
+        seed (int): Random seed.
+
+    Returns:
+        np.ndarray: A (n, dim) matrix.
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(clusters, size=n)]
+    vectors += 0.5 * rng.normal(size=(n, dim)).astype(np.float32)
+    return vectors
+
+
+def latencies(
+    index: VectorIndex, queries: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Search the queries one at a time.
+
+    Args:
+        index (VectorIndex): The index to query.
+        queries (np.ndarray): A (queries, dim) matrix.
+        k (int): Number of results per query.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (queries, k) results and the latency
+        of every query, in milliseconds.
+    """
+    results = np.zeros((len(queries), k), dtype=np.int64)
+    timings = np.zeros(len(queries))
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        results[i], _ = index.search(query[None, :], k)
+        timings[i] = (time.perf_counter() - start) * 1000
+    return results, timings
+
+
+def recall(expected: np.ndarray, found: np.ndarray) -> float:
+    """Return the mean fraction of the exact neighbours that were found.
+
+    Args:
+        expected (np.ndarray): The exact (queries, k) results.
+        found (np.ndarray): The approximate (queries, k) results.
+
+    Returns:
+        float: recall@k.
+    """
+    k = expected.shape[1]
+    return float(
+        np.mean(
+            [len(set(e) & set(f)) / k for e, f in zip(expected, found, strict=True)]
+        )
+    )
+
+
+def main() -> None:
+    """Print build time, recall@k and latency percentiles per size and backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument(
+        "--backends", nargs="+", default=["ivf"], choices=sorted(INDEX_BACKENDS)
+    )
+    parser.add_argument("--n-probe", type=int, default=16)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    for size in args.sizes:
+        vectors = make_vectors(size, args.dim)
+        picks = rng.integers(size, size=args.queries)
+        queries = vectors[picks] + 0.1 * rng.normal(size=(args.queries, args.dim))
+        print(f"{size} vectors of dimension {args.dim}, {args.queries} queries")
+
+        exact = create_index("exact")
+        exact.build(vectors)
+        expected, timings = latencies(exact, queries, args.k)
+        print(
+            f"  {'exact':>6}: recall@{args.k} 1.000, "
+            f"p50 {np.percentile(timings, 50):.2f}ms, "
+            f"p99 {np.percentile(timings, 99):.2f}ms"
+        )
+        for backend in args.backends:
+            index = create_index(backend, n_probe=args.n_probe)
+            start = time.perf_counter()
+            index.build(vectors)
+            build_time = time.perf_counter() - start
+            found, timings = latencies(index, queries, args.k)
+            print(
+                f"  {backend:>6}: recall@{args.k} {recall(expected, found):.3f}, "
+                f"p50 {np.percentile(timings, 50):.2f}ms, "
+                f"p99 {np.percentile(timings, 99):.2f}ms, build {build_time:.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
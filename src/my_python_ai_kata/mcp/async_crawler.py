@@ -0,0 +1,329 @@
+"""Concurrent crawler for documentation websites.
+
+All the seed URLs are crawled together, level by level, over a single pooled
+``httpx.AsyncClient``: URLs are deduplicated across seeds, links are followed up
+to ``max_depth`` (with the same semantics as LangChain's ``RecursiveUrlLoader``),
+and the number of concurrent requests to each host is capped. Only a few pages
+are fetched ahead of the consumer of the crawl, so a slow consumer slows the
+crawl down instead of leaving a whole level of pages in memory. Pages are cached
+on disk with their ``ETag`` / ``Last-Modified`` validators, so that a re-crawl
+only downloads the pages that changed.
+"""
+
+import asyncio
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Sequence
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urldefrag
+from urllib.parse import urlparse
+
+import httpx
+from langchain_core.documents import Document
+from langchain_core.utils.html import extract_sub_links
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_MAX_PER_HOST = 8
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_BUFFERED = 16
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+@dataclass
+class CachedPage:
+    """A previously fetched page and its HTTP cache validators."""
+
+    content: str
+    content_type: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class PageCache:
+    """On-disk cache of fetched pages, one JSON file per URL."""
+
+    def __init__(self, cache_dir: str):
+        """Initialize the cache.
+
+        Args:
+            cache_dir (str): The directory holding the cached pages.
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        """Return the cache file path of a URL."""
+        return os.path.join(
+            self.cache_dir, f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+        )
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page of a URL, if any.
+
+        Args:
+            url (str): The page URL.
+
+        Returns:
+            Optional[CachedPage]: The cached page, or None.
+        """
+        try:
+            with open(self._path(url)) as f:
+                return CachedPage(**json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            return None
+
+    def put(self, url: str, page: CachedPage) -> None:
+        """Cache a page.
+
+        Args:
+            url (str): The page URL.
+            page (CachedPage): The page and its validators.
+        """
+        path = self._path(url)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(asdict(page), f)
+        os.replace(f"{path}.tmp", path)
+
+
+@dataclass
+class CrawlStats:
+    """Counters collected during a crawl."""
+
+    fetched: int = 0
+    not_modified: int = 0
+    failed: int = 0
+
+    def __str__(self) -> str:
+        """Return a human readable summary of the counters."""
+        return (
+            f"{self.fetched} fetched, {self.not_modified} not modified, "
+            f"{self.failed} failed"
+        )
+
+
+class AsyncCrawler:
+    """Crawl several seed URLs concurrently and yield their pages as documents."""
+
+    def __init__(
+        self,
+        extractor: Optional[Callable[[str], str]] = None,
+        max_depth: int = 2,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_dir: Optional[str] = None,
+        exclude_dirs: Sequence[str] = (),
+        max_buffered: int = DEFAULT_MAX_BUFFERED,
+    ):
+        """Initialize the crawler.
+
+        Args:
+            extractor (Optional[Callable[[str], str]]): Turns the raw HTML of a page
+                into the document content. Defaults to keeping the raw HTML.
+            max_depth (int): Maximum depth for recursive crawling; 1 only fetches
+                the seed URLs themselves.
+            max_connections (int): Size of the HTTP connection pool.
+            max_per_host (int): Maximum number of concurrent requests per host.
+            timeout (float): Timeout of a single request, in seconds.
+            cache_dir (Optional[str]): Directory for the conditional fetch cache.
+                When None, every page is downloaded in full.
+            exclude_dirs (Sequence[str]): URL prefixes that are never crawled.
+            max_buffered (int): Maximum number of pages being fetched or
+                waiting for the consumer at any time.
+        """
+        self.extractor = extractor or (lambda raw_html: raw_html)
+        self.max_depth = max_depth
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.cache = PageCache(cache_dir) if cache_dir else None
+        self.exclude_dirs = exclude_dirs
+        self.max_buffered = max_buffered
+        self.stats = CrawlStats()
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore capping concurrent requests to the URL's host."""
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_semaphores[host]
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Optional[CachedPage]:
+        """Fetch a page, revalidating the cached copy when there is one.
+
+        Args:
+            client (httpx.AsyncClient): The pooled HTTP client.
+            url (str): The page URL.
+
+        Returns:
+            Optional[CachedPage]: The page, or None if it could not be fetched.
+        """
+        cached = self.cache.get(url) if self.cache else None
+        headers: dict[str, str] = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            async with self._host_semaphore(url):
+                response = await client.get(url, headers=headers)
+            if response.status_code == 304 and cached:
+                self.stats.not_modified += 1
+                return cached
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Unable to load from {url}. Received error {e!r}")
+            self.stats.failed += 1
+            return None
+
+        self.stats.fetched += 1
+        page = CachedPage(
+            content=response.text,
+            content_type=response.headers.get("content-type"),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        if self.cache and (page.etag or page.last_modified):
+            self.cache.put(url, page)
+        return page
+
+    def _to_document(self, url: str, page: CachedPage) -> Optional[Document]:
+        """Turn a fetched page into a document, or None if it has no content."""
+        content = self.extractor(page.content)
+        if not content:
+            return None
+        metadata: dict[str, str] = {"source": url}
+        if page.content_type:
+            metadata["content_type"] = page.content_type
+        if match := _TITLE_RE.search(page.content):
+            metadata["title"] = html.unescape(match.group(1).strip())
+        return Document(page_content=content, metadata=metadata)
+
+    async def _visit(
+        self, client: httpx.AsyncClient, url: str, base_url: str
+    ) -> tuple[Optional[Document], list[tuple[str, str]]]:
+        """Fetch a page and extract its document and its child links.
+
+        Args:
+            client (httpx.AsyncClient): The pooled HTTP client.
+            url (str): The page URL.
+            base_url (str): The seed URL that links must stay under.
+
+        Returns:
+            tuple[Optional[Document], list[tuple[str, str]]]: The page document,
+            and the (link, base URL) pairs found in the page.
+        """
+        page = await self._fetch(client, url)
+        if page is None:
+            return None, []
+        links = extract_sub_links(
+            page.content,
+            url,
+            base_url=base_url,
+            prevent_outside=True,
+            exclude_prefixes=self.exclude_dirs,
+            continue_on_failure=True,
+        )
+        return self._to_document(url, page), [(link, base_url) for link in links]
+
+    async def _buffered_visit(
+        self,
+        buffered: asyncio.Semaphore,
+        client: httpx.AsyncClient,
+        url: str,
+        base_url: str,
+    ) -> tuple[Optional[Document], list[tuple[str, str]]]:
+        """Visit a page once the buffer has room for it.
+
+        The buffer is given back by the consumer of the page, or right away
+        when the visit fails.
+        """
+        await buffered.acquire()
+        try:
+            return await self._visit(client, url, base_url)
+        except BaseException:
+            buffered.release()
+            raise
+
+    async def crawl(self, urls: Sequence[str]) -> AsyncIterator[Document]:
+        """Crawl all the seed URLs together, breadth first.
+
+        Every URL is fetched at most once, at the smallest depth it is reachable
+        from any seed, and only links under the seed they were found from are
+        followed. A page is only fetched while fewer than ``max_buffered`` pages
+        are being fetched or waiting to be taken by the consumer.
+
+        Args:
+            urls (Sequence[str]): The seed URLs.
+
+        Yields:
+            Document: A document per fetched page, as soon as it is available.
+        """
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+        seen: set[str] = set()
+        level = [(url, url) for url in dict.fromkeys(urls)]
+        seen.update(url for url, _ in level)
+        # Taken before a page is fetched, given back once the consumer took it
+        buffered = asyncio.Semaphore(self.max_buffered)
+        async with httpx.AsyncClient(
+            limits=limits, timeout=self.timeout, follow_redirects=True
+        ) as client:
+            for _ in range(self.max_depth):
+                next_level: list[tuple[str, str]] = []
+                tasks = [
+                    asyncio.create_task(
+                        self._buffered_visit(buffered, client, url, base_url)
+                    )
+                    for url, base_url in level
+                ]
+                try:
+                    for task in asyncio.as_completed(tasks):
+                        document, links = await task
+                        try:
+                            if document is not None:
+                                yield document
+                        finally:
+                            buffered.release()
+                        for link, base_url in links:
+                            link = urldefrag(link).url
+                            if link not in seen:
+                                seen.add(link)
+                                next_level.append((link, base_url))
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                level = next_level
+
+    def load(self, urls: Sequence[str]) -> list[Document]:
+        """Crawl the seed URLs and collect all the documents.
+
+        Args:
+            urls (Sequence[str]): The seed URLs.
+
+        Returns:
+            list[Document]: A document per fetched page.
+        """
+
+        async def collect() -> list[Document]:
+            return [document async for document in self.crawl(urls)]
+
+        self.stats = CrawlStats()
+        self._host_semaphores = {}
+        return asyncio.run(collect())
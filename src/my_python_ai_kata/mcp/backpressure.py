@@ -0,0 +1,86 @@
+"""Admission control for the async query paths of the MCP servers.
+
+A ``ConcurrencyLimiter`` lets a bounded number of requests run at once and a
+bounded number wait for their turn. Requests beyond that are rejected right
+away with ``ServerBusyError``, so a burst of clients gets a fast, retryable
+error instead of piling up unbounded work and latency on the server.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 32
+DEFAULT_MAX_PENDING_REQUESTS = 256
+
+
+class ServerBusyError(RuntimeError):
+    """Raised when a request is rejected because too many are already queued."""
+
+
+@dataclass
+class LimiterStats:
+    """Counters collected by a concurrency limiter."""
+
+    active: int = 0
+    waiting: int = 0
+    completed: int = 0
+    rejected: int = 0
+
+    def __str__(self) -> str:
+        """Return a human readable summary of the counters."""
+        return (
+            f"{self.active} active, {self.waiting} waiting, "
+            f"{self.completed} completed, {self.rejected} rejected"
+        )
+
+
+class ConcurrencyLimiter:
+    """Cap the running and the queued requests of an event loop."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_pending: int = DEFAULT_MAX_PENDING_REQUESTS,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency (int): Maximum number of requests running at once.
+            max_pending (int): Maximum number of requests waiting for a slot;
+                further requests are rejected.
+        """
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.stats = LimiterStats()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of a request, waiting for one if needed.
+
+        Yields:
+            None: Once the slot is acquired.
+
+        Raises:
+            ServerBusyError: If the waiting queue is full.
+        """
+        if self._semaphore.locked() and self.stats.waiting >= self.max_pending:
+            self.stats.rejected += 1
+            raise ServerBusyError(
+                f"Too many concurrent requests ({self.stats}), retry later"
+            )
+        self.stats.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.stats.waiting -= 1
+        self.stats.active += 1
+        try:
+            yield
+        finally:
+            self.stats.active -= 1
+            self.stats.completed += 1
+            self._semaphore.release()
@@ -0,0 +1,393 @@
+"""A pool of warm MCP client sessions, shared by concurrent callers.
+
+Opening a ``fastmcp.Client`` costs an MCP handshake, and awaiting independent
+calls one after another adds up their latencies. ``McpClientPool`` keeps warm
+sessions per server URL and runs the calls of a session concurrently, so that
+independent tool calls and resource reads can be issued together with
+``asyncio.gather``::
+
+    async with McpClientPool() as pool:
+        greeting, config = await asyncio.gather(
+            pool.call_tool(url, "greet", {"name": "Ada"}),
+            pool.read_resource(url, "data://config"),
+        )
+
+A call failing on a broken connection (a restarted server, an expired
+session) reconnects its session and is retried. A call goes to the least busy
+session, and a new session is only opened, up to ``size`` per URL, when all of
+them run ``max_in_flight`` calls; behind a multi-worker server with session
+affinity, the sessions spread the load over the workers. The duration of every
+call is recorded in ``timings``.
+
+With ``cache_resources``, resource contents are cached per server and reused
+until the server sends ``notifications/resources/updated`` for the resource or
+``notifications/resources/list_changed``, or a session of the server has to
+reconnect and may have missed notifications. Servers that cannot notify, such
+as stateless ones, need a ``resource_ttl``.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+from typing import Optional
+from typing import TypeVar
+
+import anyio
+import httpx
+import mcp.types
+from fastmcp import Client
+from fastmcp.client.messages import MessageHandler
+from mcp.shared.exceptions import McpError
+
+from my_python_ai_kata.mcp.query_cache import LRUCache
+
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_CALL_TIMEOUT = 30.0
+DEFAULT_RETRIES = 1
+DEFAULT_RESOURCE_CACHE_SIZE = 1024
+MAX_TIMINGS = 10_000
+
+# Errors of the connection rather than of the call, fixed by reconnecting
+CONNECTION_ERRORS = (
+    ConnectionError,
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+)
+# Reported when a restarted server no longer knows the session
+SESSION_TERMINATED = "Session terminated"
+
+
+@dataclass
+class CallTiming:
+    """The outcome and the duration of a pooled call."""
+
+    url: str
+    kind: str
+    name: str
+    seconds: float
+    attempts: int
+    ok: bool
+    cached: bool = False
+
+
+def is_connection_error(client: Client, error: Exception) -> bool:
+    """Tell whether a call failed because of its connection.
+
+    Args:
+        client (Client): The client of the call.
+        error (Exception): The error raised by the call.
+
+    Returns:
+        bool: True if the client must reconnect, False for an error of the call
+        itself, such as an unknown resource.
+    """
+    if not client.is_connected() or isinstance(error, CONNECTION_ERRORS):
+        return True
+    return isinstance(error, McpError) and error.error.message == SESSION_TERMINATED
+
+
+ResourceContents = list[mcp.types.TextResourceContents | mcp.types.BlobResourceContents]
+
+
+class _ServerResources:
+    """The cached resources of a server, dropped on change notifications."""
+
+    def __init__(self, max_size: int, ttl: Optional[float]):
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of cached resources.
+            ttl (Optional[float]): Lifetime of a cached resource in seconds, or
+                None to keep it until a notification.
+        """
+        self.contents: LRUCache[str, ResourceContents] = LRUCache(max_size, ttl)
+        # Bumped by every invalidation, so that reads overtaken by one are not cached
+        self.generation = 0
+
+    def invalidate(self, uri: Optional[str] = None) -> None:
+        """Drop a cached resource, or all of them.
+
+        Args:
+            uri (Optional[str]): The resource URI, or None for every resource.
+        """
+        self.generation += 1
+        if uri is None:
+            self.contents.clear()
+        else:
+            self.contents.discard(uri)
+
+
+class _InvalidationHandler(MessageHandler):
+    """Invalidate the cached resources of a server as its notifications arrive."""
+
+    def __init__(self, resources: _ServerResources):
+        """Initialize the handler.
+
+        Args:
+            resources (_ServerResources): The cached resources of the server.
+        """
+        self.resources = resources
+
+    async def on_resource_updated(
+        self, message: mcp.types.ResourceUpdatedNotification
+    ) -> None:
+        """Drop the updated resource."""
+        self.resources.invalidate(str(message.params.uri))
+
+    async def on_resource_list_changed(
+        self, message: mcp.types.ResourceListChangedNotification
+    ) -> None:
+        """Drop every resource of the server."""
+        self.resources.invalidate()
+
+
+class _PooledSession:
+    """A client session of the pool, connected on first use."""
+
+    def __init__(self, url: str, timeout: float, resources: _ServerResources):
+        """Initialize the session, without connecting it.
+
+        Args:
+            url (str): The MCP server URL.
+            timeout (float): The timeout of every request, in seconds.
+            resources (_ServerResources): The cached resources of the server,
+                invalidated by the notifications received by the session.
+        """
+        self.url = url
+        self.timeout = timeout
+        self.resources = resources
+        self.client: Optional[Client] = None
+        self.connections = 0
+        self.in_flight = 0
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> Client:
+        """Return the connected client, connecting it if needed.
+
+        Returns:
+            Client: The connected client.
+        """
+        client = self.client
+        if client is not None and client.is_connected():
+            return client
+        async with self._lock:
+            if self.client is None or not self.client.is_connected():
+                await self.close()
+                if self.connections:
+                    # Notifications may have been lost with the connection
+                    self.resources.invalidate()
+                client = Client(
+                    self.url,
+                    timeout=self.timeout,
+                    message_handler=_InvalidationHandler(self.resources),
+                )
+                await client.__aenter__()
+                self.client = client
+                self.connections += 1
+            return self.client
+
+    async def reconnect(self, broken: Client) -> None:
+        """Drop a broken client, unless another caller replaced it already.
+
+        Args:
+            broken (Client): The client whose call failed.
+        """
+        async with self._lock:
+            if self.client is broken:
+                await self.close()
+
+    async def close(self) -> None:
+        """Disconnect the client, ignoring the errors of a broken connection."""
+        client, self.client = self.client, None
+        if client is not None:
+            try:
+                await client.__aexit__(None, None, None)
+            except Exception:  # noqa: S110
+                pass
+
+
+class McpClientPool:
+    """Keep warm MCP sessions per server URL and time every call."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_CALL_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        cache_resources: bool = False,
+        resource_cache_size: int = DEFAULT_RESOURCE_CACHE_SIZE,
+        resource_ttl: Optional[float] = None,
+    ):
+        """Initialize the pool, without connecting.
+
+        Args:
+            size (int): Maximum number of sessions per server URL.
+            timeout (float): The timeout of every request, in seconds.
+            retries (int): Number of times a call failing on a broken
+                connection is retried on a new connection.
+            max_in_flight (int): Number of concurrent calls per session past
+                which another session is opened.
+            cache_resources (bool): Whether to cache resource contents until
+                the server notifies a change.
+            resource_cache_size (int): Maximum number of cached resources per
+                server.
+            resource_ttl (Optional[float]): Lifetime of a cached resource in
+                seconds, or None to keep it until a notification.
+        """
+        self.size = size
+        self.timeout = timeout
+        self.retries = retries
+        self.max_in_flight = max_in_flight
+        self.cache_resources = cache_resources
+        self.resource_cache_size = resource_cache_size
+        self.resource_ttl = resource_ttl
+        self.resources: dict[str, _ServerResources] = {}
+        self.timings: deque[CallTiming] = deque(maxlen=MAX_TIMINGS)
+        self._sessions: dict[str, list[_PooledSession]] = {}
+
+    def _session(self, url: str) -> _PooledSession:
+        """Return the least busy session of a server, opening one if all are busy."""
+        sessions = self._sessions.setdefault(url, [])
+        session = min(sessions, key=lambda s: s.in_flight, default=None)
+        if session is None or (
+            session.in_flight >= self.max_in_flight and len(sessions) < self.size
+        ):
+            session = _PooledSession(url, self.timeout, self._resources(url))
+            sessions.append(session)
+        return session
+
+    def _resources(self, url: str) -> _ServerResources:
+        """Return the cached resources of a server."""
+        if url not in self.resources:
+            self.resources[url] = _ServerResources(
+                self.resource_cache_size, self.resource_ttl
+            )
+        return self.resources[url]
+
+    async def _call(
+        self, url: str, kind: str, name: str, request: Callable[[Client], Awaitable[T]]
+    ) -> T:
+        """Run a request on a pooled session, reconnecting on connection errors.
+
+        Args:
+            url (str): The MCP server URL.
+            kind (str): The kind of call, for the timings.
+            name (str): The tool name or the resource URI, for the timings.
+            request (Callable[[Client], Awaitable[T]]): Runs the request on a client.
+
+        Returns:
+            T: The result of the request.
+        """
+        session = self._session(url)
+        session.in_flight += 1
+        start = time.perf_counter()
+        attempts = 0
+        ok = False
+        try:
+            while True:
+                attempts += 1
+                client = await session.connect()
+                try:
+                    result = await request(client)
+                except Exception as e:
+                    if not is_connection_error(client, e):
+                        raise
+                    await session.reconnect(client)
+                    if attempts > self.retries:
+                        raise
+                    continue
+                ok = True
+                return result
+        finally:
+            session.in_flight -= 1
+            self.timings.append(
+                CallTiming(url, kind, name, time.perf_counter() - start, attempts, ok)
+            )
+
+    async def call_tool(
+        self, url: str, name: str, arguments: Optional[dict[str, Any]] = None
+    ) -> mcp.types.CallToolResult:
+        """Call a tool of a server.
+
+        Args:
+            url (str): The MCP server URL.
+            name (str): The tool name.
+            arguments (Optional[dict[str, Any]]): The tool arguments.
+
+        Returns:
+            mcp.types.CallToolResult: The raw result, errors included.
+        """
+        return await self._call(
+            url,
+            "tool",
+            name,
+            lambda client: client.call_tool_mcp(name, arguments or {}),
+        )
+
+    async def read_resource(
+        self, url: str, uri: str, cache: Optional[bool] = None
+    ) -> ResourceContents:
+        """Read a resource of a server.
+
+        Args:
+            url (str): The MCP server URL.
+            uri (str): The resource URI.
+            cache (Optional[bool]): Whether to use the resource cache; defaults
+                to ``cache_resources``.
+
+        Returns:
+            ResourceContents: The resource contents.
+        """
+        if not (self.cache_resources if cache is None else cache):
+            return await self._call(
+                url, "resource", uri, lambda client: client.read_resource(uri)
+            )
+        resources = self._resources(url)
+        start = time.perf_counter()
+        contents = resources.contents.get(uri)
+        if contents is not None:
+            self.timings.append(
+                CallTiming(
+                    url, "resource", uri, time.perf_counter() - start, 0, True, True
+                )
+            )
+            return contents
+        generation = resources.generation
+        contents = await self._call(
+            url, "resource", uri, lambda client: client.read_resource(uri)
+        )
+        if resources.generation == generation:
+            resources.contents.put(uri, contents)
+        return contents
+
+    async def close(self) -> None:
+        """Disconnect every session and drop the cached resources."""
+        sessions = [s for pool in self._sessions.values() for s in pool]
+        await asyncio.gather(*(s.close() for s in sessions))
+        self._sessions.clear()
+        self.resources.clear()
+
+    async def __aenter__(self) -> "McpClientPool":
+        """Return the pool itself."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Disconnect every session."""
+        await self.close()
@@ -0,0 +1,144 @@
+"""CPU-bound processing of crawled pages: HTML extraction, splitting and token counting.
+
+BeautifulSoup parsing, tiktoken encoding and recursive splitting all hold the
+GIL, so ``DocumentProcessor`` runs them in a process pool, one page per task,
+while the crawler and the embedding requests keep running on the main process.
+"""
+
+import os
+import re
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Optional
+
+from bs4 import BeautifulSoup
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+
+from my_python_ai_kata.mcp.embedding_cache import text_hash
+from my_python_ai_kata.mcp.ingestion_pipeline import parallel_map
+from my_python_ai_kata.mcp.tokenizers import count_tokens
+
+
+DEFAULT_CHUNK_SIZE = 8000
+DEFAULT_CHUNK_OVERLAP = 500
+
+
+def extract_text(html: str) -> str:
+    """Extract and clean text content from HTML using BeautifulSoup.
+
+    Args:
+        html (str): The HTML content to extract text from.
+
+    Returns:
+        str: The cleaned text content.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    main_content = soup.find("article", class_="md-content__inner")
+    content = main_content.get_text() if main_content else soup.text
+    return re.sub(r"\n\n+", "\n\n", content).strip()
+
+
+@dataclass
+class ProcessedDocument:
+    """A crawled page after extraction, with its chunks and their token counts."""
+
+    document: Document
+    content_hash: str
+    chunks: list[Document] = field(default_factory=list)
+    token_counts: list[int] = field(default_factory=list)
+
+
+class DocumentProcessor:
+    """Extract, split and token-count documents, in parallel across processes.
+
+    The extractor and length function must be picklable (module level
+    functions), since they are shipped to the worker processes.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+        extractor: Optional[Callable[[str], str]] = extract_text,
+        length_function: Callable[[str], int] = count_tokens,
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize the processor.
+
+        Args:
+            chunk_size (int): Maximum size of a chunk, measured by length_function.
+            chunk_overlap (int): Overlap between consecutive chunks.
+            extractor (Optional[Callable[[str], str]]): Turns the raw HTML of a page
+                into the document content. When None, the content is kept as is.
+            length_function (Callable[[str], int]): Measures chunks and gives the
+                returned token counts. Defaults to tiktoken's cl100k_base.
+            max_workers (Optional[int]): Number of worker processes. Defaults to the
+                number of CPUs; 1 processes the documents serially, in-process.
+        """
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.extractor = extractor
+        self.length_function = length_function
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def process(
+        self, document: Document, known_hash: Optional[str] = None
+    ) -> ProcessedDocument:
+        """Extract, split and token-count a single document.
+
+        Args:
+            document (Document): The crawled page, with its raw HTML as content.
+            known_hash (Optional[str]): The content hash the page had when it was
+                last indexed. When it is unchanged, the page is not split.
+
+        Returns:
+            ProcessedDocument: The extracted document and its chunks.
+        """
+        content = document.page_content
+        if self.extractor is not None:
+            content = self.extractor(content)
+        extracted = Document(page_content=content, metadata=document.metadata)
+        processed = ProcessedDocument(extracted, text_hash(content))
+        if not content or processed.content_hash == known_hash:
+            return processed
+
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            length_function=self.length_function,
+        )
+        processed.chunks = splitter.split_documents([extracted])
+        processed.token_counts = [
+            self.length_function(chunk.page_content) for chunk in processed.chunks
+        ]
+        return processed
+
+    def map(
+        self, documents: Iterable[tuple[Document, Optional[str]]]
+    ) -> Iterator[ProcessedDocument]:
+        """Process a stream of documents, keeping their order.
+
+        Only a couple of documents per worker are in flight at any time, so the
+        input stream is consumed as fast as the results are.
+
+        Args:
+            documents (Iterable[tuple[Document, Optional[str]]]): Pairs of a
+                crawled page and its previously indexed content hash, if any.
+
+        Yields:
+            ProcessedDocument: The processed documents, in input order.
+        """
+        if self.max_workers == 1:
+            for document, known_hash in documents:
+                yield self.process(document, known_hash)
+            return
+
+        with ProcessPoolExecutor(self.max_workers) as executor:
+            yield from parallel_map(
+                executor, self.process, documents, max_pending=2 * self.max_workers
+            )
@@ -0,0 +1,239 @@
+"""Persistent, content-addressed cache of embedding vectors.
+
+Vectors are stored in a SQLite database keyed by the embedding model name and the
+SHA-256 hash of the embedded text, so unchanged chunks are never embedded twice.
+Entries are evicted when they get too old or when the cache grows too large.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+DEFAULT_MAX_ENTRIES = 200_000
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters collected while using an embedding cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evicted: int = 0
+
+    def __str__(self) -> str:
+        """Return a human readable summary of the counters."""
+        lookups = self.hits + self.misses
+        ratio = self.hits / lookups if lookups else 0.0
+        return (
+            f"{self.hits} hits, {self.misses} misses ({ratio:.1%} hit rate), "
+            f"{self.evicted} evicted"
+        )
+
+
+def text_hash(text: str) -> str:
+    """Return the content hash used as cache key for a text.
+
+    Args:
+        text (str): The text to hash.
+
+    Returns:
+        str: The hex SHA-256 digest of the UTF-8 encoded text.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """On-disk embedding cache keyed by (embedding model, hash of text)."""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_age: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path (str): Path to the SQLite database file.
+            max_entries (Optional[int]): Maximum number of entries kept after an
+                eviction, least recently used first. None means unbounded.
+            max_age (Optional[float]): Entries not used for longer than this many
+                seconds are evicted. None means they never expire.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.stats = EmbeddingCacheStats()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " model TEXT NOT NULL,"
+            " text_hash TEXT NOT NULL,"
+            " vector BLOB NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (model, text_hash))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_accessed_at"
+            " ON embeddings (accessed_at)"
+        )
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        """Return the number of cached vectors, across all models."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()
+        return count
+
+    def get_many(self, model: str, texts: Sequence[str]) -> list[Optional[list[float]]]:
+        """Look up the cached vectors of many texts.
+
+        Args:
+            model (str): The embedding model name.
+            texts (Sequence[str]): The texts to look up.
+
+        Returns:
+            list[Optional[list[float]]]: The cached vector of each text, or None
+            when it is not cached.
+        """
+        hashes = [text_hash(text) for text in texts]
+        found: dict[str, bytes] = {}
+        with self._lock:
+            # Stay well below SQLite's limit on the number of query parameters
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    "SELECT text_hash, vector FROM embeddings"
+                    f" WHERE model = ? AND text_hash IN ({placeholders})",  # noqa: S608
+                    (model, *chunk),
+                ).fetchall()
+                found.update(rows)
+            self._connection.executemany(
+                "UPDATE embeddings SET accessed_at = ? WHERE model = ? AND text_hash = ?",
+                [(time.time(), model, h) for h in found],
+            )
+            self._connection.commit()
+            self.stats.hits += sum(1 for h in hashes if h in found)
+            self.stats.misses += sum(1 for h in hashes if h not in found)
+
+        return [
+            np.frombuffer(found[h], dtype=np.float32).tolist() if h in found else None
+            for h in hashes
+        ]
+
+    def put_many(
+        self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> None:
+        """Store the vectors of many texts.
+
+        Args:
+            model (str): The embedding model name.
+            texts (Sequence[str]): The embedded texts.
+            vectors (Sequence[Sequence[float]]): The vector of each text.
+        """
+        now = time.time()
+        rows = [
+            (
+                model,
+                text_hash(text),
+                np.asarray(vector, dtype=np.float32).tobytes(),
+                now,
+            )
+            for text, vector in zip(texts, vectors, strict=True)
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.commit()
+
+    def evict(self) -> int:
+        """Drop expired entries, then the least recently used ones above the limit.
+
+        Returns:
+            int: The number of evicted entries.
+        """
+        evicted = 0
+        with self._lock:
+            if self.max_age is not None:
+                evicted += self._connection.execute(
+                    "DELETE FROM embeddings WHERE accessed_at < ?",
+                    (time.time() - self.max_age,),
+                ).rowcount
+            if self.max_entries is not None:
+                evicted += self._connection.execute(
+                    "DELETE FROM embeddings WHERE rowid IN ("
+                    " SELECT rowid FROM embeddings ORDER BY accessed_at DESC"
+                    " LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+            self._connection.commit()
+            self.stats.evicted += evicted
+        return evicted
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings that only ask the underlying model for uncached texts."""
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, model: str):
+        """Wrap an embedding model with a cache.
+
+        Args:
+            embeddings (Embeddings): The underlying embedding model.
+            cache (EmbeddingCache): The cache to read from and write to.
+            model (str): The embedding model name used to namespace the cache.
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = model
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, reusing the cached vectors.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            list[list[float]]: One vector per text.
+        """
+        vectors = self.cache.get_many(self.model, texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            embedded = self.embeddings.embed_documents([texts[i] for i in missing])
+            self.cache.put_many(self.model, [texts[i] for i in missing], embedded)
+            for i, vector in zip(missing, embedded, strict=True):
+                vectors[i] = vector
+        return [vector for vector in vectors if vector is not None]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query text, bypassing the cache.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            list[float]: The query vector.
+        """
+        return self.embeddings.embed_query(text)
@@ -0,0 +1,195 @@
+"""Token-budgeted, concurrent embedding of document chunks.
+
+The OpenAI embedding endpoint rejects requests above 300K tokens (or 2048 inputs),
+so chunks are packed into batches that fit under a token budget and embedded
+concurrently over a bounded thread pool, with retry and exponential backoff.
+Results are streamed back as soon as each batch completes.
+"""
+
+import random
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+
+from langchain_core.embeddings import Embeddings
+
+
+DEFAULT_MAX_TOKENS_PER_BATCH = 250_000
+DEFAULT_MAX_ITEMS_PER_BATCH = 2048
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 5
+
+
+@dataclass
+class EmbeddingBatch:
+    """A group of chunks that fits into a single embedding request."""
+
+    indices: list[int] = field(default_factory=list)
+    texts: list[str] = field(default_factory=list)
+    token_count: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of chunks in the batch."""
+        return len(self.texts)
+
+
+def pack_items(
+    items: Iterable[tuple[str, int]],
+    max_tokens: int = DEFAULT_MAX_TOKENS_PER_BATCH,
+    max_items: int = DEFAULT_MAX_ITEMS_PER_BATCH,
+) -> Iterator[EmbeddingBatch]:
+    """Greedily pack (text, token count) pairs into batches within the budgets.
+
+    The input is consumed lazily, one batch at a time. A single text larger than
+    ``max_tokens`` is emitted as a batch on its own.
+
+    Args:
+        items (Iterable[tuple[str, int]]): The texts to pack with their token
+            counts, in order.
+        max_tokens (int): Maximum number of tokens per batch.
+        max_items (int): Maximum number of texts per batch.
+
+    Yields:
+        EmbeddingBatch: Batches in input order, each remembering the original
+        index of its texts.
+    """
+    batch = EmbeddingBatch()
+    for index, (text, tokens) in enumerate(items):
+        if batch.texts and (
+            batch.token_count + tokens > max_tokens or len(batch) >= max_items
+        ):
+            yield batch
+            batch = EmbeddingBatch()
+        batch.indices.append(index)
+        batch.texts.append(text)
+        batch.token_count += tokens
+    if batch.texts:
+        yield batch
+
+
+def pack_batches(
+    texts: Iterable[str],
+    token_counts: Iterable[int],
+    max_tokens: int = DEFAULT_MAX_TOKENS_PER_BATCH,
+    max_items: int = DEFAULT_MAX_ITEMS_PER_BATCH,
+) -> Iterator[EmbeddingBatch]:
+    """Greedily pack texts into batches that respect the token and item budgets.
+
+    A single text larger than ``max_tokens`` is emitted as a batch on its own.
+
+    Args:
+        texts (Iterable[str]): The texts to pack, in order.
+        token_counts (Iterable[int]): The token count of each text.
+        max_tokens (int): Maximum number of tokens per batch.
+        max_items (int): Maximum number of texts per batch.
+
+    Returns:
+        Iterator[EmbeddingBatch]: Batches in input order, each remembering the
+        original index of its texts.
+    """
+    return pack_items(
+        zip(texts, token_counts, strict=True),
+        max_tokens=max_tokens,
+        max_items=max_items,
+    )
+
+
+class EmbeddingPipeline:
+    """Embed batches of texts concurrently with retry and backoff."""
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            embeddings (Embeddings): The embedding model used for every batch.
+            max_concurrency (int): Maximum number of batches in flight at once.
+            max_retries (int): How many times a failed batch is retried.
+            backoff_base (float): Initial backoff delay, in seconds.
+            backoff_max (float): Upper bound for a single backoff delay, in seconds.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is not positive.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive.")
+        self.embeddings = embeddings
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given attempt."""
+        return random.uniform(  # noqa: S311
+            0, min(self.backoff_max, self.backoff_base * 2**attempt)
+        )
+
+    def _embed_with_retry(self, batch: EmbeddingBatch) -> list[list[float]]:
+        """Embed one batch, retrying transient failures with backoff.
+
+        Args:
+            batch (EmbeddingBatch): The batch to embed.
+
+        Returns:
+            list[list[float]]: One vector per text in the batch.
+        """
+        attempt = 0
+        while True:
+            try:
+                return self.embeddings.embed_documents(batch.texts)
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                print(
+                    f"Embedding batch of {len(batch)} chunks failed ({e}), "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
+    def embed_batches(
+        self, batches: Iterable[EmbeddingBatch]
+    ) -> Iterator[tuple[EmbeddingBatch, list[list[float]]]]:
+        """Embed batches concurrently, yielding each one as soon as it completes.
+
+        At most ``max_concurrency`` batches are in flight, and batches are only
+        pulled from the input when a slot frees up, so a lazy input is never
+        materialized in full.
+
+        Args:
+            batches (Iterable[EmbeddingBatch]): The batches to embed.
+
+        Yields:
+            tuple[EmbeddingBatch, list[list[float]]]: Each batch with its vectors,
+            in completion order.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            pending: dict[Future[list[list[float]]], EmbeddingBatch] = {}
+            for batch in batches:
+                if len(pending) >= self.max_concurrency:
+                    yield from self._drain(pending)
+                pending[executor.submit(self._embed_with_retry, batch)] = batch
+            while pending:
+                yield from self._drain(pending)
+
+    def _drain(
+        self, pending: dict[Future[list[list[float]]], EmbeddingBatch]
+    ) -> Iterator[tuple[EmbeddingBatch, list[list[float]]]]:
+        """Wait for at least one pending batch and yield every completed one."""
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future.result()
@@ -0,0 +1,81 @@
+"""Local fake embedding model for tests and benchmarks.
+
+It produces deterministic vectors without any network access, and can simulate
+the round-trip latency of a remote embedding API, blocking in the sync methods
+and awaiting in the async ones, like an async HTTP client.
+"""
+
+import asyncio
+import time
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+
+class FakeEmbeddings(DeterministicFakeEmbedding):
+    """Deterministic fake embeddings with a configurable per-request latency."""
+
+    latency: float = 0.0
+    """Seconds slept for every embedding request."""
+
+    requests: int = 0
+    """Number of embedding requests served so far."""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts as a single simulated request.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            list[list[float]]: One vector per text.
+        """
+        self._simulate_request()
+        return [self._get_embedding(seed=self._get_seed(text)) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single query text as a simulated request.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            list[float]: The query vector.
+        """
+        self._simulate_request()
+        return self._get_embedding(seed=self._get_seed(text))
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts as a single simulated non-blocking request.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            list[list[float]]: One vector per text.
+        """
+        await self._asimulate_request()
+        return [self._get_embedding(seed=self._get_seed(text)) for text in texts]
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Embed a single query text as a simulated non-blocking request.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            list[float]: The query vector.
+        """
+        await self._asimulate_request()
+        return self._get_embedding(seed=self._get_seed(text))
+
+    async def _asimulate_request(self) -> None:
+        """Count the request and sleep for the configured latency, without blocking."""
+        self.requests += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+    def _simulate_request(self) -> None:
+        """Count the request and wait for the configured latency."""
+        self.requests += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
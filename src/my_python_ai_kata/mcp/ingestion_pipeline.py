@@ -0,0 +1,332 @@
+"""Building blocks for a streaming, bounded-memory ingestion pipeline.
+
+Stages are plain generators. ``prefetch`` runs a stage on its own thread behind a
+bounded queue, so that stages overlap while at most a few items are buffered
+between them, and ``iterate_async`` does the same for an async generator such as
+the crawler. ``ParquetStoreWriter`` writes vector store rows in row groups, in
+the same layout ``SKLearnVectorStore`` persists to parquet, without keeping the
+whole store in memory.
+"""
+
+import asyncio
+import json
+import os
+import queue
+import threading
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from types import TracebackType
+from typing import Any
+from typing import Optional
+from typing import TypeVar
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_ROW_GROUP_SIZE = 256
+
+METADATA_FIELDS = ("source",)
+"""Metadata keys every persisted store has a column for, even if no chunk sets them."""
+
+_STAGING_SCHEMA = pa.schema(
+    [
+        ("ids", pa.string()),
+        ("texts", pa.string()),
+        ("metadatas", pa.string()),
+        ("embeddings", pa.list_(pa.float64())),
+    ]
+)
+
+
+def store_schema(metadata_keys: Iterable[str]) -> pa.Schema:
+    """Get the schema of a persisted store whose chunks have the given metadata.
+
+    Like ``SKLearnVectorStore``, the metadata is a struct with a field per key
+    found in any chunk; the values are persisted as strings.
+
+    Args:
+        metadata_keys (Iterable[str]): The metadata keys of the chunks.
+
+    Returns:
+        pa.Schema: The parquet schema of the store.
+    """
+    keys = [*METADATA_FIELDS, *sorted(set(metadata_keys) - set(METADATA_FIELDS))]
+    return pa.schema(
+        [
+            ("ids", pa.string()),
+            ("texts", pa.string()),
+            ("metadatas", pa.struct([(key, pa.string()) for key in keys])),
+            ("embeddings", pa.list_(pa.float64())),
+        ]
+    )
+
+
+class _Done:
+    """Marks the end of a prefetched stream, carrying the producer's error."""
+
+    def __init__(self, error: Optional[BaseException] = None):
+        self.error = error
+
+
+def _drain_queue(items: "queue.Queue[Any]", stop: threading.Event) -> Iterator[Any]:
+    """Yield queued items until the end marker, re-raising producer errors."""
+    try:
+        while True:
+            item = items.get()
+            if isinstance(item, _Done):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _put(items: "queue.Queue[Any]", item: Any, stop: threading.Event) -> bool:
+    """Put an item in a bounded queue, giving up when the consumer is gone."""
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def prefetch(iterable: Iterable[T], maxsize: int = DEFAULT_QUEUE_SIZE) -> Iterator[T]:
+    """Consume an iterable on a background thread, through a bounded queue.
+
+    Args:
+        iterable (Iterable[T]): The upstream stage.
+        maxsize (int): Maximum number of items buffered ahead of the consumer.
+
+    Returns:
+        Iterator[T]: The items of the iterable, in order.
+    """
+    items: queue.Queue[Any] = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not _put(items, item, stop):
+                    return
+        except BaseException as e:
+            _put(items, _Done(e), stop)
+        else:
+            _put(items, _Done(), stop)
+
+    threading.Thread(target=produce, daemon=True).start()
+    return _drain_queue(items, stop)
+
+
+def iterate_async(
+    iterable: AsyncIterator[T], maxsize: int = DEFAULT_QUEUE_SIZE
+) -> Iterator[T]:
+    """Run an async iterator on its own event loop thread, through a bounded queue.
+
+    When the queue is full the producing coroutine waits, so a fast producer
+    (such as a crawler) is throttled by its slowest consumer.
+
+    Args:
+        iterable (AsyncIterator[T]): The async upstream stage.
+        maxsize (int): Maximum number of items buffered ahead of the consumer.
+
+    Returns:
+        Iterator[T]: The items of the async iterator, in order.
+    """
+    items: queue.Queue[Any] = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    async def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put_nowait(item)
+                return True
+            except queue.Full:
+                await asyncio.sleep(0.01)
+        return False
+
+    async def produce() -> None:
+        try:
+            async for item in iterable:
+                if not await put(item):
+                    return
+        except BaseException as e:
+            await put(_Done(e))
+        else:
+            await put(_Done())
+
+    threading.Thread(target=asyncio.run, args=(produce(),), daemon=True).start()
+    return _drain_queue(items, stop)
+
+
+def parallel_map(
+    executor: Executor,
+    fn: Callable[..., R],
+    iterable: Iterable[tuple[Any, ...]],
+    max_pending: int,
+) -> Iterator[R]:
+    """Apply a function to argument tuples on an executor, in order, lazily.
+
+    Unlike ``Executor.map``, which submits the whole input up front, at most
+    ``max_pending`` calls are in flight, so a streaming input is consumed only
+    as fast as results are taken.
+
+    Args:
+        executor (Executor): The thread or process pool to run the calls on.
+        fn (Callable[..., R]): The function, called as ``fn(*args)``.
+        iterable (Iterable[tuple[Any, ...]]): The argument tuples.
+        max_pending (int): Maximum number of submitted but unconsumed calls.
+
+    Returns:
+        Iterator[R]: The results, in input order.
+    """
+    pending: deque[Future[R]] = deque()
+    try:
+        for args in iterable:
+            pending.append(executor.submit(fn, *args))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def read_store_rows(
+    path: str, batch_size: int = DEFAULT_ROW_GROUP_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Stream the rows of a persisted vector store, a batch at a time.
+
+    Args:
+        path (str): Path to the parquet file.
+        batch_size (int): Number of rows read at once.
+
+    Yields:
+        dict[str, Any]: A row with ``ids``, ``texts``, ``metadatas`` and
+        ``embeddings``.
+    """
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        yield from batch.to_pylist()
+
+
+class ParquetStoreWriter:
+    """Write vector store rows to parquet, one row group at a time.
+
+    The metadata keys of the chunks are only known once all of them are
+    written, so rows are first staged with their metadata as JSON, then copied
+    a row group at a time to a temporary file with a struct field per key, which
+    atomically replaces the target on a successful close. Readers never see a
+    half-written store.
+    """
+
+    def __init__(self, path: str, row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        """Open the writer.
+
+        Args:
+            path (str): Path to the parquet file to (re)place.
+            row_group_size (int): Number of rows buffered per row group.
+        """
+        self.path = path
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._tmp_path = f"{path}.tmp"
+        self._staging_path = f"{path}.staging.tmp"
+        self._writer = pq.ParquetWriter(self._staging_path, _STAGING_SCHEMA)
+        self._rows: list[dict[str, Any]] = []
+        self._metadata_keys: set[str] = set()
+
+    def write(
+        self,
+        id_: str,
+        text: str,
+        metadata: dict[str, Any],
+        embedding: Iterable[float],
+    ) -> None:
+        """Buffer a row, flushing a row group when the buffer is full.
+
+        Args:
+            id_ (str): The chunk id.
+            text (str): The chunk text.
+            metadata (dict[str, Any]): The chunk metadata; its values are
+                persisted as strings.
+            embedding (Iterable[float]): The chunk embedding.
+        """
+        values = {
+            key: None if value is None else str(value)
+            for key, value in metadata.items()
+        }
+        self._metadata_keys.update(values)
+        self._rows.append(
+            {
+                "ids": id_,
+                "texts": text,
+                "metadatas": json.dumps(values),
+                "embeddings": [float(x) for x in embedding],
+            }
+        )
+        self.count += 1
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows as a row group of the staging file."""
+        if self._rows:
+            self._writer.write_table(
+                pa.Table.from_pylist(self._rows, schema=_STAGING_SCHEMA)
+            )
+            self._rows = []
+
+    def close(self) -> None:
+        """Flush the last rows, write the store and replace the target file."""
+        self.flush()
+        self._writer.close()
+        schema = store_schema(self._metadata_keys)
+        keys = schema.field("metadatas").type.names
+        with (
+            pq.ParquetFile(self._staging_path) as staged,
+            pq.ParquetWriter(self._tmp_path, schema) as writer,
+        ):
+            for batch in staged.iter_batches(batch_size=self.row_group_size):
+                rows = batch.to_pylist()
+                for row in rows:
+                    metadata = json.loads(row["metadatas"])
+                    row["metadatas"] = {key: metadata.get(key) for key in keys}
+                writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+        os.remove(self._staging_path)
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard everything written so far, leaving the target untouched."""
+        self._writer.close()
+        os.remove(self._staging_path)
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> "ParquetStoreWriter":
+        """Return the writer itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Commit the file on success, discard it on error."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -1,44 +1,152 @@
 #!/workspaces/my-python-ai-kata/.venv/bin/python
-"""Query tool for Langraph using the example vector store."""
+"""Query tool for Langraph using the example vector store.
 
+The store directory and the startup policy come from the ``[vector_store]``
+section of the configuration. The store and its dependencies are loaded on a
+background thread, so the server answers the MCP handshake right away:
+
+* ``lazy``: the store is loaded by the first call that needs it;
+* ``background``: the store starts loading when the server starts;
+* ``eager``: the store is loaded, and warmed up with the configured queries,
+  before the server starts listening.
+"""
+
+import argparse
 import os
+from typing import TYPE_CHECKING
+from typing import Literal
+from typing import Optional
+from urllib.parse import unquote
 
+from langchain_core.documents import Document
 from mcp.server.fastmcp import FastMCP
 
-from my_python_ai_kata.mcp.vector_store_helpers import VectorStoreQueryHelper
+from my_python_ai_kata.agents.app_config import get_application_config
+from my_python_ai_kata.mcp.multiworker import serve
+from my_python_ai_kata.mcp.multiworker import worker_count
+from my_python_ai_kata.mcp.startup import STARTUP_POLICIES
+from my_python_ai_kata.mcp.startup import BackgroundLoader
+from my_python_ai_kata.mcp.startup import FirstAnswerReporter
+from my_python_ai_kata.mcp.startup import report
+
+
+if TYPE_CHECKING:
+    from my_python_ai_kata.mcp.llms_full import LlmsFullReader
+    from my_python_ai_kata.mcp.vector_store_helpers import VectorStoreQueryHelper
 
 
-# Define common path to the repo locally
-work_dir = "/workspaces/my-python-ai-kata/vector_store_data"  # os.path.join(os.getcwd(), "vector_store_data")
+vector_store_config = get_application_config().vector_store
+# The store directory, relative to the working directory unless absolute
+work_dir = os.path.abspath(vector_store_config.get("path", "vector_store_data"))
 parquet_path = os.path.join(work_dir, "sklearn_vectorstore.parquet")
 
-print(f"Using vector store at {parquet_path!r} for LangGraph documentation queries.")
-query_helper = VectorStoreQueryHelper(parquet_path=parquet_path)
+
+def load_query_helper() -> "VectorStoreQueryHelper":
+    """Import the vector store dependencies and load the store.
+
+    Returns:
+        VectorStoreQueryHelper: The query helper
+    """
+    from my_python_ai_kata.mcp.vector_store_helpers import VectorStoreQueryHelper
+
+    report(f"Using vector store at {parquet_path!r} for LangGraph documentation queries.")
+    layout = vector_store_config.get("layout", "parquet")
+    if layout == "parquet" and worker_count() > 1:
+        # Share one memory-mapped copy of the store between the workers
+        report("Using the mmap layout, shared by the worker processes")
+        layout = "mmap"
+    return VectorStoreQueryHelper(
+        parquet_path=parquet_path,
+        index_backend=vector_store_config.get("index", "exact"),
+        index_params=vector_store_config.get("index_params", {}),
+        layout=layout,
+        dtype=vector_store_config.get("dtype", "float32"),
+        cache_size=vector_store_config.get("query_cache_size", 1024),
+        cache_ttl=vector_store_config.get("query_cache_ttl_seconds", 3600),
+        mode=vector_store_config.get("retrieval_mode", "dense"),
+        max_concurrent_queries=vector_store_config.get("max_concurrent_queries", 32),
+        max_pending_queries=vector_store_config.get("max_pending_queries", 256),
+        search_workers=vector_store_config.get("search_workers", 4),
+    )
+
+
+def load_llms_full() -> "LlmsFullReader":
+    """Map the llms_full.txt file of the store, which needs no vector store.
+
+    Returns:
+        LlmsFullReader: The reader of the file
+    """
+    from my_python_ai_kata.mcp.llms_full import LlmsFullReader
+
+    return LlmsFullReader(os.path.join(work_dir, "llms_full.txt"))
+
+
+query_helper_loader = BackgroundLoader("the vector store", load_query_helper)
+llms_full_loader = BackgroundLoader("llms_full.txt", load_llms_full)
+first_answer = FirstAnswerReporter()
 
 # Create an MCP server
 mcp = FastMCP("LangGraph-Docs-MCP-Server")
 
 
+def format_documents(docs: list[Document]) -> str:
+    """Format retrieved documents as a numbered context block.
+
+    Args:
+        docs (list[Document]): The retrieved documents
+
+    Returns:
+        str: The documents, one numbered section each
+    """
+    return "\n\n".join(
+        [f"==DOCUMENT {i + 1}==\n{doc.page_content}" for i, doc in enumerate(docs)]
+    )
+
+
 # Add a tool to query the LangGraph documentation
-@mcp.tool(description="Query the LangGraph documentation.")
-def langgraph_query_tool(query: str) -> str:
+@mcp.tool(
+    description="Query the LangGraph documentation. Use mode 'lexical' to look up "
+    "exact API names such as StateGraph.add_conditional_edges, 'dense' for "
+    "questions in natural language, or 'hybrid' for both."
+)
+async def langgraph_query_tool(
+    query: str, mode: Optional[Literal["dense", "lexical", "hybrid"]] = None
+) -> str:
     """Query the LangGraph documentation using a retriever.
 
     Args:
         query (str): The query to search the documentation with
+        mode (Optional[str]): The retrieval mode; defaults to the configured one
 
     Returns:
         str: A str of the retrieved documents
     """
-    relevant_docs = query_helper.query(query)
+    query_helper = await query_helper_loader.aget()
+    relevant_docs = await query_helper.aquery(query, mode=mode)
+    first_answer.answered("langgraph_query_tool")
+    return format_documents(relevant_docs)
+
+
+@mcp.tool(
+    description="Query the LangGraph documentation with several related questions "
+    "at once; cheaper than one call per question."
+)
+async def langgraph_query_many_tool(queries: list[str]) -> str:
+    """Query the LangGraph documentation with several queries in a single batch.
+
+    Args:
+        queries (list[str]): The queries to search the documentation with
 
-    formatted_context = "\n\n".join(
-        [
-            f"==DOCUMENT {i + 1}==\n{doc.page_content}"
-            for i, doc in enumerate(relevant_docs)
-        ]
+    Returns:
+        str: The retrieved documents, grouped by query
+    """
+    query_helper = await query_helper_loader.aget()
+    results = await query_helper.aquery_many(queries)
+    first_answer.answered("langgraph_query_many_tool")
+    return "\n\n".join(
+        f"==QUERY {i + 1}: {query}==\n{format_documents(docs)}"
+        for i, (query, docs) in enumerate(zip(queries, results))
     )
-    return formatted_context
 
 
 # The @mcp.resource() decorator is meant to map a URI pattern to a function that provides the resource content
@@ -46,7 +154,7 @@ def langgraph_query_tool(query: str) -> str:
     uri="docs://langgraph/full",
     description="Get all LangGraph documentation in one single shot.",
 )
-def get_all_langgraph_docs() -> str:
+async def get_all_langgraph_docs() -> str:
     """Get all the LangGraph documentation.
 
     Returns the contents of the file llms_full.txt,
@@ -56,10 +164,185 @@ def get_all_langgraph_docs() -> str:
     Returns:
         str: The contents of the LangGraph documentation
     """
-    # Local path to the LangGraph documentation
-    return query_helper.get_llms_full()
+    try:
+        llms_full = await llms_full_loader.aget()
+    except FileNotFoundError:
+        return "llms_full.txt not found. Please ensure the vector store has been created."
+    return llms_full.text()
+
+
+@mcp.resource(
+    uri="docs://langgraph/index",
+    description="List the LangGraph documents by number, with their source URL "
+    "and size; read them one at a time with docs://langgraph/doc/{n}.",
+)
+async def get_langgraph_docs_index() -> str:
+    """Get the table of contents of the LangGraph documentation.
+
+    Returns:
+        str: One tab separated line per document: number, source and size in bytes
+    """
+    llms_full = await llms_full_loader.aget()
+    sizes = llms_full.ends - llms_full.content_starts
+    return "\n".join(
+        f"{n}\t{source}\t{size}"
+        for n, (source, size) in enumerate(zip(llms_full.sources, sizes), start=1)
+    )
+
+
+@mcp.resource(
+    uri="docs://langgraph/doc/{n}",
+    description="Get a single LangGraph document by number.",
+)
+async def get_langgraph_doc(n: int) -> str:
+    """Get a single LangGraph document.
+
+    Args:
+        n (int): The document number, from 1
+
+    Returns:
+        str: The document, with its number and source
+    """
+    return (await llms_full_loader.aget()).document(int(n))
+
+
+@mcp.resource(
+    uri="docs://langgraph/source/{url}",
+    description="Get the LangGraph document crawled from a URL; the URL must be "
+    "percent-encoded, slashes included.",
+)
+async def get_langgraph_doc_by_source(url: str) -> str:
+    """Get the LangGraph document crawled from a source URL.
+
+    Args:
+        url (str): The percent-encoded source URL
+
+    Returns:
+        str: The document, with its number and source
+    """
+    llms_full = await llms_full_loader.aget()
+    n = llms_full.find(unquote(url))
+    if n is None:
+        raise ValueError(f"No LangGraph document was crawled from {unquote(url)!r}")
+    return llms_full.document(n)
+
+
+@mcp.resource(
+    uri="docs://langgraph/bytes/{start}/{end}",
+    description="Get a byte range of the full LangGraph documentation.",
+)
+async def get_langgraph_docs_bytes(start: int, end: int) -> str:
+    """Get a byte range of the file llms_full.txt.
+
+    Args:
+        start (int): The first byte offset
+        end (int): The byte offset after the range
+
+    Returns:
+        str: The range, without the characters cut by its boundaries
+    """
+    return (await llms_full_loader.aget()).read_bytes(int(start), int(end))
+
+
+@mcp.resource(
+    uri="docs://langgraph/tokens/{start}/{end}",
+    description="Get a token range of the full LangGraph documentation, to page "
+    "through it within a context budget.",
+)
+async def get_langgraph_docs_tokens(start: int, end: int) -> str:
+    """Get a token range of the file llms_full.txt.
+
+    Args:
+        start (int): The first token offset
+        end (int): The token offset after the range
+
+    Returns:
+        str: The decoded range
+    """
+    return (await llms_full_loader.aget()).read_tokens(int(start), int(end))
+
+
+@mcp.resource(
+    uri="docs://langgraph/cache-stats",
+    description="Get the hit and miss counters of the query caches, and the "
+    "query concurrency counters.",
+)
+async def get_query_cache_stats() -> str:
+    """Get the statistics of the query embedding and result caches.
+
+    Returns:
+        str: One line per cache, with its hits, misses, evictions and expirations,
+        and one line with the running, waiting and rejected queries
+    """
+    if not query_helper_loader.ready:
+        return "The vector store is not loaded yet."
+    query_helper = await query_helper_loader.aget()
+    return "\n".join(
+        [f"{name}: {stats}" for name, stats in query_helper.cache_stats.items()]
+        + [f"queries: {query_helper.limiter.stats}"]
+    )
+
+
+def apply_startup_policy(startup: Optional[str] = None) -> None:
+    """Start loading the store and llms_full.txt according to a startup policy.
+
+    Args:
+        startup (Optional[str]): The startup policy; defaults to the configured one
+    """
+    startup = startup or vector_store_config.get("startup", "lazy")
+    if startup == "eager":
+        query_helper = query_helper_loader.get()
+        for query in vector_store_config.get("warmup_queries", []):
+            query_helper.query(query)
+        llms_full_loader.start()
+        report("Warm-up complete")
+    elif startup == "background":
+        query_helper_loader.start()
+        llms_full_loader.start()
+
+
+def main() -> None:
+    """Load the store according to the startup policy, and run the server."""
+    parser = argparse.ArgumentParser(description="LangGraph documentation MCP server.")
+    parser.add_argument(
+        "--startup",
+        choices=STARTUP_POLICIES,
+        default=vector_store_config.get("startup", "lazy"),
+        help="When to load the vector store (default: from the configuration)",
+    )
+    parser.add_argument(
+        "--transport", choices=["stdio", "streamable-http"], default="stdio"
+    )
+    parser.add_argument("--port", type=int, default=mcp.settings.port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=vector_store_config.get("workers", 1),
+        help="Worker processes of the streamable-http transport (default: from the configuration)",
+    )
+    parser.add_argument(
+        "--stateful",
+        action="store_true",
+        help="Keep MCP sessions across workers, pinned by a session affinity proxy",
+    )
+    args = parser.parse_args()
+
+    if args.transport == "streamable-http" and args.workers > 1:
+        serve(
+            "my_python_ai_kata.mcp.langgraph_query_tool:mcp",
+            args.workers,
+            host=mcp.settings.host,
+            port=args.port,
+            stateful=args.stateful,
+            startup=args.startup,
+        )
+        return
+    apply_startup_policy(args.startup)
+    mcp.settings.port = args.port
+    report(f"Serving over {args.transport} ({args.startup} startup)")
+    mcp.run(transport=args.transport)
 
 
 if __name__ == "__main__":
     # Initialize and run the server
-    mcp.run(transport="stdio")
+    main()
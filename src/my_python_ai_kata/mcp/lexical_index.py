@@ -0,0 +1,281 @@
+"""BM25 inverted index over the vector store chunks, for offline lexical search.
+
+Dense retrieval is poor at exact API names such as
+``StateGraph.add_conditional_edges``, and every query costs an embedding
+request. The lexical index is built from the same chunks at ingest time and
+persisted next to the parquet file, so exact names can be looked up locally,
+or fused with the dense results by reciprocal rank.
+
+Identifiers are indexed whole and split: ``StateGraph.add_conditional_edges``
+yields the dotted name, ``stategraph`` and ``add_conditional_edges``, and the
+sub-words ``state``, ``graph``, ``add``, ``conditional`` and ``edges``. The
+postings are kept in compressed sparse rows, with the BM25 weight of every
+posting precomputed, so a query is a few vectorized additions.
+"""
+
+import os
+import re
+from collections import Counter
+from collections.abc import Iterable
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import chain
+from typing import Optional
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from my_python_ai_kata.mcp.vector_index import fingerprint
+from my_python_ai_kata.mcp.vector_index import index_path
+from my_python_ai_kata.mcp.vector_index import top_k
+
+
+LEXICAL_BACKEND = "bm25"
+MAX_TERM_LENGTH = 64
+DEFAULT_RRF_CONSTANT = 60
+
+_IDENTIFIER_RE = re.compile(r"\w+(?:\.\w+)*")
+_SUBWORD_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+@lru_cache(maxsize=1 << 16)
+def _identifier_terms(name: str) -> tuple[str, ...]:
+    """Expand a possibly dotted identifier into its terms; words repeat a lot."""
+    parts = name.split(".")
+    terms = [name.lower()] if len(parts) > 1 else []
+    for part in parts:
+        terms.append(part.lower())
+        words = _SUBWORD_RE.findall(part)
+        if len(words) > 1:
+            terms.extend(word.lower() for word in words)
+    return tuple(term for term in terms if len(term) <= MAX_TERM_LENGTH)
+
+
+def lexical_terms(text: str) -> list[str]:
+    """Split a text into lower-cased terms, expanding identifiers.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list[str]: The terms, in order, with repetitions.
+    """
+    return list(
+        chain.from_iterable(map(_identifier_terms, _IDENTIFIER_RE.findall(text)))
+    )
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[int]], k: int, constant: int = DEFAULT_RRF_CONSTANT
+) -> list[int]:
+    """Fuse several rankings of the same items by reciprocal rank.
+
+    Every item scores ``1 / (constant + rank)`` in each ranking it appears in.
+
+    Args:
+        rankings (Sequence[Sequence[int]]): The rankings, best item first.
+        k (int): Number of fused results.
+        constant (int): Dampens the weight of the top ranks.
+
+    Returns:
+        list[int]: The k best items, best first; ties keep the first ranking order.
+    """
+    scores: dict[int, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (constant + rank)
+    return sorted(scores, key=lambda item: -scores[item])[:k]
+
+
+class BM25Index:
+    """Okapi BM25 index over a fixed list of texts."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """Initialize an empty index.
+
+        Args:
+            k1 (float): Term frequency saturation.
+            b (float): Document length normalization.
+        """
+        self.k1 = k1
+        self.b = b
+        self.fingerprint = ""
+        self.count = 0
+        self.terms: dict[str, int] = {}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.doc_ids = np.zeros(0, dtype=np.int32)
+        self.weights = np.zeros(0, dtype=np.float32)
+
+    def build(self, texts: Iterable[str]) -> None:
+        """Index the texts; their positions are the document ids.
+
+        Args:
+            texts (Iterable[str]): The texts to index, in store order.
+        """
+        terms: dict[str, int] = {}
+        term_ids: list[np.ndarray] = []
+        frequencies: list[np.ndarray] = []
+        lengths: list[int] = []
+        for text in texts:
+            ids = [terms.setdefault(term, len(terms)) for term in lexical_terms(text)]
+            unique_ids, counts = np.unique(
+                np.asarray(ids, dtype=np.int32), return_counts=True
+            )
+            term_ids.append(unique_ids)
+            frequencies.append(counts)
+            lengths.append(len(ids))
+
+        self.count = len(lengths)
+        self.terms = terms
+        all_term_ids = np.concatenate(term_ids or [np.zeros(0, dtype=np.int32)])
+        order = np.argsort(all_term_ids, kind="stable")
+        posting_terms = all_term_ids[order]
+        self.doc_ids = np.repeat(
+            np.arange(self.count, dtype=np.int32),
+            [len(ids) for ids in term_ids],
+        )[order]
+        document_frequencies = np.bincount(posting_terms, minlength=len(terms))
+        self.offsets = np.concatenate(([0], np.cumsum(document_frequencies)))
+
+        idf = np.log1p(
+            (self.count - document_frequencies + 0.5) / (document_frequencies + 0.5)
+        )
+        tf = np.concatenate(frequencies or [np.zeros(0)]).astype(np.float32)[order]
+        doc_lengths = np.asarray(lengths, dtype=np.float32)
+        average_length = max(float(doc_lengths.mean()) if self.count else 0.0, 1.0)
+        norms = self.k1 * (1 - self.b + self.b * doc_lengths / average_length)
+        self.weights = (
+            idf[posting_terms] * tf * (self.k1 + 1) / (tf + norms[self.doc_ids])
+        ).astype(np.float32)
+
+    def scores(self, query: str) -> np.ndarray:
+        """Score every document against a query.
+
+        Args:
+            query (str): The query text.
+
+        Returns:
+            np.ndarray: The BM25 score of every document, 0 if no term matches.
+        """
+        scores = np.zeros(self.count, dtype=np.float32)
+        for term, frequency in Counter(lexical_terms(query)).items():
+            term_id = self.terms.get(term)
+            if term_id is not None:
+                start, end = self.offsets[term_id], self.offsets[term_id + 1]
+                # Documents are unique within a posting list
+                scores[self.doc_ids[start:end]] += frequency * self.weights[start:end]
+        return scores
+
+    def search(self, queries: Sequence[str], k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Find the k best matching documents of every query.
+
+        Args:
+            queries (Sequence[str]): The query texts.
+            k (int): Number of results per query.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (queries, k) document ids and
+            scores, best first. Missing results have id -1.
+        """
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.zeros((len(queries), k), dtype=np.float32)
+        for q, query in enumerate(queries):
+            query_scores = self.scores(query)
+            matches = np.flatnonzero(query_scores)
+            if len(matches):
+                best, best_scores = top_k(query_scores[matches][None, :], k)
+                indices[q, : best.shape[1]] = matches[best[0]]
+                scores[q, : best.shape[1]] = best_scores[0]
+        return indices, scores
+
+    def save(self, path: str) -> None:
+        """Persist the vocabulary and the postings as a NumPy archive.
+
+        Args:
+            path (str): The index file path.
+        """
+        vocabulary = "\n".join(self.terms).encode()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                vocabulary=np.frombuffer(vocabulary, dtype=np.uint8),
+                offsets=self.offsets,
+                doc_ids=self.doc_ids,
+                weights=self.weights,
+                params=np.array([self.k1, self.b, self.count], dtype=np.float64),
+                fingerprint=np.array(self.fingerprint),
+            )
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        """Load the vocabulary and the postings.
+
+        Args:
+            path (str): The index file path.
+        """
+        with np.load(path) as data:
+            vocabulary = data["vocabulary"].tobytes().decode()
+            self.terms = (
+                {term: i for i, term in enumerate(vocabulary.split("\n"))}
+                if vocabulary
+                else {}
+            )
+            self.offsets = data["offsets"]
+            self.doc_ids = data["doc_ids"]
+            self.weights = data["weights"]
+            k1, b, count = data["params"]
+            self.k1, self.b, self.count = float(k1), float(b), int(count)
+            self.fingerprint = str(data["fingerprint"])
+
+
+def build_lexical_index(parquet_path: str, batch_size: int = 1024) -> BM25Index:
+    """Build and persist the lexical index of a parquet store.
+
+    Only the ids and texts are read, a batch at a time.
+
+    Args:
+        parquet_path (str): Path to the vector store parquet file.
+        batch_size (int): Number of rows read at once.
+
+    Returns:
+        BM25Index: The index, tagged with the fingerprint of the chunk ids.
+    """
+    ids: list[str] = []
+
+    def texts() -> Iterable[str]:
+        parquet = pq.ParquetFile(parquet_path)
+        for batch in parquet.iter_batches(batch_size, columns=["ids", "texts"]):
+            ids.extend(batch.column("ids").to_pylist())
+            yield from batch.column("texts").to_pylist()
+
+    index = BM25Index()
+    index.build(texts())
+    index.fingerprint = fingerprint(ids)
+    path = index_path(parquet_path, LEXICAL_BACKEND)
+    index.save(path)
+    print(f"Lexical index of {index.count} chunks persisted to {path!r}")
+    return index
+
+
+def load_or_build_lexical_index(
+    parquet_path: str, store_fingerprint: Optional[str] = None
+) -> BM25Index:
+    """Load the persisted lexical index of a store, rebuilding it if it is stale.
+
+    Args:
+        parquet_path (str): Path to the vector store parquet file.
+        store_fingerprint (Optional[str]): The fingerprint of the stored chunk
+            ids. When None, a persisted index is trusted as is.
+
+    Returns:
+        BM25Index: The lexical index of the store.
+    """
+    path = index_path(parquet_path, LEXICAL_BACKEND)
+    if os.path.isfile(path):
+        index = BM25Index()
+        index.load(path)
+        if store_fingerprint in (None, index.fingerprint):
+            return index
+        print(f"Lexical index {path!r} is stale, rebuilding it...")
+    return build_lexical_index(parquet_path)
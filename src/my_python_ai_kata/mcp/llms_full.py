@@ -0,0 +1,368 @@
+"""Writer and reader of the llms_full.txt file that concatenates all the crawled documents.
+
+Next to ``llms_full.txt``, the writer saves ``llms_full.index.json`` with the
+source and the byte offsets of every document. The reader memory-maps the file
+and uses the index to serve single documents, or byte and token ranges,
+without reading or sending the whole file.
+"""
+
+import json
+import mmap
+import os
+import re
+import threading
+from itertools import chain
+from types import TracebackType
+from typing import Optional
+
+import numpy as np
+from langchain_core.documents import Document
+
+from my_python_ai_kata.mcp.mmap_vector_store import source_stamp
+from my_python_ai_kata.mcp.tokenizers import DEFAULT_ENCODING
+from my_python_ai_kata.mcp.tokenizers import count_tokens_batch
+from my_python_ai_kata.mcp.tokenizers import get_encoder
+from my_python_ai_kata.mcp.vector_store_manifest import document_source
+
+
+DOCUMENT_SEPARATOR = f"\n\n{'=' * 80}\n\n"
+INDEX_VERSION = 1
+
+_HEADER_RE = re.compile(rb"DOCUMENT \d+\nSOURCE: ([^\n]*)\nCONTENT:\n")
+
+
+def llms_full_index_path(path: str) -> str:
+    """Return the path of the offset index of an llms_full.txt file.
+
+    Args:
+        path (str): Path to the llms_full.txt file.
+
+    Returns:
+        str: The path of the index file.
+    """
+    return f"{os.path.splitext(path)[0]}.index.json"
+
+
+def write_llms_full_index(
+    path: str,
+    sources: list[str],
+    starts: list[int],
+    content_starts: list[int],
+    ends: list[int],
+) -> None:
+    """Save the offset index of an llms_full.txt file.
+
+    The index is tagged with the stamp of the file, so that a reader can tell
+    whether it is still in sync.
+
+    Args:
+        path (str): Path to the llms_full.txt file.
+        sources (list[str]): The source of every document.
+        starts (list[int]): The byte offset of every document header.
+        content_starts (list[int]): The byte offset of every document content.
+        ends (list[int]): The byte offset of the end of every document content.
+    """
+    index_path = llms_full_index_path(path)
+    with open(f"{index_path}.tmp", "w") as f:
+        json.dump(
+            {
+                "version": INDEX_VERSION,
+                "stamp": source_stamp(path),
+                "sources": sources,
+                "starts": starts,
+                "content_starts": content_starts,
+                "ends": ends,
+            },
+            f,
+        )
+    os.replace(f"{index_path}.tmp", index_path)
+
+
+def build_llms_full_index(path: str) -> None:
+    """Rebuild the offset index of an llms_full.txt file by scanning its headers.
+
+    Args:
+        path (str): Path to the llms_full.txt file.
+    """
+    separator = DOCUMENT_SEPARATOR.encode()
+    sources: list[str] = []
+    starts: list[int] = []
+    content_starts: list[int] = []
+    ends: list[int] = []
+    with open(path, "rb") as f:
+        data = f.read()
+    position = 0
+    while (match := _HEADER_RE.match(data, position)) is not None:
+        end = data.find(separator, match.end())
+        end = len(data) if end < 0 else end
+        sources.append(match.group(1).decode())
+        starts.append(match.start())
+        content_starts.append(match.end())
+        ends.append(end)
+        position = end + len(separator)
+    write_llms_full_index(path, sources, starts, content_starts, ends)
+    print(f"Indexed {len(sources)} documents of {path!r}")
+
+
+class LlmsFullWriter:
+    """Append documents to llms_full.txt one at a time, as they are crawled.
+
+    The documents are written to a temporary file that atomically replaces the
+    target on a successful close, followed by the offset index.
+    """
+
+    def __init__(self, path: str):
+        """Open the output file.
+
+        Args:
+            path (str): Path to the llms_full.txt file.
+        """
+        self.path = path
+        self.count = 0
+        self.sources: list[str] = []
+        self.starts: list[int] = []
+        self.content_starts: list[int] = []
+        self.ends: list[int] = []
+        self._tmp_path = f"{path}.tmp"
+        self._file = open(self._tmp_path, "wb")  # noqa: SIM115
+        self._separator = DOCUMENT_SEPARATOR.encode()
+
+    def write(self, document: Document) -> None:
+        """Append a document.
+
+        Args:
+            document (Document): The document to append.
+        """
+        self.count += 1
+        source = document_source(document)
+        header = f"DOCUMENT {self.count}\nSOURCE: {source}\nCONTENT:\n".encode()
+        content = document.page_content.encode()
+        start = self._file.tell()
+        self._file.write(header + content + self._separator)
+        self.sources.append(source)
+        self.starts.append(start)
+        self.content_starts.append(start + len(header))
+        self.ends.append(start + len(header) + len(content))
+
+    def close(self) -> None:
+        """Close the output file, replace the target and save the offset index."""
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        write_llms_full_index(
+            self.path, self.sources, self.starts, self.content_starts, self.ends
+        )
+
+    def abort(self) -> None:
+        """Discard everything written so far, leaving the target untouched."""
+        self._file.close()
+        os.remove(self._tmp_path)
+
+    def __enter__(self) -> "LlmsFullWriter":
+        """Return the writer itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Commit the file on success, discard it on error."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class LlmsFullReader:
+    """Serve parts of a memory-mapped llms_full.txt file through its offset index.
+
+    The file is remapped when it is rewritten, and its index is rebuilt if it
+    is missing or out of date. Documents are numbered from 1, as in the file.
+    Token offsets count the tokens of every document, separator included,
+    encoded on its own; they are computed on the first token range read.
+    """
+
+    def __init__(self, path: str, encoding_name: str = DEFAULT_ENCODING):
+        """Map the file.
+
+        Args:
+            path (str): Path to the llms_full.txt file.
+            encoding_name (str): The tiktoken encoding of the token ranges.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        self.path = path
+        self.encoding_name = encoding_name
+        self._stamp = ""
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Remap the file and reload its index if the file was rewritten.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        stamp = source_stamp(self.path)
+        if not stamp:
+            raise FileNotFoundError(self.path)
+        if stamp == self._stamp:
+            return
+        with self._lock:
+            if stamp == self._stamp:
+                return
+            index = self._read_index(stamp)
+            if index is None:
+                build_llms_full_index(self.path)
+                index = self._read_index(stamp) or {}
+            with open(self.path, "rb") as f:
+                self._data = (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if os.fstat(f.fileno()).st_size
+                    else b""
+                )
+            self.sources: list[str] = index.get("sources", [])
+            self.starts = np.asarray(index.get("starts", []), dtype=np.int64)
+            self.content_starts = np.asarray(
+                index.get("content_starts", []), dtype=np.int64
+            )
+            self.ends = np.asarray(index.get("ends", []), dtype=np.int64)
+            self._by_source: dict[str, int] = {}
+            for n, source in enumerate(self.sources, start=1):
+                self._by_source.setdefault(source, n)
+            self._token_offsets: Optional[np.ndarray] = None
+            self._stamp = stamp
+
+    def _read_index(self, stamp: str) -> Optional[dict]:
+        """Read the offset index, if it exists and matches the file stamp."""
+        try:
+            with open(llms_full_index_path(self.path)) as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if index.get("version") != INDEX_VERSION or index.get("stamp") != stamp:
+            return None
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of documents."""
+        self.refresh()
+        return len(self.sources)
+
+    @property
+    def size(self) -> int:
+        """The size of the file, in bytes."""
+        self.refresh()
+        return len(self._data)
+
+    def text(self) -> str:
+        """Return the whole file.
+
+        Returns:
+            str: The contents of the file.
+        """
+        self.refresh()
+        return self._data[:].decode()
+
+    def document(self, n: int, content_only: bool = False) -> str:
+        """Return a single document.
+
+        Args:
+            n (int): The document number, from 1.
+            content_only (bool): Whether to leave out the document header.
+
+        Returns:
+            str: The document.
+
+        Raises:
+            IndexError: If there is no such document.
+        """
+        self.refresh()
+        if not 1 <= n <= len(self.sources):
+            raise IndexError(f"No document {n}, there are {len(self.sources)}")
+        start = self.content_starts[n - 1] if content_only else self.starts[n - 1]
+        return self._data[start : self.ends[n - 1]].decode()
+
+    def find(self, source: str) -> Optional[int]:
+        """Return the number of the first document of a source.
+
+        Args:
+            source (str): The document source URL.
+
+        Returns:
+            Optional[int]: The document number, or None.
+        """
+        self.refresh()
+        return self._by_source.get(source) or self._by_source.get(
+            source.rstrip("/") if source.endswith("/") else f"{source}/"
+        )
+
+    def read_bytes(self, start: int, end: int) -> str:
+        """Return a byte range of the file.
+
+        Characters cut by the range boundaries are left out.
+
+        Args:
+            start (int): The first byte offset.
+            end (int): The byte offset after the range.
+
+        Returns:
+            str: The decoded range.
+        """
+        self.refresh()
+        return self._data[max(start, 0) : max(end, 0)].decode(errors="ignore")
+
+    @property
+    def token_offsets(self) -> np.ndarray:
+        """The token offset of every document, and the total token count.
+
+        Returns:
+            np.ndarray: A (documents + 1,) int64 array of cumulative counts.
+        """
+        self.refresh()
+        if self._token_offsets is None:
+            bounds = np.append(self.starts, len(self._data))
+            counts = count_tokens_batch(
+                [
+                    self._data[bounds[i] : bounds[i + 1]].decode()
+                    for i in range(len(self.starts))
+                ],
+                self.encoding_name,
+            )
+            self._token_offsets = np.concatenate(([0], np.cumsum(counts)))
+        return self._token_offsets
+
+    def read_tokens(self, start: int, end: int) -> str:
+        """Return a token range of the file.
+
+        Only the documents overlapping the range are encoded.
+
+        Args:
+            start (int): The first token offset.
+            end (int): The token offset after the range.
+
+        Returns:
+            str: The decoded range.
+        """
+        offsets = self.token_offsets
+        start, end = max(start, 0), min(end, int(offsets[-1]))
+        if start >= end:
+            return ""
+        first = int(np.searchsorted(offsets, start, side="right")) - 1
+        last = int(np.searchsorted(offsets, end, side="left"))
+        bounds = np.append(self.starts, len(self._data))
+        encoder = get_encoder(self.encoding_name)
+        tokens = list(
+            chain.from_iterable(
+                encoder.encode_ordinary_batch(
+                    [
+                        self._data[bounds[i] : bounds[i + 1]].decode()
+                        for i in range(first, last)
+                    ]
+                )
+            )
+        )
+        skip = start - int(offsets[first])
+        return encoder.decode(tokens[skip : skip + end - start])
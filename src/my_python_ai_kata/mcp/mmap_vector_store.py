@@ -0,0 +1,335 @@
+"""Memory-mapped vector store layout for fast-starting query servers.
+
+The parquet store is exported, next to the parquet file, to:
+
+* ``<name>.vectors.npy``: the unit-length embeddings, as a float32 or float16
+  matrix;
+* ``<name>.chunks.jsonl``: one ``{"id", "text", "metadata"}`` line per chunk;
+* ``<name>.offsets.npy``: the byte offset of every line of the JSONL file;
+* ``<name>.mmap.json``: the layout metadata, written last.
+
+Opening the store only maps these files: nothing is parsed or copied, pages
+are read on demand, and every process serving the same store shares a single
+page-cached copy of them.
+"""
+
+import json
+import mmap
+import os
+from collections.abc import Sequence
+from dataclasses import asdict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
+from typing import Optional
+
+import numpy as np
+import pyarrow.parquet as pq
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from my_python_ai_kata.mcp.ingestion_pipeline import read_store_rows
+from my_python_ai_kata.mcp.vector_index import DEFAULT_BACKEND
+from my_python_ai_kata.mcp.vector_index import VectorIndex
+from my_python_ai_kata.mcp.vector_index import fingerprint
+from my_python_ai_kata.mcp.vector_index import load_or_build_index
+from my_python_ai_kata.mcp.vector_index import normalize
+
+
+LAYOUT_VERSION = 1
+DTYPES = ("float32", "float16")
+
+
+@dataclass
+class MmapLayout:
+    """The metadata of an exported store."""
+
+    count: int
+    dim: int
+    dtype: str
+    fingerprint: str
+    source_stamp: str
+    version: int = LAYOUT_VERSION
+
+
+def mmap_prefix(parquet_path: str) -> str:
+    """Return the common path prefix of the memory-mapped files of a store.
+
+    Args:
+        parquet_path (str): Path to the vector store parquet file.
+
+    Returns:
+        str: The prefix, the parquet path without its extension.
+    """
+    return os.path.splitext(parquet_path)[0]
+
+
+def source_stamp(parquet_path: str) -> str:
+    """Identify the version of a parquet file from its size and modification time.
+
+    Args:
+        parquet_path (str): Path to the vector store parquet file.
+
+    Returns:
+        str: The stamp, empty if the file does not exist.
+    """
+    try:
+        stat = os.stat(parquet_path)
+    except FileNotFoundError:
+        return ""
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def read_layout(parquet_path: str) -> Optional[MmapLayout]:
+    """Read the metadata of the exported store, if there is one.
+
+    Args:
+        parquet_path (str): Path to the vector store parquet file.
+
+    Returns:
+        Optional[MmapLayout]: The layout metadata, or None.
+    """
+    try:
+        with open(f"{mmap_prefix(parquet_path)}.mmap.json") as f:
+            layout = MmapLayout(**json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, TypeError):
+        return None
+    return layout if layout.version == LAYOUT_VERSION else None
+
+
+def export_mmap_store(
+    parquet_path: str, dtype: str = "float32", batch_size: int = 1024
+) -> MmapLayout:
+    """Export a parquet store to the memory-mapped layout, a batch at a time.
+
+    Args:
+        parquet_path (str): Path to the vector store parquet file.
+        dtype (str): The matrix dtype, "float32" or "float16".
+        batch_size (int): Number of rows converted at once.
+
+    Returns:
+        MmapLayout: The metadata of the exported store.
+
+    Raises:
+        ValueError: If the dtype is not supported.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported dtype {dtype!r}, expected one of {DTYPES}")
+    prefix = mmap_prefix(parquet_path)
+    suffix = f".{os.getpid()}.tmp"
+    stamp = source_stamp(parquet_path)
+    count = pq.ParquetFile(parquet_path).metadata.num_rows
+    rows = read_store_rows(parquet_path, batch_size)
+    first = next(rows, None)
+    dim = len(first["embeddings"]) if first else 0
+
+    vectors = np.lib.format.open_memmap(
+        f"{prefix}.vectors.npy{suffix}", mode="w+", dtype=dtype, shape=(count, dim)
+    )
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    ids: list[str] = []
+    with open(f"{prefix}.chunks.jsonl{suffix}", "wb") as chunks:
+        batch: list[list[float]] = []
+        for i, row in enumerate(chain([first], rows) if first else rows):
+            line = json.dumps(
+                {"id": row["ids"], "text": row["texts"], "metadata": row["metadatas"]}
+            ).encode()
+            chunks.write(line + b"\n")
+            offsets[i + 1] = offsets[i] + len(line) + 1
+            ids.append(row["ids"])
+            batch.append(row["embeddings"])
+            if len(batch) == batch_size or i == count - 1:
+                vectors[i + 1 - len(batch) : i + 1] = normalize(np.asarray(batch))
+                batch = []
+    vectors.flush()
+    del vectors
+    with open(f"{prefix}.offsets.npy{suffix}", "wb") as f:
+        np.save(f, offsets, allow_pickle=False)
+    os.replace(f"{prefix}.offsets.npy{suffix}", f"{prefix}.offsets.npy")
+
+    layout = MmapLayout(count, dim, dtype, fingerprint(ids), stamp)
+    for name in ("vectors.npy", "chunks.jsonl"):
+        os.replace(f"{prefix}.{name}{suffix}", f"{prefix}.{name}")
+    with open(f"{prefix}.mmap.json{suffix}", "w") as f:
+        json.dump(asdict(layout), f)
+    os.replace(f"{prefix}.mmap.json{suffix}", f"{prefix}.mmap.json")
+    print(f"Exported {count} chunks to the memory-mapped layout at {prefix!r}")
+    return layout
+
+
+class MmapVectorStore(VectorStore):
+    """Read-only vector store over the memory-mapped layout."""
+
+    def __init__(
+        self,
+        parquet_path: str,
+        embedding: Embeddings,
+        index_backend: str = DEFAULT_BACKEND,
+        index_params: Optional[dict[str, Any]] = None,
+        dtype: str = "float32",
+    ):
+        """Map the exported store, exporting it first if it is missing or stale.
+
+        Args:
+            parquet_path (str): Path to the vector store parquet file.
+            embedding (Embeddings): The embedding model used for queries.
+            index_backend (str): The index backend name.
+            index_params (Optional[dict[str, Any]]): Backend specific parameters.
+            dtype (str): The matrix dtype, "float32" or "float16".
+        """
+        self.parquet_path = parquet_path
+        self.embedding = embedding
+        layout = read_layout(parquet_path)
+        stamp = source_stamp(parquet_path)
+        if (
+            layout is None
+            or layout.dtype != dtype
+            or stamp not in ("", layout.source_stamp)
+        ):
+            layout = export_mmap_store(parquet_path, dtype)
+        self.layout = layout
+
+        prefix = mmap_prefix(parquet_path)
+        self.vectors = np.load(f"{prefix}.vectors.npy", mmap_mode="r")
+        self.offsets = np.load(f"{prefix}.offsets.npy", mmap_mode="r")
+        with open(f"{prefix}.chunks.jsonl", "rb") as f:
+            self._chunks = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if layout.count
+                else b""
+            )
+        params = dict(index_params or {})
+        if index_backend == "exact":
+            params["normalized"] = True
+        self.index: VectorIndex = load_or_build_index(
+            parquet_path, self.vectors, layout.fingerprint, index_backend, **params
+        )
+
+    @property
+    def embeddings(self) -> Embeddings:
+        """The embedding model used for queries."""
+        return self.embedding
+
+    def __len__(self) -> int:
+        """Return the number of stored chunks."""
+        return self.layout.count
+
+    def document(self, i: int) -> Document:
+        """Read the i-th chunk from the mapped JSONL file.
+
+        Args:
+            i (int): The chunk position.
+
+        Returns:
+            Document: The chunk, with its id in the metadata.
+        """
+        chunk = json.loads(self._chunks[self.offsets[i] : self.offsets[i + 1]])
+        return Document(
+            page_content=chunk["text"],
+            metadata={"id": chunk["id"], **(chunk["metadata"] or {})},
+        )
+
+    def similarity_search_by_vector_with_score(
+        self, embedding: list[float], k: int = 4
+    ) -> list[tuple[Document, float]]:
+        """Search the chunks closest to an embedding.
+
+        Args:
+            embedding (list[float]): The query embedding.
+            k (int): Number of results.
+
+        Returns:
+            list[tuple[Document, float]]: The chunks and their cosine distances.
+        """
+        indices, similarities = self.index.search(
+            np.asarray([embedding], dtype=np.float32), k
+        )
+        return [
+            (self.document(int(i)), 1.0 - float(similarity))
+            for i, similarity in zip(indices[0], similarities[0], strict=True)
+            if i >= 0
+        ]
+
+    def similarity_search_by_vector(
+        self, embedding: list[float], k: int = 4, **kwargs: Any
+    ) -> list[Document]:
+        """Return the chunks closest to an already computed query embedding.
+
+        Args:
+            embedding (list[float]): The query embedding.
+            k (int): Number of results.
+            **kwargs (Any): Unused.
+
+        Returns:
+            list[Document]: The closest chunks.
+        """
+        return [
+            doc for doc, _ in self.similarity_search_by_vector_with_score(embedding, k)
+        ]
+
+    def similarity_search_by_vectors(
+        self, embeddings: Sequence[list[float]], k: int = 4
+    ) -> list[list[Document]]:
+        """Return the chunks closest to each of several query embeddings.
+
+        All the queries are scored together, in a single search.
+
+        Args:
+            embeddings (Sequence[list[float]]): The query embeddings.
+            k (int): Number of results per query.
+
+        Returns:
+            list[list[Document]]: The closest chunks of every query.
+        """
+        if not embeddings:
+            return []
+        indices, _ = self.index.search(np.asarray(embeddings, dtype=np.float32), k)
+        return [[self.document(int(i)) for i in row if i >= 0] for row in indices]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, float]]:
+        """Embed a query and search the closest chunks.
+
+        Args:
+            query (str): The query.
+            k (int): Number of results.
+            **kwargs (Any): Unused.
+
+        Returns:
+            list[tuple[Document, float]]: The chunks and their cosine distances.
+        """
+        return self.similarity_search_by_vector_with_score(
+            self.embedding.embed_query(query), k
+        )
+
+    def similarity_search(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[Document]:
+        """Embed a query and return the closest chunks.
+
+        Args:
+            query (str): The query.
+            k (int): Number of results.
+            **kwargs (Any): Unused.
+
+        Returns:
+            list[Document]: The closest chunks.
+        """
+        return [doc for doc, _ in self.similarity_search_with_score(query, k)]
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: Optional[list[dict]] = None,
+        **kwargs: Any,
+    ) -> "MmapVectorStore":
+        """Not supported: export a parquet store with export_mmap_store instead.
+
+        Raises:
+            NotImplementedError: Always.
+        """
+        raise NotImplementedError("MmapVectorStore is read-only")
@@ -0,0 +1,329 @@
+"""Run an MCP server as several worker processes behind streamable HTTP.
+
+A single ``mcp.run(...)`` process answers every request on one core. This
+module serves the ``mcp`` object of a server module from N processes, in one
+of two ways:
+
+* stateless (the default): every worker runs the server in stateless HTTP
+  mode and listens on the same socket, shared by uvicorn, so the kernel
+  spreads the connections. Any worker can answer any request, so no session
+  affinity is needed; server-initiated messages are not available;
+* stateful: every worker listens on its own port (``port + 1`` to
+  ``port + N``) behind a ``SessionAffinityProxy`` on ``port``, which sends
+  every request of a session to the worker that created it, as tracked by
+  the ``Mcp-Session-Id`` header.
+
+The workers load their data themselves; with the ``mmap`` vector store layout
+they all map the same files, so the operating system keeps a single copy of
+the index in memory. Run it with::
+
+    python -m my_python_ai_kata.mcp.multiworker \\
+        my_python_ai_kata.mcp.langgraph_query_tool:mcp --workers 4 --port 8000
+"""
+
+import argparse
+import importlib
+import itertools
+import os
+import subprocess
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from typing import Optional
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+
+from my_python_ai_kata.mcp.query_cache import LRUCache
+
+
+# Environment of the worker processes
+SERVER_ENV = "MCP_SERVER"
+WORKERS_ENV = "MCP_WORKERS"
+STATELESS_ENV = "MCP_STATELESS_HTTP"
+STARTUP_ENV = "MCP_STARTUP"
+
+SESSION_HEADER = "mcp-session-id"
+# Sessions tracked by the proxy, and how long an idle one is kept
+DEFAULT_MAX_SESSIONS = 10_000
+DEFAULT_SESSION_TTL_SECONDS = 60 * 60.0
+HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "host",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+
+def worker_count() -> int:
+    """Return the number of worker processes serving the current server.
+
+    Returns:
+        int: The number of workers; 1 outside of a multi-worker server.
+    """
+    return int(os.environ.get(WORKERS_ENV, "1"))
+
+
+def load_server(spec: str) -> Any:
+    """Import the MCP server object named by a ``module:attribute`` spec.
+
+    Args:
+        spec (str): The server spec, such as ``package.module:mcp``.
+
+    Returns:
+        Any: The FastMCP server, from either the ``mcp`` or the ``fastmcp`` package.
+    """
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "mcp")
+
+
+def http_app(server: Any, stateless: bool) -> Starlette:
+    """Build the streamable HTTP application of a FastMCP server.
+
+    Args:
+        server (Any): The FastMCP server, from either the ``mcp`` or the
+            ``fastmcp`` package.
+        stateless (bool): Whether to serve every request without a session.
+
+    Returns:
+        Starlette: The ASGI application.
+    """
+    if hasattr(server, "http_app"):
+        return server.http_app(transport="streamable-http", stateless_http=stateless)
+    server.settings.stateless_http = stateless
+    return server.streamable_http_app()
+
+
+def create_app() -> Starlette:
+    """Build the application of a worker process, from its environment.
+
+    The server module may define ``apply_startup_policy(startup)``, which is
+    called with the requested startup policy before the worker starts serving.
+
+    Returns:
+        Starlette: The ASGI application.
+    """
+    spec = os.environ[SERVER_ENV]
+    server = load_server(spec)
+    module = sys.modules[spec.partition(":")[0]]
+    apply_startup_policy = getattr(module, "apply_startup_policy", None)
+    if apply_startup_policy is not None:
+        apply_startup_policy(os.environ.get(STARTUP_ENV) or None)
+    return http_app(server, stateless=os.environ.get(STATELESS_ENV, "1") == "1")
+
+
+class SessionAffinityProxy:
+    """Forward MCP requests to workers, pinning every session to one worker.
+
+    A request without a session goes to the next worker in turn; the session
+    id returned by the worker is then mapped to it until the session is
+    deleted, is unknown to the worker, stays idle for too long or is evicted
+    by newer sessions. Requests of an unknown session get a 404, which tells
+    MCP clients to start a new session.
+    """
+
+    def __init__(
+        self,
+        upstreams: list[str],
+        processes: Optional[list[subprocess.Popen]] = None,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        session_ttl: Optional[float] = DEFAULT_SESSION_TTL_SECONDS,
+    ):
+        """Initialize the proxy.
+
+        Args:
+            upstreams (list[str]): The base URLs of the workers.
+            processes (Optional[list[subprocess.Popen]]): The worker processes,
+                terminated when the proxy shuts down.
+            max_sessions (int): Maximum number of sessions tracked; the least
+                recently used ones are forgotten first.
+            session_ttl (Optional[float]): Seconds after which an idle session
+                is forgotten, or None to keep it until it is evicted.
+        """
+        self.upstreams = upstreams
+        self.processes = processes or []
+        self.sessions: LRUCache[str, str] = LRUCache(max_sessions, ttl=session_ttl)
+        self._next_upstream = itertools.cycle(upstreams)
+        self._client = httpx.AsyncClient(
+            timeout=None, limits=httpx.Limits(max_connections=None)
+        )
+        self.app = Starlette(
+            routes=[
+                Route("/{path:path}", self.forward, methods=["GET", "POST", "DELETE"])
+            ],
+            lifespan=self._lifespan,
+        )
+
+    @asynccontextmanager
+    async def _lifespan(self, app: Starlette) -> AsyncIterator[None]:
+        """Close the connections to the workers and stop them on shutdown."""
+        yield
+        await self._client.aclose()
+        stop_processes(self.processes)
+
+    async def forward(self, request: Request) -> Response:
+        """Forward a request to the worker of its session, streaming the response.
+
+        Args:
+            request (Request): The client request.
+
+        Returns:
+            Response: The worker response.
+        """
+        session = request.headers.get(SESSION_HEADER)
+        if session is None:
+            upstream = next(self._next_upstream)
+        elif (upstream := self.sessions.get(session)) is None:
+            return Response(f"Unknown session {session!r}", status_code=404)
+        upstream_request = self._client.build_request(
+            request.method,
+            httpx.URL(upstream + request.url.path, query=request.url.query.encode()),
+            headers=[
+                (name, value)
+                for name, value in request.headers.raw
+                if name.decode().lower() not in HOP_BY_HOP_HEADERS
+            ],
+            content=request.stream(),
+        )
+        try:
+            response = await self._client.send(upstream_request, stream=True)
+        except httpx.TransportError as e:
+            return Response(f"Worker {upstream} unavailable: {e!r}", status_code=503)
+        if created := response.headers.get(SESSION_HEADER):
+            self.sessions.put(created, upstream)
+        if session is not None:
+            # The worker lost or ended the session, or it is still in use
+            if request.method == "DELETE" or response.status_code == 404:
+                self.sessions.discard(session)
+            elif not created:
+                self.sessions.put(session, upstream)
+        return StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in HOP_BY_HOP_HEADERS
+                and name.lower() not in ("date", "server")
+            },
+            background=BackgroundTask(response.aclose),
+        )
+
+
+def stop_processes(processes: list[subprocess.Popen]) -> None:
+    """Terminate processes and wait for them to exit.
+
+    Args:
+        processes (list[subprocess.Popen]): The processes.
+    """
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.wait()
+
+
+def serve(
+    spec: str,
+    workers: int,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    stateful: bool = False,
+    startup: Optional[str] = None,
+) -> None:
+    """Serve an MCP server from several worker processes, until interrupted.
+
+    Args:
+        spec (str): The ``module:attribute`` spec of the FastMCP server.
+        workers (int): Number of worker processes.
+        host (str): The interface to listen on.
+        port (int): The port of the MCP endpoint.
+        stateful (bool): Whether to keep MCP sessions, behind a session
+            affinity proxy, instead of serving stateless requests.
+        startup (Optional[str]): The startup policy passed to the workers.
+    """
+    os.environ[SERVER_ENV] = spec
+    os.environ[STATELESS_ENV] = "0" if stateful else "1"
+    if workers > 1:
+        os.environ[WORKERS_ENV] = str(workers)
+    if startup:
+        os.environ[STARTUP_ENV] = startup
+
+    if not stateful or workers == 1:
+        print(
+            f"--- Serving {spec!r} on http://{host}:{port}/mcp with {workers} "
+            f"{'stateful' if stateful else 'stateless'} worker(s) ---"
+        )
+        uvicorn.run(
+            f"{__name__}:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            log_level="warning",
+        )
+        return
+
+    ports = [port + i for i in range(1, workers + 1)]
+    processes = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                __name__,
+                spec,
+                "--workers",
+                "1",
+                "--stateful",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(worker_port),
+            ]
+        )
+        for worker_port in ports
+    ]
+    proxy = SessionAffinityProxy([f"http://127.0.0.1:{p}" for p in ports], processes)
+    print(
+        f"--- Serving {spec!r} on http://{host}:{port}/mcp with {workers} "
+        f"stateful workers on ports {ports[0]}-{ports[-1]} ---"
+    )
+    try:
+        uvicorn.run(proxy.app, host=host, port=port, log_level="warning")
+    finally:
+        # Reached when the proxy fails to start; a signal stops it at shutdown
+        stop_processes(processes)
+
+
+def main() -> None:
+    """Parse the command line and serve the MCP server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("server", help="The FastMCP server, as module:attribute")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--stateful",
+        action="store_true",
+        help="Keep MCP sessions, pinned to their worker by a proxy",
+    )
+    parser.add_argument("--startup", help="The startup policy of the workers")
+    args = parser.parse_args()
+    serve(args.server, args.workers, args.host, args.port, args.stateful, args.startup)
+
+
+if __name__ == "__main__":
+    main()
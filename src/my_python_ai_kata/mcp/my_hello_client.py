@@ -2,12 +2,12 @@
 
 import asyncio
 
-from fastmcp import Client
+from my_python_ai_kata.mcp.client_pool import McpClientPool
 
 
 async def interact_with_server() -> None:
-    """Interact with the FastMCP server using the Client."""
-    # Create a client instance to connect to the FastMCP server
+    """Interact with the FastMCP server through a pool of client sessions."""
+    # Sessions to the FastMCP server are opened by the pool on first use
 
     print("--- Creating Client ---")
 
@@ -15,26 +15,27 @@ async def interact_with_server() -> None:
     # client = Client("my_hello_server.py")
 
     # Option 2: Connect to a server run via `fastmcp run ... --transport sse --port 8080`
-    client = Client("http://localhost:8888")  # Use the correct URL/port
+    url = "http://localhost:8888"  # Use the correct URL/port
 
-    print(f"Client configured to connect to: {client}")
+    print(f"Client configured to connect to: {url}")
 
     try:
-        async with client:
+        async with McpClientPool() as pool:
             print("--- Client Connected ---")
-            # Call the 'greet' tool
-            greet_result = await client.call_tool_mcp(
-                "greet", {"name": "Remote Client"}
+            # The calls are independent: issue them together on warm sessions
+            greet_result, config_data, profile_102 = await asyncio.gather(
+                # Call the 'greet' tool
+                pool.call_tool(url, "greet", {"name": "Remote Client"}),
+                # Read the 'config' resource
+                pool.read_resource(url, "data://config"),
+                # Read user profile 102
+                pool.read_resource(url, "users://102/profile"),
             )
             print(f"greet result: {greet_result}")
-
-            # Read the 'config' resource
-            config_data = await client.read_resource("data://config")
             print(f"config resource: {config_data}")
-
-            # Read user profile 102
-            profile_102 = await client.read_resource("users://102/profile")
             print(f"User 102 profile: {profile_102}")
+            for timing in pool.timings:
+                print(f"  {timing.kind} {timing.name}: {timing.seconds * 1000:.1f}ms")
 
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -1,11 +1,33 @@
 """Hello World MCP Server."""
 
-from typing import Any, Literal
+import asyncio
+import threading
+from typing import Any
+from typing import Literal
+from typing import Optional
+
+from fastmcp import Context
 from fastmcp import FastMCP
 
+from my_python_ai_kata.agents.app_config import get_application_config
+from my_python_ai_kata.mcp import user_profiles as profiles_db
+from my_python_ai_kata.mcp.resource_cache import ResourceSubscribers
+from my_python_ai_kata.mcp.resource_cache import VersionedPayloadCache
+
 
 mcp: FastMCP = FastMCP(name="My First MCP Server")  # type: ignore
 
+profiles_config = get_application_config().get("user_profiles", {})
+# Seconds a profile read from the database is served from memory: other workers and
+# processes sharing the database may change it behind this one
+profiles_ttl = profiles_config.get("hot_rows_ttl_seconds", profiles_db.DEFAULT_HOT_ROWS_TTL_SECONDS)
+
+# Serialized resources, and the sessions to notify when they change. The configuration
+# only changes through this process, which bumps its version, so it has no TTL
+config_payloads = VersionedPayloadCache()
+profile_payloads = VersionedPayloadCache(ttl=profiles_ttl)
+subscribers = ResourceSubscribers()
+
 
 @mcp.tool(description="Greet a person by name provided as input")
 def greet(name: str) -> str:
@@ -22,23 +44,124 @@ def add(a: int, b: int) -> int:
 APP_CONFIG = {"theme": "dark", "version": "1.1", "feature_flags": ["new_dashboard"]}
 
 
-@mcp.resource("data://config")
-def get_config() -> dict:  # type: ignore
-    """Provides the application configuration."""
+@mcp.resource("data://config", mime_type="application/json")
+def get_config(ctx: Context) -> str:
+    """Provides the application configuration, serialized once per version."""
+    subscribers.add(ctx)
+    return config_payloads.payload("data://config", lambda: APP_CONFIG)
+
+
+@mcp.tool(description="Change a setting of the application configuration")
+async def update_config(key: str, value: Any, ctx: Context) -> dict:  # type: ignore
+    """Changes a setting, and notifies the clients that read the configuration."""
+    APP_CONFIG[key] = value
+    config_payloads.bump("data://config")
+    await subscribers.resource_updated("data://config", ctx)
     return APP_CONFIG
 
 
+# Seed profiles, written to the database when it has none
 USER_PROFILES = {
     101: {"name": "Alice", "status": "active"},
     102: {"name": "Bob", "status": "inactive"},
 }
+USER_NOT_FOUND = {"error": "User not found"}
+MAX_BATCH_IDS = 1000
+
+_user_profiles: Optional[profiles_db.UserProfileRepository] = None
+_user_profiles_lock = threading.Lock()
+
+
+def get_user_profile_repository() -> profiles_db.UserProfileRepository:
+    """Lazy get or create the profile repository, seeding an empty database.
+
+    Returns:
+        The profile repository
+    """
+    global _user_profiles
+    with _user_profiles_lock:
+        if _user_profiles is None:
+            repository = profiles_db.UserProfileRepository(
+                profiles_db.create_profile_engine(
+                    profiles_config.get("database_url", profiles_db.DEFAULT_DATABASE_URL),
+                    pool_size=profiles_config.get("pool_size", profiles_db.DEFAULT_POOL_SIZE),
+                    max_overflow=profiles_config.get("max_overflow", profiles_db.DEFAULT_MAX_OVERFLOW),
+                ),
+                hot_rows=profiles_config.get("hot_rows", profiles_db.DEFAULT_HOT_ROWS),
+                hot_rows_ttl=profiles_ttl,
+            )
+            if not repository.count():
+                repository.put_many(USER_PROFILES)
+            _user_profiles = repository
+        return _user_profiles
+
+
+@mcp.resource("users://{user_id}/profile", mime_type="application/json")
+async def get_user_profile(user_id: int, ctx: Context) -> str:
+    """Retrieves a user's profile by their ID, serialized once per version."""
+    # The {user_id} from the URI is automatically passed as an argument
+    subscribers.add(ctx)
+    # The database is queried off the event loop
+    return await asyncio.to_thread(
+        profile_payloads.payload,
+        f"users://{user_id}/profile",
+        lambda: get_user_profile_repository().get(int(user_id)) or USER_NOT_FOUND,
+    )
 
 
-@mcp.resource("users://{user_id}/profile")
-def get_user_profile(user_id: int) -> dict[str, Any]:
-    """Retrieves a user's profile by their ID."""
-    # The {user_id} from the URI is automatically passed as an argument
-    return USER_PROFILES.get(user_id, {"error": "User not found"})
+def parse_user_ids(ids: str) -> list[int]:
+    """Parses comma separated user IDs, ignoring the empty ones.
+
+    Raises:
+        ValueError: If an ID is not an integer.
+    """
+    user_ids = []
+    for user_id in (user_id.strip() for user_id in ids.split(",")):
+        if not user_id:
+            continue
+        try:
+            user_ids.append(int(user_id))
+        except ValueError:
+            raise ValueError(f"Invalid user ID {user_id!r}: expected comma separated integers") from None
+    return user_ids
+
+
+@mcp.resource(
+    "users://batch/{ids}",
+    mime_type="application/json",
+    description="Profiles of many users at once, by comma separated IDs; "
+    "not covered by change notifications.",
+)
+async def get_user_profiles(ids: str) -> dict[str, dict[str, Any]]:
+    """Retrieves many users' profiles in a single database round trip."""
+    user_ids = parse_user_ids(ids)
+    if len(user_ids) > MAX_BATCH_IDS:
+        raise ValueError(f"At most {MAX_BATCH_IDS} profiles per batch, got {len(user_ids)}")
+    # The repository is created, and the database queried, off the event loop
+    profiles = await asyncio.to_thread(lambda: get_user_profile_repository().get_many(user_ids))
+    return {str(user_id): profiles.get(user_id, USER_NOT_FOUND) for user_id in user_ids}
+
+
+@mcp.tool(description="Create or replace the profile of a user")
+async def update_user_profile(
+    user_id: int, name: str, status: str, ctx: Context
+) -> dict[str, Any]:
+    """Stores a user's profile, and notifies the clients that read profiles."""
+    profile = {"name": name, "status": status}
+    await asyncio.to_thread(lambda: get_user_profile_repository().put(user_id, profile))
+    uri = f"users://{user_id}/profile"
+    profile_payloads.bump(uri)
+    await subscribers.resource_updated(uri, ctx)
+    return profile
+
+
+@mcp.resource("data://versions", mime_type="application/json")
+def get_versions() -> dict[str, str]:
+    """Provides the version tags of the changed resources, to revalidate them cheaply.
+
+    The resources that are not listed have the tag listed under "*".
+    """
+    return profile_payloads.tags() | config_payloads.tags()
 
 
 @mcp.prompt("summarize")
@@ -63,7 +186,32 @@ if __name__ == "__main__":
         default="stdio",
         help="Transport to use for the server (default: stdio)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes of the streamable-http transport (default: 1)",
+    )
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--stateful",
+        action="store_true",
+        help="Keep MCP sessions across workers, pinned by a session affinity proxy",
+    )
     args = parser.parse_args()
     transport: Literal["stdio", "streamable-http", "sse"] = args.transport  # type: ignore
-    print(f"\n--- Starting {mcp.name!r} via __main__ (transport={transport!r}) ---")
-    mcp.run(transport=transport)
+    if transport == "streamable-http" and args.workers > 1:
+        from my_python_ai_kata.mcp.multiworker import serve
+
+        serve(
+            "my_python_ai_kata.mcp.my_hello_server:mcp",
+            args.workers,
+            port=args.port,
+            stateful=args.stateful,
+        )
+    else:
+        print(f"\n--- Starting {mcp.name!r} via __main__ (transport={transport!r}) ---")
+        if transport == "stdio":
+            mcp.run(transport=transport)
+        else:
+            mcp.run(transport=transport, port=args.port)
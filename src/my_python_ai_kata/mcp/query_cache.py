@@ -0,0 +1,130 @@
+"""In-memory LRU caches with expiry, for query embeddings and query results."""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Generic
+from typing import Optional
+from typing import TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL_SECONDS = 60 * 60.0
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so that trivially different spellings share cache entries.
+
+    Args:
+        query (str): The query text.
+
+    Returns:
+        str: The query, lower-cased, with collapsed and stripped whitespace.
+    """
+    return _WHITESPACE_RE.sub(" ", query).strip().lower()
+
+
+@dataclass
+class LRUCacheStats:
+    """Counters collected while using an LRU cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evicted: int = 0
+    expired: int = 0
+
+    def __str__(self) -> str:
+        """Return a human readable summary of the counters."""
+        lookups = self.hits + self.misses
+        ratio = self.hits / lookups if lookups else 0.0
+        return (
+            f"{self.hits} hits, {self.misses} misses ({ratio:.1%} hit rate), "
+            f"{self.evicted} evicted, {self.expired} expired"
+        )
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe, size-bounded LRU cache whose entries expire after a TTL."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of entries; 0 disables the cache.
+            ttl (Optional[float]): Lifetime of an entry in seconds, or None to keep
+                entries until they are evicted.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = LRUCacheStats()
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value of a key, if it is present and fresh.
+
+        Args:
+            key (K): The cache key.
+
+        Returns:
+            Optional[V]: The cached value, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[0] > self.ttl:
+                    del self._entries[key]
+                    self.stats.expired += 1
+                    entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, key: K, value: V) -> None:
+        """Cache a value, evicting the least recently used entries when full.
+
+        Args:
+            key (K): The cache key.
+            value (V): The value to cache.
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evicted += 1
+
+    def discard(self, key: K) -> None:
+        """Drop the entry of a key, if any.
+
+        Args:
+            key (K): The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all the entries, keeping the statistics."""
+        with self._lock:
+            self._entries.clear()
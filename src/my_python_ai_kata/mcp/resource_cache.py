@@ -0,0 +1,183 @@
+"""Server-side caching of serialized MCP resources, with version tags.
+
+A ``VersionedPayloadCache`` keeps the JSON payload of every resource read,
+keyed by the resource URI and its version. The version of a resource is bumped
+whenever its data changes, which leaves the old payload to be evicted, and the
+current ``tag`` of a resource works like an HTTP ETag.
+
+``ResourceSubscribers`` remembers the sessions that read cached resources and
+notifies them of changes, with ``notifications/resources/updated`` for a
+single resource and ``notifications/resources/list_changed`` for all of them,
+so that clients can cache the payloads until they are told otherwise.
+"""
+
+import itertools
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any
+from typing import Optional
+
+import mcp.types
+import pydantic_core
+from fastmcp import Context
+from mcp.server.session import ServerSession
+from pydantic import AnyUrl
+
+from my_python_ai_kata.mcp.query_cache import LRUCache
+
+
+DEFAULT_MAX_PAYLOADS = 4096
+
+
+class VersionedPayloadCache:
+    """Serialized resource payloads, cached until the version of the resource changes."""
+
+    def __init__(
+        self, max_size: int = DEFAULT_MAX_PAYLOADS, ttl: Optional[float] = None
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of cached payloads.
+            ttl (Optional[float]): Seconds a payload is served before it is
+                serialized again, or None to keep it until its version changes;
+                versions only change with the writes of this process.
+        """
+        self.payloads: LRUCache[tuple[str, int], str] = LRUCache(max_size, ttl=ttl)
+        self._versions: dict[str, int] = {}
+        self._changes = itertools.count(1)
+        self._all_changed = 0
+        self._lock = threading.Lock()
+
+    def version(self, uri: str) -> int:
+        """Return the current version of a resource.
+
+        Args:
+            uri (str): The resource URI.
+
+        Returns:
+            int: The version, which grows with every change of the resource or
+            of all of them.
+        """
+        with self._lock:
+            return max(self._versions.get(uri, 0), self._all_changed)
+
+    def tag(self, uri: str) -> str:
+        """Return the version tag of a resource, which changes with its data.
+
+        Args:
+            uri (str): The resource URI.
+
+        Returns:
+            str: The version tag.
+        """
+        return f'W/"{self.version(uri)}"'
+
+    def bump(self, uri: Optional[str] = None) -> None:
+        """Record a change of a resource, or of all of them.
+
+        Args:
+            uri (Optional[str]): The resource URI, or None for every resource.
+        """
+        with self._lock:
+            if uri is None:
+                self._all_changed = next(self._changes)
+                self._versions.clear()
+            else:
+                self._versions[uri] = next(self._changes)
+
+    def tags(self) -> dict[str, str]:
+        """Return the version tags of the resources that changed on their own.
+
+        Returns:
+            dict[str, str]: The tags by URI, and under ``"*"`` the tag of every
+            other resource.
+        """
+        with self._lock:
+            uris = list(self._versions)
+            default = f'W/"{self._all_changed}"'
+        return {"*": default} | {uri: self.tag(uri) for uri in uris}
+
+    def payload(self, uri: str, build: Callable[[], Any]) -> str:
+        """Return the JSON payload of a resource, serializing it on a miss.
+
+        Args:
+            uri (str): The resource URI.
+            build (Callable[[], Any]): Returns the data of the resource.
+
+        Returns:
+            str: The payload, serialized as FastMCP serializes resource data.
+        """
+        key = (uri, self.version(uri))
+        payload = self.payloads.get(key)
+        if payload is None:
+            payload = pydantic_core.to_json(build(), fallback=str).decode()
+            self.payloads.put(key, payload)
+        return payload
+
+
+class ResourceSubscribers:
+    """The sessions that read cached resources, to notify them of changes."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._sessions: weakref.WeakSet[ServerSession] = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        """Return the number of registered sessions."""
+        return len(self._sessions)
+
+    def add(self, context: Context) -> None:
+        """Register the session of a request.
+
+        Args:
+            context (Context): The context of the request.
+        """
+        self._sessions.add(context.session)
+
+    async def resource_updated(
+        self, uri: str, context: Optional[Context] = None
+    ) -> None:
+        """Notify every session that a resource changed.
+
+        Args:
+            uri (str): The resource URI.
+            context (Optional[Context]): The context of the request that changed
+                it, whose session is notified before the response.
+        """
+        await self._broadcast(
+            mcp.types.ServerNotification(
+                mcp.types.ResourceUpdatedNotification(
+                    params=mcp.types.ResourceUpdatedNotificationParams(uri=AnyUrl(uri))
+                )
+            ),
+            context,
+        )
+
+    async def resource_list_changed(self, context: Optional[Context] = None) -> None:
+        """Notify every session that any resource may have changed.
+
+        Args:
+            context (Optional[Context]): The context of the request that changed
+                them, whose session is notified before the response.
+        """
+        await self._broadcast(
+            mcp.types.ServerNotification(mcp.types.ResourceListChangedNotification()),
+            context,
+        )
+
+    async def _broadcast(
+        self, notification: mcp.types.ServerNotification, context: Optional[Context]
+    ) -> None:
+        """Send a notification to every session, dropping the closed ones."""
+        current = context.session if context is not None else None
+        for session in list(self._sessions):
+            # Sent on the stream of the request, it reaches its client first
+            related_request_id = (
+                context.request_context.request_id if session is current else None
+            )
+            try:
+                await session.send_notification(notification, related_request_id)
+            except Exception:
+                self._sessions.discard(session)
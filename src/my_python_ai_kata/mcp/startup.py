@@ -0,0 +1,145 @@
+"""Startup policies for MCP servers backed by slow-to-load resources.
+
+Loading a vector store (and importing its dependencies) takes seconds, and an
+MCP server that does it at import time cannot even answer the ``initialize``
+handshake meanwhile. With a ``BackgroundLoader`` the resource is built once,
+on a background thread, either:
+
+* ``"lazy"``: when a tool first needs it, while the server keeps answering
+  the handshake and the listing requests;
+* ``"background"``: as soon as the server starts, without delaying it;
+* ``"eager"``: before the server starts listening, followed by warm-up calls.
+
+Timings are reported relative to the start of the process, on stderr so that
+they never mix with a stdio transport.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Generic
+from typing import Optional
+from typing import TypeVar
+
+
+T = TypeVar("T")
+
+STARTUP_POLICIES = ("lazy", "background", "eager")
+
+_PROCESS_START = time.perf_counter()
+
+
+def uptime() -> float:
+    """Return the seconds elapsed since this module was first imported.
+
+    Returns:
+        float: The approximate process uptime.
+    """
+    return time.perf_counter() - _PROCESS_START
+
+
+def report(message: str) -> None:
+    """Print a startup timing message, prefixed with the process uptime.
+
+    Args:
+        message (str): The message.
+    """
+    print(f"[{uptime():7.3f}s] {message}", file=sys.stderr, flush=True)
+
+
+class BackgroundLoader(Generic[T]):
+    """Build a resource once, on a background thread, for sync and async callers.
+
+    A failed build is reported to the callers waiting for it, and retried by
+    the next one.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        """Initialize the loader, without starting it.
+
+        Args:
+            name (str): The resource name, used in the timing reports.
+            factory (Callable[[], T]): Builds the resource.
+        """
+        self.name = name
+        self.factory = factory
+        self.load_seconds: Optional[float] = None
+        self._future: Optional[Future[T]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the resource was built successfully."""
+        future = self._future
+        return future is not None and future.done() and future.exception() is None
+
+    def start(self) -> "Future[T]":
+        """Start building the resource, unless it is built or being built.
+
+        Returns:
+            Future[T]: The future resource.
+        """
+        with self._lock:
+            future = self._future
+            if future is None or (future.done() and future.exception() is not None):
+                future = self._future = Future()
+                # A running future cannot be cancelled by a waiter giving up
+                future.set_running_or_notify_cancel()
+                threading.Thread(
+                    target=self._load,
+                    args=(future,),
+                    name=f"load-{self.name}",
+                    daemon=True,
+                ).start()
+            return future
+
+    def _load(self, future: "Future[T]") -> None:
+        """Build the resource and resolve the future with it."""
+        report(f"Loading {self.name}...")
+        start = time.perf_counter()
+        try:
+            resource = self.factory()
+        except Exception as e:
+            report(f"Loading {self.name} failed: {e!r}")
+            future.set_exception(e)
+            return
+        self.load_seconds = time.perf_counter() - start
+        report(f"Loaded {self.name} in {self.load_seconds:.3f}s")
+        future.set_result(resource)
+
+    def get(self) -> T:
+        """Return the resource, waiting for it to be built.
+
+        Returns:
+            T: The resource.
+        """
+        return self.start().result()
+
+    async def aget(self) -> T:
+        """Return the resource without blocking the event loop.
+
+        Returns:
+            T: The resource.
+        """
+        return await asyncio.wrap_future(self.start())
+
+
+class FirstAnswerReporter:
+    """Report the uptime at which a server sent its first answer."""
+
+    def __init__(self) -> None:
+        """Initialize the reporter."""
+        self._reported = False
+
+    def answered(self, what: str) -> None:
+        """Record an answer, reporting it if it is the first one.
+
+        Args:
+            what (str): A description of the answer.
+        """
+        if not self._reported:
+            self._reported = True
+            report(f"First answer ({what})")
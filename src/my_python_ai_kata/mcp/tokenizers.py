@@ -0,0 +1,77 @@
+"""Shared tiktoken encoders and token counting helpers.
+
+Encoders are loaded once per process and reused by every caller. Batches of
+texts are encoded by tiktoken's native thread pool, which releases the GIL.
+"""
+
+import threading
+from collections.abc import Sequence
+
+import numpy as np
+import tiktoken
+
+
+DEFAULT_ENCODING = "cl100k_base"
+DEFAULT_NUM_THREADS = 8
+
+_encoders: dict[str, tiktoken.Encoding] = {}
+_encoders_lock = threading.Lock()
+
+
+def get_encoder(encoding_name: str = DEFAULT_ENCODING) -> tiktoken.Encoding:
+    """Return the encoder for an encoding, loading it on first use.
+
+    Args:
+        encoding_name (str): The tiktoken encoding name.
+
+    Returns:
+        tiktoken.Encoding: The shared encoder.
+    """
+    encoder = _encoders.get(encoding_name)
+    if encoder is None:
+        with _encoders_lock:
+            encoder = _encoders.get(encoding_name)
+            if encoder is None:
+                encoder = _encoders[encoding_name] = tiktoken.get_encoding(
+                    encoding_name
+                )
+    return encoder
+
+
+def count_tokens(text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """Count the number of tokens in a text.
+
+    Special tokens are counted as plain text.
+
+    Args:
+        text (str): The text to count tokens for.
+        encoding_name (str): The tiktoken encoding name.
+
+    Returns:
+        int: Number of tokens in the text.
+    """
+    return len(get_encoder(encoding_name).encode_ordinary(text))
+
+
+def count_tokens_batch(
+    texts: Sequence[str],
+    encoding_name: str = DEFAULT_ENCODING,
+    num_threads: int = DEFAULT_NUM_THREADS,
+) -> np.ndarray:
+    """Count the number of tokens of many texts at once, on several threads.
+
+    Args:
+        texts (Sequence[str]): The texts to count tokens for.
+        encoding_name (str): The tiktoken encoding name.
+        num_threads (int): Number of encoding threads.
+
+    Returns:
+        np.ndarray: The token count of every text, as an int32 array.
+    """
+    counts = np.zeros(len(texts), dtype=np.int32)
+    if texts:
+        tokens = get_encoder(encoding_name).encode_ordinary_batch(
+            list(texts), num_threads=num_threads
+        )
+        counts[:] = [len(t) for t in tokens]
+    return counts
@@ -0,0 +1,218 @@
+"""Repository of user profiles stored in a SQL database through SQLAlchemy.
+
+The profiles live in a ``user_profiles`` table of any database SQLAlchemy
+supports: PostgreSQL in production (see the compose service) and SQLite as a
+local stand-in. The repository:
+
+* shares a pool of connections between threads, sized by ``pool_size`` and
+  ``max_overflow``;
+* runs statements built once, so that SQLAlchemy compiles each of them once
+  and only binds new parameters; batches use an expanding ``IN`` parameter and
+  fetch many profiles in a single round trip;
+* keeps the most recently used profiles in an LRU cache of hot rows, updated
+  by its own writes; the writes of other processes sharing the database show
+  up once the cached rows expire.
+"""
+
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import Any
+from typing import Optional
+
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import bindparam
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+from my_python_ai_kata.mcp.query_cache import LRUCache
+
+
+DEFAULT_DATABASE_URL = "sqlite://"
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_HOT_ROWS = 10_000
+DEFAULT_HOT_ROWS_TTL_SECONDS = 60.0
+# Profiles fetched per statement, below the bound parameter limits of the databases
+BATCH_SIZE = 500
+
+metadata = MetaData()
+
+user_profiles_table = Table(
+    "user_profiles",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(100), nullable=False),
+    Column("status", String(20), nullable=False),
+)
+
+_SELECT_ONE = select(user_profiles_table.c.name, user_profiles_table.c.status).where(
+    user_profiles_table.c.id == bindparam("user_id")
+)
+_SELECT_MANY = select(
+    user_profiles_table.c.id, user_profiles_table.c.name, user_profiles_table.c.status
+).where(user_profiles_table.c.id.in_(bindparam("user_ids", expanding=True)))
+_COUNT = select(func.count()).select_from(user_profiles_table)
+
+
+def create_profile_engine(
+    url: str = DEFAULT_DATABASE_URL,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_overflow: int = DEFAULT_MAX_OVERFLOW,
+) -> Engine:
+    """Create a pooled engine for a profile database.
+
+    Args:
+        url (str): The SQLAlchemy database URL.
+        pool_size (int): Connections kept open in the pool.
+        max_overflow (int): Connections opened past the pool size under load.
+
+    Returns:
+        Engine: The engine.
+    """
+    database_url = make_url(url)
+    in_memory = database_url.database in (None, "", ":memory:")
+    if database_url.get_backend_name() == "sqlite" and in_memory:
+        # Every connection to an in-memory database would get its own database,
+        # so a single one is shared; sqlite3 serializes its use by threads
+        return create_engine(
+            database_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    return create_engine(
+        database_url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+class UserProfileRepository:
+    """Read and write user profiles, keeping the hot rows in memory."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        hot_rows: int = DEFAULT_HOT_ROWS,
+        hot_rows_ttl: Optional[float] = DEFAULT_HOT_ROWS_TTL_SECONDS,
+    ):
+        """Initialize the repository and create its table if needed.
+
+        Args:
+            engine (Engine): The engine of the profile database.
+            hot_rows (int): Number of profiles cached in memory; 0 disables the
+                cache.
+            hot_rows_ttl (Optional[float]): Seconds a cached profile is used
+                before it is read again, or None to keep it until it is evicted,
+                when no other process writes to the database.
+        """
+        self.engine = engine
+        self.cache: LRUCache[int, dict[str, Any]] = LRUCache(hot_rows, ttl=hot_rows_ttl)
+        metadata.create_all(engine)
+        if engine.dialect.name == "postgresql":
+            self._insert = postgresql.insert(user_profiles_table)
+        else:
+            self._insert = sqlite.insert(user_profiles_table)
+        self._upsert = self._insert.on_conflict_do_update(
+            index_elements=[user_profiles_table.c.id],
+            set_={
+                "name": self._insert.excluded.name,
+                "status": self._insert.excluded.status,
+            },
+        )
+
+    def count(self) -> int:
+        """Return the number of stored profiles.
+
+        Returns:
+            int: The number of profiles.
+        """
+        with self.engine.connect() as connection:
+            return connection.execute(_COUNT).scalar_one()
+
+    def get(self, user_id: int) -> Optional[dict[str, Any]]:
+        """Return the profile of a user.
+
+        Args:
+            user_id (int): The user id.
+
+        Returns:
+            Optional[dict[str, Any]]: The profile, or None if there is none.
+        """
+        profile = self.cache.get(user_id)
+        if profile is not None:
+            return profile
+        with self.engine.connect() as connection:
+            row = connection.execute(_SELECT_ONE, {"user_id": user_id}).first()
+        if row is None:
+            return None
+        profile = row._asdict()
+        self.cache.put(user_id, profile)
+        return profile
+
+    def get_many(self, user_ids: Iterable[int]) -> dict[int, dict[str, Any]]:
+        """Return the profiles of many users, fetching the uncached ones at once.
+
+        Args:
+            user_ids (Iterable[int]): The user ids.
+
+        Returns:
+            dict[int, dict[str, Any]]: The profiles by user id; users without a
+            profile are left out.
+        """
+        profiles: dict[int, dict[str, Any]] = {}
+        missing: list[int] = []
+        for user_id in dict.fromkeys(user_ids):
+            profile = self.cache.get(user_id)
+            if profile is None:
+                missing.append(user_id)
+            else:
+                profiles[user_id] = profile
+        if missing:
+            with self.engine.connect() as connection:
+                for start in range(0, len(missing), BATCH_SIZE):
+                    rows = connection.execute(
+                        _SELECT_MANY,
+                        {"user_ids": missing[start : start + BATCH_SIZE]},
+                    )
+                    for user_id, name, status in rows:
+                        profile = {"name": name, "status": status}
+                        self.cache.put(user_id, profile)
+                        profiles[user_id] = profile
+        return profiles
+
+    def put(self, user_id: int, profile: Mapping[str, Any]) -> None:
+        """Create or replace the profile of a user.
+
+        Args:
+            user_id (int): The user id.
+            profile (Mapping[str, Any]): The profile, with a name and a status.
+        """
+        self.put_many({user_id: profile})
+
+    def put_many(self, profiles: Mapping[int, Mapping[str, Any]]) -> None:
+        """Create or replace many profiles in a single transaction.
+
+        Args:
+            profiles (Mapping[int, Mapping[str, Any]]): The profiles by user id.
+        """
+        rows = [
+            {"id": user_id, "name": profile["name"], "status": profile["status"]}
+            for user_id, profile in profiles.items()
+        ]
+        if not rows:
+            return
+        with self.engine.begin() as connection:
+            connection.execute(self._upsert, rows)
+        for user_id in profiles:
+            self.cache.discard(user_id)
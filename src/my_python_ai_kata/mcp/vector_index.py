@@ -0,0 +1,680 @@
+"""Pluggable nearest-neighbour indexes over the vector store embeddings.
+
+All the indexes rank by cosine similarity. ``ExactIndex`` is a brute-force
+baseline; ``IVFIndex`` is an inverted-file index in pure NumPy that only scans
+the clusters closest to the query; ``HNSWIndex`` wraps the optional ``hnswlib``
+package. The quantized indexes (``Float16Index``, ``Int8Index`` and
+``BinaryIndex``) scan compact codes of the vectors and re-rank a shortlist at
+full precision. Approximate indexes are persisted next to the parquet file, tagged
+with a fingerprint of the stored chunk ids and vectors, and rebuilt when the store
+changes, including when the same chunks are embedded again with another model.
+"""
+
+import hashlib
+import json
+import os
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import Any
+from typing import Optional
+
+import numpy as np
+
+
+try:
+    import hnswlib
+except ImportError:  # pragma: no cover - optional dependency
+    hnswlib = None
+
+DEFAULT_BACKEND = "exact"
+_BLOCK_SIZE = 8192
+# Upcasting codes is memory bound: small blocks stay in the CPU caches
+_SCAN_BLOCK_SIZE = 256
+# Rows of the vectors hashed into the fingerprint of an index
+_FINGERPRINT_ROWS = 64
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale vectors to unit length, so that dot products are cosine similarities.
+
+    Args:
+        vectors (np.ndarray): A (n, dim) matrix.
+
+    Returns:
+        np.ndarray: The normalized float32 matrix.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+
+
+def top_k(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Select the k highest scores of every row, in decreasing order.
+
+    Args:
+        scores (np.ndarray): A (queries, candidates) score matrix.
+        k (int): Number of results per row.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The column indices and their scores.
+    """
+    k = min(k, scores.shape[1])
+    if k < scores.shape[1]:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(k), (scores.shape[0], k))
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return (
+        np.take_along_axis(candidates, order, axis=1),
+        np.take_along_axis(candidate_scores, order, axis=1),
+    )
+
+
+def fingerprint(ids: Sequence[str]) -> str:
+    """Fingerprint the chunk ids an index was built from.
+
+    Args:
+        ids (Sequence[str]): The ids of the stored chunks, in order.
+
+    Returns:
+        str: A hex digest that changes whenever the store does.
+    """
+    digest = hashlib.sha256()
+    for id_ in ids:
+        digest.update(id_.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def index_fingerprint(store_fingerprint: str, vectors: np.ndarray) -> str:
+    """Fingerprint the vectors an index is built from, along with their chunks.
+
+    The chunk ids only depend on the source and the content of the chunks, so
+    the shape of the vectors and a sample of rows spread over the whole matrix
+    are hashed too: embedding the same chunks with another model changes them.
+    Only the sampled rows of a memory-mapped matrix are read.
+
+    Args:
+        store_fingerprint (str): The fingerprint of the stored chunk ids.
+        vectors (np.ndarray): The stored embeddings, in store order.
+
+    Returns:
+        str: A hex digest that changes whenever the chunks or their vectors do.
+    """
+    digest = hashlib.sha256(store_fingerprint.encode())
+    digest.update(str(vectors.shape).encode())
+    if len(vectors):
+        rows = np.unique(
+            np.linspace(0, len(vectors) - 1, _FINGERPRINT_ROWS).astype(np.int64)
+        )
+        digest.update(np.ascontiguousarray(vectors[rows], dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+class VectorIndex(ABC):
+    """A nearest-neighbour index over a fixed set of vectors."""
+
+    backend: str
+    persistent = True
+
+    def __init__(self, **params: Any):
+        """Initialize an empty index.
+
+        Args:
+            **params (Any): Backend specific build and search parameters.
+        """
+        self.params = params
+        self.fingerprint = ""
+
+    @abstractmethod
+    def build(self, vectors: np.ndarray) -> None:
+        """Index a (n, dim) matrix of vectors.
+
+        Args:
+            vectors (np.ndarray): The vectors; row i gets the index i.
+        """
+
+    @abstractmethod
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Find the k most similar vectors of each query.
+
+        Args:
+            queries (np.ndarray): A (queries, dim) matrix.
+            k (int): Number of results per query.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (queries, k) row indices, -1 when
+            there are fewer results, and their cosine similarities.
+        """
+
+    @abstractmethod
+    def save(self, path: str) -> None:
+        """Persist the index.
+
+        Args:
+            path (str): The file to write.
+        """
+
+    @abstractmethod
+    def load(self, path: str) -> None:
+        """Load a persisted index.
+
+        Args:
+            path (str): The file written by save.
+        """
+
+    def attach(self, vectors: np.ndarray) -> None:
+        """Give a loaded index access to the full precision vectors of the store.
+
+        Args:
+            vectors (np.ndarray): The stored vectors, in store order.
+        """
+
+
+class ExactIndex(VectorIndex):
+    """Brute-force cosine search: one matrix product per query batch."""
+
+    backend = "exact"
+    persistent = False
+
+    def __init__(self, normalized: bool = False, **params: Any):
+        """Initialize an empty index.
+
+        Args:
+            normalized (bool): Whether the vectors to index already have unit
+                length. They are then searched in place, without being copied,
+                which keeps memory-mapped matrices shared between processes.
+            **params (Any): Unused extra parameters.
+        """
+        super().__init__(**params)
+        self.normalized = normalized
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+
+    def build(self, vectors: np.ndarray) -> None:
+        """Keep the vectors, normalizing a copy of them if needed."""
+        self.vectors = vectors if self.normalized else normalize(vectors)
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Score every vector against the queries and keep the best k."""
+        queries = normalize(queries)
+        if self.vectors.dtype == np.float32:
+            return top_k(queries @ self.vectors.T, k)
+        # Half precision has no BLAS kernels: upcast one block at a time
+        scores = np.concatenate(
+            [
+                queries @ self.vectors[i : i + _BLOCK_SIZE].astype(np.float32).T
+                for i in range(0, len(self.vectors), _BLOCK_SIZE)
+            ]
+            or [np.zeros((len(queries), 0), dtype=np.float32)],
+            axis=1,
+        )
+        return top_k(scores, k)
+
+    def save(self, path: str) -> None:
+        """Nothing to persist: the vectors live in the store."""
+
+    def load(self, path: str) -> None:
+        """Nothing to load: the index is rebuilt from the store."""
+
+
+class IVFIndex(VectorIndex):
+    """Inverted-file index: vectors are bucketed by their nearest k-means centroid.
+
+    A query only scans the ``n_probe`` buckets whose centroids are the most
+    similar to it, trading a little recall for a large cut in scanned vectors.
+    """
+
+    backend = "ivf"
+
+    def __init__(
+        self,
+        n_lists: Optional[int] = None,
+        n_probe: int = 16,
+        n_iter: int = 10,
+        sample_size: int = 256,
+        seed: int = 0,
+        **params: Any,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            n_lists (Optional[int]): Number of buckets. Defaults to 4 * sqrt(n).
+            n_probe (int): Number of buckets scanned per query.
+            n_iter (int): Number of k-means iterations.
+            sample_size (int): Training vectors sampled per bucket.
+            seed (int): Seed of the k-means initialization.
+            **params (Any): Unused extra parameters.
+        """
+        super().__init__(**params)
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iter = n_iter
+        self.sample_size = sample_size
+        self.seed = seed
+        self.centroids = np.zeros((0, 0), dtype=np.float32)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.row_ids = np.zeros(0, dtype=np.int64)
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Return the nearest centroid of every vector, a block at a time."""
+        return np.concatenate(
+            [
+                np.argmax(vectors[i : i + _BLOCK_SIZE] @ self.centroids.T, axis=1)
+                for i in range(0, len(vectors), _BLOCK_SIZE)
+            ]
+            or [np.zeros(0, dtype=np.int64)]
+        )
+
+    def build(self, vectors: np.ndarray) -> None:
+        """Train spherical k-means on a sample and bucket all the vectors."""
+        vectors = normalize(vectors)
+        n = len(vectors)
+        if not n:
+            return
+        n_lists = max(1, min(n, self.n_lists or int(4 * np.sqrt(n))))
+        rng = np.random.default_rng(self.seed)
+        sample = vectors[
+            rng.choice(n, size=min(n, n_lists * self.sample_size), replace=False)
+        ]
+        self.centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(self.n_iter):
+            assignment = self._assign(sample)
+            counts = np.bincount(assignment, minlength=n_lists)
+            starts = np.cumsum(counts) - counts
+            sums = self.centroids.copy()
+            sums[counts > 0] = np.add.reduceat(
+                sample[np.argsort(assignment, kind="stable")],
+                starts[counts > 0],
+                axis=0,
+            )
+            self.centroids = normalize(sums)
+
+        assignment = self._assign(vectors)
+        self.row_ids = np.argsort(assignment, kind="stable")
+        self.vectors = vectors[self.row_ids]
+        self.offsets = np.searchsorted(
+            assignment[self.row_ids], np.arange(n_lists + 1)
+        ).astype(np.int64)
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Scan the closest buckets of every query."""
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        if not len(self.centroids):
+            return indices, scores
+        queries = normalize(queries)
+        probes, _ = top_k(queries @ self.centroids.T, self.n_probe)
+        for q, lists in enumerate(probes):
+            rows = np.concatenate(
+                [np.arange(self.offsets[c], self.offsets[c + 1]) for c in lists]
+            )
+            if not len(rows):
+                continue
+            best, best_scores = top_k(queries[q : q + 1] @ self.vectors[rows].T, k)
+            indices[q, : best.shape[1]] = self.row_ids[rows[best[0]]]
+            scores[q, : best.shape[1]] = best_scores[0]
+        return indices, scores
+
+    def save(self, path: str) -> None:
+        """Persist the centroids and the bucketed vectors as a NumPy archive."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                centroids=self.centroids,
+                offsets=self.offsets,
+                row_ids=self.row_ids,
+                vectors=self.vectors,
+                fingerprint=np.array(self.fingerprint),
+            )
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        """Load the centroids and the bucketed vectors."""
+        with np.load(path) as data:
+            self.centroids = data["centroids"]
+            self.offsets = data["offsets"]
+            self.row_ids = data["row_ids"]
+            self.vectors = data["vectors"]
+            self.fingerprint = str(data["fingerprint"])
+
+
+class HNSWIndex(VectorIndex):
+    """Hierarchical navigable small world graph, built with ``hnswlib``."""
+
+    backend = "hnsw"
+
+    def __init__(
+        self, m: int = 16, ef_construction: int = 200, ef: int = 64, **params: Any
+    ):
+        """Initialize an empty index.
+
+        Args:
+            m (int): Number of graph neighbours per node.
+            ef_construction (int): Size of the candidate list while building.
+            ef (int): Size of the candidate list while searching.
+            **params (Any): Unused extra parameters.
+
+        Raises:
+            ImportError: If hnswlib is not installed.
+        """
+        if hnswlib is None:
+            raise ImportError(
+                "The hnsw index backend requires hnswlib, install the 'extra' dependencies"
+            )
+        super().__init__(**params)
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef = ef
+        self.index: Any = None
+
+    def build(self, vectors: np.ndarray) -> None:
+        """Insert all the vectors into a new graph."""
+        vectors = normalize(vectors)
+        self.index = hnswlib.Index(space="ip", dim=vectors.shape[1])
+        self.index.init_index(
+            max_elements=max(1, len(vectors)),
+            ef_construction=self.ef_construction,
+            M=self.m,
+        )
+        self.index.add_items(vectors, np.arange(len(vectors)))
+        self.index.set_ef(self.ef)
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Walk the graph from its entry point towards each query."""
+        k = min(k, self.index.get_current_count())
+        self.index.set_ef(max(self.ef, k))
+        labels, distances = self.index.knn_query(normalize(queries), k=k)
+        return labels.astype(np.int64), 1.0 - distances
+
+    def save(self, path: str) -> None:
+        """Persist the graph, then its fingerprint and dimension alongside it."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        self.index.save_index(tmp_path)
+        with open(f"{tmp_path}.json", "w") as f:
+            json.dump({"fingerprint": self.fingerprint, "dim": self.index.dim}, f)
+        os.replace(tmp_path, path)
+        os.replace(f"{tmp_path}.json", f"{path}.json")
+
+    def load(self, path: str) -> None:
+        """Load the graph and its fingerprint."""
+        try:
+            with open(f"{path}.json") as f:
+                info = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.fingerprint = info["fingerprint"]
+        self.index = hnswlib.Index(space="ip", dim=info["dim"])
+        self.index.load_index(path)
+        self.index.set_ef(self.ef)
+
+
+class QuantizedIndex(VectorIndex):
+    """Scan compact codes of the vectors, then re-rank a shortlist exactly.
+
+    Only the codes are kept in memory: the full precision vectors are read
+    for the ``shortlist * k`` best candidates of a query, so with a
+    memory-mapped store only those rows are paged in.
+    """
+
+    def __init__(self, shortlist: int = 4, **params: Any):
+        """Initialize an empty index.
+
+        Args:
+            shortlist (int): Candidates re-ranked at full precision, as a multiple
+                of k; 0 returns the approximate ranking of the codes as is.
+            **params (Any): Unused extra parameters.
+        """
+        super().__init__(**params)
+        self.shortlist = shortlist
+        self.codes = np.zeros((0, 0), dtype=np.uint8)
+        self.vectors: Optional[np.ndarray] = None
+
+    @abstractmethod
+    def _encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Encode a block of unit-length vectors."""
+
+    @abstractmethod
+    def _score(self, queries: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Approximate the similarities of unit-length queries to a block of codes."""
+
+    def _fit(self, vectors: np.ndarray) -> None:
+        """Learn the encoding parameters, if any, before encoding."""
+
+    def _blocks(self, vectors: np.ndarray) -> Iterator[np.ndarray]:
+        """Yield normalized blocks of the vectors."""
+        for i in range(0, len(vectors), _BLOCK_SIZE):
+            yield normalize(vectors[i : i + _BLOCK_SIZE])
+
+    def build(self, vectors: np.ndarray) -> None:
+        """Encode the vectors, a block at a time."""
+        self._fit(vectors)
+        blocks = [self._encode(block) for block in self._blocks(vectors)]
+        self.codes = np.concatenate(blocks) if blocks else self.codes
+        self.attach(vectors)
+
+    def attach(self, vectors: np.ndarray) -> None:
+        """Keep a reference to the full precision vectors, for re-ranking."""
+        self.vectors = vectors
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Rank the codes, then re-rank the best candidates at full precision."""
+        queries = normalize(queries)
+        scores = np.concatenate(
+            [
+                self._score(queries, self.codes[i : i + _SCAN_BLOCK_SIZE])
+                for i in range(0, len(self.codes), _SCAN_BLOCK_SIZE)
+            ]
+            or [np.zeros((len(queries), 0), dtype=np.float32)],
+            axis=1,
+        )
+        if not self.shortlist or self.vectors is None:
+            return top_k(scores, k)
+
+        candidates, _ = top_k(scores, k * self.shortlist)
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        similarities = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        for q, rows in enumerate(candidates):
+            rows = np.sort(rows)
+            exact = normalize(self.vectors[rows]) @ queries[q]
+            best, best_scores = top_k(exact[None, :], k)
+            indices[q, : best.shape[1]] = rows[best[0]]
+            similarities[q, : best.shape[1]] = best_scores[0]
+        return indices, similarities
+
+    def _arrays(self) -> dict[str, np.ndarray]:
+        """Return the arrays to persist, besides the codes."""
+        return {}
+
+    def save(self, path: str) -> None:
+        """Persist the codes and the encoding parameters as a NumPy archive."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                codes=self.codes,
+                fingerprint=np.array(self.fingerprint),
+                **self._arrays(),
+            )
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        """Load the codes and the encoding parameters."""
+        with np.load(path) as data:
+            self.codes = data["codes"]
+            self.fingerprint = str(data["fingerprint"])
+            for name in self._arrays():
+                setattr(self, name, data[name])
+
+
+class Float16Index(QuantizedIndex):
+    """Half precision copy of the vectors: half the memory of float32."""
+
+    backend = "float16"
+
+    def _encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Round the vectors to half precision."""
+        return vectors.astype(np.float16)
+
+    def _score(self, queries: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Upcast the block and take dot products."""
+        return queries @ codes.astype(np.float32).T
+
+
+class Int8Index(QuantizedIndex):
+    """Symmetric scalar quantization to int8, with one scale per dimension."""
+
+    backend = "int8"
+
+    def __init__(self, **params: Any):
+        """Initialize an empty index.
+
+        Args:
+            **params (Any): QuantizedIndex parameters.
+        """
+        super().__init__(**params)
+        self.scale = np.ones(0, dtype=np.float32)
+
+    def _fit(self, vectors: np.ndarray) -> None:
+        """Scale every dimension so that its largest magnitude maps to 127."""
+        peak = np.zeros(vectors.shape[1] if vectors.ndim == 2 else 0, np.float32)
+        for block in self._blocks(vectors):
+            peak = np.maximum(peak, np.abs(block).max(axis=0))
+        self.scale = np.maximum(peak, np.finfo(np.float32).tiny) / 127
+
+    def _encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Round the scaled vectors to int8."""
+        return np.clip(np.rint(vectors / self.scale), -127, 127).astype(np.int8)
+
+    def _score(self, queries: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Fold the scales into the queries and take dot products."""
+        return (queries * self.scale) @ codes.astype(np.float32).T
+
+    def _arrays(self) -> dict[str, np.ndarray]:
+        """Persist the per-dimension scales."""
+        return {"scale": self.scale}
+
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(bits: np.ndarray) -> np.ndarray:
+    """Count the set bits of every row of a packed bit matrix."""
+    if hasattr(np, "bitwise_count"):
+        if bits.shape[1] % 8 == 0:
+            bits = bits.view(np.uint64)
+        return np.bitwise_count(bits).sum(axis=1, dtype=np.int32)
+    return _POPCOUNT[bits].sum(axis=1, dtype=np.int32)
+
+
+class BinaryIndex(QuantizedIndex):
+    """One sign bit per dimension, compared by Hamming distance: 32x smaller."""
+
+    backend = "binary"
+
+    def __init__(self, shortlist: int = 10, **params: Any):
+        """Initialize an empty index.
+
+        Args:
+            shortlist (int): Candidates re-ranked at full precision, as a multiple
+                of k. Sign codes are coarse, so the default is larger.
+            **params (Any): QuantizedIndex parameters.
+        """
+        super().__init__(shortlist=shortlist, **params)
+
+    def _encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Pack the signs of the vectors into bits."""
+        return np.packbits(vectors > 0, axis=1)
+
+    def _score(self, queries: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Count the matching sign bits of every query and code."""
+        query_codes = self._encode(queries)
+        return np.stack([-_popcount(codes ^ q) for q in query_codes]).astype(np.float32)
+
+
+INDEX_BACKENDS: dict[str, type[VectorIndex]] = {
+    index.backend: index
+    for index in (
+        ExactIndex,
+        IVFIndex,
+        HNSWIndex,
+        Float16Index,
+        Int8Index,
+        BinaryIndex,
+    )
+}
+
+
+def create_index(backend: str = DEFAULT_BACKEND, **params: Any) -> VectorIndex:
+    """Create an empty index.
+
+    Args:
+        backend (str): One of the INDEX_BACKENDS names.
+        **params (Any): Backend specific parameters.
+
+    Returns:
+        VectorIndex: The index.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend not in INDEX_BACKENDS:
+        raise ValueError(
+            f"Unknown index backend {backend!r}, expected one of "
+            f"{sorted(INDEX_BACKENDS)}"
+        )
+    return INDEX_BACKENDS[backend](**params)
+
+
+def index_path(parquet_path: str, backend: str) -> str:
+    """Return the path of the persisted index next to a parquet file.
+
+    Args:
+        parquet_path (str): Path to the vector store parquet file.
+        backend (str): The index backend name.
+
+    Returns:
+        str: The path of the index file.
+    """
+    return f"{os.path.splitext(parquet_path)[0]}.{backend}.index"
+
+
+def load_or_build_index(
+    parquet_path: str,
+    vectors: np.ndarray,
+    store_fingerprint: str,
+    backend: str = DEFAULT_BACKEND,
+    **params: Any,
+) -> VectorIndex:
+    """Load the persisted index of a store, rebuilding it if it is stale.
+
+    Args:
+        parquet_path (str): Path to the vector store parquet file.
+        vectors (np.ndarray): The stored embeddings, in store order.
+        store_fingerprint (str): The fingerprint of the stored chunk ids.
+        backend (str): The index backend name.
+        **params (Any): Backend specific parameters.
+
+    Returns:
+        VectorIndex: An index over the vectors.
+    """
+    index = create_index(backend, **params)
+    current = index_fingerprint(store_fingerprint, vectors)
+    path = index_path(parquet_path, backend)
+    if index.persistent and os.path.isfile(path):
+        index.load(path)
+        if index.fingerprint == current:
+            index.attach(vectors)
+            return index
+        print(f"Index {path!r} is stale, rebuilding it...")
+
+    index.build(vectors)
+    index.fingerprint = current
+    if index.persistent:
+        index.save(path)
+        print(f"Index persisted to {path!r}")
+    return index
@@ -4,19 +4,305 @@ It simplifies loading, processing, splitting, and vectorizing LangGraph document
 using LangChain, OpenAI embeddings, and SKLearnVectorStore.
 """
 
+import asyncio
 import os
-import re
+import resource
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from functools import partial
+from typing import Any
 from typing import Optional
+from typing import TypeVar
+from typing import Union
+from uuid import uuid4
 
-import tiktoken
-from bs4 import BeautifulSoup
+import numpy as np
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import RecursiveUrlLoader
 from langchain_community.vectorstores import SKLearnVectorStore
 from langchain_community.vectorstores import VectorStore
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 
+from my_python_ai_kata.mcp.async_crawler import AsyncCrawler
+from my_python_ai_kata.mcp.backpressure import DEFAULT_MAX_CONCURRENT_REQUESTS
+from my_python_ai_kata.mcp.backpressure import DEFAULT_MAX_PENDING_REQUESTS
+from my_python_ai_kata.mcp.backpressure import ConcurrencyLimiter
+from my_python_ai_kata.mcp.document_processing import DEFAULT_CHUNK_OVERLAP
+from my_python_ai_kata.mcp.document_processing import DEFAULT_CHUNK_SIZE
+from my_python_ai_kata.mcp.document_processing import DocumentProcessor
+from my_python_ai_kata.mcp.document_processing import extract_text
+from my_python_ai_kata.mcp.embedding_cache import CachedEmbeddings
+from my_python_ai_kata.mcp.embedding_cache import EmbeddingCache
+from my_python_ai_kata.mcp.embedding_pipeline import DEFAULT_MAX_CONCURRENCY
+from my_python_ai_kata.mcp.embedding_pipeline import DEFAULT_MAX_TOKENS_PER_BATCH
+from my_python_ai_kata.mcp.embedding_pipeline import EmbeddingPipeline
+from my_python_ai_kata.mcp.embedding_pipeline import pack_batches
+from my_python_ai_kata.mcp.embedding_pipeline import pack_items
+from my_python_ai_kata.mcp.ingestion_pipeline import ParquetStoreWriter
+from my_python_ai_kata.mcp.ingestion_pipeline import iterate_async
+from my_python_ai_kata.mcp.ingestion_pipeline import prefetch
+from my_python_ai_kata.mcp.ingestion_pipeline import read_store_rows
+from my_python_ai_kata.mcp.lexical_index import BM25Index
+from my_python_ai_kata.mcp.lexical_index import build_lexical_index
+from my_python_ai_kata.mcp.lexical_index import load_or_build_lexical_index
+from my_python_ai_kata.mcp.lexical_index import reciprocal_rank_fusion
+from my_python_ai_kata.mcp.llms_full import LlmsFullReader
+from my_python_ai_kata.mcp.llms_full import LlmsFullWriter
+from my_python_ai_kata.mcp.mmap_vector_store import MmapVectorStore
+from my_python_ai_kata.mcp.mmap_vector_store import export_mmap_store
+from my_python_ai_kata.mcp.mmap_vector_store import source_stamp
+from my_python_ai_kata.mcp.query_cache import DEFAULT_MAX_SIZE
+from my_python_ai_kata.mcp.query_cache import DEFAULT_TTL_SECONDS
+from my_python_ai_kata.mcp.query_cache import LRUCache
+from my_python_ai_kata.mcp.query_cache import LRUCacheStats
+from my_python_ai_kata.mcp.query_cache import normalize_query
+from my_python_ai_kata.mcp.tokenizers import DEFAULT_ENCODING
+from my_python_ai_kata.mcp.tokenizers import count_tokens
+from my_python_ai_kata.mcp.tokenizers import count_tokens_batch
+from my_python_ai_kata.mcp.vector_index import DEFAULT_BACKEND
+from my_python_ai_kata.mcp.vector_index import VectorIndex
+from my_python_ai_kata.mcp.vector_index import fingerprint
+from my_python_ai_kata.mcp.vector_index import load_or_build_index
+from my_python_ai_kata.mcp.vector_store_manifest import SourceEntry
+from my_python_ai_kata.mcp.vector_store_manifest import VectorStoreManifest
+from my_python_ai_kata.mcp.vector_store_manifest import chunk_id
+from my_python_ai_kata.mcp.vector_store_manifest import document_source
+
+
+EMBEDDING_MODEL = "text-embedding-3-large"
+RETRIEVAL_MODES = ("dense", "lexical", "hybrid")
+# Candidates taken from each ranking before a hybrid fusion
+HYBRID_CANDIDATES = 20
+DEFAULT_SEARCH_WORKERS = 4
+
+T = TypeVar("T")
+
+
+class BatchedSKLearnVectorStore(SKLearnVectorStore):
+    """SKLearnVectorStore that can be filled with precomputed embeddings.
+
+    Fitting the nearest-neighbour index is deferred until all the batches have
+    been added, instead of refitting it after every insert. Chunks can also be
+    deleted by id, so that a persisted store can be updated incrementally.
+    """
+
+    def __init__(self, *args: Any, load: bool = True, **kwargs: Any):
+        """Initialize the store.
+
+        Args:
+            *args (Any): Positional arguments for SKLearnVectorStore.
+            load (bool): Whether to load the existing persisted store, if any.
+                When False the store starts empty and overwrites it on persist.
+            **kwargs (Any): Keyword arguments for SKLearnVectorStore.
+        """
+        self._load_persisted = load
+        super().__init__(*args, **kwargs)
+
+    def _load(self) -> None:
+        """Load the persisted store, unless asked to start empty."""
+        if self._load_persisted:
+            super()._load()
+
+    @property
+    def ids(self) -> list[str]:
+        """The ids of all the stored chunks."""
+        return list(self._ids)
+
+    def add_embeddings(
+        self,
+        text_embeddings: Iterable[tuple[str, list[float]]],
+        metadatas: Optional[list[dict[str, Any]]] = None,
+        ids: Optional[list[str]] = None,
+        refit: bool = True,
+    ) -> list[str]:
+        """Add texts with their already computed embeddings to the store.
+
+        Args:
+            text_embeddings (Iterable[tuple[str, list[float]]]): Pairs of text and
+                its embedding vector.
+            metadatas (Optional[list[dict[str, Any]]]): Optional metadata for each text.
+            ids (Optional[list[str]]): Optional ids for each text.
+            refit (bool): Whether to refit the neighbour index right away.
+
+        Returns:
+            list[str]: The ids of the added texts.
+        """
+        pairs = list(text_embeddings)
+        texts = [text for text, _ in pairs]
+        embeddings = [embedding for _, embedding in pairs]
+        added_ids = ids or [str(uuid4()) for _ in texts]
+        self._texts.extend(texts)
+        self._embeddings.extend(embeddings)
+        self._metadatas.extend(metadatas or ([{}] * len(texts)))
+        self._ids.extend(added_ids)
+        if refit:
+            self.refit()
+        return added_ids
+
+    def delete(
+        self, ids: Optional[list[str]] = None, refit: bool = True, **kwargs: Any
+    ) -> bool:
+        """Delete chunks by id.
+
+        Args:
+            ids (Optional[list[str]]): The ids of the chunks to delete.
+            refit (bool): Whether to refit the neighbour index right away.
+            **kwargs (Any): Unused, for compatibility with VectorStore.delete.
+
+        Returns:
+            bool: True if at least one chunk was deleted.
+        """
+        to_delete = set(ids or [])
+        keep = [i for i, id_ in enumerate(self._ids) if id_ not in to_delete]
+        if len(keep) == len(self._ids):
+            return False
+        self._ids = [self._ids[i] for i in keep]
+        self._texts = [self._texts[i] for i in keep]
+        self._metadatas = [self._metadatas[i] for i in keep]
+        self._embeddings = [self._embeddings[i] for i in keep]
+        if refit:
+            self.refit()
+        return True
+
+    def refit(self) -> None:
+        """Refit the nearest-neighbour index over all the stored embeddings."""
+        if self._embeddings:
+            self._update_neighbors()
+        else:
+            self._neighbors_fitted = False
+
+
+class IndexedSKLearnVectorStore(BatchedSKLearnVectorStore):
+    """SKLearnVectorStore whose similarity search runs on a pluggable index.
+
+    Without an index, searches fall back to the brute-force scikit-learn
+    neighbours. Distances are cosine distances either way.
+    """
+
+    def __init__(self, *args: Any, index: Optional[VectorIndex] = None, **kwargs: Any):
+        """Initialize the store.
+
+        Args:
+            *args (Any): Positional arguments for BatchedSKLearnVectorStore.
+            index (Optional[VectorIndex]): The index to search with.
+            **kwargs (Any): Keyword arguments for BatchedSKLearnVectorStore.
+        """
+        self.index = index
+        super().__init__(*args, **kwargs)
+
+    def embeddings_matrix(self) -> np.ndarray:
+        """Return the stored embeddings as a float32 matrix.
+
+        Returns:
+            np.ndarray: A (chunks, dim) matrix, in store order.
+        """
+        return np.asarray(self._embeddings, dtype=np.float32)
+
+    def release_embeddings(self) -> None:
+        """Drop the embeddings held for scikit-learn, once the index is built.
+
+        The loaded store keeps its embeddings as lists of Python floats, plus a
+        float64 copy fitted by scikit-learn, several times the size of the
+        float32 matrix an index needs. Afterwards the store only searches
+        through its index, and cannot be changed or persisted.
+
+        Raises:
+            ValueError: If the store has no index to search with.
+        """
+        if self.index is None:
+            raise ValueError("The embeddings are needed to search without an index")
+        self._embeddings = []
+        self._embeddings_np = np.asarray([])
+        # An unfitted copy, without a reference to the fitted vectors
+        self._neighbors = type(self._neighbors)(**self._neighbors.get_params())
+        self._neighbors_fitted = False
+
+    def _similarity_index_search_with_score(
+        self, query_embedding: list[float], *, k: int = 4, **kwargs: Any
+    ) -> list[tuple[int, float]]:
+        """Search the k embeddings closest to the query embedding.
+
+        Args:
+            query_embedding (list[float]): The embedded query.
+            k (int): Number of results.
+            **kwargs (Any): Passed to the scikit-learn search without an index.
+
+        Returns:
+            list[tuple[int, float]]: Pairs of store position and cosine distance.
+        """
+        if self.index is None:
+            return super()._similarity_index_search_with_score(
+                query_embedding, k=k, **kwargs
+            )
+        indices, similarities = self.index.search(
+            np.asarray([query_embedding], dtype=np.float32), k
+        )
+        return [
+            (int(i), 1.0 - float(similarity))
+            for i, similarity in zip(indices[0], similarities[0], strict=True)
+            if i >= 0
+        ]
+
+    def similarity_search_by_vector(
+        self, embedding: list[float], k: int = 4, **kwargs: Any
+    ) -> list[Document]:
+        """Return the chunks closest to an already computed query embedding.
+
+        Args:
+            embedding (list[float]): The query embedding.
+            k (int): Number of results.
+            **kwargs (Any): Passed to the similarity search.
+
+        Returns:
+            list[Document]: The closest chunks, with their id in the metadata.
+        """
+        return [
+            self.document(i)
+            for i, _ in self._similarity_index_search_with_score(
+                embedding, k=k, **kwargs
+            )
+        ]
+
+    def similarity_search_by_vectors(
+        self, embeddings: Sequence[list[float]], k: int = 4
+    ) -> list[list[Document]]:
+        """Return the chunks closest to each of several query embeddings.
+
+        With an index, all the queries are scored together, in a single search.
+
+        Args:
+            embeddings (Sequence[list[float]]): The query embeddings.
+            k (int): Number of results per query.
+
+        Returns:
+            list[list[Document]]: The closest chunks of every query.
+        """
+        if self.index is None or not embeddings:
+            return [self.similarity_search_by_vector(e, k=k) for e in embeddings]
+        indices, _ = self.index.search(np.asarray(embeddings, dtype=np.float32), k)
+        return [[self.document(int(i)) for i in row if i >= 0] for row in indices]
+
+    def document(self, i: int) -> Document:
+        """Return the i-th stored chunk.
+
+        Args:
+            i (int): The chunk position.
+
+        Returns:
+            Document: The chunk, with its id in the metadata.
+        """
+        return Document(
+            page_content=self._texts[i],
+            metadata={"id": self._ids[i], **self._metadatas[i]},
+        )
+
 
 class VectorStoreFactory:
     """A helper class for managing vector stores.
@@ -24,16 +310,67 @@ class VectorStoreFactory:
     This includes loading, processing, splitting, and vectorizing documents.
     """
 
-    def __init__(self, work_dir: Optional[str] = None):
+    def __init__(
+        self,
+        work_dir: Optional[str] = None,
+        embeddings: Optional[Embeddings] = None,
+        embedding_model: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_tokens_per_batch: int = DEFAULT_MAX_TOKENS_PER_BATCH,
+        use_embedding_cache: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+        max_workers: Optional[int] = None,
+    ):
         """Initialize the VectorStoreHelper with a working directory.
 
         Args:
             work_dir (Optional[str]): The directory where vector store files will
                 be saved. Defaults to the current working directory.
+            embeddings (Optional[Embeddings]): The embedding model to use. Defaults
+                to OpenAI's ``embedding_model``.
+            embedding_model (Optional[str]): The embedding model name, also used to
+                namespace the embedding cache. Defaults to the ``model`` attribute of
+                ``embeddings`` when given, else to ``EMBEDDING_MODEL``.
+            max_concurrency (int): Maximum number of embedding requests in flight.
+            max_tokens_per_batch (int): Token budget of a single embedding request.
+            use_embedding_cache (bool): Whether to reuse the vectors of previously
+                embedded chunks from the on-disk embedding cache.
+            chunk_size (int): Maximum size of a chunk, in tokens.
+            chunk_overlap (int): Overlap between consecutive chunks, in tokens.
+            max_workers (Optional[int]): Number of processes extracting, splitting
+                and token-counting pages. Defaults to the number of CPUs.
+
+        Raises:
+            ValueError: If ``embeddings`` are given without a model name, as their
+                vectors would be cached under the one of another model.
         """
         self.work_dir = work_dir or os.getcwd()
+        if embeddings is None:
+            self.embedding_model = embedding_model or EMBEDDING_MODEL
+            self.embeddings: Embeddings = OpenAIEmbeddings(model=self.embedding_model)
+        else:
+            model = embedding_model or getattr(embeddings, "model", None)
+            if not isinstance(model, str) or not model:
+                raise ValueError(
+                    "embedding_model is required with embeddings that do not name their model"
+                )
+            self.embedding_model = model
+            self.embeddings = embeddings
+        self.max_concurrency = max_concurrency
+        self.max_tokens_per_batch = max_tokens_per_batch
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.document_processor = DocumentProcessor(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap, max_workers=max_workers
+        )
         if not os.path.exists(self.work_dir):
             os.makedirs(self.work_dir)
+        self.embedding_cache = (
+            EmbeddingCache(os.path.join(self.work_dir, "embedding_cache.sqlite"))
+            if use_embedding_cache
+            else None
+        )
 
     @property
     def parquet_path(self) -> str:
@@ -44,7 +381,16 @@ class VectorStoreFactory:
         """
         return os.path.join(self.work_dir, "sklearn_vectorstore.parquet")
 
-    def count_tokens(self, text: str, model: str = "cl100k_base") -> int:
+    @property
+    def manifest_path(self) -> str:
+        """Get the path to the manifest of the indexed sources.
+
+        Returns:
+            str: The path to the manifest file.
+        """
+        return os.path.join(self.work_dir, "vector_store_manifest.json")
+
+    def count_tokens(self, text: str, model: str = DEFAULT_ENCODING) -> int:
         """Count the number of tokens in the text using tiktoken.
 
         Args:
@@ -54,8 +400,21 @@ class VectorStoreFactory:
         Returns:
             int: Number of tokens in the text.
         """
-        encoder = tiktoken.get_encoding(model)
-        return len(encoder.encode(text))
+        return count_tokens(text, model)
+
+    def count_tokens_batch(
+        self, texts: list[str], model: str = DEFAULT_ENCODING
+    ) -> list[int]:
+        """Count the number of tokens of many texts at once, on several threads.
+
+        Args:
+            texts (list[str]): The texts to count tokens for.
+            model (str): The tokenizer model to use (default: cl100k_base for GPT-4).
+
+        Returns:
+            list[int]: Number of tokens in each text.
+        """
+        return count_tokens_batch(texts, model).tolist()
 
     def bs4_extractor(self, html: str) -> str:
         """Extract and clean text content from HTML using BeautifulSoup.
@@ -66,10 +425,7 @@ class VectorStoreFactory:
         Returns:
             str: The cleaned text content.
         """
-        soup = BeautifulSoup(html, "lxml")
-        main_content = soup.find("article", class_="md-content__inner")
-        content = main_content.get_text() if main_content else soup.text
-        return re.sub(r"\n\n+", "\n\n", content).strip()
+        return extract_text(html)
 
     def load_langgraph_docs(
         self, urls: list[str], max_depth: int
@@ -85,37 +441,71 @@ class VectorStoreFactory:
             token counts.
         """
         print("Loading LangGraph documentation...")
-        docs: list[Document] = []
-        for url in urls:
-            loader = RecursiveUrlLoader(
-                url,
-                max_depth=max_depth,
-                extractor=self.bs4_extractor,
-            )
-            docs.extend(loader.lazy_load())
+        crawler = AsyncCrawler(
+            extractor=self.bs4_extractor,
+            max_depth=max_depth,
+            cache_dir=os.path.join(self.work_dir, "http_cache"),
+        )
+        start = time.perf_counter()
+        docs = crawler.load(urls)
+        print(
+            f"Crawled {len(urls)} seed URLs in {time.perf_counter() - start:.2f}s "
+            f"({crawler.stats})"
+        )
 
         print(f"Loaded {len(docs)} documents from LangGraph documentation.")
-        tokens_per_doc = [self.count_tokens(doc.page_content) for doc in docs]
+        tokens_per_doc = self.count_tokens_batch([doc.page_content for doc in docs])
         print(f"Total tokens in loaded documents: {sum(tokens_per_doc)}")
         return docs, tokens_per_doc
 
-    def save_llms_full(self, documents: list[Document], output_filename: str) -> None:
+    def stream_langgraph_docs(
+        self, urls: list[str], max_depth: int
+    ) -> Iterator[Document]:
+        """Stream LangGraph documentation pages as they are crawled.
+
+        The crawler runs on a background thread and is throttled when the
+        consumer falls behind, so only a few pages are buffered at any time.
+        Pages are yielded with their raw HTML content, to be extracted by the
+        document processor.
+
+        Args:
+            urls (list[str]): List of URLs to fetch documentation from.
+            max_depth (int): Maximum depth for recursive URL loading.
+
+        Returns:
+            Iterator[Document]: The crawled documents.
+        """
+        crawler = AsyncCrawler(
+            max_depth=max_depth, cache_dir=os.path.join(self.work_dir, "http_cache")
+        )
+        return iterate_async(crawler.crawl(urls))
+
+    def save_llms_full(
+        self, documents: Iterable[Document], output_filename: str
+    ) -> None:
         """Save the documents to a file.
 
         Args:
-            documents (list[Document]): List of Document objects to save.
+            documents (Iterable[Document]): The Document objects to save.
             output_filename (str): The filename to save the documents to.
         """
         output_filename = os.path.join(self.work_dir, output_filename)
-        with open(output_filename, "w") as f:
-            for i, doc in enumerate(documents):
-                source = doc.metadata.get("source", "Unknown URL")  # type: ignore
-                f.write(
-                    f"DOCUMENT {i + 1}\nSOURCE: {source}\nCONTENT:\n"
-                    f"{doc.page_content}\n\n{'=' * 80}\n\n"
-                )
+        with LlmsFullWriter(output_filename) as writer:
+            for doc in documents:
+                writer.write(doc)
         print(f"Documents concatenated into {output_filename}")
 
+    @cached_property
+    def text_splitter(self) -> RecursiveCharacterTextSplitter:
+        """The splitter used to chunk documents, built on first use.
+
+        Returns:
+            RecursiveCharacterTextSplitter: The text splitter.
+        """
+        return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap
+        )
+
     def split_documents(self, documents: list[Document]) -> list[Document]:
         """Split documents into smaller chunks for improved retrieval.
 
@@ -126,16 +516,86 @@ class VectorStoreFactory:
             list[Document]: A list of split Document objects.
         """
         print("Splitting documents...")
-        text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            chunk_size=8000, chunk_overlap=500
-        )
-        split_docs = text_splitter.split_documents(documents)
+        split_docs = self.text_splitter.split_documents(documents)
         print(f"Created {len(split_docs)} chunks from documents.")
         return split_docs
 
+    def embed_texts(
+        self, texts: list[str]
+    ) -> Iterator[tuple[list[int], list[list[float]]]]:
+        """Embed texts, reusing cached vectors and batching the rest.
+
+        Texts missing from the embedding cache are packed into token-budgeted
+        batches that are embedded concurrently, and their vectors are cached.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Yields:
+            tuple[list[int], list[list[float]]]: The indices of a group of texts
+            and their vectors, cached groups first.
+        """
+        missing = list(range(len(texts)))
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get_many(self.embedding_model, texts)
+            hits = [i for i, vector in enumerate(cached) if vector is not None]
+            if hits:
+                yield hits, [vector for vector in cached if vector is not None]
+            missing = [i for i, vector in enumerate(cached) if vector is None]
+
+        missing_texts = [texts[i] for i in missing]
+        batches = pack_batches(
+            missing_texts,
+            self.count_tokens_batch(missing_texts),
+            max_tokens=self.max_tokens_per_batch,
+        )
+        pipeline = EmbeddingPipeline(
+            self.embeddings, max_concurrency=self.max_concurrency
+        )
+        for batch, vectors in pipeline.embed_batches(batches):
+            if self.embedding_cache is not None:
+                self.embedding_cache.put_many(
+                    self.embedding_model, batch.texts, vectors
+                )
+            print(f"Embedded batch of {len(batch)} chunks ({batch.token_count} tokens)")
+            yield [missing[i] for i in batch.indices], vectors
+
+        if self.embedding_cache is not None:
+            self.embedding_cache.evict()
+            print(f"Embedding cache: {self.embedding_cache.stats}")
+
+    def _add_splits(
+        self,
+        vectorstore: BatchedSKLearnVectorStore,
+        splits: list[Document],
+        ids: Optional[list[str]] = None,
+    ) -> None:
+        """Embed document chunks and add them to a store, without refitting it.
+
+        Args:
+            vectorstore (BatchedSKLearnVectorStore): The store to add chunks to.
+            splits (list[Document]): The chunks to embed.
+            ids (Optional[list[str]]): Optional ids for the chunks.
+        """
+        texts = [split.page_content for split in splits]
+        start = time.perf_counter()
+        for indices, vectors in self.embed_texts(texts):
+            vectorstore.add_embeddings(
+                zip([texts[i] for i in indices], vectors),
+                metadatas=[splits[i].metadata for i in indices],
+                ids=[ids[i] for i in indices] if ids else None,
+                refit=False,
+            )
+        print(f"Embedded {len(splits)} chunks in {time.perf_counter() - start:.2f}s")
+
     def create_vectorstore(self, splits: list[Document]) -> VectorStore:
         """Create a vector store from document chunks using SKLearnVectorStore.
 
+        Chunks already in the embedding cache are not embedded again; the others
+        are packed into token-budgeted batches that are embedded concurrently, and
+        the vectors are added to the store as each batch completes. Any previously
+        persisted store is replaced.
+
         Args:
             splits (list[Document]): List of split Document objects to embed.
 
@@ -143,45 +603,522 @@ class VectorStoreFactory:
             VectorStore: A vector store containing the embedded documents.
         """
         print("Creating SKLearnVectorStore...")
-        embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
-        vectorstore = SKLearnVectorStore.from_documents(
-            documents=splits,
-            embedding=embeddings,
+        vectorstore = BatchedSKLearnVectorStore(
+            embedding=self.embeddings,
             persist_path=self.parquet_path,
             serializer="parquet",
+            load=False,
         )
+        self._add_splits(vectorstore, splits)
+        vectorstore.refit()
         vectorstore.persist()
+        # The chunks are not tracked by source, so a stale manifest must go
+        if os.path.exists(self.manifest_path):
+            os.remove(self.manifest_path)
         print(f"SKLearnVectorStore was persisted to {self.parquet_path}")
         return vectorstore
 
-    def create_vectore_store(self, urls: list[str], max_depth: int = 2) -> None:
+    def update_vectorstore(
+        self, documents: Iterable[Document], incremental: bool = True
+    ) -> None:
+        """Bring the vector store in line with the given documents.
+
+        The documents go through the same streaming pipeline as the crawled
+        pages of ``create_vectore_store``, their content being kept as is. In
+        incremental mode only new and changed sources are split and embedded,
+        and the chunks of the unchanged ones are copied from the persisted
+        store; otherwise, or without a readable manifest of that store, it is
+        rebuilt from scratch.
+
+        Args:
+            documents (Iterable[Document]): The current version of all the documents.
+            incremental (bool): Whether to reuse the chunks of the persisted store.
+        """
+        processor = DocumentProcessor(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            extractor=None,
+            max_workers=self.document_processor.max_workers,
+        )
+        print("Streaming documents into the vector store...")
+        self._write_store(documents, processor, incremental)
+
+    def _chunk_stream(
+        self,
+        documents: Iterable[Document],
+        processor: DocumentProcessor,
+        previous: VectorStoreManifest,
+        manifest: VectorStoreManifest,
+        llms_full: LlmsFullWriter,
+    ) -> Iterator[tuple[str, Document, int]]:
+        """Extract, save, diff, split and token-count documents, one at a time.
+
+        The CPU-bound extraction, splitting and token counting run on the
+        worker processes of the document processor. Every document is appended to
+        llms_full.txt. Documents unchanged since the previous manifest keep
+        their entry; the chunks of the others get deterministic ids, recorded
+        in the new manifest.
+
+        Args:
+            documents (Iterable[Document]): The crawled pages, as raw HTML.
+            processor (DocumentProcessor): Extracts, splits and token-counts them.
+            previous (VectorStoreManifest): The manifest of the persisted store.
+            manifest (VectorStoreManifest): The manifest being built.
+            llms_full (LlmsFullWriter): The llms_full.txt writer.
+
+        Yields:
+            tuple[str, Document, int]: The id, the chunk and its token count.
+        """
+
+        def with_known_hashes() -> Iterator[tuple[Document, Optional[str]]]:
+            for document in documents:
+                entry = previous.sources.get(document_source(document))
+                yield document, entry.content_hash if entry else None
+
+        for processed in processor.map(with_known_hashes()):
+            document = processed.document
+            source = document_source(document)
+            if not document.page_content or source in manifest.sources:
+                continue
+            llms_full.write(document)
+            entry = previous.sources.get(source)
+            if entry is not None and entry.content_hash == processed.content_hash:
+                manifest.sources[source] = entry
+                continue
+            entry = manifest.sources[source] = SourceEntry(processed.content_hash)
+            for index, (chunk, tokens) in enumerate(
+                zip(processed.chunks, processed.token_counts, strict=True)
+            ):
+                entry.chunk_ids.append(chunk_id(source, processed.content_hash, index))
+                yield entry.chunk_ids[-1], chunk, tokens
+
+    def create_vectore_store(
+        self, urls: list[str], max_depth: int = 2, incremental: bool = False
+    ) -> None:
         """Create a vector store from LangGraph documentation.
 
+        The pages flow through a streaming pipeline: crawling, splitting and
+        token counting, embedding and writing run concurrently and hand items
+        over through bounded queues, so memory stays flat whatever the corpus
+        size. The parquet file is written one row group at a time.
+
         Args:
             urls (list[str]): List of URLs to fetch documentation from.
             max_depth (int): Maximum depth for recursive URL loading. Defaults to 2.
+            incremental (bool): Only embed the pages that were added or changed
+                since the last run, instead of rebuilding the whole store.
         """
-        documents, _ = self.load_langgraph_docs(urls, max_depth)
-        self.save_llms_full(documents, "llms_full.txt")
-        split_docs = self.split_documents(documents)
-        self.create_vectorstore(split_docs)
+        print("Streaming LangGraph documentation into the vector store...")
+        self._write_store(
+            self.stream_langgraph_docs(urls, max_depth),
+            self.document_processor,
+            incremental,
+        )
+
+    def _write_store(
+        self,
+        documents: Iterable[Document],
+        processor: DocumentProcessor,
+        incremental: bool,
+    ) -> None:
+        """Write the vector store, llms_full.txt and the derived indexes.
+
+        Args:
+            documents (Iterable[Document]): The documents to index.
+            processor (DocumentProcessor): Extracts, splits and token-counts them.
+            incremental (bool): Whether to reuse the chunks of the unchanged
+                documents from the persisted store.
+        """
+        previous = self._previous_manifest(incremental)
+        manifest = VectorStoreManifest()
+        embeddings: Embeddings = self.embeddings
+        if self.embedding_cache is not None:
+            embeddings = CachedEmbeddings(
+                embeddings, self.embedding_cache, self.embedding_model
+            )
+        pipeline = EmbeddingPipeline(embeddings, max_concurrency=self.max_concurrency)
+        pending: dict[int, tuple[str, Document]] = {}
+        start = time.perf_counter()
+
+        with (
+            LlmsFullWriter(os.path.join(self.work_dir, "llms_full.txt")) as llms_full,
+            ParquetStoreWriter(self.parquet_path) as writer,
+        ):
+            chunks = prefetch(
+                self._chunk_stream(
+                    documents,
+                    processor,
+                    previous,
+                    manifest,
+                    llms_full,
+                )
+            )
+
+            def texts_and_counts() -> Iterator[tuple[str, int]]:
+                for index, (id_, chunk, tokens) in enumerate(chunks):
+                    pending[index] = (id_, chunk)
+                    yield chunk.page_content, tokens
+
+            batches = pack_items(
+                texts_and_counts(), max_tokens=self.max_tokens_per_batch
+            )
+            for batch, vectors in pipeline.embed_batches(batches):
+                for index, vector in zip(batch.indices, vectors, strict=True):
+                    id_, chunk = pending.pop(index)
+                    writer.write(id_, chunk.page_content, chunk.metadata, vector)
+            embedded = writer.count
+
+            if previous.sources:
+                self._copy_unchanged_chunks(writer, manifest)
+
+        manifest.save(self.manifest_path)
+        if self.embedding_cache is not None:
+            self.embedding_cache.evict()
+            print(f"Embedding cache: {self.embedding_cache.stats}")
+        print(
+            f"Indexed {llms_full.count} documents into {writer.count} chunks "
+            f"({embedded} embedded) in {time.perf_counter() - start:.2f}s, "
+            f"peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024} MB"
+        )
+        print(f"SKLearnVectorStore was persisted to {self.parquet_path}")
+        export_mmap_store(self.parquet_path)
+        build_lexical_index(self.parquet_path)
         print("Vector store creation complete.")
 
+    def _previous_manifest(self, incremental: bool) -> VectorStoreManifest:
+        """Return the manifest of the persisted store, if it can be updated.
+
+        Without a readable manifest, the chunks of the persisted store cannot be
+        told apart by source, so none of them is reused.
+
+        Args:
+            incremental (bool): Whether the persisted store should be updated.
+
+        Returns:
+            VectorStoreManifest: The manifest, empty for a rebuild from scratch.
+        """
+        previous = VectorStoreManifest()
+        if incremental and os.path.isfile(self.parquet_path):
+            previous = VectorStoreManifest.load(self.manifest_path)
+        if not previous.sources:
+            print("Rebuilding the vector store from scratch")
+        return previous
+
+    def _copy_unchanged_chunks(
+        self, writer: ParquetStoreWriter, manifest: VectorStoreManifest
+    ) -> None:
+        """Copy the chunks of the new manifest from the persisted store.
+
+        Args:
+            writer (ParquetStoreWriter): The writer of the new store.
+            manifest (VectorStoreManifest): The manifest of the new store.
+        """
+        kept_ids = {id_ for entry in manifest.sources.values() for id_ in entry.chunk_ids}
+        for row in read_store_rows(self.parquet_path):
+            if row["ids"] in kept_ids:
+                writer.write(
+                    row["ids"], row["texts"], row["metadatas"], row["embeddings"]
+                )
+
 
 class VectorStoreQueryHelper:
-    """Helper class for querying a vector store."""
+    """Helper class for querying a vector store.
+
+    Queries run in one of the RETRIEVAL_MODES: "dense" ranks the chunks by
+    embedding similarity, "lexical" by BM25 over the persisted inverted index,
+    without any embedding request, and "hybrid" fuses both rankings by
+    reciprocal rank.
 
-    def __init__(self, parquet_path: str):
+    Query embeddings and top-k results are kept in LRU caches. The results are
+    keyed by the store version, and both caches are dropped when the persisted
+    store is rebuilt, which is detected on every query.
+
+    The async methods, meant for servers, await the embedding client and run
+    the searches on a small thread pool, behind a concurrency limiter.
+    """
+
+    def __init__(
+        self,
+        parquet_path: str,
+        embeddings: Optional[Embeddings] = None,
+        index_backend: str = DEFAULT_BACKEND,
+        index_params: Optional[dict[str, Any]] = None,
+        layout: str = "parquet",
+        dtype: str = "float32",
+        cache_size: int = DEFAULT_MAX_SIZE,
+        cache_ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+        mode: str = "dense",
+        max_concurrent_queries: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_pending_queries: int = DEFAULT_MAX_PENDING_REQUESTS,
+        search_workers: int = DEFAULT_SEARCH_WORKERS,
+    ):
         """Initialize with the path to the parquet file.
 
+        The nearest-neighbour index is loaded from next to the parquet file, or
+        built and persisted there if it is missing or out of date.
+
         Args:
             parquet_path (str): Path to the SKLearnVectorStore parquet file.
+            embeddings (Optional[Embeddings]): The embedding model used for
+                queries. Defaults to OpenAI's ``EMBEDDING_MODEL``.
+            index_backend (str): The index backend: "exact", "ivf", "hnsw", or
+                one of the quantized "float16", "int8" and "binary".
+            index_params (Optional[dict[str, Any]]): Backend specific parameters.
+            layout (str): "parquet" loads the whole store in memory; "mmap" maps
+                the exported matrix and chunk files instead, sharing them between
+                processes and starting in milliseconds.
+            dtype (str): The matrix dtype of the "mmap" layout, "float32" or
+                "float16".
+            cache_size (int): Maximum number of cached query embeddings, and of
+                cached results; 0 disables caching.
+            cache_ttl (Optional[float]): Lifetime of cached entries in seconds, or
+                None to keep them until they are evicted.
+            mode (str): The default retrieval mode, one of RETRIEVAL_MODES.
+            max_concurrent_queries (int): Maximum number of async queries
+                running at once.
+            max_pending_queries (int): Maximum number of async queries waiting
+                for their turn; further ones are rejected with ServerBusyError.
+            search_workers (int): Number of threads running the async searches.
+
+        Raises:
+            ValueError: If the layout or the retrieval mode is unknown.
         """
+        if layout not in ("parquet", "mmap"):
+            raise ValueError(f"Unknown vector store layout {layout!r}")
+        self.mode = self._check_mode(mode)
         self.parquet_path = parquet_path
-        embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
-        self.vectorstore = SKLearnVectorStore(
-            embedding=embeddings, persist_path=parquet_path, serializer="parquet"
+        self.embeddings = embeddings or OpenAIEmbeddings(model=EMBEDDING_MODEL)
+        self.index_backend = index_backend
+        self.index_params = index_params or {}
+        self.layout = layout
+        self.dtype = dtype
+        self.embedding_cache: LRUCache[str, list[float]] = LRUCache(
+            cache_size, cache_ttl
+        )
+        self.result_cache: LRUCache[tuple[str, int, str, str], list[Document]] = (
+            LRUCache(cache_size, cache_ttl)
+        )
+        self._llms_full: Optional[LlmsFullReader] = None
+        self.limiter = ConcurrencyLimiter(max_concurrent_queries, max_pending_queries)
+        self._executor = ThreadPoolExecutor(
+            max_workers=search_workers, thread_name_prefix="vector-search"
         )
+        self._reload_lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _check_mode(mode: str) -> str:
+        """Validate a retrieval mode.
+
+        Args:
+            mode (str): The retrieval mode.
+
+        Returns:
+            str: The retrieval mode.
+
+        Raises:
+            ValueError: If the retrieval mode is unknown.
+        """
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(
+                f"Unknown retrieval mode {mode!r}, expected one of {RETRIEVAL_MODES}"
+            )
+        return mode
+
+    def _load(self) -> None:
+        """Load the store and its index, recording the version of the store.
+
+        The lexical index is only loaded by the first query that needs it.
+        """
+        start = time.perf_counter()
+        self.store_version = source_stamp(self.parquet_path)
+        self._lexical_index: Optional[BM25Index] = None
+        self.vectorstore: Union[MmapVectorStore, IndexedSKLearnVectorStore]
+        if self.layout == "mmap":
+            self.vectorstore = MmapVectorStore(
+                self.parquet_path,
+                self.embeddings,
+                self.index_backend,
+                self.index_params,
+                self.dtype,
+            )
+            count = len(self.vectorstore)
+            self.store_fingerprint = self.vectorstore.layout.fingerprint
+        else:
+            self.vectorstore = IndexedSKLearnVectorStore(
+                embedding=self.embeddings,
+                persist_path=self.parquet_path,
+                serializer="parquet",
+            )
+            self.store_fingerprint = fingerprint(self.vectorstore.ids)
+            self.vectorstore.index = load_or_build_index(
+                self.parquet_path,
+                self.vectorstore.embeddings_matrix(),
+                self.store_fingerprint,
+                self.index_backend,
+                **self.index_params,
+            )
+            # The index holds all the searches need: codes and re-ranking matrix
+            # for the quantized backends, its own copy of the vectors otherwise
+            self.vectorstore.release_embeddings()
+            count = len(self.vectorstore.ids)
+        print(
+            f"Loaded {count} chunks ({self.layout} layout, {self.index_backend!r} "
+            f"index) in {time.perf_counter() - start:.3f}s"
+        )
+
+    def reload_if_changed(self) -> bool:
+        """Reload the store and drop the caches if the parquet file was rebuilt.
+
+        Returns:
+            bool: True if the store was reloaded.
+        """
+        if source_stamp(self.parquet_path) in ("", self.store_version):
+            return False
+        with self._reload_lock:
+            if source_stamp(self.parquet_path) in ("", self.store_version):
+                return False
+            print(f"Vector store {self.parquet_path!r} changed, reloading it...")
+            self._load()
+            self.embedding_cache.clear()
+            self.result_cache.clear()
+        return True
+
+    @property
+    def lexical_index(self) -> BM25Index:
+        """The BM25 index of the store, loaded or rebuilt on first use.
+
+        Returns:
+            BM25Index: The lexical index.
+        """
+        if self._lexical_index is None:
+            self._lexical_index = load_or_build_lexical_index(
+                self.parquet_path, self.store_fingerprint
+            )
+        return self._lexical_index
+
+    @property
+    def cache_stats(self) -> dict[str, LRUCacheStats]:
+        """The statistics of the query embedding and result caches.
+
+        Returns:
+            dict[str, LRUCacheStats]: The statistics, by cache name.
+        """
+        return {
+            "embeddings": self.embedding_cache.stats,
+            "results": self.result_cache.stats,
+        }
+
+    def _missing_embeddings(
+        self, queries: Sequence[str]
+    ) -> tuple[list[str], list[Optional[list[float]]], dict[str, str]]:
+        """Look the queries up in the embedding cache.
+
+        Args:
+            queries (Sequence[str]): Query strings.
+
+        Returns:
+            tuple[list[str], list[Optional[list[float]]], dict[str, str]]: The
+            cache key and cached embedding of every query, and the first query
+            of every key that missed the cache.
+        """
+        keys = [normalize_query(query) for query in queries]
+        embeddings = [self.embedding_cache.get(key) for key in keys]
+        missing: dict[str, str] = {}
+        for key, query, embedding in zip(keys, queries, embeddings, strict=True):
+            if embedding is None:
+                missing.setdefault(key, query)
+        return keys, embeddings, missing
+
+    def _fill_embeddings(
+        self,
+        keys: list[str],
+        embeddings: list[Optional[list[float]]],
+        missing: dict[str, str],
+        embedded: list[list[float]],
+    ) -> list[list[float]]:
+        """Cache freshly computed embeddings and merge them with the cached ones.
+
+        Args:
+            keys (list[str]): The cache key of every query.
+            embeddings (list[Optional[list[float]]]): The cached embeddings.
+            missing (dict[str, str]): The queries that missed the cache.
+            embedded (list[list[float]]): The embeddings of the missing queries.
+
+        Returns:
+            list[list[float]]: The embeddings of all the queries, in order.
+        """
+        found = dict(zip(missing, embedded, strict=True))
+        for key, embedding in found.items():
+            self.embedding_cache.put(key, embedding)
+        return [
+            embedding if embedding is not None else found[key]
+            for key, embedding in zip(keys, embeddings, strict=True)
+        ]
+
+    def embed_queries(self, queries: Sequence[str]) -> list[list[float]]:
+        """Embed several queries, sending the uncached ones in a single request.
+
+        Args:
+            queries (Sequence[str]): Query strings.
+
+        Returns:
+            list[list[float]]: The query embeddings, in order.
+        """
+        keys, embeddings, missing = self._missing_embeddings(queries)
+        embedded = (
+            self.embeddings.embed_documents(list(missing.values())) if missing else []
+        )
+        return self._fill_embeddings(keys, embeddings, missing, embedded)
+
+    async def aembed_queries(self, queries: Sequence[str]) -> list[list[float]]:
+        """Embed several queries without blocking the event loop.
+
+        Args:
+            queries (Sequence[str]): Query strings.
+
+        Returns:
+            list[list[float]]: The query embeddings, in order.
+        """
+        keys, embeddings, missing = self._missing_embeddings(queries)
+        embedded = (
+            await self.embeddings.aembed_documents(list(missing.values()))
+            if missing
+            else []
+        )
+        return self._fill_embeddings(keys, embeddings, missing, embedded)
+
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a query, reusing the embedding of an identical normalized query.
+
+        Args:
+            query (str): Query string.
+
+        Returns:
+            list[float]: The query embedding.
+        """
+        key = normalize_query(query)
+        embedding = self.embedding_cache.get(key)
+        if embedding is None:
+            embedding = self.embeddings.embed_query(query)
+            self.embedding_cache.put(key, embedding)
+        return embedding
+
+    async def aembed_query(self, query: str) -> list[float]:
+        """Embed a query without blocking the event loop.
+
+        Args:
+            query (str): Query string.
+
+        Returns:
+            list[float]: The query embedding.
+        """
+        key = normalize_query(query)
+        embedding = self.embedding_cache.get(key)
+        if embedding is None:
+            embedding = await self.embeddings.aembed_query(query)
+            self.embedding_cache.put(key, embedding)
+        return embedding
 
     @property
     def llms_full_path(self) -> str:
@@ -192,6 +1129,20 @@ class VectorStoreQueryHelper:
         """
         return os.path.join(os.path.dirname(self.parquet_path), "llms_full.txt")
 
+    @property
+    def llms_full(self) -> LlmsFullReader:
+        """The memory-mapped llms_full.txt file, opened on first use.
+
+        Returns:
+            LlmsFullReader: The reader of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        if self._llms_full is None:
+            self._llms_full = LlmsFullReader(self.llms_full_path)
+        return self._llms_full
+
     def get_llms_full(self) -> str:
         """Get the contents of the llms_full.txt file.
 
@@ -199,29 +1150,287 @@ class VectorStoreQueryHelper:
             str: The contents of the llms_full.txt file.
         """
         try:
-            with open(self.llms_full_path) as file:
-                return file.read()
+            return self.llms_full.text()
         except FileNotFoundError:
             return "llms_full.txt not found. Please ensure the vector store has been created."
 
-    def query(self, query: str, k: int = 3) -> list[Document]:
+    def rank(
+        self,
+        queries: Sequence[str],
+        k: int,
+        mode: str,
+        embeddings: Optional[Sequence[list[float]]] = None,
+    ) -> list[list[int]]:
+        """Rank the stored chunks for several queries, lexically or hybridly.
+
+        Args:
+            queries (Sequence[str]): Query strings.
+            k (int): Number of chunks per query.
+            mode (str): "lexical" or "hybrid".
+            embeddings (Optional[Sequence[list[float]]]): The query embeddings of
+                a hybrid search; computed when not given.
+
+        Returns:
+            list[list[int]]: The store positions of the best chunks of every
+            query, best first.
+        """
+        if mode == "lexical":
+            indices, _ = self.lexical_index.search(queries, k)
+            return [[int(i) for i in row if i >= 0] for row in indices]
+
+        candidates = max(k, HYBRID_CANDIDATES)
+        if embeddings is None:
+            embeddings = self.embed_queries(queries)
+        dense, _ = self.vectorstore.index.search(
+            np.asarray(embeddings, dtype=np.float32), candidates
+        )
+        lexical, _ = self.lexical_index.search(queries, candidates)
+        return [
+            reciprocal_rank_fusion(
+                [
+                    [int(i) for i in dense_row if i >= 0],
+                    [int(i) for i in lexical_row if i >= 0],
+                ],
+                k,
+            )
+            for dense_row, lexical_row in zip(dense, lexical, strict=True)
+        ]
+
+    def _search(
+        self,
+        queries: Sequence[str],
+        k: int,
+        mode: str,
+        embeddings: Optional[Sequence[list[float]]] = None,
+    ) -> list[list[Document]]:
+        """Search the store for several queries, bypassing the result cache.
+
+        Args:
+            queries (Sequence[str]): Query strings.
+            k (int): Number of documents per query.
+            mode (str): The retrieval mode.
+            embeddings (Optional[Sequence[list[float]]]): The query embeddings,
+                computed when needed and not given.
+
+        Returns:
+            list[list[Document]]: The relevant documents of every query.
+        """
+        if mode == "dense":
+            if embeddings is None:
+                embeddings = self.embed_queries(queries)
+            return self.vectorstore.similarity_search_by_vectors(embeddings, k=k)
+        return [
+            [self.vectorstore.document(i) for i in ranking]
+            for ranking in self.rank(queries, k, mode, embeddings)
+        ]
+
+    def _cached_results(self, queries: Sequence[str], k: int, mode: str) -> tuple[
+        list[tuple[str, int, str, str]],
+        list[Optional[list[Document]]],
+        dict[tuple[str, int, str, str], str],
+    ]:
+        """Look the queries up in the result cache.
+
+        Args:
+            queries (Sequence[str]): Query strings.
+            k (int): Number of documents per query.
+            mode (str): The retrieval mode.
+
+        Returns:
+            tuple[list[tuple[str, int, str, str]], list[Optional[list[Document]]],
+            dict[tuple[str, int, str, str], str]]: The cache key and cached
+            documents of every query, and the first query of every key that
+            missed the cache.
+        """
+        keys = [
+            (normalize_query(query), k, self.store_version, mode) for query in queries
+        ]
+        results = [self.result_cache.get(key) for key in keys]
+        missing: dict[tuple[str, int, str, str], str] = {}
+        for key, query, docs in zip(keys, queries, results, strict=True):
+            if docs is None:
+                missing.setdefault(key, query)
+        return keys, results, missing
+
+    def _fill_results(
+        self,
+        keys: list[tuple[str, int, str, str]],
+        results: list[Optional[list[Document]]],
+        missing: dict[tuple[str, int, str, str], str],
+        found: list[list[Document]],
+    ) -> list[list[Document]]:
+        """Cache fresh results and merge them with the cached ones.
+
+        Args:
+            keys (list[tuple[str, int, str, str]]): The cache key of every query.
+            results (list[Optional[list[Document]]]): The cached documents.
+            missing (dict[tuple[str, int, str, str], str]): The queries that
+                missed the cache.
+            found (list[list[Document]]): The documents of the missing queries.
+
+        Returns:
+            list[list[Document]]: The documents of every query, in order.
+        """
+        fresh = dict(zip(missing, found, strict=True))
+        for key, docs in fresh.items():
+            self.result_cache.put(key, docs)
+        return [
+            list(docs if docs is not None else fresh[key])
+            for key, docs in zip(keys, results, strict=True)
+        ]
+
+    def query(
+        self, query: str, k: int = 3, mode: Optional[str] = None
+    ) -> list[Document]:
         """Query the vector store and return relevant documents.
 
         Args:
             query (str): Query string.
             k (int): Number of top relevant documents to retrieve. Defaults to 3.
+            mode (Optional[str]): The retrieval mode, one of RETRIEVAL_MODES.
+                Defaults to the mode of the helper.
+
+        Returns:
+            list[Document]: List of relevant documents. They may be shared with
+            the result cache, and must not be modified.
+        """
+        mode = self._check_mode(mode or self.mode)
+        self.reload_if_changed()
+        keys, results, missing = self._cached_results([query], k, mode)
+        if not missing:
+            print(f"Retrieved {len(results[0] or [])} cached documents for: {query}")
+            return self._fill_results(keys, results, missing, [])[0]
+
+        print(f"Querying vector store ({mode}) for: {query}")
+        embeddings = None if mode == "lexical" else [self.embed_query(query)]
+        found = self._search([query], k, mode, embeddings)
+        print(f"Retrieved {len(found[0])} relevant documents")
+        return self._fill_results(keys, results, missing, found)[0]
+
+    def query_many(
+        self, queries: Sequence[str], k: int = 3, mode: Optional[str] = None
+    ) -> list[list[Document]]:
+        """Query the vector store with several queries at once.
+
+        The queries that are not in the result cache are embedded in a single
+        request and scored together against the corpus, so a fan-out of related
+        sub-questions costs about as much as a single query.
+
+        Args:
+            queries (Sequence[str]): Query strings.
+            k (int): Number of top relevant documents per query. Defaults to 3.
+            mode (Optional[str]): The retrieval mode, one of RETRIEVAL_MODES.
+                Defaults to the mode of the helper.
+
+        Returns:
+            list[list[Document]]: The relevant documents of every query, in order.
+            They may be shared with the result cache, and must not be modified.
+        """
+        mode = self._check_mode(mode or self.mode)
+        self.reload_if_changed()
+        keys, results, missing = self._cached_results(queries, k, mode)
+        print(
+            f"Querying vector store for {len(queries)} queries "
+            f"({len(missing)} not cached)"
+        )
+        found = self._search(list(missing.values()), k, mode) if missing else []
+        return self._fill_results(keys, results, missing, found)
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking function on the search executor.
+
+        Args:
+            fn (Callable[..., T]): The function.
+            *args (Any): Its arguments.
+
+        Returns:
+            T: Its result.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(fn, *args)
+        )
+
+    async def aquery(
+        self, query: str, k: int = 3, mode: Optional[str] = None
+    ) -> list[Document]:
+        """Query the vector store without blocking the event loop.
+
+        The query embedding is awaited from the async embedding client, and the
+        store reload check and the search run on the search executor threads.
+        At most ``max_concurrent_queries`` queries run at once and
+        ``max_pending_queries`` wait for their turn; further ones are rejected.
+
+        Args:
+            query (str): Query string.
+            k (int): Number of top relevant documents to retrieve. Defaults to 3.
+            mode (Optional[str]): The retrieval mode, one of RETRIEVAL_MODES.
+                Defaults to the mode of the helper.
 
         Returns:
             list[Document]: List of relevant documents.
+
+        Raises:
+            ServerBusyError: If too many queries are already waiting.
+        """
+        return (await self.aquery_many([query], k, mode))[0]
+
+    async def aquery_many(
+        self, queries: Sequence[str], k: int = 3, mode: Optional[str] = None
+    ) -> list[list[Document]]:
+        """Query the vector store with several queries without blocking the event loop.
+
+        Args:
+            queries (Sequence[str]): Query strings.
+            k (int): Number of top relevant documents per query. Defaults to 3.
+            mode (Optional[str]): The retrieval mode, one of RETRIEVAL_MODES.
+                Defaults to the mode of the helper.
+
+        Returns:
+            list[list[Document]]: The relevant documents of every query, in order.
+
+        Raises:
+            ServerBusyError: If too many queries are already waiting.
         """
-        print(f"Querying vector store for: {query}")
-        retriever = self.vectorstore.as_retriever(search_kwargs={"k": k})
-        relevant_docs = retriever.invoke(query)
-        print(f"Retrieved {len(relevant_docs)} relevant documents")
-        return relevant_docs
+        mode = self._check_mode(mode or self.mode)
+        async with self.limiter.slot():
+            await self._run(self.reload_if_changed)
+            keys, results, missing = self._cached_results(queries, k, mode)
+            found: list[list[Document]] = []
+            if missing:
+                embeddings = (
+                    None
+                    if mode == "lexical"
+                    else await self.aembed_queries(list(missing.values()))
+                )
+                found = await self._run(
+                    self._search, list(missing.values()), k, mode, embeddings
+                )
+            return self._fill_results(keys, results, missing, found)
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Create the sample vector store.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only embed the pages added or changed since the last run",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Maximum size of a chunk, in tokens",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of processes extracting and splitting pages (default: all CPUs)",
+    )
+    args = parser.parse_args()
+
     work_dir = os.path.join(os.getcwd(), "vector_store_data")
     print(
         f"Creating a sample Vector store in {work_dir!r} using Langgraph online documentation ..."
@@ -233,12 +1442,16 @@ if __name__ == "__main__":
         "https://langchain-ai.github.io/langgraph/tutorials/introduction/",
         "https://langchain-ai.github.io/langgraph/tutorials/langgraph-platform/local-server/",
     ]
-    # Watch out - if you recursively load too many URLs, you may hit 300K max token limit
-    # from OpenAI embedding model!
+    # Chunks are embedded in batches below the 300K tokens per request limit
+    # of the OpenAI embedding model, so deeper crawls are fine.
     max_depth = 3  # this triggers about 221K tokens
 
-    vector_store_factory = VectorStoreFactory(work_dir=work_dir)
-    vector_store_factory.create_vectore_store(urls, max_depth)
+    vector_store_factory = VectorStoreFactory(
+        work_dir=work_dir, chunk_size=args.chunk_size, max_workers=args.workers
+    )
+    vector_store_factory.create_vectore_store(
+        urls, max_depth, incremental=args.incremental
+    )
     print("Vector store created successfully.")
 
     query_helper = VectorStoreQueryHelper(
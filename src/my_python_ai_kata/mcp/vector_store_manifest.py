@@ -0,0 +1,105 @@
+"""Manifest of the sources indexed in a vector store.
+
+For every source URL the manifest records the hash of its content and the ids of
+the chunks it was split into, so that an incremental ingest can reuse the chunks
+of the sources that did not change, and drop those of the others.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+
+from langchain_core.documents import Document
+
+
+MANIFEST_VERSION = 1
+UNKNOWN_SOURCE = "Unknown URL"
+
+
+def document_source(document: Document) -> str:
+    """Return the source URL of a document.
+
+    Args:
+        document (Document): The document.
+
+    Returns:
+        str: The ``source`` metadata of the document, or a placeholder.
+    """
+    return document.metadata.get("source", UNKNOWN_SOURCE)  # type: ignore
+
+
+def chunk_id(source: str, content_hash: str, index: int) -> str:
+    """Return a deterministic id for the n-th chunk of a source.
+
+    Args:
+        source (str): The source URL.
+        content_hash (str): The hash of the source content.
+        index (int): The position of the chunk within the source.
+
+    Returns:
+        str: The chunk id.
+    """
+    source_hash = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return f"{source_hash[:16]}-{content_hash[:16]}-{index}"
+
+
+@dataclass
+class SourceEntry:
+    """What is indexed for a single source."""
+
+    content_hash: str
+    chunk_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class VectorStoreManifest:
+    """The indexed sources of a vector store, keyed by source URL."""
+
+    sources: dict[str, SourceEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> "VectorStoreManifest":
+        """Load a manifest from disk.
+
+        Args:
+            path (str): Path to the manifest JSON file.
+
+        Returns:
+            VectorStoreManifest: The loaded manifest, or an empty one if the file
+            does not exist, cannot be read or has an unknown version.
+        """
+        if not os.path.isfile(path):
+            return cls()
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return cls()
+            return cls(
+                sources={
+                    source: SourceEntry(**entry)
+                    for source, entry in data["sources"].items()
+                }
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return cls()
+
+    def save(self, path: str) -> None:
+        """Atomically write the manifest to disk.
+
+        Args:
+            path (str): Path to the manifest JSON file.
+        """
+        data = {
+            "version": MANIFEST_VERSION,
+            "sources": {
+                source: asdict(entry) for source, entry in self.sources.items()
+            },
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,57 @@
+"""Test cases for the agent_pool module."""
+
+import time
+
+from my_python_ai_kata.agents.staff.agent_pool import AgentPool
+from my_python_ai_kata.agents.staff.no_expertise import get_general_assistant
+from my_python_ai_kata.benchmarks.agent_pool import StubModel
+
+
+def test_pool_reuses_agents_with_a_clear_conversation() -> None:
+    """It lends the same agent again, without the messages of its last call."""
+    pool = AgentPool(lambda: get_general_assistant(StubModel("Paris")))
+
+    with pool.checkout() as agent:
+        agent.state.set("topic", "geography")
+        assert str(agent("What is the capital of France?")).strip() == "Paris"
+        assert len(agent.messages) == 2
+    with pool.checkout() as again:
+        assert again is agent
+        assert again.messages == []
+        assert again.state.get() == {}
+        with pool.checkout() as other:
+            assert other is not agent
+
+    assert pool.created == 2
+    assert len(pool) == 2
+
+
+def test_pool_evicts_idle_agents() -> None:
+    """It drops the agents past the idle limits."""
+    pool = AgentPool(
+        lambda: get_general_assistant(StubModel()), max_idle=1, idle_seconds=0.05
+    )
+    with pool.checkout(), pool.checkout():
+        pass
+    assert len(pool) == 1
+
+    time.sleep(0.1)
+    with pool.checkout():
+        pass
+
+    assert pool.created == 3
+
+
+def test_pool_drops_agents_lent_before_a_clear() -> None:
+    """It does not keep the agents returned after being cleared."""
+    pool = AgentPool(lambda: get_general_assistant(StubModel()))
+    with pool.checkout() as stale:
+        pool.clear()
+    assert len(pool) == 0
+
+    with pool.checkout() as agent:
+        assert agent is not stale
+    with pool.checkout() as again:
+        assert again is agent
+
+    assert pool.created == 2
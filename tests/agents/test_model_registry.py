@@ -0,0 +1,76 @@
+"""Test cases for the model registry of the app_config module."""
+
+from collections.abc import Iterator
+
+import pytest
+from strands import Agent
+
+from my_python_ai_kata.agents.app_config import ModelConfig
+from my_python_ai_kata.agents.app_config import ModelRegistry
+from my_python_ai_kata.agents.app_config import ModelType
+from my_python_ai_kata.benchmarks.concurrent_queries import free_port
+from my_python_ai_kata.benchmarks.model_registry import fake_openai_app
+from my_python_ai_kata.benchmarks.model_registry import serve_in_thread
+
+
+@pytest.fixture(scope="module")
+def connections() -> Iterator[tuple[set, str]]:
+    """Serve a fake chat completions API, and collect its client connections."""
+    seen: set = set()
+    port = free_port()
+    server = serve_in_thread(
+        fake_openai_app("Hello there", chunks=3, connections=seen), port
+    )
+    yield seen, f"http://127.0.0.1:{port}/v1"
+    server.should_exit = True
+
+
+def model_config(base_url: str, temperature: float = 0.0) -> ModelConfig:
+    """Return the configuration of a model of the fake API."""
+    return ModelConfig(
+        model_type=ModelType.OPENAI,
+        api_key="fake",
+        base_url=base_url,
+        model_id="fake",
+        max_tokens=100,
+        temperature=temperature,
+    )
+
+
+def test_registry_shares_models_and_their_connections(
+    connections: tuple[set, str],
+) -> None:
+    """It returns one model per configuration, whose calls reuse one connection."""
+    seen, base_url = connections
+    registry = ModelRegistry()
+    try:
+        model = registry.get(model_config(base_url))
+        assert registry.get(model_config(base_url)) is model
+        assert registry.get(model_config(base_url, temperature=0.5)) is not model
+
+        # Every synchronous agent call runs on an event loop of its own
+        answers = [
+            str(Agent(model=model, callback_handler=None)("Hi")).strip()
+            for _ in range(3)
+        ]
+    finally:
+        registry.shutdown()
+
+    assert answers == ["Hello there"] * 3
+    assert len(seen) == 1
+
+
+def test_registry_replaces_models_on_refresh(connections: tuple[set, str]) -> None:
+    """It runs the refresh hooks and creates new models after a refresh."""
+    _, base_url = connections
+    registry = ModelRegistry()
+    refreshed: list[bool] = []
+    registry.on_refresh(lambda: refreshed.append(True))
+    model = registry.get(model_config(base_url))
+
+    registry.refresh()
+
+    assert refreshed == [True]
+    assert registry.get(model_config(base_url)) is not model
+    registry.shutdown()
+    assert len(registry) == 0
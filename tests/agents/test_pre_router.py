@@ -0,0 +1,56 @@
+"""Test cases for the pre_router module."""
+
+from pathlib import Path
+
+import pytest
+
+from my_python_ai_kata.agents.pre_router import KeywordRouter
+from my_python_ai_kata.agents.pre_router import RouteLog
+from my_python_ai_kata.agents.pre_router import build_pre_router
+from my_python_ai_kata.agents.routing_examples import HELD_OUT_ROUTING_EXAMPLES
+
+
+def test_keyword_router_only_routes_unambiguous_queries() -> None:
+    """It routes queries whose keywords agree, and leaves the others to the LLM."""
+    router = KeywordRouter()
+
+    assert router.route("Solve the equation 2x + 1 = 5").specialist == "math"
+    assert router.route("Translate 'hello' into French").specialist == "language"
+    assert router.route("Who painted the Mona Lisa?").specialist is None
+    # Keywords of two subjects at once
+    mixed = router.route("Write a Python function to solve a quadratic equation")
+    assert not mixed.confident
+    assert 0 < mixed.confidence < 1
+    assert not router.route("Solve x^2 = 4 and explain it in French").confident
+    # A single keyword, in passing
+    incidental = router.route("What is the mean temperature on Mars?")
+    assert (incidental.specialist, incidental.confidence) == (None, 1.0)
+
+
+def test_keyword_router_is_accurate_on_held_out_queries() -> None:
+    """It sends none of the queries it was not written against to a wrong specialist."""
+    router = KeywordRouter()
+    decisions = [
+        (router.route(query).specialist, label)
+        for query, label in HELD_OUT_ROUTING_EXAMPLES
+    ]
+
+    assert all(specialist in (None, label) for specialist, label in decisions)
+    assert any(specialist is not None for specialist, _ in decisions)
+
+
+def test_pre_router_learns_from_logged_routes(tmp_path: Path) -> None:
+    """It trains its classifier on the routes of the teacher agent too."""
+    log = RouteLog(tmp_path / "logs" / "routes.jsonl")
+    for _ in range(5):
+        log.append("Tell me about the Roman empire", "general")
+    assert log.load()[0] == ("Tell me about the Roman empire", "general")
+
+    pre_router = build_pre_router("both", log)
+
+    assert pre_router is not None
+    decision = pre_router.route("Tell me about the Roman empire")
+    assert (decision.specialist, decision.router) == ("general", "classifier")
+    assert build_pre_router("off", log) is None
+    with pytest.raises(ValueError):
+        build_pre_router("telepathy")
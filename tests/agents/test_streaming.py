@@ -0,0 +1,75 @@
+"""Test cases for the streaming module."""
+
+from collections.abc import Iterator
+
+import pytest
+from strands import Agent
+
+from my_python_ai_kata.agents.staff import math_assistant as math_module
+from my_python_ai_kata.agents.staff.math_assistant import get_math_assistant
+from my_python_ai_kata.agents.staff.math_assistant import math_assistant
+from my_python_ai_kata.agents.streaming import TokenStream
+from my_python_ai_kata.benchmarks.agent_pool import StubModel
+from my_python_ai_kata.benchmarks.streaming import RoutingStubModel
+
+
+def test_token_stream_writes_deltas_with_a_header_per_source() -> None:
+    """It writes the text deltas as they come, and counts them."""
+    written: list[str] = []
+    stream = TokenStream(write=written.append)
+
+    stream(init_event_loop=True)
+    assert stream.finish().time_to_first_token is None
+    stream(data="Let me ask. ")
+    stream(data="4", source="Math Assistant")
+    stream(data="2", source="Math Assistant")
+    stream(data="Done.")
+
+    timing = stream.finish()
+    assert "".join(written) == "Let me ask. \n\n[Math Assistant]\n42\n\nDone."
+    assert timing.chunks == 4
+    assert 0 <= timing.time_to_first_token <= timing.total
+
+    stream.start()
+    assert stream.finish().chunks == 0
+
+
+@pytest.fixture
+def stub_math_assistant(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Make the math assistant tool answer with a slowly streaming stub model."""
+    model = StubModel(
+        "Six times seven is 42.", latency=0.05, chunks=5, chunk_latency=0.05
+    )
+    monkeypatch.setattr(
+        math_module.math_assistant_pool, "factory", lambda: get_math_assistant(model)
+    )
+    math_module.math_assistant_pool.clear()
+    yield
+    math_module.math_assistant_pool.clear()
+
+
+@pytest.mark.usefixtures("stub_math_assistant")
+def test_specialist_tokens_stream_through_the_teacher_agent() -> None:
+    """The tokens of the specialist reach the stream of the teacher agent before its answer."""
+    written: list[str] = []
+    stream = TokenStream(write=written.append)
+    teacher = Agent(
+        model=RoutingStubModel(math_assistant.tool_name, reply="Anything else?"),
+        tools=[math_assistant],
+        callback_handler=stream,
+    )
+
+    result = teacher("What is 6 times 7?")
+
+    timing = stream.finish()
+    assert "".join(written) == (
+        "\n\n[Math Assistant]\nSix times seven is 42.\n\nAnything else?"
+    )
+    assert str(result).strip() == "Anything else?"
+    # The four chunks after the first one take 0.2s, whatever pauses came before it
+    assert timing.total - timing.time_to_first_token >= 0.2
+
+    # Called directly, the specialist only returns its answer
+    written.clear()
+    assert math_assistant("What is 6 times 7?").strip() == "Six times seven is 42."
+    assert written == []
@@ -0,0 +1,151 @@
+"""Test cases for the teachers_assistant module."""
+
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+
+import pytest
+from strands import Agent
+
+from my_python_ai_kata.agents.pre_router import KeywordRouter
+from my_python_ai_kata.agents.pre_router import PreRouter
+from my_python_ai_kata.agents.staff import math_assistant as math_module
+from my_python_ai_kata.agents.staff.math_assistant import get_math_assistant
+from my_python_ai_kata.agents.staff.math_assistant import math_assistant
+from my_python_ai_kata.agents.teachers_assistant import FanOutPlan
+from my_python_ai_kata.agents.teachers_assistant import FanOutTeacher
+from my_python_ai_kata.agents.teachers_assistant import SpecialistTask
+from my_python_ai_kata.agents.teachers_assistant import answer_query
+from my_python_ai_kata.benchmarks.agent_pool import StubModel
+from my_python_ai_kata.benchmarks.streaming import RoutingStubModel
+
+
+def slow(answer: str, seconds: float) -> Callable[[str], str]:
+    """Return a specialist answering after a delay."""
+
+    def specialist(query: str) -> str:
+        time.sleep(seconds)
+        return f"{answer}: {query}"
+
+    return specialist
+
+
+def plan(*tasks: tuple[str, str]) -> Callable[[str], FanOutPlan]:
+    """Return a planner that always plans the same tasks."""
+    return lambda query: FanOutPlan(
+        tasks=[SpecialistTask(specialist=name, query=q) for name, q in tasks]
+    )
+
+
+def test_fan_out_asks_specialists_at_the_same_time() -> None:
+    """It waits for the slowest specialist only, and merges the answers in order."""
+    teacher = FanOutTeacher(
+        {"math": slow("42", 0.3), "english": slow("Hamlet", 0.3)},
+        planner=plan(("math", "6 x 7?"), ("english", "A play?")),
+    )
+
+    response = teacher("What is 6 x 7, and a famous play?")
+    teacher.close()
+
+    assert response.seconds < 0.5
+    assert response.message == (
+        "## Math Assistant\n\n42: 6 x 7?\n\n## English Assistant\n\nHamlet: A play?"
+    )
+
+
+def test_fan_out_reports_late_specialists_and_falls_back_on_general() -> None:
+    """It gives up on specialists past their timeout, and asks the general one if unsure."""
+    teacher = FanOutTeacher(
+        {
+            "math": slow("42", 1.0),
+            "english": slow("Hamlet", 0.0),
+            "general": slow("Hi", 0),
+        },
+        planner=plan(("math", "6 x 7?"), ("english", "A play?")),
+        timeout=5,
+        timeouts={"math": 0.1},
+    )
+    response = teacher("What is 6 x 7, and a famous play?")
+    assert [answer.timed_out for answer in response.answers] == [True, False]
+    assert response.seconds < 0.5
+    assert "did not answer in time" in response.message
+
+    teacher.planner = plan(("history", "When?"))
+    assert teacher("When?").message == "Hi: When?"
+    teacher.close()
+
+
+@pytest.fixture
+def stub_math_assistant(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Make the math assistant tool answer with a stub model."""
+    model = StubModel("x is 2.")
+    monkeypatch.setattr(
+        math_module.math_assistant_pool, "factory", lambda: get_math_assistant(model)
+    )
+    math_module.math_assistant_pool.clear()
+    yield
+    math_module.math_assistant_pool.clear()
+
+
+@pytest.mark.usefixtures("stub_math_assistant")
+def test_pre_routed_queries_join_the_conversation_of_the_teacher() -> None:
+    """The teacher agent knows the pre-routed queries and their answers."""
+    teacher = Agent(
+        model=RoutingStubModel(math_assistant.tool_name, reply="Anything else?"),
+        tools=[math_assistant],
+        callback_handler=None,
+    )
+    pre_router = PreRouter([KeywordRouter()])
+
+    answer = answer_query(teacher, "Solve the equation 2x + 1 = 5", pre_router)
+
+    assert answer.strip() == "x is 2."
+    assert [message["role"] for message in teacher.messages] == ["user", "assistant"]
+    assert teacher.messages[0]["content"] == [{"text": "Solve the equation 2x + 1 = 5"}]
+    response = answer_query(teacher, "And why?", pre_router)
+    assert str(response).strip() == "Anything else?"
+    assert teacher.messages[2]["content"] == [{"text": "And why?"}]
+
+
+def test_fan_out_times_specialists_from_their_start() -> None:
+    """It waits for a queued specialist from the moment it starts running."""
+    teacher = FanOutTeacher(
+        {"math": slow("42", 0.2), "english": slow("Hamlet", 0.2)},
+        planner=plan(("math", "6 x 7?"), ("english", "A play?")),
+        timeout=0.3,
+        max_workers=1,
+    )
+
+    response = teacher("What is 6 x 7, and a famous play?")
+
+    assert not any(answer.timed_out for answer in response.answers)
+    assert response.seconds >= 0.4
+
+
+def test_fan_out_specialists_that_timed_out_do_not_hold_later_queries() -> None:
+    """It answers the next queries while a specialist that timed out still runs."""
+    teacher = FanOutTeacher(
+        {"math": slow("42", 1.0), "english": slow("Hamlet", 0.0)},
+        planner=plan(("math", "6 x 7?")),
+        timeouts={"math": 0.1},
+        max_workers=1,
+    )
+    assert teacher("6 x 7?").answers[0].timed_out
+
+    teacher.planner = plan(("english", "A play?"))
+    response = teacher("A play?")
+
+    assert response.message == "Hamlet: A play?"
+    assert response.seconds < 0.5
+
+
+def test_fan_out_asks_a_specialist_all_its_questions() -> None:
+    """It merges the questions planned for the same specialist."""
+    teacher = FanOutTeacher(
+        {"math": slow("42", 0.0)},
+        planner=plan(("math", "6 x 7?"), ("math", "7 x 6?")),
+    )
+
+    assert teacher.plan("Products").tasks == [
+        SpecialistTask(specialist="math", query="6 x 7?\n\n7 x 6?")
+    ]
@@ -0,0 +1,135 @@
+"""Test cases for the async_crawler module."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from functools import partial
+from http.server import SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from my_python_ai_kata.mcp.async_crawler import AsyncCrawler
+
+
+PAGES = {
+    "docs/index.html": '<title>Home</title><a href="a.html">A</a> <a href="b.html#x">B</a>'
+    ' <a href="../outside.html">out</a>',
+    "docs/a.html": '<title>A</title><a href="c.html">C</a>',
+    "docs/b.html": '<title>B</title><a href="a.html">A</a>',
+    "docs/c.html": "<title>C</title>leaf",
+    "outside.html": "<title>Outside</title>",
+}
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log requests."""
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence the request log."""
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Iterator[str]:
+    """Fixture serving a small static documentation site on localhost."""
+    root = tmp_path / "site"
+    for name, content in PAGES.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(content)
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(QuietHandler, directory=str(root))
+    )
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/docs/"
+    server.shutdown()
+    server.server_close()
+
+
+def sources(crawler: AsyncCrawler, urls: list[str]) -> list[str]:
+    """Crawl the URLs and return the sorted page paths."""
+    return sorted(
+        doc.metadata["source"].rsplit("/", 1)[-1] or "index.html"
+        for doc in crawler.load(urls)
+    )
+
+
+@pytest.mark.parametrize(
+    ("max_depth", "expected"),
+    [
+        (1, ["index.html"]),
+        (2, ["a.html", "b.html", "index.html"]),
+        (3, ["a.html", "b.html", "c.html", "index.html"]),
+    ],
+)
+def test_crawl_respects_max_depth(
+    site: str, max_depth: int, expected: list[str]
+) -> None:
+    """It follows links under the seed URL up to max_depth."""
+    crawler = AsyncCrawler(max_depth=max_depth)
+    assert sources(crawler, [site]) == expected
+
+
+def test_crawl_dedupes_urls_across_seeds(site: str) -> None:
+    """It fetches every page once, even when reachable from several seeds."""
+    crawler = AsyncCrawler(max_depth=3)
+    found = sources(crawler, [site, f"{site}b.html"])
+    assert found == ["a.html", "b.html", "c.html", "index.html"]
+    assert crawler.stats.fetched == 4
+
+
+def test_crawl_extracts_content_and_metadata(site: str) -> None:
+    """It applies the extractor and records the source and title."""
+    crawler = AsyncCrawler(extractor=str.upper, max_depth=1)
+    (doc,) = crawler.load([f"{site}c.html"])
+    assert doc.page_content == "<TITLE>C</TITLE>LEAF"
+    assert doc.metadata["source"] == f"{site}c.html"
+    assert doc.metadata["title"] == "C"
+
+
+def test_recrawl_uses_conditional_fetches(site: str, tmp_path: Path) -> None:
+    """It revalidates cached pages instead of downloading them again."""
+    cache_dir = str(tmp_path / "cache")
+    AsyncCrawler(max_depth=3, cache_dir=cache_dir).load([site])
+
+    crawler = AsyncCrawler(max_depth=3, cache_dir=cache_dir)
+    docs = crawler.load([site])
+
+    assert len(docs) == 4
+    assert (crawler.stats.fetched, crawler.stats.not_modified) == (0, 4)
+
+
+def test_crawl_skips_missing_pages(site: str) -> None:
+    """It keeps crawling when a page cannot be fetched."""
+    crawler = AsyncCrawler(max_depth=1)
+    assert sources(crawler, [f"{site}missing.html", f"{site}c.html"]) == ["c.html"]
+    assert crawler.stats.failed == 1
+
+
+def test_crawl_only_fetches_a_few_pages_ahead_of_the_consumer(site: str) -> None:
+    """It waits for the consumer to take the pages before fetching more."""
+    crawler = AsyncCrawler(max_depth=3, max_buffered=2)
+    fetch = crawler._fetch
+    fetched: list[str] = []
+
+    async def counting_fetch(client: Any, url: str) -> Any:
+        fetched.append(url)
+        return await fetch(client, url)
+
+    crawler._fetch = counting_fetch  # type: ignore[method-assign]
+
+    async def consume() -> list[int]:
+        ahead = []
+        async for _ in crawler.crawl([site, f"{site}b.html", f"{site}c.html"]):
+            # Let the crawler fetch all it can while the consumer is busy
+            await asyncio.sleep(0.1)
+            ahead.append(len(fetched))
+        return ahead
+
+    ahead = asyncio.run(consume())
+    assert len(ahead) == 4
+    assert all(count <= taken + 2 for taken, count in enumerate(ahead))
@@ -0,0 +1,31 @@
+"""Test cases for the backpressure module."""
+
+import asyncio
+
+from my_python_ai_kata.mcp.backpressure import ConcurrencyLimiter
+from my_python_ai_kata.mcp.backpressure import ServerBusyError
+
+
+def test_limiter_caps_running_and_waiting_requests() -> None:
+    """It runs max_concurrency requests at once and rejects past max_pending."""
+    limiter = ConcurrencyLimiter(max_concurrency=2, max_pending=3)
+    peak = 0
+
+    async def request() -> None:
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.stats.active)
+            await asyncio.sleep(0.01)
+
+    async def burst() -> list[BaseException | None]:
+        return await asyncio.gather(
+            *(request() for _ in range(8)), return_exceptions=True
+        )
+
+    results = asyncio.run(burst())
+
+    assert peak == 2
+    assert sum(isinstance(r, ServerBusyError) for r in results) == 3
+    assert limiter.stats.completed == 5
+    assert limiter.stats.rejected == 3
+    assert (limiter.stats.active, limiter.stats.waiting) == (0, 0)
@@ -0,0 +1,120 @@
+"""Test cases for the client_pool module."""
+
+import asyncio
+import socket
+import threading
+import time
+from collections.abc import Iterator
+
+import anyio
+import pytest
+import uvicorn
+from mcp.shared.exceptions import McpError
+
+from my_python_ai_kata.mcp.client_pool import McpClientPool
+from my_python_ai_kata.mcp.my_hello_server import mcp
+
+
+@pytest.fixture(scope="module")
+def url() -> Iterator[str]:
+    """Serve the hello server over streamable HTTP on a background thread."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(mcp.http_app(), port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    yield f"http://127.0.0.1:{port}/mcp"
+    server.should_exit = True
+    thread.join()
+
+
+def test_pool_runs_independent_calls_on_one_warm_session(url: str) -> None:
+    """It sends gathered calls over a single session and times each of them."""
+
+    async def scenario() -> tuple[list, int]:
+        async with McpClientPool() as pool:
+            results = await asyncio.gather(
+                pool.call_tool(url, "greet", {"name": "Ada"}),
+                pool.call_tool(url, "add", {"a": 1, "b": 2}),
+                pool.read_resource(url, "data://config"),
+            )
+            with pytest.raises(McpError):
+                await pool.read_resource(url, "data://missing")
+            return results, len(pool._sessions[url]), list(pool.timings)
+
+    (greeting, total, config), sessions, timings = asyncio.run(scenario())
+
+    assert greeting.content[0].text == "Hello, Ada!"
+    assert total.content[0].text == "3"
+    assert '"theme":"dark"' in config[0].text
+    assert sessions == 1
+    assert sorted((t.name, t.attempts, t.ok) for t in timings) == [
+        ("add", 1, True),
+        ("data://config", 1, True),
+        ("data://missing", 1, False),
+        ("greet", 1, True),
+    ]
+
+
+def test_pool_reconnects_broken_sessions(url: str) -> None:
+    """It retries a call that failed on its connection over a new session."""
+
+    async def scenario() -> tuple[str, int]:
+        async with McpClientPool() as pool:
+            await pool.call_tool(url, "greet", {"name": "Ada"})
+            session = pool._sessions[url][0]
+            broken = session.client
+
+            async def fail(*args: object, **kwargs: object) -> None:
+                raise anyio.ClosedResourceError
+
+            broken.call_tool_mcp = fail  # type: ignore[method-assign]
+            result = await pool.call_tool(url, "greet", {"name": "Bob"})
+            assert session.client is not broken
+            return result.content[0].text, pool.timings[-1].attempts
+
+    assert asyncio.run(scenario()) == ("Hello, Bob!", 2)
+
+
+def test_pool_caches_resources_until_notified(url: str) -> None:
+    """It reuses resource contents until the server notifies their change."""
+
+    async def read(pool: McpClientPool, uri: str) -> tuple[str, bool]:
+        contents = await pool.read_resource(url, uri)
+        return contents[0].text, pool.timings[-1].cached
+
+    async def scenario() -> list[tuple[str, bool]]:
+        async with McpClientPool(cache_resources=True) as reader, McpClientPool(
+            cache_resources=True
+        ) as writer:
+            reads = [
+                await read(reader, "users://103/profile"),
+                await read(reader, "users://103/profile"),
+                await read(reader, "data://config"),
+            ]
+            await writer.call_tool(
+                url,
+                "update_user_profile",
+                {"user_id": 103, "name": "Carol", "status": "active"},
+            )
+            # The notification reaches the other session asynchronously
+            for _ in range(50):
+                if not reader.resources[url].contents.get("users://103/profile"):
+                    break
+                await asyncio.sleep(0.01)
+            return reads + [
+                await read(reader, "users://103/profile"),
+                await read(reader, "data://config"),
+            ]
+
+    missing = '{"error":"User not found"}'
+    carol = '{"name":"Carol","status":"active"}'
+    reads = asyncio.run(scenario())
+    assert [cached for _, cached in reads] == [False, True, False, False, True]
+    assert [text for text, _ in reads][:2] == [missing, missing]
+    assert reads[3][0] == carol
@@ -0,0 +1,57 @@
+"""Test cases for the document_processing module."""
+
+import pytest
+from langchain_core.documents import Document
+
+from my_python_ai_kata.mcp.document_processing import DocumentProcessor
+from my_python_ai_kata.mcp.document_processing import extract_text
+from my_python_ai_kata.mcp.embedding_cache import text_hash
+
+
+def make_page(i: int) -> Document:
+    """Create a crawled page with an article and some navigation chrome."""
+    article = "\n\n\n".join(f"Paragraph {j} of page {i}." for j in range(20))
+    return Document(
+        page_content=f'<nav>menu</nav><article class="md-content__inner">{article}'
+        "</article>",
+        metadata={"source": f"url-{i}"},
+    )
+
+
+def test_extract_text_keeps_the_article() -> None:
+    """It keeps the main article and collapses blank lines."""
+    assert extract_text(make_page(0).page_content).startswith(
+        "Paragraph 0 of page 0.\n\nParagraph 1"
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_map_splits_pages_in_order(max_workers: int) -> None:
+    """It extracts and splits every page, in input order, serially or not."""
+    processor = DocumentProcessor(
+        chunk_size=100, chunk_overlap=0, length_function=len, max_workers=max_workers
+    )
+    pages = [make_page(i) for i in range(6)]
+
+    processed = list(processor.map((page, None) for page in pages))
+
+    assert [p.document.metadata["source"] for p in processed] == [
+        f"url-{i}" for i in range(6)
+    ]
+    for p in processed:
+        assert len(p.chunks) > 1
+        assert p.token_counts == [len(c.page_content) for c in p.chunks]
+        assert all(count <= 100 for count in p.token_counts)
+        assert p.content_hash == text_hash(p.document.page_content)
+
+
+def test_process_skips_splitting_unchanged_pages() -> None:
+    """It does not split a page whose content hash is already known."""
+    processor = DocumentProcessor(length_function=len, max_workers=1)
+    page = make_page(0)
+    known_hash = text_hash(extract_text(page.page_content))
+
+    processed = processor.process(page, known_hash)
+
+    assert processed.content_hash == known_hash
+    assert processed.chunks == []
@@ -0,0 +1,63 @@
+"""Test cases for the embedding_cache module."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from my_python_ai_kata.mcp.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> EmbeddingCache:
+    """Fixture for an empty embedding cache in a temporary directory."""
+    return EmbeddingCache(
+        str(tmp_path / "cache.sqlite"), max_entries=None, max_age=None
+    )
+
+
+def test_get_many_counts_hits_and_misses(cache: EmbeddingCache) -> None:
+    """It returns cached vectors and None for missing texts."""
+    cache.put_many("model-a", ["one", "two"], [[1.0, 2.0], [3.0, 4.0]])
+
+    assert cache.get_many("model-a", ["two", "three", "one"]) == [
+        [3.0, 4.0],
+        None,
+        [1.0, 2.0],
+    ]
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+def test_entries_are_namespaced_by_model(cache: EmbeddingCache) -> None:
+    """It does not reuse vectors computed by a different model."""
+    cache.put_many("model-a", ["one"], [[1.0]])
+    assert cache.get_many("model-b", ["one"]) == [None]
+
+
+def test_cache_persists_across_instances(tmp_path: Path) -> None:
+    """It keeps vectors on disk between runs."""
+    path = str(tmp_path / "cache.sqlite")
+    EmbeddingCache(path).put_many("model-a", ["one"], [[0.5]])
+    assert EmbeddingCache(path).get_many("model-a", ["one"]) == [[0.5]]
+
+
+def test_evict_keeps_most_recently_used_entries(cache: EmbeddingCache) -> None:
+    """It evicts the least recently used entries above max_entries."""
+    cache.max_entries = 2
+    for text in ["a", "b", "c"]:
+        cache.put_many("model-a", [text], [[0.0]])
+        time.sleep(0.01)
+    cache.get_many("model-a", ["a"])
+
+    assert cache.evict() == 1
+    assert cache.get_many("model-a", ["a", "b", "c"]) == [[0.0], None, [0.0]]
+
+
+def test_evict_drops_expired_entries(cache: EmbeddingCache) -> None:
+    """It evicts entries older than max_age."""
+    cache.put_many("model-a", ["a"], [[0.0]])
+    cache.max_age = 0.0
+    time.sleep(0.01)
+
+    assert cache.evict() == 1
+    assert len(cache) == 0
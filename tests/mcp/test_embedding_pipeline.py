@@ -0,0 +1,78 @@
+"""Test cases for the embedding_pipeline module."""
+
+import pytest
+
+from my_python_ai_kata.mcp.embedding_pipeline import EmbeddingPipeline
+from my_python_ai_kata.mcp.embedding_pipeline import pack_batches
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+
+
+@pytest.mark.parametrize(
+    ("token_counts", "max_tokens", "max_items", "expected"),
+    [
+        ([10, 10, 10], 100, 10, [[0, 1, 2]]),
+        ([60, 50, 40], 100, 10, [[0], [1, 2]]),
+        ([10, 10, 10], 100, 2, [[0, 1], [2]]),
+        ([500, 10], 100, 10, [[0], [1]]),
+        ([], 100, 10, []),
+    ],
+)
+def test_pack_batches_respects_budgets(
+    token_counts: list[int], max_tokens: int, max_items: int, expected: list[list[int]]
+) -> None:
+    """It packs texts greedily under the token and item budgets."""
+    texts = [f"text {i}" for i in range(len(token_counts))]
+    batches = list(pack_batches(texts, token_counts, max_tokens, max_items))
+    assert [batch.indices for batch in batches] == expected
+    assert [batch.texts for batch in batches] == [
+        [texts[i] for i in indices] for indices in expected
+    ]
+
+
+def test_embed_batches_returns_a_vector_per_text() -> None:
+    """It embeds every batch exactly once and keeps texts aligned to vectors."""
+    embeddings = FakeEmbeddings(size=8)
+    texts = [f"chunk {i}" for i in range(25)]
+    pipeline = EmbeddingPipeline(embeddings, max_concurrency=3)
+
+    vectors: dict[int, list[float]] = {}
+    for batch, batch_vectors in pipeline.embed_batches(
+        pack_batches(texts, [1] * len(texts), max_tokens=4)
+    ):
+        vectors.update(zip(batch.indices, batch_vectors, strict=True))
+
+    assert sorted(vectors) == list(range(len(texts)))
+    assert embeddings.requests == 7
+    assert vectors[7] == embeddings.embed_query(texts[7])
+
+
+class FlakyEmbeddings(FakeEmbeddings):
+    """Fake embeddings that fail the first requests."""
+
+    failures: int = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Fail while there are failures left, then embed normally."""
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("rate limited")
+        return super().embed_documents(texts)
+
+
+def test_embed_batches_retries_failures() -> None:
+    """It retries a failing batch with backoff until it succeeds."""
+    pipeline = EmbeddingPipeline(
+        FlakyEmbeddings(size=4, failures=2), max_retries=3, backoff_base=0.0
+    )
+    results = list(pipeline.embed_batches(pack_batches(["a", "b"], [1, 1])))
+    assert len(results) == 1
+    assert len(results[0][1]) == 2
+
+
+def test_embed_batches_gives_up_after_max_retries() -> None:
+    """It raises the last error once the retries are exhausted."""
+    pipeline = EmbeddingPipeline(
+        FlakyEmbeddings(size=4, failures=5), max_retries=2, backoff_base=0.0
+    )
+    with pytest.raises(RuntimeError, match="rate limited"):
+        list(pipeline.embed_batches(pack_batches(["a"], [1])))
@@ -0,0 +1,83 @@
+"""Test cases for the ingestion_pipeline module."""
+
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from langchain_community.vectorstores import SKLearnVectorStore
+
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+from my_python_ai_kata.mcp.ingestion_pipeline import ParquetStoreWriter
+from my_python_ai_kata.mcp.ingestion_pipeline import iterate_async
+from my_python_ai_kata.mcp.ingestion_pipeline import prefetch
+from my_python_ai_kata.mcp.ingestion_pipeline import read_store_rows
+
+
+def failing(n: int) -> Iterator[int]:
+    """Yield n integers, then fail."""
+    yield from range(n)
+    raise ValueError("boom")
+
+
+def test_prefetch_preserves_order_and_errors() -> None:
+    """It yields the upstream items in order and re-raises upstream errors."""
+    assert list(prefetch(range(100), maxsize=2)) == list(range(100))
+    with pytest.raises(ValueError, match="boom"):
+        list(prefetch(failing(5), maxsize=2))
+
+
+def test_iterate_async_drains_an_async_generator() -> None:
+    """It turns an async generator into a plain iterator."""
+
+    async def numbers() -> AsyncIterator[int]:
+        for i in range(50):
+            yield i
+
+    assert list(iterate_async(numbers(), maxsize=3)) == list(range(50))
+
+
+def test_parquet_store_writer_is_readable_by_sklearn_store(tmp_path: Path) -> None:
+    """It writes row groups that SKLearnVectorStore loads back."""
+    path = str(tmp_path / "store.parquet")
+    embeddings = FakeEmbeddings(size=4)
+    with ParquetStoreWriter(path, row_group_size=2) as writer:
+        for i in range(5):
+            text = f"text {i}"
+            metadata = {"source": f"url-{i}", "title": f"Page {i}"}
+            if i == 3:
+                metadata["language"] = "en"
+            writer.write(f"id-{i}", text, metadata, embeddings.embed_query(text))
+
+    assert [row["ids"] for row in read_store_rows(path)] == [
+        f"id-{i}" for i in range(5)
+    ]
+    store = SKLearnVectorStore(
+        embedding=embeddings, persist_path=path, serializer="parquet"
+    )
+    (doc,) = store.similarity_search("text 3", k=1)
+    assert doc.page_content == "text 3"
+    assert doc.metadata["source"] == "url-3"
+    assert doc.metadata["title"] == "Page 3"
+    assert doc.metadata["language"] == "en"
+    assert [row["metadatas"]["language"] for row in read_store_rows(path)] == [
+        None,
+        None,
+        None,
+        "en",
+        None,
+    ]
+    assert not Path(f"{path}.staging.tmp").exists()
+
+
+def test_parquet_store_writer_aborts_on_error(tmp_path: Path) -> None:
+    """It leaves the existing store untouched when writing fails."""
+    path = tmp_path / "store.parquet"
+    path.write_bytes(b"previous")
+    with pytest.raises(RuntimeError), ParquetStoreWriter(str(path)) as writer:
+        writer.write("id", "text", {}, [0.0])
+        raise RuntimeError
+
+    assert path.read_bytes() == b"previous"
+    assert not Path(f"{path}.tmp").exists()
+    assert not Path(f"{path}.staging.tmp").exists()
@@ -0,0 +1,56 @@
+"""Test cases for the lexical_index module."""
+
+from pathlib import Path
+
+from my_python_ai_kata.mcp.lexical_index import BM25Index
+from my_python_ai_kata.mcp.lexical_index import lexical_terms
+from my_python_ai_kata.mcp.lexical_index import reciprocal_rank_fusion
+
+
+TEXTS = [
+    "Build a graph with StateGraph and compile it.",
+    "Use graph.add_conditional_edges to route between nodes.",
+    "Edges connect the nodes of the graph; add_edge adds a normal edge.",
+    "Checkpointers persist the state of a thread.",
+]
+
+
+def test_lexical_terms_split_identifiers() -> None:
+    """It keeps dotted names whole and adds their parts and sub-words."""
+    assert lexical_terms("StateGraph.add_conditional_edges") == [
+        "stategraph.add_conditional_edges",
+        "stategraph",
+        "state",
+        "graph",
+        "add_conditional_edges",
+        "add",
+        "conditional",
+        "edges",
+    ]
+
+
+def test_bm25_index_ranks_exact_api_names_first(tmp_path: Path) -> None:
+    """It ranks the chunk naming the API first, before and after persisting."""
+    index = BM25Index()
+    index.build(TEXTS)
+    path = str(tmp_path / "store.bm25.index")
+    index.fingerprint = "abc"
+    index.save(path)
+    loaded = BM25Index()
+    loaded.load(path)
+
+    for searched in (index, loaded):
+        indices, scores = searched.search(
+            ["StateGraph.add_conditional_edges", "unknown words"], k=2
+        )
+
+        assert indices[0, 0] == 1
+        assert scores[0, 0] > scores[0, 1] > 0
+        assert indices[1].tolist() == [-1, -1]
+    assert loaded.fingerprint == "abc"
+    assert loaded.count == len(TEXTS)
+
+
+def test_reciprocal_rank_fusion_favours_items_ranked_by_both() -> None:
+    """It promotes the items that several rankings agree on."""
+    assert reciprocal_rank_fusion([[1, 2, 3], [3, 4, 2]], k=3) == [3, 2, 1]
@@ -0,0 +1,75 @@
+"""Test cases for the llms_full module."""
+
+import os
+from pathlib import Path
+
+import pytest
+import tiktoken
+from langchain_core.documents import Document
+
+from my_python_ai_kata.mcp import tokenizers
+from my_python_ai_kata.mcp.llms_full import LlmsFullReader
+from my_python_ai_kata.mcp.llms_full import LlmsFullWriter
+from my_python_ai_kata.mcp.llms_full import llms_full_index_path
+
+
+def write_llms_full(path: str, pages: dict[str, str]) -> None:
+    """Write an llms_full.txt file with one document per source."""
+    with LlmsFullWriter(path) as writer:
+        for source, content in pages.items():
+            writer.write(Document(page_content=content, metadata={"source": source}))
+
+
+@pytest.mark.parametrize("with_index", [True, False])
+def test_reader_serves_single_documents(tmp_path: Path, with_index: bool) -> None:
+    """It reads documents by number and source, rebuilding a missing index."""
+    path = str(tmp_path / "llms_full.txt")
+    write_llms_full(path, {"https://a.dev/": "Ünïcode page", "https://b.dev": "B"})
+    if not with_index:
+        os.remove(llms_full_index_path(path))
+
+    reader = LlmsFullReader(path)
+
+    assert len(reader) == 2
+    assert reader.document(1) == (
+        "DOCUMENT 1\nSOURCE: https://a.dev/\nCONTENT:\nÜnïcode page"
+    )
+    assert reader.document(2, content_only=True) == "B"
+    assert reader.find("https://a.dev") == 1
+    assert reader.find("https://c.dev") is None
+    assert reader.read_bytes(0, 10) == "DOCUMENT 1"
+    assert reader.text().startswith(reader.document(1))
+    with pytest.raises(IndexError):
+        reader.document(3)
+
+    write_llms_full(path, {"https://c.dev": "C"})
+    os.utime(path, ns=(0, 0))
+
+    assert reader.document(1, content_only=True) == "C"
+
+
+def test_reader_serves_token_ranges(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It decodes the tokens of a range spanning several documents."""
+
+    def get_encoding(name: str) -> tiktoken.Encoding:
+        return tiktoken.Encoding(
+            name=name,
+            pat_str=r"\S+|\s+",
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={},
+        )
+
+    monkeypatch.setattr(tokenizers, "_encoders", {})
+    monkeypatch.setattr(tiktoken, "get_encoding", get_encoding)
+    path = str(tmp_path / "llms_full.txt")
+    write_llms_full(path, {f"https://{i}.dev": f"page {i} " * 20 for i in range(5)})
+    reader = LlmsFullReader(path)
+
+    assert reader.token_offsets[-1] == reader.size
+    assert reader.read_tokens(150, 700) == reader.read_bytes(150, 700)
+    assert reader.read_tokens(reader.size - 5, reader.size + 5) == (
+        reader.read_bytes(reader.size - 5, reader.size)
+    )
+    assert reader.read_tokens(10, 10) == ""
@@ -0,0 +1,55 @@
+"""Test cases for the mmap_vector_store module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+from my_python_ai_kata.mcp.ingestion_pipeline import ParquetStoreWriter
+from my_python_ai_kata.mcp.mmap_vector_store import MmapVectorStore
+from my_python_ai_kata.mcp.mmap_vector_store import read_layout
+
+
+TEXTS = [f"chunk about topic {i}" for i in range(20)]
+
+
+@pytest.fixture
+def parquet_path(tmp_path: Path) -> str:
+    """Fixture writing a small parquet vector store."""
+    path = str(tmp_path / "store.parquet")
+    embeddings = FakeEmbeddings(size=8)
+    with ParquetStoreWriter(path) as writer:
+        for i, text in enumerate(TEXTS):
+            writer.write(
+                f"id-{i}", text, {"source": f"url-{i}"}, embeddings.embed_query(text)
+            )
+    return path
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_search_finds_the_stored_chunk(parquet_path: str, dtype: str) -> None:
+    """It maps the exported matrix and returns chunks with their metadata."""
+    store = MmapVectorStore(parquet_path, FakeEmbeddings(size=8), dtype=dtype)
+
+    (doc,) = store.similarity_search(TEXTS[7], k=1)
+
+    assert isinstance(store.vectors, np.memmap)
+    assert store.vectors.dtype == dtype
+    assert doc.page_content == TEXTS[7]
+    assert doc.metadata == {"id": "id-7", "source": "url-7"}
+
+
+def test_export_is_reused_until_the_parquet_file_changes(parquet_path: str) -> None:
+    """It only exports again when the parquet file is replaced."""
+    MmapVectorStore(parquet_path, FakeEmbeddings(size=8))
+    exported = read_layout(parquet_path)
+    MmapVectorStore(parquet_path, FakeEmbeddings(size=8))
+    assert read_layout(parquet_path) == exported
+
+    with ParquetStoreWriter(parquet_path) as writer:
+        writer.write("only", "only chunk", {}, [1.0] * 8)
+    store = MmapVectorStore(parquet_path, FakeEmbeddings(size=8))
+
+    assert len(store) == 1
+    assert read_layout(parquet_path) != exported
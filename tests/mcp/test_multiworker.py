@@ -0,0 +1,104 @@
+"""Test cases for the multiworker module."""
+
+import asyncio
+import itertools
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from my_python_ai_kata.mcp.multiworker import SESSION_HEADER
+from my_python_ai_kata.mcp.multiworker import SessionAffinityProxy
+
+
+def test_proxy_pins_sessions_to_their_worker() -> None:
+    """It spreads new sessions over the workers and keeps each on its own."""
+    proxy = SessionAffinityProxy(["http://worker-1", "http://worker-2"])
+    counter = itertools.count()
+
+    async def worker(request: Request) -> Response:
+        host = request.url.hostname or ""
+        headers = {}
+        if SESSION_HEADER not in request.headers:
+            headers[SESSION_HEADER] = f"{host}-{next(counter)}"
+        return Response(host, headers=headers)
+
+    workers = Starlette(
+        routes=[Route("/mcp", worker, methods=["GET", "POST", "DELETE"])]
+    )
+    proxy._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=workers))
+
+    async def scenario() -> list[tuple[int, str]]:
+        transport = httpx.ASGITransport(app=proxy.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://proxy"
+        ) as client:
+            first = await client.post("/mcp", content=b"{}")
+            second = await client.post("/mcp", content=b"{}")
+            responses = [first, second]
+            for session in (first, second, first):
+                session_id = session.headers[SESSION_HEADER]
+                responses.append(
+                    await client.post("/mcp", headers={SESSION_HEADER: session_id})
+                )
+            session_id = first.headers[SESSION_HEADER]
+            responses.append(
+                await client.delete("/mcp", headers={SESSION_HEADER: session_id})
+            )
+            responses.append(
+                await client.post("/mcp", headers={SESSION_HEADER: session_id})
+            )
+            return [(r.status_code, r.text) for r in responses]
+
+    assert asyncio.run(scenario()) == [
+        (200, "worker-1"),
+        (200, "worker-2"),
+        (200, "worker-1"),
+        (200, "worker-2"),
+        (200, "worker-1"),
+        (200, "worker-1"),
+        (404, "Unknown session 'worker-1-0'"),
+    ]
+    assert len(proxy.sessions) == 1
+    assert proxy.sessions.get("worker-2-1") == "http://worker-2"
+
+
+def test_proxy_forgets_sessions_lost_or_evicted() -> None:
+    """It drops the sessions its worker no longer knows, and the oldest ones."""
+    proxy = SessionAffinityProxy(["http://worker-1"], max_sessions=2)
+    known: set[str] = set()
+    counter = itertools.count()
+
+    async def worker(request: Request) -> Response:
+        session = request.headers.get(SESSION_HEADER)
+        if session is None:
+            session = f"session-{next(counter)}"
+            known.add(session)
+            return Response("created", headers={SESSION_HEADER: session})
+        if session not in known:
+            return Response("gone", status_code=404)
+        return Response("ok")
+
+    workers = Starlette(routes=[Route("/mcp", worker, methods=["POST"])])
+    proxy._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=workers))
+
+    async def scenario() -> list[int]:
+        transport = httpx.ASGITransport(app=proxy.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://proxy"
+        ) as client:
+            for _ in range(3):
+                await client.post("/mcp")
+            # The worker restarted and lost the sessions
+            known.clear()
+            statuses = []
+            for session in ("session-1", "session-2", "session-2"):
+                response = await client.post("/mcp", headers={SESSION_HEADER: session})
+                statuses.append(response.status_code)
+            return statuses
+
+    assert asyncio.run(scenario()) == [404, 404, 404]
+    assert len(proxy.sessions) == 0
+    assert proxy.sessions.stats.evicted == 1
@@ -0,0 +1,12 @@
+"""Test cases for the my_hello_server module."""
+
+import pytest
+
+from my_python_ai_kata.mcp.my_hello_server import parse_user_ids
+
+
+def test_parse_user_ids_names_the_invalid_id() -> None:
+    """It skips empty IDs and rejects the ones that are not integers."""
+    assert parse_user_ids("101, 102,,") == [101, 102]
+    with pytest.raises(ValueError, match="'abc'"):
+        parse_user_ids("101,abc")
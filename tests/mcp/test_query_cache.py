@@ -0,0 +1,64 @@
+"""Test cases for the query_cache module and the cached query helper."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+from my_python_ai_kata.mcp.query_cache import LRUCache
+from my_python_ai_kata.mcp.query_cache import normalize_query
+from my_python_ai_kata.mcp.vector_store_helpers import VectorStoreQueryHelper
+from tests.mcp.vector_stores import write_store
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """It keeps the most recently used entries within its size."""
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evicted) == (3, 1, 1)
+
+
+def test_lru_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It drops entries older than the TTL."""
+    now = [100.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    cache: LRUCache[str, int] = LRUCache(ttl=10)
+    cache.put("a", 1)
+    now[0] += 11
+
+    assert cache.get("a") is None
+    assert cache.stats.expired == 1
+
+
+def test_normalize_query() -> None:
+    """It ignores case and whitespace differences."""
+    assert normalize_query("  What is\n LangGraph? ") == "what is langgraph?"
+
+
+def test_repeated_queries_are_served_from_cache(tmp_path: Path) -> None:
+    """It embeds and searches once per distinct query and store version."""
+    path = str(tmp_path / "store.parquet")
+    write_store(path, ["alpha", "beta", "gamma"])
+    embeddings = FakeEmbeddings(size=8)
+    helper = VectorStoreQueryHelper(path, embeddings=embeddings)
+
+    first = helper.query("beta", k=1)
+    again = helper.query("  BETA ", k=1)
+
+    assert first == again
+    assert first[0].page_content == "beta"
+    assert embeddings.requests == 1
+    assert helper.cache_stats["results"].hits == 1
+
+    write_store(path, ["delta"])
+    os.utime(path, ns=(0, 0))
+    (doc,) = helper.query("beta", k=1)
+
+    assert doc.page_content == "delta"
+    assert embeddings.requests == 2
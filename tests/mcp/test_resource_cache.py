@@ -0,0 +1,34 @@
+"""Test cases for the resource_cache module."""
+
+from my_python_ai_kata.mcp.resource_cache import VersionedPayloadCache
+
+
+def test_payloads_are_serialized_once_per_version() -> None:
+    """It reuses a payload until its resource, or every resource, changes."""
+    cache = VersionedPayloadCache()
+    data = {"theme": "dark"}
+    builds: list[str] = []
+
+    def build(uri: str) -> dict:
+        builds.append(uri)
+        return data
+
+    assert cache.payload("data://config", lambda: build("config")) == '{"theme":"dark"}'
+    assert cache.payload("data://config", lambda: build("config")) == '{"theme":"dark"}'
+    cache.payload("users://1/profile", lambda: build("user"))
+    assert builds == ["config", "user"]
+    tag = cache.tag("data://config")
+
+    data["theme"] = "light"
+    cache.bump("data://config")
+    assert cache.tag("data://config") != tag
+    assert (
+        cache.payload("data://config", lambda: build("config")) == '{"theme":"light"}'
+    )
+    cache.payload("users://1/profile", lambda: build("user"))
+    assert builds == ["config", "user", "config"]
+
+    cache.bump()
+    cache.payload("data://config", lambda: build("config"))
+    cache.payload("users://1/profile", lambda: build("user"))
+    assert builds == ["config", "user", "config", "config", "user"]
@@ -0,0 +1,32 @@
+"""Test cases for the startup module."""
+
+import asyncio
+
+import pytest
+
+from my_python_ai_kata.mcp.startup import BackgroundLoader
+
+
+def test_background_loader_builds_once_and_retries_failures() -> None:
+    """It shares a single build between callers, and retries a failed one."""
+    calls: list[int] = []
+
+    def factory() -> str:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise FileNotFoundError("store")
+        return "store"
+
+    loader = BackgroundLoader("store", factory)
+
+    with pytest.raises(FileNotFoundError):
+        loader.get()
+    assert not loader.ready
+
+    async def concurrent_gets() -> list[str]:
+        return await asyncio.gather(*(loader.aget() for _ in range(5)))
+
+    assert asyncio.run(concurrent_gets()) == ["store"] * 5
+    assert loader.get() == "store"
+    assert loader.ready
+    assert calls == [0, 1]
@@ -0,0 +1,46 @@
+"""Test cases for the tokenizers module."""
+
+import numpy as np
+import pytest
+import tiktoken
+
+from my_python_ai_kata.mcp import tokenizers
+
+
+@pytest.fixture
+def loads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Fixture replacing tiktoken encodings with an offline byte-level one."""
+    calls: list[str] = []
+
+    def get_encoding(name: str) -> tiktoken.Encoding:
+        calls.append(name)
+        return tiktoken.Encoding(
+            name=name,
+            pat_str=r"\S+|\s+",
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={},
+        )
+
+    monkeypatch.setattr(tokenizers, "_encoders", {})
+    monkeypatch.setattr(tiktoken, "get_encoding", get_encoding)
+    return calls
+
+
+def test_encoders_are_loaded_once(loads: list[str]) -> None:
+    """It loads each encoding a single time, however often it is used."""
+    for _ in range(3):
+        tokenizers.count_tokens("hello")
+        tokenizers.count_tokens("hello", "other")
+
+    assert loads == ["cl100k_base", "other"]
+
+
+def test_count_tokens_batch_matches_count_tokens(loads: list[str]) -> None:
+    """It returns the same counts as counting texts one at a time."""
+    texts = ["", "a", "héllo world", "<|endoftext|>"]
+
+    counts = tokenizers.count_tokens_batch(texts)
+
+    assert counts.dtype == np.int32
+    assert counts.tolist() == [tokenizers.count_tokens(text) for text in texts]
+    assert tokenizers.count_tokens_batch([]).shape == (0,)
@@ -0,0 +1,58 @@
+"""Test cases for the user_profiles module."""
+
+import time
+from pathlib import Path
+
+from my_python_ai_kata.mcp.user_profiles import BATCH_SIZE
+from my_python_ai_kata.mcp.user_profiles import UserProfileRepository
+from my_python_ai_kata.mcp.user_profiles import create_profile_engine
+
+
+def test_repository_reads_profiles_one_by_one_and_in_batches() -> None:
+    """It finds stored profiles alone or by batches larger than a statement."""
+    repository = UserProfileRepository(create_profile_engine(), hot_rows=100)
+    repository.put_many(
+        {
+            user_id: {"name": f"User {user_id}", "status": "active"}
+            for user_id in range(1200)
+        }
+    )
+
+    assert repository.count() == 1200
+    assert repository.get(7) == {"name": "User 7", "status": "active"}
+    assert repository.get(5000) is None
+    ids = list(range(2 * BATCH_SIZE + 100)) + [5000, 7]
+    profiles = repository.get_many(ids)
+    assert len(profiles) == 2 * BATCH_SIZE + 100
+    assert 5000 not in profiles
+    assert profiles[1099] == {"name": "User 1099", "status": "active"}
+
+
+def test_repository_refreshes_cached_profiles_on_write() -> None:
+    """It drops the cached profile of a user whose profile is replaced."""
+    repository = UserProfileRepository(create_profile_engine(), hot_rows=10)
+    repository.put(1, {"name": "Alice", "status": "active"})
+    assert repository.get(1) == {"name": "Alice", "status": "active"}
+    assert len(repository.cache) == 1
+
+    repository.put(1, {"name": "Alice", "status": "inactive"})
+
+    assert repository.get(1) == {"name": "Alice", "status": "inactive"}
+    assert repository.get_many([1]) == {1: {"name": "Alice", "status": "inactive"}}
+
+
+def test_repository_reads_again_profiles_changed_by_another_process(
+    tmp_path: Path,
+) -> None:
+    """It serves a profile written by another process once its cached row expires."""
+    url = f"sqlite:///{tmp_path / 'profiles.db'}"
+    repository = UserProfileRepository(create_profile_engine(url), hot_rows_ttl=0.05)
+    other = UserProfileRepository(create_profile_engine(url))
+    repository.put(1, {"name": "Alice", "status": "active"})
+    assert repository.get(1) == {"name": "Alice", "status": "active"}
+
+    other.put(1, {"name": "Alice", "status": "inactive"})
+    assert repository.get(1) == {"name": "Alice", "status": "active"}
+
+    time.sleep(0.1)
+    assert repository.get(1) == {"name": "Alice", "status": "inactive"}
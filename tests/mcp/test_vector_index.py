@@ -0,0 +1,127 @@
+"""Test cases for the vector_index module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from my_python_ai_kata.mcp.vector_index import ExactIndex
+from my_python_ai_kata.mcp.vector_index import create_index
+from my_python_ai_kata.mcp.vector_index import fingerprint
+from my_python_ai_kata.mcp.vector_index import index_path
+from my_python_ai_kata.mcp.vector_index import load_or_build_index
+
+
+def clustered_vectors(n: int, dim: int = 16, clusters: int = 8) -> np.ndarray:
+    """Generate vectors scattered around a few random directions."""
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(clusters, dim))
+    return centers[rng.integers(clusters, size=n)] + 0.3 * rng.normal(size=(n, dim))
+
+
+def test_exact_index_ranks_by_cosine_similarity() -> None:
+    """It returns the most similar vectors first, whatever their norm."""
+    index = ExactIndex()
+    index.build(np.array([[1.0, 0.0], [10.0, 1.0], [0.0, 1.0]]))
+
+    indices, scores = index.search(np.array([[1.0, 0.02]]), k=2)
+
+    assert indices.tolist() == [[0, 1]]
+    assert scores[0, 0] == pytest.approx(np.cos(np.arctan(0.02)), rel=1e-5)
+
+
+def test_ivf_index_recalls_the_exact_neighbours() -> None:
+    """It finds nearly all of the exact top k while probing few buckets."""
+    vectors = clustered_vectors(2000)
+    queries = vectors[:50] + 0.01
+    exact = ExactIndex()
+    exact.build(vectors)
+    ivf = create_index("ivf", n_lists=32, n_probe=4)
+    ivf.build(vectors)
+
+    expected, _ = exact.search(queries, k=10)
+    found, _ = ivf.search(queries, k=10)
+
+    recall = np.mean([len(set(e) & set(f)) / 10 for e, f in zip(expected, found)])
+    assert recall > 0.9
+
+
+def test_empty_ivf_index_finds_nothing() -> None:
+    """An IVF index built without vectors answers every query with no neighbour."""
+    index = create_index("ivf")
+    index.build(np.zeros((0, 8), dtype=np.float32))
+
+    indices, scores = index.search(np.ones((2, 8), dtype=np.float32), k=3)
+
+    assert indices.shape == (2, 3)
+    assert (indices == -1).all()
+    assert np.isneginf(scores).all()
+
+
+def test_index_is_persisted_and_rebuilt_when_stale(tmp_path: Path) -> None:
+    """It reuses the persisted index until the stored ids or vectors change."""
+    parquet_path = str(tmp_path / "store.parquet")
+    vectors = clustered_vectors(300)
+    ids = [str(i) for i in range(300)]
+    all_ids, some_ids = fingerprint(ids), fingerprint(ids[:10])
+
+    built = load_or_build_index(parquet_path, vectors, all_ids, "ivf", n_lists=8)
+    loaded = load_or_build_index(parquet_path, vectors, all_ids, "ivf")
+    rebuilt = load_or_build_index(parquet_path, vectors[:10], some_ids, "ivf")
+
+    assert Path(index_path(parquet_path, "ivf")).is_file()
+    assert len(loaded.centroids) == 8
+    np.testing.assert_array_equal(loaded.centroids, built.centroids)
+    assert len(rebuilt.row_ids) == 10
+
+    # The same chunks embedded again, by another model
+    load_or_build_index(parquet_path, vectors, all_ids, "ivf", n_lists=8)
+    reembedded = vectors[:, ::-1].copy()
+    rebuilt = load_or_build_index(parquet_path, reembedded, all_ids, "ivf")
+    assert len(rebuilt.centroids) != 8
+    resized = load_or_build_index(parquet_path, vectors[:, :8], all_ids, "ivf")
+    assert resized.centroids.shape[1] == 8
+
+
+def test_unknown_backend_is_rejected() -> None:
+    """It refuses backends it does not know."""
+    with pytest.raises(ValueError, match="Unknown index backend"):
+        create_index("faiss")
+
+
+@pytest.mark.parametrize(
+    ("backend", "bytes_per_dim", "shortlist"),
+    [("float16", 2, 4), ("int8", 1, 4), ("binary", 1 / 8, 40)],
+)
+def test_quantized_index_recalls_the_exact_neighbours(
+    backend: str, bytes_per_dim: float, shortlist: int
+) -> None:
+    """It stores compact codes and re-ranks them back to the exact top k."""
+    vectors = clustered_vectors(1000, dim=64)
+    queries = vectors[:20] + 0.01
+    exact = ExactIndex()
+    exact.build(vectors)
+    index = create_index(backend, shortlist=shortlist)
+    index.build(vectors)
+
+    expected, expected_scores = exact.search(queries, k=5)
+    found, scores = index.search(queries, k=5)
+
+    assert index.codes.nbytes == 1000 * 64 * bytes_per_dim
+    recall = np.mean([len(set(e) & set(f)) / 5 for e, f in zip(expected, found)])
+    assert recall > 0.95
+    np.testing.assert_allclose(scores[:, 0], expected_scores[:, 0], rtol=1e-5)
+
+
+def test_quantized_index_is_reattached_after_loading(tmp_path: Path) -> None:
+    """It re-ranks with the store vectors after being loaded from disk."""
+    parquet_path = str(tmp_path / "store.parquet")
+    vectors = clustered_vectors(200)
+    store = fingerprint([str(i) for i in range(200)])
+    load_or_build_index(parquet_path, vectors, store, "int8")
+
+    loaded = load_or_build_index(parquet_path, vectors, store, "int8")
+    (indices,), _ = loaded.search(vectors[7:8], k=1)
+
+    assert loaded.vectors is vectors
+    assert indices.tolist() == [7]
@@ -0,0 +1,127 @@
+"""Test cases for the VectorStoreFactory of the vector_store_helpers module."""
+
+from pathlib import Path
+
+import pytest
+import tiktoken
+from langchain_core.documents import Document
+
+from my_python_ai_kata.mcp import tokenizers
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+from my_python_ai_kata.mcp.ingestion_pipeline import read_store_rows
+from my_python_ai_kata.mcp.vector_store_helpers import VectorStoreFactory
+
+
+class NamedFakeEmbeddings(FakeEmbeddings):
+    """Fake embeddings naming their model, like the OpenAI ones."""
+
+    model: str = "named-fake"
+
+
+def test_embedding_cache_namespace_follows_the_embeddings(tmp_path: Path) -> None:
+    """Custom embeddings never share the cache namespace of the default model."""
+    with pytest.raises(ValueError):
+        VectorStoreFactory(work_dir=str(tmp_path), embeddings=FakeEmbeddings(size=8))
+
+    factory = VectorStoreFactory(
+        work_dir=str(tmp_path),
+        embeddings=FakeEmbeddings(size=8),
+        embedding_model="fake-8",
+    )
+    assert factory.embedding_model == "fake-8"
+
+    named = VectorStoreFactory(
+        work_dir=str(tmp_path), embeddings=NamedFakeEmbeddings(size=8)
+    )
+    assert named.embedding_model == "named-fake"
+
+
+@pytest.fixture(autouse=True)
+def offline_encodings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fixture replacing tiktoken encodings with an offline byte-level one."""
+
+    def get_encoding(name: str) -> tiktoken.Encoding:
+        return tiktoken.Encoding(
+            name=name,
+            pat_str=r"\S+|\s+",
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={},
+        )
+
+    monkeypatch.setattr(tokenizers, "_encoders", {})
+    monkeypatch.setattr(tiktoken, "get_encoding", get_encoding)
+
+
+def make_factory(work_dir: Path, embeddings: FakeEmbeddings) -> VectorStoreFactory:
+    """Create a factory splitting into small chunks, without embedding cache."""
+    return VectorStoreFactory(
+        work_dir=str(work_dir),
+        embeddings=embeddings,
+        embedding_model="fake-8",
+        use_embedding_cache=False,
+        chunk_size=20,
+        chunk_overlap=0,
+        max_workers=1,
+    )
+
+
+def make_documents(pages: dict[str, str]) -> list[Document]:
+    """Create a document per source."""
+    return [
+        Document(page_content=content, metadata={"source": source})
+        for source, content in pages.items()
+    ]
+
+
+def stored_chunks(factory: VectorStoreFactory) -> dict[str, str]:
+    """Return the text of the persisted chunks, by id."""
+    return {row["ids"]: row["texts"] for row in read_store_rows(factory.parquet_path)}
+
+
+def test_update_vectorstore_only_embeds_the_changed_documents(tmp_path: Path) -> None:
+    """It rebuilds the store at first, then patches it like a rebuild would."""
+    embeddings = FakeEmbeddings(size=8)
+    factory = make_factory(tmp_path / "store", embeddings)
+    pages = {"a": "alpha " * 30, "b": "beta " * 30, "c": "gamma " * 30}
+
+    factory.update_vectorstore(make_documents(pages))
+    built = stored_chunks(factory)
+    requests = embeddings.requests
+
+    pages["b"] = "bravo " * 30
+    del pages["c"]
+    pages["d"] = "delta " * 30
+    factory.update_vectorstore(make_documents(pages))
+    patched = stored_chunks(factory)
+
+    rebuilt = make_factory(tmp_path / "rebuilt", FakeEmbeddings(size=8))
+    rebuilt.update_vectorstore(make_documents(pages), incremental=False)
+    assert patched == stored_chunks(rebuilt)
+    assert {id_: text for id_, text in built.items() if "alpha" in text} == {
+        id_: text for id_, text in patched.items() if "alpha" in text
+    }
+    assert not any("gamma" in text or "beta" in text for text in patched.values())
+    # Only the chunks of b and d were embedded again
+    changed = sum(1 for text in patched.values() if "bravo" in text or "delta" in text)
+    assert 0 < embeddings.requests - requests <= changed
+
+
+def test_update_vectorstore_rebuilds_a_store_without_manifest(tmp_path: Path) -> None:
+    """The chunks of a store without manifest are replaced, not duplicated."""
+    factory = make_factory(tmp_path, FakeEmbeddings(size=8))
+    documents = make_documents({"a": "alpha " * 30, "b": "beta " * 30})
+    factory.create_vectorstore(documents)
+    assert not Path(factory.manifest_path).exists()
+
+    factory.update_vectorstore(documents)
+    first = stored_chunks(factory)
+    factory.update_vectorstore(documents)
+
+    assert stored_chunks(factory) == first
+    rebuilt = make_factory(tmp_path / "rebuilt", FakeEmbeddings(size=8))
+    rebuilt.update_vectorstore(documents, incremental=False)
+    assert first == stored_chunks(rebuilt)
+
+    Path(factory.manifest_path).write_text("{not json")
+    factory.update_vectorstore(documents)
+    assert stored_chunks(factory) == first
@@ -0,0 +1,103 @@
+"""Test cases for the vector_store_helpers module."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from langchain_core.documents import Document
+
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+from my_python_ai_kata.mcp.vector_store_helpers import VectorStoreQueryHelper
+from tests.mcp.vector_stores import write_store
+
+
+@pytest.mark.parametrize("layout", ["parquet", "mmap"])
+def test_query_many_embeds_in_one_request(tmp_path: Path, layout: str) -> None:
+    """It embeds all the uncached queries at once and answers each of them."""
+    path = str(tmp_path / "store.parquet")
+    texts = [f"topic {i}" for i in range(10)]
+    write_store(path, texts)
+    embeddings = FakeEmbeddings(size=8)
+    helper = VectorStoreQueryHelper(path, embeddings=embeddings, layout=layout)
+    helper.query("topic 1", k=1)
+
+    results = helper.query_many(["topic 1", "topic 4", "topic 7", "Topic 4"], k=1)
+
+    assert [docs[0].page_content for docs in results] == [
+        "topic 1",
+        "topic 4",
+        "topic 7",
+        "topic 4",
+    ]
+    assert embeddings.requests == 2
+    assert helper.query_many([], k=1) == []
+
+
+@pytest.mark.parametrize("layout", ["parquet", "mmap"])
+def test_lexical_queries_do_not_embed(tmp_path: Path, layout: str) -> None:
+    """It answers lexical queries from the BM25 index, and fuses hybrid ones."""
+    path = str(tmp_path / "store.parquet")
+    write_store(
+        path,
+        [
+            "Compile the StateGraph before invoking it.",
+            "Call graph.add_conditional_edges with a routing function.",
+            "Persist threads with a checkpointer.",
+        ],
+    )
+    embeddings = FakeEmbeddings(size=8)
+    helper = VectorStoreQueryHelper(
+        path, embeddings=embeddings, layout=layout, mode="lexical"
+    )
+
+    (doc,) = helper.query("add_conditional_edges", k=1)
+    (many,) = helper.query_many(["StateGraph"], k=1)
+
+    assert "add_conditional_edges" in doc.page_content
+    assert "StateGraph" in many[0].page_content
+    assert embeddings.requests == 0
+
+    hybrid = helper.query("add_conditional_edges", k=3, mode="hybrid")
+
+    assert "add_conditional_edges" in hybrid[0].page_content
+    assert len(hybrid) == 3
+    assert embeddings.requests == 1
+    with pytest.raises(ValueError):
+        helper.query("anything", mode="sparse")
+
+
+def test_async_queries_overlap_their_embedding_requests(tmp_path: Path) -> None:
+    """It awaits the embeddings of concurrent queries instead of serializing them."""
+    path = str(tmp_path / "store.parquet")
+    texts = [f"topic {i}" for i in range(20)]
+    write_store(path, texts)
+    embeddings = FakeEmbeddings(size=8, latency=0.1)
+    helper = VectorStoreQueryHelper(path, embeddings=embeddings)
+
+    async def run() -> list[list[Document]]:
+        return await asyncio.gather(*(helper.aquery(text, k=1) for text in texts[:10]))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    assert [docs[0].page_content for docs in results] == texts[:10]
+    assert results[3] == helper.query("topic 3", k=1)
+    assert embeddings.requests == 10
+    assert elapsed < 0.5
+
+
+@pytest.mark.parametrize("backend", ["exact", "int8"])
+def test_parquet_layout_only_keeps_the_index_vectors(
+    tmp_path: Path, backend: str
+) -> None:
+    """The loaded store drops its float lists once the index is built."""
+    path = str(tmp_path / "store.parquet")
+    write_store(path, [f"topic {i}" for i in range(10)])
+    helper = VectorStoreQueryHelper(
+        path, embeddings=FakeEmbeddings(size=8), index_backend=backend
+    )
+
+    assert helper.vectorstore._embeddings == []
+    assert helper.query("topic 4", k=1)[0].page_content == "topic 4"
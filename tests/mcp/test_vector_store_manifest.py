@@ -0,0 +1,25 @@
+"""Test cases for the vector_store_manifest module."""
+
+from pathlib import Path
+
+from my_python_ai_kata.mcp.vector_store_manifest import SourceEntry
+from my_python_ai_kata.mcp.vector_store_manifest import VectorStoreManifest
+from my_python_ai_kata.mcp.vector_store_manifest import chunk_id
+
+
+def test_manifest_round_trips_through_disk(tmp_path: Path) -> None:
+    """It saves and loads the manifest unchanged."""
+    path = str(tmp_path / "manifest.json")
+    manifest = VectorStoreManifest(sources={"url": SourceEntry("abc", ["a", "b"])})
+
+    manifest.save(path)
+
+    assert VectorStoreManifest.load(path) == manifest
+    assert VectorStoreManifest.load(str(tmp_path / "missing.json")).sources == {}
+
+
+def test_chunk_id_is_deterministic() -> None:
+    """It derives the same id from the same source, content and position."""
+    assert chunk_id("url", "hash", 0) == chunk_id("url", "hash", 0)
+    assert chunk_id("url", "hash", 0) != chunk_id("url", "hash", 1)
+    assert chunk_id("url", "hash", 0) != chunk_id("url", "other", 0)
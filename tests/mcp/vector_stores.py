@@ -0,0 +1,12 @@
+"""Vector store fixtures shared by the test cases of the query helpers."""
+
+from my_python_ai_kata.mcp.fake_embeddings import FakeEmbeddings
+from my_python_ai_kata.mcp.ingestion_pipeline import ParquetStoreWriter
+
+
+def write_store(path: str, texts: list[str]) -> None:
+    """Write a parquet vector store holding the texts."""
+    embeddings = FakeEmbeddings(size=8)
+    with ParquetStoreWriter(path) as writer:
+        for i, text in enumerate(texts):
+            writer.write(f"id-{i}", text, {}, embeddings.embed_query(text))